@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import hashlib
+import os
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from video_translate.config import ASRConfig
+from video_translate.io import dumps_json, loads_json
+from video_translate.models import TranscriptSegment, WordTimestamp
+
+CHECKPOINT_FILENAME = "asr_checkpoint.jsonl"
+# Segments ending this close to the resume offset were already committed.
+_RESUME_OVERLAP_SECONDS = 0.05
+# Threading and the OOM retry switch do not change decoded text, so they must not
+# invalidate a checkpoint.
+_NON_DECODE_FIELDS = frozenset({"cpu_threads", "num_workers", "fallback_on_oom"})
+
+
+def asr_settings_fingerprint(asr_config: ASRConfig) -> str:
+    settings = {
+        key: value
+        for key, value in asdict(asr_config).items()
+        if key not in _NON_DECODE_FIELDS
+    }
+    return hashlib.sha1(dumps_json(settings, compact=True, backend="json")).hexdigest()
+
+
+class ASRCheckpoint:
+    """Append-only JSON-lines log of finalized ASR segments for one audio file.
+
+    Line 1 is a header identifying the audio and the decode-relevant ASR settings
+    (model, compute type, beam size, language, two-pass mode, ...); each further line
+    is one segment, and a final ``complete`` line marks a finished transcription. A torn last
+    line from a killed process is ignored on load, so decoding resumes from the end of
+    the last intact segment.
+    """
+
+    def __init__(self, path: Path, *, audio_path: Path, asr_config: ASRConfig) -> None:
+        self.path = path
+        self.identity = {
+            "audio": audio_path.name,
+            "audio_bytes": audio_path.stat().st_size if audio_path.exists() else None,
+            "asr_settings": asr_settings_fingerprint(asr_config),
+        }
+        self.segments: list[TranscriptSegment] = []
+        self.info: dict[str, Any] | None = None
+        self.complete = False
+        self._handle: BinaryIO | None = None
+        self._load()
+
+    @property
+    def resume_offset(self) -> float:
+        return self.segments[-1].end if self.segments else 0.0
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        lines = self.path.read_bytes().splitlines()
+        records: list[dict[str, Any]] = []
+        for line in lines:
+            try:
+                records.append(loads_json(line))
+            except Exception:  # noqa: BLE001
+                # Torn write of a killed process; everything before it is intact.
+                break
+        if not records or records[0].get("kind") != "header":
+            return
+        header = records[0]
+        if {key: header.get(key) for key in self.identity} != self.identity:
+            # Different audio or settings: start over instead of mixing transcripts.
+            return
+        self.info = header.get("info")
+        for record in records[1:]:
+            kind = record.get("kind")
+            if kind == "complete":
+                self.complete = True
+                break
+            if kind != "segment":
+                continue
+            self.segments.append(
+                TranscriptSegment(
+                    id=int(record["id"]),
+                    start=float(record["start"]),
+                    end=float(record["end"]),
+                    text=str(record["text"]),
+                    words=[
+                        WordTimestamp(
+                            word=str(word),
+                            start=float(start),
+                            end=float(end),
+                            probability=float(probability),
+                        )
+                        for word, start, end, probability in record.get("words", [])
+                    ],
+                )
+            )
+
+    def _write(self, record: dict[str, Any]) -> None:
+        if self._handle is None:
+            raise RuntimeError("ASR checkpoint is not open.")
+        self._handle.write(dumps_json(record, compact=True) + b"\n")
+        # Flushed per record so a killed process keeps every finalized segment.
+        self._handle.flush()
+
+    def open(self, info: Any) -> None:
+        """Start writing; rewrites the file so it holds exactly the committed segments."""
+        if self.info is None:
+            self.info = {
+                "language": str(info.language),
+                "language_probability": float(info.language_probability),
+                "duration": float(getattr(info, "duration", 0.0)),
+            }
+        self.close()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Compact into a temp file first so a crash here cannot lose committed segments.
+        staging = self.path.with_name(self.path.name + ".tmp")
+        with staging.open("wb") as handle:
+            records = [{"kind": "header", **self.identity, "info": self.info}]
+            records.extend(_segment_record(segment) for segment in self.segments)
+            for record in records:
+                handle.write(dumps_json(record, compact=True) + b"\n")
+        os.replace(staging, self.path)
+        self._handle = self.path.open("ab")
+
+    def is_committed(self, end: float) -> bool:
+        return bool(self.segments) and end <= self.resume_offset + _RESUME_OVERLAP_SECONDS
+
+    def append(self, segment: TranscriptSegment) -> None:
+        self.segments.append(segment)
+        self._write(_segment_record(segment))
+
+    def mark_complete(self) -> None:
+        self._write({"kind": "complete", "segment_count": len(self.segments)})
+        self.complete = True
+        self.close()
+
+    def close(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+
+def _segment_record(segment: TranscriptSegment) -> dict[str, Any]:
+    return {
+        "kind": "segment",
+        "id": segment.id,
+        "start": segment.start,
+        "end": segment.end,
+        "text": segment.text,
+        "words": [
+            [word.word, word.start, word.end, word.probability] for word in segment.words
+        ],
+    }
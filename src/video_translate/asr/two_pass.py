@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+from video_translate.models import TranscriptSegment
+
+Window = tuple[float, float]
+
+
+@dataclass
+class TwoPassStats:
+    """Outcome of a draft + selective re-decode ASR run, written to the M1 manifest."""
+
+    draft_model: str = ""
+    accurate_model: str = ""
+    probability_threshold: float = 0.0
+    audio_seconds: float = 0.0
+    windows: list[Window] = field(default_factory=list)
+    draft_seconds: float = 0.0
+    redecode_seconds: float = 0.0
+    accurate_load_seconds: float = 0.0
+    redecode_error: str | None = None
+
+    @property
+    def redecoded_seconds(self) -> float:
+        return sum(end - start for start, end in self.windows)
+
+    @property
+    def redecoded_fraction(self) -> float:
+        if self.audio_seconds <= 0.0:
+            return 0.0
+        return min(1.0, self.redecoded_seconds / self.audio_seconds)
+
+    def estimated_single_pass_seconds(self) -> float | None:
+        # Scale the accurate model's decode time (not its load time) to the whole file.
+        fraction = self.redecoded_fraction
+        if fraction <= 0.0 or self.redecode_error is not None:
+            return None
+        decode_seconds = max(0.0, self.redecode_seconds - self.accurate_load_seconds)
+        return self.accurate_load_seconds + decode_seconds / fraction
+
+    def to_dict(self) -> dict[str, Any]:
+        single_pass = self.estimated_single_pass_seconds()
+        total = self.draft_seconds + self.redecode_seconds
+        return {
+            "draft_model": self.draft_model,
+            "accurate_model": self.accurate_model,
+            "probability_threshold": self.probability_threshold,
+            "audio_seconds": round(self.audio_seconds, 3),
+            "window_count": len(self.windows),
+            "redecoded_seconds": round(self.redecoded_seconds, 3),
+            "redecoded_fraction": round(self.redecoded_fraction, 4),
+            "draft_seconds": round(self.draft_seconds, 3),
+            "redecode_seconds": round(self.redecode_seconds, 3),
+            "total_seconds": round(total, 3),
+            "estimated_single_pass_seconds": (
+                round(single_pass, 3) if single_pass is not None else None
+            ),
+            "estimated_saved_seconds": (
+                round(single_pass - total, 3) if single_pass is not None else None
+            ),
+            "redecode_error": self.redecode_error,
+        }
+
+
+def _mean_probability(segment: TranscriptSegment) -> float | None:
+    if not segment.words:
+        return None
+    return sum(word.probability for word in segment.words) / len(segment.words)
+
+
+def find_redecode_windows(
+    segments: Iterable[TranscriptSegment],
+    *,
+    probability_threshold: float,
+    merge_gap_seconds: float,
+) -> list[Window]:
+    """Return time windows covering segments whose mean word probability is too low.
+
+    Windows follow draft segment boundaries so re-decoded text replaces whole segments;
+    flagged segments closer than ``merge_gap_seconds`` share one window.
+    """
+    windows: list[Window] = []
+    for segment in segments:
+        probability = _mean_probability(segment)
+        if probability is None or probability >= probability_threshold:
+            continue
+        if windows and segment.start - windows[-1][1] <= merge_gap_seconds:
+            windows[-1] = (windows[-1][0], max(windows[-1][1], segment.end))
+        else:
+            windows.append((segment.start, segment.end))
+    return windows
+
+
+def _window_index(
+    segment: TranscriptSegment, windows: list[Window], starts: list[float]
+) -> int | None:
+    # Windows are sorted and disjoint; a segment belongs to the one holding its midpoint.
+    midpoint = (segment.start + segment.end) / 2.0
+    index = bisect_right(starts, midpoint) - 1
+    if index >= 0 and midpoint <= windows[index][1]:
+        return index
+    return None
+
+
+def splice_redecoded_segments(
+    draft: list[TranscriptSegment],
+    redecoded: list[TranscriptSegment],
+    windows: list[Window],
+) -> list[TranscriptSegment]:
+    """Replace draft segments inside ``windows`` with re-decoded ones and renumber ids.
+
+    A window the accurate model left empty keeps its draft segments, so re-decoding
+    never drops text.
+    """
+    starts = [start for start, _ in windows]
+    replacements: dict[int, list[TranscriptSegment]] = {}
+    for segment in redecoded:
+        index = _window_index(segment, windows, starts)
+        if index is not None:
+            replacements.setdefault(index, []).append(segment)
+
+    spliced: list[TranscriptSegment] = []
+    for segment in draft:
+        index = _window_index(segment, windows, starts)
+        if index is None or index not in replacements:
+            spliced.append(segment)
+    for items in replacements.values():
+        spliced.extend(items)
+    spliced.sort(key=lambda item: (item.start, item.end))
+    # faster-whisper numbers segments from 1.
+    return [
+        TranscriptSegment(
+            id=new_id,
+            start=segment.start,
+            end=segment.end,
+            text=segment.text,
+            words=segment.words,
+        )
+        for new_id, segment in enumerate(spliced, start=1)
+    ]
@@ -0,0 +1,270 @@
+from __future__ import annotations
+
+import math
+import wave
+from array import array
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field, replace
+from functools import cached_property
+from pathlib import Path
+from typing import Any
+
+from video_translate.io import read_json, write_json
+from video_translate.models import TranscriptDocument, TranscriptSegment, WordTimestamp
+
+try:  # numpy ships with faster-whisper; the stdlib path keeps the pre-pass importable.
+    import numpy
+except ImportError:  # pragma: no cover - depends on environment
+    numpy = None  # type: ignore[assignment, unused-ignore]
+
+SPEECH_MAP_FILENAME = "speech_map.json"
+FRAME_SECONDS = 0.02
+# Below this share of skippable audio, ASR reads the original file instead of a copy.
+MIN_SKIP_RATIO = 0.05
+_PCM16_FULL_SCALE_SQUARED = 32768.0 * 32768.0
+
+Region = tuple[float, float]
+
+
+@dataclass(frozen=True)
+class SpeechMap:
+    """Speech regions of a normalized mono PCM16 WAV, in source seconds."""
+
+    duration: float
+    regions: list[Region]
+    threshold_db: float
+    frame_seconds: float = FRAME_SECONDS
+    params: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def speech_seconds(self) -> float:
+        return sum(end - start for start, end in self.regions)
+
+    @property
+    def skipped_seconds(self) -> float:
+        return max(0.0, self.duration - self.speech_seconds)
+
+    @property
+    def skipped_ratio(self) -> float:
+        return self.skipped_seconds / self.duration if self.duration > 0 else 0.0
+
+    @cached_property
+    def _region_starts(self) -> list[float]:
+        return [start for start, _ in self.regions]
+
+    def overlap_seconds(self, start: float, end: float) -> float:
+        """Seconds of ``[start, end]`` that fall inside speech regions."""
+        total = 0.0
+        index = max(0, bisect_right(self._region_starts, start) - 1)
+        for region_start, region_end in self.regions[index:]:
+            if region_start >= end:
+                break
+            total += max(0.0, min(end, region_end) - max(start, region_start))
+        return total
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "duration_seconds": self.duration,
+            "speech_seconds": round(self.speech_seconds, 3),
+            "skipped_ratio": round(self.skipped_ratio, 4),
+            "threshold_db": self.threshold_db,
+            "frame_seconds": self.frame_seconds,
+            "params": self.params,
+            "regions": [[round(start, 3), round(end, 3)] for start, end in self.regions],
+        }
+
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any]) -> SpeechMap:
+        return cls(
+            duration=float(payload["duration_seconds"]),
+            regions=[(float(start), float(end)) for start, end in payload["regions"]],
+            threshold_db=float(payload["threshold_db"]),
+            frame_seconds=float(payload.get("frame_seconds", FRAME_SECONDS)),
+            params={key: float(value) for key, value in payload.get("params", {}).items()},
+        )
+
+
+def write_speech_map(path: Path, speech_map: SpeechMap) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    write_json(path, speech_map.to_dict())
+    return path
+
+
+def read_speech_map(path: Path) -> SpeechMap | None:
+    if not path.exists():
+        return None
+    try:
+        return SpeechMap.from_dict(read_json(path))
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _read_pcm16_mono(wav_path: Path) -> tuple[int, bytes]:
+    with wave.open(str(wav_path), "rb") as wav_file:
+        if wav_file.getnchannels() != 1 or wav_file.getsampwidth() != 2:
+            raise ValueError(f"Energy VAD expects mono PCM16 WAV: {wav_path}")
+        return wav_file.getframerate(), wav_file.readframes(wav_file.getnframes())
+
+
+def _frame_active_flags(
+    raw: bytes, *, frame_samples: int, threshold_db: float, hangover_frames: int
+) -> list[bool]:
+    """Frame energy in dBFS against ``threshold_db``, held for ``hangover_frames`` frames."""
+    frame_count = len(raw) // 2 // frame_samples
+    if frame_count == 0:
+        return []
+    # Energy threshold as a mean-square value, so no per-frame log is needed.
+    threshold = _PCM16_FULL_SCALE_SQUARED * (10.0 ** (threshold_db / 10.0))
+    if numpy is not None:
+        samples = numpy.frombuffer(raw, dtype="<i2", count=frame_count * frame_samples)
+        frames = samples.reshape(frame_count, frame_samples).astype(numpy.float32)
+        loud = numpy.einsum("ij,ij->i", frames, frames) / frame_samples >= threshold
+        # Distance to the most recent loud frame; speech stays on for the hangover.
+        indices = numpy.arange(frame_count)
+        last_loud = numpy.maximum.accumulate(numpy.where(loud, indices, -(hangover_frames + 1)))
+        return [bool(flag) for flag in indices - last_loud <= hangover_frames]
+
+    samples_list = array("h")
+    samples_list.frombytes(raw[: frame_count * frame_samples * 2])
+    flags: list[bool] = []
+    since_loud = hangover_frames + 1
+    for frame in range(frame_count):
+        offset = frame * frame_samples
+        chunk = samples_list[offset : offset + frame_samples]
+        if sum(value * value for value in chunk) / frame_samples >= threshold:
+            since_loud = 0
+        else:
+            since_loud += 1
+        flags.append(since_loud <= hangover_frames)
+    return flags
+
+
+def detect_speech_map(
+    wav_path: Path,
+    *,
+    threshold_db: float,
+    hangover_seconds: float,
+    padding_seconds: float,
+    min_silence_seconds: float,
+) -> SpeechMap:
+    """Energy VAD over a mono PCM16 WAV.
+
+    Frames of ``FRAME_SECONDS`` whose mean energy reaches ``threshold_db`` dBFS are
+    speech; speech is held for ``hangover_seconds`` after the last loud frame, regions
+    are padded by ``padding_seconds`` and silences shorter than ``min_silence_seconds``
+    are kept so words are never cut at a pause.
+    """
+    sample_rate, raw = _read_pcm16_mono(wav_path)
+    duration = len(raw) / 2 / sample_rate if sample_rate > 0 else 0.0
+    frame_samples = max(1, int(round(FRAME_SECONDS * sample_rate)))
+    frame_seconds = frame_samples / sample_rate
+    flags = _frame_active_flags(
+        raw,
+        frame_samples=frame_samples,
+        threshold_db=threshold_db,
+        hangover_frames=int(math.ceil(hangover_seconds / frame_seconds)),
+    )
+
+    regions: list[Region] = []
+    run_start: int | None = None
+    for index, active in enumerate([*flags, False]):
+        if active and run_start is None:
+            run_start = index
+        elif not active and run_start is not None:
+            start = max(0.0, run_start * frame_seconds - padding_seconds)
+            end = min(duration, index * frame_seconds + padding_seconds)
+            if regions and start - regions[-1][1] < min_silence_seconds:
+                regions[-1] = (regions[-1][0], end)
+            else:
+                regions.append((start, end))
+            run_start = None
+    return SpeechMap(
+        duration=duration,
+        regions=regions,
+        threshold_db=threshold_db,
+        frame_seconds=frame_seconds,
+        params={
+            "hangover_seconds": hangover_seconds,
+            "padding_seconds": padding_seconds,
+            "min_silence_seconds": min_silence_seconds,
+        },
+    )
+
+
+@dataclass(frozen=True)
+class SpeechOnlyAudio:
+    """A WAV holding only the speech regions back to back, with the offset table."""
+
+    path: Path
+    concat_starts: list[float]
+    source_starts: list[float]
+    lengths: list[float]
+
+    def to_source_time(self, seconds: float, *, is_end: bool = False) -> float:
+        """Map a timestamp of the speech-only WAV back to the source timeline.
+
+        A timestamp exactly on a join belongs to the earlier region when it ends a
+        segment or word, and to the later one when it starts one.
+        """
+        if not self.concat_starts:
+            return seconds
+        if is_end:
+            index = max(0, bisect_left(self.concat_starts, seconds) - 1)
+        else:
+            index = max(0, bisect_right(self.concat_starts, seconds) - 1)
+        offset = min(max(0.0, seconds - self.concat_starts[index]), self.lengths[index])
+        return self.source_starts[index] + offset
+
+    def remap_document(self, doc: TranscriptDocument, *, duration: float) -> TranscriptDocument:
+        segments = [
+            TranscriptSegment(
+                id=segment.id,
+                start=self.to_source_time(segment.start),
+                end=self.to_source_time(segment.end, is_end=True),
+                text=segment.text,
+                words=[
+                    WordTimestamp(
+                        word=word.word,
+                        start=self.to_source_time(word.start),
+                        end=self.to_source_time(word.end, is_end=True),
+                        probability=word.probability,
+                    )
+                    for word in segment.words
+                ],
+            )
+            for segment in doc.segments
+        ]
+        return replace(doc, duration=duration, segments=segments)
+
+
+def write_speech_only_wav(
+    source_wav: Path, speech_map: SpeechMap, output_wav: Path
+) -> SpeechOnlyAudio:
+    sample_rate, raw = _read_pcm16_mono(source_wav)
+    concat_starts: list[float] = []
+    source_starts: list[float] = []
+    lengths: list[float] = []
+    chunks: list[bytes] = []
+    written_samples = 0
+    for start, end in speech_map.regions:
+        first = int(round(start * sample_rate))
+        last = min(len(raw) // 2, int(round(end * sample_rate)))
+        if last <= first:
+            continue
+        concat_starts.append(written_samples / sample_rate)
+        source_starts.append(first / sample_rate)
+        lengths.append((last - first) / sample_rate)
+        chunks.append(raw[first * 2 : last * 2])
+        written_samples += last - first
+    output_wav.parent.mkdir(parents=True, exist_ok=True)
+    with wave.open(str(output_wav), "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes(b"".join(chunks))
+    return SpeechOnlyAudio(
+        path=output_wav,
+        concat_starts=concat_starts,
+        source_starts=source_starts,
+        lengths=lengths,
+    )
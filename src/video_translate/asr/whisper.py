@@ -1,10 +1,27 @@
 from __future__ import annotations
 
+from dataclasses import replace
 from pathlib import Path
+from time import perf_counter
+from types import SimpleNamespace
 from typing import Any, Callable
 
+from video_translate.asr.checkpoint import ASRCheckpoint
+from video_translate.asr.two_pass import (
+    TwoPassStats,
+    find_redecode_windows,
+    splice_redecoded_segments,
+)
 from video_translate.config import ASRConfig
 from video_translate.models import TranscriptDocument, TranscriptSegment, WordTimestamp
+from video_translate.qa.m1_report import M1QAStats
+from video_translate.tracing import span
+
+# Called as factory(model_size_or_path=..., device=..., compute_type=...) and must return
+# an object with faster-whisper's ``transcribe`` signature. Benchmarks and CI inject fakes.
+# In batched mode an injected model's ``transcribe`` also receives ``batch_size``; real
+# models are wrapped in faster-whisper's ``BatchedInferencePipeline`` instead.
+WhisperModelFactory = Callable[..., Any]
 
 
 def _is_probable_oom_error(exc: Exception) -> bool:
@@ -30,21 +47,63 @@ def _transcribe_with_settings(
     device: str,
     compute_type: str,
     asr_config: ASRConfig,
+    model_factory: WhisperModelFactory | None = None,
+    clip_timestamps: list[float] | None = None,
+    load_seconds: list[float] | None = None,
+    batch_size: int | None = None,
 ) -> tuple[Any, Any]:
-    from faster_whisper import WhisperModel  # Imported lazily for startup speed.
+    injected = model_factory is not None
+    if model_factory is None:
+        from faster_whisper import WhisperModel  # Imported lazily for startup speed.
 
-    model = WhisperModel(
-        model_size_or_path=model_name,
-        device=device,
-        compute_type=compute_type,
-    )
-    return model.transcribe(
-        str(audio_path),
-        language=asr_config.language,
-        beam_size=asr_config.beam_size,
-        word_timestamps=asr_config.word_timestamps,
-        vad_filter=asr_config.vad_filter,
-    )
+        model_factory = WhisperModel
+    thread_options: dict[str, int] = {}
+    # Only non-default threading is passed, so three-argument factories keep working.
+    if asr_config.cpu_threads > 0:
+        thread_options["cpu_threads"] = asr_config.cpu_threads
+    if asr_config.num_workers > 1:
+        thread_options["num_workers"] = asr_config.num_workers
+    load_started = perf_counter()
+    with span("asr.model_load", **thread_options):
+        model = model_factory(
+            model_size_or_path=model_name,
+            device=device,
+            compute_type=compute_type,
+            **thread_options,
+        )
+    if load_seconds is not None:
+        load_seconds.append(perf_counter() - load_started)
+    extra: dict[str, Any] = {}
+    if clip_timestamps is not None:
+        # faster-whisper decodes only these [start, end, ...] ranges and skips VAD.
+        extra["clip_timestamps"] = clip_timestamps
+    decoder = model
+    if batch_size is not None and not injected:
+        decoder = _batched_pipeline(model)
+        if decoder is None:
+            batch_size = None
+            decoder = model
+    if batch_size is not None:
+        extra["batch_size"] = batch_size
+    # Feature extraction, VAD and language detection run eagerly inside transcribe().
+    with span("asr.features", mode="batched" if batch_size is not None else "sequential"):
+        return decoder.transcribe(
+            str(audio_path),
+            language=asr_config.language,
+            beam_size=asr_config.beam_size,
+            word_timestamps=asr_config.word_timestamps,
+            vad_filter=asr_config.vad_filter,
+            **extra,
+        )
+
+
+def _batched_pipeline(model: Any) -> Any | None:
+    try:
+        from faster_whisper import BatchedInferencePipeline
+    except ImportError:
+        # faster-whisper < 1.1 has no batched pipeline; decode sequentially.
+        return None
+    return BatchedInferencePipeline(model=model)
 
 
 def _transcribe_and_collect(
@@ -55,47 +114,156 @@ def _transcribe_and_collect(
     compute_type: str,
     asr_config: ASRConfig,
     on_segment_collected: Callable[[int], None] | None = None,
+    model_factory: WhisperModelFactory | None = None,
+    qa_stats: M1QAStats | None = None,
+    clip_timestamps: list[float] | None = None,
+    load_seconds: list[float] | None = None,
+    checkpoint: ASRCheckpoint | None = None,
+    batch_size: int | None = None,
 ) -> tuple[list[Any], Any]:
-    segments_iter, info = _transcribe_with_settings(
-        audio_path=audio_path,
-        model_name=model_name,
+    committed: list[Any] = list(checkpoint.segments) if checkpoint is not None else []
+    if checkpoint is not None and checkpoint.complete and checkpoint.info is not None:
+        # A previous run already finished this audio; nothing left to decode.
+        _feed_qa_stats(qa_stats, committed)
+        return committed, SimpleNamespace(**checkpoint.info)
+    # A failed earlier attempt may have fed part of its segments.
+    _feed_qa_stats(qa_stats, committed)
+    resume_offset = checkpoint.resume_offset if checkpoint is not None else 0.0
+    if resume_offset > 0.0:
+        # Decode only what follows the last committed segment.
+        clip_timestamps = [resume_offset]
+    if clip_timestamps is not None:
+        # Clipped decodes (resume, re-decode windows) cover little audio; keep them
+        # on the sequential path, which takes clip_timestamps as plain floats.
+        batch_size = None
+    with span(
+        "asr.attempt",
+        model=model_name,
         device=device,
         compute_type=compute_type,
-        asr_config=asr_config,
-    )
-    # faster-whisper returns a generator that can raise at iteration time.
-    # Force evaluation here so fallback logic can catch runtime failures.
-    collected: list[Any] = []
-    for index, item in enumerate(segments_iter, start=1):
-        collected.append(item)
-        if on_segment_collected is not None:
-            on_segment_collected(index)
+        resume_offset_seconds=resume_offset,
+        batch_size=batch_size,
+    ):
+        segments_iter, info = _transcribe_with_settings(
+            audio_path=audio_path,
+            model_name=model_name,
+            device=device,
+            compute_type=compute_type,
+            asr_config=asr_config,
+            model_factory=model_factory,
+            clip_timestamps=clip_timestamps,
+            load_seconds=load_seconds,
+            batch_size=batch_size,
+        )
+        if checkpoint is not None:
+            checkpoint.open(info)
+        # faster-whisper returns a generator that can raise at iteration time.
+        # Force evaluation here so fallback logic can catch runtime failures.
+        collected: list[Any] = committed
+        try:
+            with span("asr.decode") as decode_span:
+                for item in segments_iter:
+                    if checkpoint is not None:
+                        if checkpoint.is_committed(float(item.end)):
+                            continue
+                        item = replace(_to_transcript_segment(item), id=len(collected) + 1)
+                        checkpoint.append(item)
+                    collected.append(item)
+                    if qa_stats is not None:
+                        raw_words = getattr(item, "words", None) or ()
+                        qa_stats.add_segment(
+                            start=float(item.start),
+                            end=float(item.end),
+                            text=str(item.text),
+                            probabilities=(float(word.probability) for word in raw_words),
+                        )
+                    if on_segment_collected is not None:
+                        on_segment_collected(len(collected))
+                decode_span.set(
+                    segment_count=len(collected),
+                    audio_seconds=_decoded_audio_seconds(info, clip_timestamps),
+                )
+            if checkpoint is not None:
+                checkpoint.mark_complete()
+        finally:
+            if checkpoint is not None:
+                checkpoint.close()
+    if checkpoint is not None and checkpoint.info is not None:
+        # Keep the language detected by the attempt that started the checkpoint.
+        info = SimpleNamespace(**checkpoint.info)
     return collected, info
 
 
-def transcribe_audio(
+def _decoded_audio_seconds(info: Any, clip_timestamps: list[float] | None) -> float:
+    """Seconds of audio a decode covered, not the length of the whole file.
+
+    ``clip_timestamps`` holds start/end pairs; a trailing start runs to the end.
+    """
+    duration = float(getattr(info, "duration", 0.0))
+    if not clip_timestamps:
+        after_vad = getattr(info, "duration_after_vad", None)
+        return float(after_vad) if after_vad is not None else duration
+    total = 0.0
+    for index in range(0, len(clip_timestamps), 2):
+        start = min(max(clip_timestamps[index], 0.0), duration)
+        end = clip_timestamps[index + 1] if index + 1 < len(clip_timestamps) else duration
+        total += max(0.0, min(end, duration) - start)
+    return total
+
+
+def _feed_qa_stats(qa_stats: M1QAStats | None, segments: list[Any]) -> None:
+    if qa_stats is None:
+        return
+    qa_stats.reset()
+    for segment in segments:
+        qa_stats.add_segment(
+            start=segment.start,
+            end=segment.end,
+            text=segment.text,
+            probabilities=(word.probability for word in segment.words),
+        )
+
+
+def _collect_with_fallback(
+    *,
     audio_path: Path,
     asr_config: ASRConfig,
+    model_name: str,
+    fallback_model_name: str,
     on_segment_collected: Callable[[int], None] | None = None,
-) -> TranscriptDocument:
+    model_factory: WhisperModelFactory | None = None,
+    qa_stats: M1QAStats | None = None,
+    clip_timestamps: list[float] | None = None,
+    load_seconds: list[float] | None = None,
+    checkpoint: ASRCheckpoint | None = None,
+) -> tuple[list[Any], Any]:
+    batch_size = asr_config.batch_size if asr_config.batched else None
     try:
-        raw_segments, info = _transcribe_and_collect(
+        return _transcribe_and_collect(
             audio_path=audio_path,
-            model_name=asr_config.model,
+            model_name=model_name,
             device=asr_config.device,
             compute_type=asr_config.compute_type,
             asr_config=asr_config,
             on_segment_collected=on_segment_collected,
+            model_factory=model_factory,
+            qa_stats=qa_stats,
+            clip_timestamps=clip_timestamps,
+            load_seconds=load_seconds,
+            checkpoint=checkpoint,
+            batch_size=batch_size,
         )
     except Exception as exc:  # noqa: BLE001
         # Primary ASR run failed. If fallback is enabled and fallback settings
-        # differ from primary settings, retry on fallback path.
+        # differ from primary settings, retry on fallback path. A batched run that
+        # ran out of memory can also retry sequentially with the same settings.
         can_retry_with_fallback = (
             asr_config.fallback_on_oom
             and (
                 asr_config.device != asr_config.fallback_device
                 or asr_config.compute_type != asr_config.fallback_compute_type
-                or asr_config.model != asr_config.fallback_model
+                or model_name != fallback_model_name
+                or batch_size is not None
             )
         )
         if not can_retry_with_fallback:
@@ -106,42 +274,191 @@ def transcribe_audio(
             and not _is_probable_oom_error(exc)
         ):
             raise
-        raw_segments, info = _transcribe_and_collect(
+        # With a checkpoint the fallback resumes after the last committed segment.
+        # Batches stay on when moving to another device; on the same device the
+        # batch itself is the likely cause of the OOM.
+        if asr_config.device == asr_config.fallback_device:
+            batch_size = None
+        return _transcribe_and_collect(
             audio_path=audio_path,
-            model_name=asr_config.fallback_model,
+            model_name=fallback_model_name,
             device=asr_config.fallback_device,
             compute_type=asr_config.fallback_compute_type,
             asr_config=asr_config,
             on_segment_collected=on_segment_collected,
+            model_factory=model_factory,
+            qa_stats=qa_stats,
+            clip_timestamps=clip_timestamps,
+            load_seconds=load_seconds,
+            checkpoint=checkpoint,
+            batch_size=batch_size,
         )
 
-    segments: list[TranscriptSegment] = []
-    for segment in raw_segments:
-        words: list[WordTimestamp] = []
-        raw_words: list[Any] | None = getattr(segment, "words", None)
-        if raw_words:
-            for raw_word in raw_words:
-                words.append(
-                    WordTimestamp(
-                        word=str(raw_word.word),
-                        start=float(raw_word.start),
-                        end=float(raw_word.end),
-                        probability=float(raw_word.probability),
-                    )
+
+def _to_transcript_segment(segment: Any) -> TranscriptSegment:
+    words: list[WordTimestamp] = []
+    raw_words: list[Any] | None = getattr(segment, "words", None)
+    if raw_words:
+        for raw_word in raw_words:
+            words.append(
+                WordTimestamp(
+                    word=str(raw_word.word),
+                    start=float(raw_word.start),
+                    end=float(raw_word.end),
+                    probability=float(raw_word.probability),
                 )
-        segments.append(
-            TranscriptSegment(
-                id=int(segment.id),
-                start=float(segment.start),
-                end=float(segment.end),
-                text=str(segment.text).strip(),
-                words=words,
             )
+    return TranscriptSegment(
+        id=int(segment.id),
+        start=float(segment.start),
+        end=float(segment.end),
+        text=str(segment.text).strip(),
+        words=words,
+    )
+
+
+def _to_transcript_segments(raw_segments: list[Any]) -> list[TranscriptSegment]:
+    return [_to_transcript_segment(segment) for segment in raw_segments]
+
+
+def _transcribe_two_pass(
+    *,
+    audio_path: Path,
+    asr_config: ASRConfig,
+    on_segment_collected: Callable[[int], None] | None,
+    model_factory: WhisperModelFactory | None,
+    qa_stats: M1QAStats | None,
+    two_pass_stats: TwoPassStats | None,
+    checkpoint: ASRCheckpoint | None,
+) -> TranscriptDocument:
+    stats = two_pass_stats if two_pass_stats is not None else TwoPassStats()
+    stats.draft_model = asr_config.draft_model
+    stats.accurate_model = asr_config.model
+    stats.probability_threshold = asr_config.redecode_probability_threshold
+    stats.windows = []
+    stats.redecode_seconds = stats.accurate_load_seconds = 0.0
+    stats.redecode_error = None
+
+    draft_started = perf_counter()
+    with span("asr.draft", model=asr_config.draft_model):
+        # The draft pass falls back to the same draft model on the fallback device.
+        draft_raw, info = _collect_with_fallback(
+            audio_path=audio_path,
+            asr_config=asr_config,
+            model_name=asr_config.draft_model,
+            fallback_model_name=asr_config.draft_model,
+            on_segment_collected=on_segment_collected,
+            model_factory=model_factory,
+            checkpoint=checkpoint,
         )
+    stats.draft_seconds = perf_counter() - draft_started
+    stats.audio_seconds = float(getattr(info, "duration", 0.0))
+    segments = _to_transcript_segments(draft_raw)
+
+    windows = find_redecode_windows(
+        segments,
+        probability_threshold=asr_config.redecode_probability_threshold,
+        merge_gap_seconds=asr_config.redecode_merge_gap_seconds,
+    )
+    stats.windows = windows
+    if windows:
+        redecode_started = perf_counter()
+        load_seconds: list[float] = []
+        try:
+            with span(
+                "asr.redecode",
+                model=asr_config.model,
+                window_count=len(windows),
+                audio_seconds=stats.redecoded_seconds,
+            ):
+                accurate_raw, _ = _collect_with_fallback(
+                    audio_path=audio_path,
+                    asr_config=asr_config,
+                    model_name=asr_config.model,
+                    fallback_model_name=asr_config.fallback_model,
+                    model_factory=model_factory,
+                    clip_timestamps=[bound for window in windows for bound in window],
+                    load_seconds=load_seconds,
+                )
+            segments = splice_redecoded_segments(
+                segments, _to_transcript_segments(accurate_raw), windows
+            )
+        except Exception as exc:  # noqa: BLE001
+            # The draft transcript is complete; keep it when the accurate model
+            # cannot be loaded on this machine.
+            if not (asr_config.fallback_on_oom and _is_probable_oom_error(exc)):
+                raise
+            stats.redecode_error = f"{type(exc).__name__}: {exc}"
+        stats.redecode_seconds = perf_counter() - redecode_started
+        stats.accurate_load_seconds = load_seconds[-1] if load_seconds else 0.0
 
+    if qa_stats is not None:
+        qa_stats.reset()
+        for segment in segments:
+            qa_stats.add_segment(
+                start=segment.start,
+                end=segment.end,
+                text=segment.text,
+                probabilities=(word.probability for word in segment.words),
+            )
     return TranscriptDocument(
         language=str(info.language),
         language_probability=float(info.language_probability),
-        duration=float(getattr(info, "duration", 0.0)),
+        duration=stats.audio_seconds,
         segments=segments,
     )
+
+
+def transcribe_audio(
+    audio_path: Path,
+    asr_config: ASRConfig,
+    on_segment_collected: Callable[[int], None] | None = None,
+    model_factory: WhisperModelFactory | None = None,
+    qa_stats: M1QAStats | None = None,
+    two_pass_stats: TwoPassStats | None = None,
+    checkpoint_path: Path | None = None,
+) -> TranscriptDocument:
+    """Transcribe ``audio_path``; ``qa_stats`` is fed with every segment as it is decoded.
+
+    With ``asr.two_pass_enabled`` the draft model decodes the whole file and only
+    low-confidence windows are re-decoded with ``asr.model``; ``two_pass_stats``
+    receives the re-decoded fraction and timings.
+
+    With ``checkpoint_path`` every finalized segment is appended to a JSON-lines
+    checkpoint. The fallback attempt and a later run over the same audio resume after
+    the last committed segment instead of decoding from the start.
+
+    With ``asr.batched`` full-file decodes run ``asr.batch_size`` windows per forward
+    pass; an OOM on the same device retries sequentially.
+    """
+    checkpoint = (
+        ASRCheckpoint(checkpoint_path, audio_path=audio_path, asr_config=asr_config)
+        if checkpoint_path is not None
+        else None
+    )
+    if asr_config.two_pass_enabled:
+        return _transcribe_two_pass(
+            audio_path=audio_path,
+            asr_config=asr_config,
+            on_segment_collected=on_segment_collected,
+            model_factory=model_factory,
+            qa_stats=qa_stats,
+            two_pass_stats=two_pass_stats,
+            checkpoint=checkpoint,
+        )
+    raw_segments, info = _collect_with_fallback(
+        audio_path=audio_path,
+        asr_config=asr_config,
+        model_name=asr_config.model,
+        fallback_model_name=asr_config.fallback_model,
+        on_segment_collected=on_segment_collected,
+        model_factory=model_factory,
+        qa_stats=qa_stats,
+        checkpoint=checkpoint,
+    )
+    return TranscriptDocument(
+        language=str(info.language),
+        language_probability=float(info.language_probability),
+        duration=float(getattr(info, "duration", 0.0)),
+        segments=_to_transcript_segments(raw_segments),
+    )
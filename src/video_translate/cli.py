@@ -4,31 +4,34 @@ from pathlib import Path
 
 import typer
 
-from video_translate.config import load_config
-from video_translate.pipeline.m1 import run_m1_pipeline
-from video_translate.pipeline.full_run import run_full_dub_pipeline
-from video_translate.pipeline.m2_benchmark import run_m2_profile_benchmark
-from video_translate.pipeline.m2 import run_m2_pipeline
-from video_translate.pipeline.m2_prep import prepare_m2_translation_input
-from video_translate.pipeline.m3 import run_m3_pipeline
-from video_translate.pipeline.m3_benchmark import run_m3_profile_benchmark
-from video_translate.pipeline.m3_finalize import finalize_m3_profile_selection
-from video_translate.pipeline.m3_closure import run_m3_closure_workflow
-from video_translate.pipeline.m3_espeak_tune import run_m3_espeak_tuning_automation
-from video_translate.pipeline.m3_prep import prepare_m3_tts_input
-from video_translate.pipeline.m3_tuning_report import build_m3_tuning_report_markdown
-from video_translate.preflight import preflight_errors, run_preflight
-from video_translate.ui import run_ui_server
+from video_translate.config import AppConfig, load_config
+from video_translate.preflight import PREFLIGHT_CACHE_TTL_SECONDS, preflight_errors, run_preflight
 from video_translate.utils.subprocess_utils import CommandExecutionError
 
+# Command implementations are imported inside each command so `--help` and light
+# commands such as `doctor` do not pay for the full pipeline/UI import graph.
 app = typer.Typer(add_completion=False, no_args_is_help=True)
 
 
+def _preflight_cache_path(config: AppConfig) -> Path:
+    return config.pipeline.workspace_dir / ".cache" / "preflight.json"
+
+
 @app.command("doctor")
 def doctor(
     config_path: Path | None = typer.Option(
         None, "--config", help="Optional TOML config file to override defaults."
     ),
+    deep: bool = typer.Option(
+        False,
+        "--deep/--no-deep",
+        help="Also run each tool once with a version flag (result is cached).",
+    ),
+    use_cache: bool = typer.Option(
+        True,
+        "--cache/--no-cache",
+        help="Reuse a recent preflight result while PATH and tool binaries are unchanged.",
+    ),
 ) -> None:
     """Validate local environment dependencies for the pipeline."""
     config = load_config(config_path)
@@ -42,17 +45,28 @@ def doctor(
         piper_model_path=getattr(config.tts, "piper_model_path", None),
         check_translate_backend=True,
         check_tts_backend=True,
+        deep=deep,
+        cache_ttl_seconds=PREFLIGHT_CACHE_TTL_SECONDS if use_cache else None,
+        cache_path=_preflight_cache_path(config),
     )
     errors = preflight_errors(report)
 
     typer.echo(f"Python: {report.python_version}")
     typer.echo(f"yt-dlp: {report.yt_dlp.path or 'MISSING'}")
     typer.echo(f"ffmpeg: {report.ffmpeg.path or 'MISSING'}")
+    if deep:
+        for check in (report.yt_dlp, report.ffmpeg, report.espeak, report.piper):
+            if check is not None and check.path is not None:
+                typer.echo(f"{check.name} version: {check.version or 'NO RESPONSE'}")
     typer.echo(f"faster_whisper: {'OK' if report.faster_whisper_available else 'MISSING'}")
     if report.translate_backend == "transformers":
         typer.echo(f"transformers: {'OK' if report.transformers_available else 'MISSING'}")
         typer.echo(f"sentencepiece: {'OK' if report.sentencepiece_available else 'MISSING'}")
         typer.echo(f"torch: {'OK' if report.torch_available else 'MISSING'}")
+    if report.translate_backend == "ctranslate2":
+        typer.echo(f"ctranslate2: {'OK' if report.ctranslate2_available else 'MISSING'}")
+        typer.echo(f"transformers: {'OK' if report.transformers_available else 'MISSING'}")
+        typer.echo(f"sentencepiece: {'OK' if report.sentencepiece_available else 'MISSING'}")
     if report.tts_backend == "espeak":
         typer.echo(f"espeak: {report.espeak.path if report.espeak and report.espeak.path else 'MISSING'}")
     if report.tts_backend == "piper":
@@ -92,6 +106,8 @@ def prepare_m2(
     target_lang: str = typer.Option("tr", "--target-lang", help="Target translation language code."),
 ) -> None:
     """Prepare M2 translation input contract from M1 transcript."""
+    from video_translate.pipeline.m2_prep import prepare_m2_translation_input
+
     source_transcript = transcript_json
     if source_transcript is None:
         if run_root is None:
@@ -152,6 +168,8 @@ def prepare_m3(
     ),
 ) -> None:
     """Prepare M3 TTS input contract from M2 translation output."""
+    from video_translate.pipeline.m3_prep import prepare_m3_tts_input
+
     source_output = translation_output_json
     if source_output is None:
         if run_root is None:
@@ -200,8 +218,19 @@ def run_m1(
     workspace: Path | None = typer.Option(None, "--workspace", help="Run workspace directory."),
     run_id: str | None = typer.Option(None, "--run-id", help="Optional explicit run id."),
     emit_srt: bool = typer.Option(True, "--emit-srt/--no-emit-srt", help="Write SRT output."),
+    resume: bool = typer.Option(
+        False,
+        "--resume",
+        help="Continue an interrupted run (needs --run-id); ASR resumes from its checkpoint.",
+    ),
 ) -> None:
     """Run M1 pipeline: ingest + normalize + ASR."""
+    from video_translate.pipeline.m1 import run_m1_pipeline
+
+    if resume and not run_id:
+        typer.echo("--resume requires --run-id of the interrupted run.", err=True)
+        raise typer.Exit(code=2)
+
     try:
         config = load_config(config_path)
         preflight_report = run_preflight(
@@ -214,6 +243,8 @@ def run_m1(
             piper_model_path=getattr(config.tts, "piper_model_path", None),
             check_translate_backend=False,
             check_tts_backend=False,
+            cache_ttl_seconds=PREFLIGHT_CACHE_TTL_SECONDS,
+            cache_path=_preflight_cache_path(config),
         )
         errors = preflight_errors(preflight_report)
         if errors:
@@ -227,6 +258,7 @@ def run_m1(
             run_id=run_id,
             emit_srt=emit_srt,
             preflight_report=preflight_report,
+            resume=resume,
         )
     except FileExistsError as exc:
         typer.echo(f"Run directory already exists: {exc}", err=True)
@@ -291,6 +323,8 @@ def run_dub(
     ),
 ) -> None:
     """Run complete URL -> M1 -> M2 -> M3 dubbing flow with one command."""
+    from video_translate.pipeline.full_run import run_full_dub_pipeline
+
     try:
         config = load_config(config_path)
         artifacts = run_full_dub_pipeline(
@@ -359,8 +393,15 @@ def run_m2(
     config_path: Path | None = typer.Option(
         None, "--config", help="Optional TOML config file to override defaults."
     ),
+    incremental: bool = typer.Option(
+        False,
+        "--incremental/--no-incremental",
+        help="Reuse previous translation output for unchanged segments.",
+    ),
 ) -> None:
     """Run M2 pipeline: translation output + QA report."""
+    from video_translate.pipeline.m2 import run_m2_pipeline
+
     config = load_config(config_path)
     preflight_report = run_preflight(
         yt_dlp_bin=config.tools.yt_dlp,
@@ -372,6 +413,8 @@ def run_m2(
         piper_model_path=getattr(config.tts, "piper_model_path", None),
         check_translate_backend=True,
         check_tts_backend=False,
+        cache_ttl_seconds=PREFLIGHT_CACHE_TTL_SECONDS,
+        cache_path=_preflight_cache_path(config),
     )
     preflight_issue_list = preflight_errors(preflight_report)
     if preflight_issue_list:
@@ -420,6 +463,7 @@ def run_m2(
             run_manifest_json_path=resolved_manifest,
             config=config,
             target_language_override=resolved_target_lang,
+            incremental=incremental,
         )
     except FileNotFoundError as exc:
         typer.echo(str(exc), err=True)
@@ -460,8 +504,15 @@ def run_m3(
     config_path: Path | None = typer.Option(
         None, "--config", help="Optional TOML config file to override defaults."
     ),
+    incremental: bool = typer.Option(
+        False,
+        "--incremental/--no-incremental",
+        help="Re-synthesize only changed segments and patch the stitched preview in place.",
+    ),
 ) -> None:
     """Run M3 pipeline: local TTS segment synthesis + QA report."""
+    from video_translate.pipeline.m3 import run_m3_pipeline
+
     config = load_config(config_path)
     preflight_report = run_preflight(
         yt_dlp_bin=config.tools.yt_dlp,
@@ -473,6 +524,8 @@ def run_m3(
         piper_model_path=getattr(config.tts, "piper_model_path", None),
         check_translate_backend=False,
         check_tts_backend=True,
+        cache_ttl_seconds=PREFLIGHT_CACHE_TTL_SECONDS,
+        cache_path=_preflight_cache_path(config),
     )
     preflight_issue_list = preflight_errors(preflight_report)
     if preflight_issue_list:
@@ -512,6 +565,7 @@ def run_m3(
             qa_report_json_path=resolved_qa_report,
             run_manifest_json_path=resolved_manifest,
             config=config,
+            incremental=incremental,
         )
     except FileNotFoundError as exc:
         typer.echo(str(exc), err=True)
@@ -548,6 +602,8 @@ def benchmark_m2(
     ),
 ) -> None:
     """Benchmark multiple M2 profiles on the same translation input."""
+    from video_translate.pipeline.m2_benchmark import run_m2_profile_benchmark
+
     resolved_input = translation_input or (run_root / "output" / "translate" / "translation_input.en-tr.json")
     configs = config_path or [
         Path("configs/profiles/gtx1650_i5_12500h.toml"),
@@ -587,6 +643,8 @@ def benchmark_m3(
     ),
 ) -> None:
     """Benchmark multiple M3 profiles on the same TTS input."""
+    from video_translate.pipeline.m3_benchmark import run_m3_profile_benchmark
+
     resolved_input = tts_input or (run_root / "output" / "tts" / "tts_input.tr.json")
     configs = config_path or [
         Path("configs/profiles/gtx1650_i5_12500h.toml"),
@@ -611,6 +669,319 @@ def benchmark_m3(
     typer.echo(f"M3 benchmark report: {report_path}")
 
 
+@app.command("benchmark-m1")
+def benchmark_m1(
+    run_root: Path = typer.Option(
+        Path("runs/benchmarks/m1"),
+        "--run-root",
+        help="Directory that receives benchmarks/m1_profile_benchmark.json and traces.",
+    ),
+    audio_path: list[Path] = typer.Option(
+        [],
+        "--audio",
+        help="Audio fixture(s). Defaults to a synthesized speech-like WAV.",
+    ),
+    synthetic_seconds: float = typer.Option(
+        30.0,
+        "--synthetic-seconds",
+        help="Length of the synthesized fixture when no --audio is given.",
+    ),
+    config_path: list[Path] = typer.Option(
+        [],
+        "--config",
+        help="Config path(s). Use multiple --config entries to compare profiles.",
+    ),
+    fake_model: bool = typer.Option(
+        False,
+        "--fake-model/--real-model",
+        help="Use the deterministic synthetic WhisperModel (no model download, for CI).",
+    ),
+) -> None:
+    """Benchmark ASR model load, decode real-time factor and memory across M1 profiles."""
+    from video_translate.pipeline.m1_benchmark import (
+        SyntheticWhisperModel,
+        run_m1_profile_benchmark,
+        write_synthetic_speech_fixture,
+    )
+
+    configs = config_path or [
+        Path("configs/profiles/m1_small_cpu.toml"),
+        Path("configs/profiles/m1_small_cpu_batched.toml"),
+        Path("configs/profiles/m1_medium_cpu.toml"),
+        Path("configs/profiles/m1_medium_cpu_batched.toml"),
+    ]
+    try:
+        fixtures = audio_path or [
+            write_synthetic_speech_fixture(
+                run_root / "benchmarks" / "fixtures" / "synthetic_speech.wav",
+                seconds=synthetic_seconds,
+            )
+        ]
+        report_path = run_m1_profile_benchmark(
+            run_root=run_root,
+            audio_paths=fixtures,
+            config_paths=configs,
+            model_factory=SyntheticWhisperModel if fake_model else None,
+        )
+    except FileNotFoundError as exc:
+        typer.echo(str(exc), err=True)
+        raise typer.Exit(code=34) from exc
+    except ValueError as exc:
+        typer.echo(f"Invalid benchmark input: {exc}", err=True)
+        raise typer.Exit(code=35) from exc
+    except Exception as exc:  # noqa: BLE001
+        typer.echo(f"Unexpected benchmark failure: {exc}", err=True)
+        raise typer.Exit(code=1) from exc
+
+    typer.echo(f"M1 benchmark report: {report_path}")
+
+
+@app.command("autotune")
+def autotune(
+    run_root: Path = typer.Option(
+        Path("runs/benchmarks/autotune"),
+        "--run-root",
+        help="Directory that receives benchmarks/autotune_report.json and fixtures.",
+    ),
+    output_config: Path | None = typer.Option(
+        None,
+        "--output-config",
+        help="Generated profile path. Defaults to configs/profiles/autotune_<host>.toml.",
+    ),
+    config_path: Path | None = typer.Option(
+        None,
+        "--config",
+        help="Base config whose ASR model and MT/TTS backends are benchmarked.",
+    ),
+    fixture_seconds: float = typer.Option(
+        10.0,
+        "--fixture-seconds",
+        help="Length of the synthesized ASR fixture.",
+    ),
+    fake_model: bool = typer.Option(
+        False,
+        "--fake-model/--real-model",
+        help="Use the deterministic synthetic WhisperModel (no model download, for CI).",
+    ),
+) -> None:
+    """Probe cores/RAM, micro-benchmark ASR/MT/TTS and write a host-tuned profile."""
+    from video_translate.pipeline.autotune import run_autotune
+    from video_translate.pipeline.m1_benchmark import synthetic_whisper_factory
+
+    try:
+        artifacts = run_autotune(
+            run_root=run_root,
+            output_config_path=output_config,
+            config_path=config_path,
+            fixture_seconds=fixture_seconds,
+            model_factory=(
+                synthetic_whisper_factory(segment_seconds=0.01) if fake_model else None
+            ),
+        )
+    except FileNotFoundError as exc:
+        typer.echo(str(exc), err=True)
+        raise typer.Exit(code=39) from exc
+    except ValueError as exc:
+        typer.echo(f"Invalid autotune input: {exc}", err=True)
+        raise typer.Exit(code=40) from exc
+    except Exception as exc:  # noqa: BLE001
+        typer.echo(f"Unexpected autotune failure: {exc}", err=True)
+        raise typer.Exit(code=1) from exc
+
+    host = artifacts.host
+    typer.echo(f"Host: {host.hostname} ({host.usable_cores} usable cores)")
+    typer.echo(f"Tuned profile: {artifacts.profile_path}")
+    typer.echo(f"Autotune report: {artifacts.report_path}")
+
+
+@app.command("benchmark-e2e")
+def benchmark_e2e(
+    output_root: Path = typer.Option(
+        Path("runs/benchmarks/e2e"),
+        "--output-root",
+        help="Directory under the project root for media, runs, downloads and the report.",
+    ),
+    media_seconds: list[float] = typer.Option(
+        [],
+        "--seconds",
+        help="Synthetic video length(s). Use multiple --seconds entries for several lengths.",
+    ),
+    segment_period: list[float] = typer.Option(
+        [],
+        "--segment-period",
+        help="Seconds per synthetic speech burst; shorter periods mean more segments.",
+    ),
+    config_path: Path | None = typer.Option(
+        None,
+        "--config",
+        help="Base config; backends are replaced by mock ones for the benchmark.",
+    ),
+    ffmpeg_bin: str | None = typer.Option(None, "--ffmpeg", help="ffmpeg binary override."),
+    asr_load_seconds: float = typer.Option(0.0, "--asr-load-seconds"),
+    asr_segment_seconds: float = typer.Option(0.0, "--asr-segment-seconds"),
+    mt_item_seconds: float = typer.Option(0.0, "--mt-item-seconds"),
+    tts_item_seconds: float = typer.Option(0.0, "--tts-item-seconds"),
+    max_overhead_per_segment: float | None = typer.Option(
+        None,
+        "--max-overhead-per-segment",
+        help="Fail (exit 38) when orchestration seconds per segment exceed this in any case.",
+    ),
+) -> None:
+    """Benchmark end-to-end throughput of M1 -> M2 -> M3 -> delivery with mock backends."""
+    from video_translate.io import read_json
+    from video_translate.pipeline.e2e_benchmark import run_e2e_benchmark
+
+    try:
+        report_path = run_e2e_benchmark(
+            output_root=output_root,
+            media_seconds=media_seconds or [10.0, 30.0, 60.0],
+            segment_periods=segment_period or [2.0, 1.0],
+            base_config_path=config_path,
+            ffmpeg_bin=ffmpeg_bin,
+            asr_load_seconds=asr_load_seconds,
+            asr_segment_seconds=asr_segment_seconds,
+            mt_item_seconds=mt_item_seconds,
+            tts_item_seconds=tts_item_seconds,
+            max_orchestration_seconds_per_segment=max_overhead_per_segment,
+        )
+    except FileNotFoundError as exc:
+        typer.echo(str(exc), err=True)
+        raise typer.Exit(code=36) from exc
+    except ValueError as exc:
+        typer.echo(f"Invalid benchmark input: {exc}", err=True)
+        raise typer.Exit(code=37) from exc
+    except Exception as exc:  # noqa: BLE001
+        typer.echo(f"Unexpected benchmark failure: {exc}", err=True)
+        raise typer.Exit(code=1) from exc
+
+    typer.echo(f"E2E benchmark report: {report_path}")
+    report = read_json(report_path)
+    if not report["gate"]["passed"]:
+        typer.echo(
+            "E2E benchmark gate failed: "
+            f"worst {report['gate']['metric']}={report['gate']['worst_value']} "
+            f"(threshold {report['gate']['threshold']}), "
+            f"failed cases={report['summary']['failed_count']}.",
+            err=True,
+        )
+        raise typer.Exit(code=38)
+
+
+@app.command("benchmark-io")
+def benchmark_io(
+    output_json: Path = typer.Option(
+        Path("runs/benchmarks/io_benchmark.json"),
+        "--output-json",
+        help="Where to write the JSON I/O benchmark report.",
+    ),
+    segment_count: list[int] = typer.Option(
+        [],
+        "--segments",
+        help="Synthetic segment count(s). Use multiple --segments entries for several sizes.",
+    ),
+    repeats: int = typer.Option(3, "--repeats", help="Timing repeats per case (best run is kept)."),
+) -> None:
+    """Benchmark JSON encode/decode of contract documents for installed backends."""
+    from video_translate.pipeline.io_benchmark import run_json_io_benchmark
+
+    try:
+        report_path = run_json_io_benchmark(
+            output_json_path=output_json,
+            segment_counts=segment_count or None,
+            repeats=repeats,
+        )
+    except ValueError as exc:
+        typer.echo(f"Invalid benchmark input: {exc}", err=True)
+        raise typer.Exit(code=31) from exc
+    except Exception as exc:  # noqa: BLE001
+        typer.echo(f"Unexpected benchmark failure: {exc}", err=True)
+        raise typer.Exit(code=1) from exc
+
+    typer.echo(f"JSON I/O benchmark report: {report_path}")
+
+
+@app.command("benchmark-models")
+def benchmark_models(
+    output_json: Path = typer.Option(
+        Path("runs/benchmarks/model_memory_benchmark.json"),
+        "--output-json",
+        help="Where to write the contract model memory report.",
+    ),
+    instance_count: int = typer.Option(
+        20000,
+        "--instances",
+        help="Instances allocated per model when measuring memory.",
+    ),
+) -> None:
+    """Benchmark per-instance memory of transcript/translation/TTS contract models."""
+    from video_translate.pipeline.model_memory_benchmark import run_model_memory_benchmark
+
+    try:
+        report_path = run_model_memory_benchmark(
+            output_json_path=output_json,
+            instance_count=instance_count,
+        )
+    except ValueError as exc:
+        typer.echo(f"Invalid benchmark input: {exc}", err=True)
+        raise typer.Exit(code=32) from exc
+    except Exception as exc:  # noqa: BLE001
+        typer.echo(f"Unexpected benchmark failure: {exc}", err=True)
+        raise typer.Exit(code=1) from exc
+
+    typer.echo(f"Model memory benchmark report: {report_path}")
+
+
+@app.command("benchmark-startup")
+def benchmark_startup(
+    output_json: Path = typer.Option(
+        Path("runs/benchmarks/cli_startup_benchmark.json"),
+        "--output-json",
+        help="Where to write the CLI startup benchmark report.",
+    ),
+    repeats: int = typer.Option(5, "--repeats", help="Fresh-process runs per command."),
+) -> None:
+    """Benchmark CLI startup for --help, doctor and run-m2 in fresh processes."""
+    from video_translate.pipeline.startup_benchmark import run_cli_startup_benchmark
+
+    try:
+        report_path = run_cli_startup_benchmark(output_json_path=output_json, repeats=repeats)
+    except ValueError as exc:
+        typer.echo(f"Invalid benchmark input: {exc}", err=True)
+        raise typer.Exit(code=33) from exc
+    except Exception as exc:  # noqa: BLE001
+        typer.echo(f"Unexpected benchmark failure: {exc}", err=True)
+        raise typer.Exit(code=1) from exc
+
+    typer.echo(f"CLI startup benchmark report: {report_path}")
+
+
+@app.command("report-m1-qa")
+def report_m1_qa(
+    run_root: Path = typer.Option(..., "--run-root", help="Run root directory created by run-m1."),
+    output_json: Path | None = typer.Option(
+        None,
+        "--output-json",
+        help="Optional explicit QA report path. Defaults to the run's m1_qa_report.json.",
+    ),
+) -> None:
+    """Rebuild the M1 QA report from a run's transcript and word sidecar."""
+    from video_translate.pipeline.m1 import rebuild_m1_qa_report
+
+    try:
+        report_path = rebuild_m1_qa_report(run_root=run_root, output_json_path=output_json)
+    except FileNotFoundError as exc:
+        typer.echo(str(exc), err=True)
+        raise typer.Exit(code=45) from exc
+    except ValueError as exc:
+        typer.echo(f"Invalid M1 transcript: {exc}", err=True)
+        raise typer.Exit(code=46) from exc
+    except Exception as exc:  # noqa: BLE001
+        typer.echo(f"Unexpected M1 QA report failure: {exc}", err=True)
+        raise typer.Exit(code=1) from exc
+
+    typer.echo(f"M1 QA report: {report_path}")
+
+
 @app.command("report-m3-tuning")
 def report_m3_tuning(
     run_root: Path = typer.Option(..., "--run-root", help="Run root directory created by run-m1."),
@@ -626,6 +997,8 @@ def report_m3_tuning(
     ),
 ) -> None:
     """Generate M3 tuning markdown report from benchmark JSON."""
+    from video_translate.pipeline.m3_tuning_report import build_m3_tuning_report_markdown
+
     try:
         report_path = build_m3_tuning_report_markdown(
             run_root=run_root,
@@ -660,6 +1033,8 @@ def finalize_m3_profile(
     ),
 ) -> None:
     """Finalize M3 profile selection and lock the recommended config."""
+    from video_translate.pipeline.m3_finalize import finalize_m3_profile_selection
+
     try:
         artifacts = finalize_m3_profile_selection(
             run_root=run_root,
@@ -707,6 +1082,8 @@ def tune_m3_espeak(
     ),
 ) -> None:
     """Run automated espeak tuning: generate candidates, benchmark, report, and lock profile."""
+    from video_translate.pipeline.m3_espeak_tune import run_m3_espeak_tuning_automation
+
     resolved_tts_input = tts_input or (run_root / "output" / "tts" / "tts_input.tr.json")
     try:
         artifacts = run_m3_espeak_tuning_automation(
@@ -770,6 +1147,8 @@ def finish_m3(
     ),
 ) -> None:
     """Finish M3 workflow: prepare, optional espeak auto tuning, strict-gate final run."""
+    from video_translate.pipeline.m3_closure import run_m3_closure_workflow
+
     try:
         artifacts = run_m3_closure_workflow(
             run_root=run_root,
@@ -802,14 +1181,112 @@ def finish_m3(
     typer.echo(f"M3 closure report: {artifacts.closure_report_json}")
 
 
+@app.command("warmup")
+def warmup(
+    config_path: list[Path] = typer.Option(
+        [],
+        "--config",
+        help="Profile(s) whose models are warmed. Defaults to configs/default.toml.",
+    ),
+    output_json: Path = typer.Option(
+        Path("runs/benchmarks/warmup_report.json"),
+        "--output-json",
+        help="Where to write the cold vs warm latency report.",
+    ),
+    refresh: bool = typer.Option(
+        False,
+        "--refresh/--no-refresh",
+        help="Re-resolve models and record new checksums instead of verifying old ones.",
+    ),
+) -> None:
+    """Download, checksum and warm every model the profiles reference."""
+    from video_translate.pipeline.warmup import run_warmup
+
+    try:
+        artifacts = run_warmup(
+            config_paths=list(config_path) or [None],
+            output_json_path=output_json,
+            refresh=refresh,
+        )
+    except FileNotFoundError as exc:
+        typer.echo(str(exc), err=True)
+        raise typer.Exit(code=41) from exc
+    except Exception as exc:  # noqa: BLE001
+        typer.echo(f"Unexpected warmup failure: {exc}", err=True)
+        raise typer.Exit(code=1) from exc
+
+    for result in artifacts.results:
+        line = f"{result.reference.kind} {result.reference.name}: {result.status}"
+        if result.error:
+            line += f" ({result.error})"
+        typer.echo(line)
+    typer.echo(f"Model registry: {artifacts.registry_path}")
+    typer.echo(f"Warmup report: {artifacts.report_path}")
+    if not artifacts.ok:
+        raise typer.Exit(code=42)
+
+
 @app.command("ui")
 def ui(
     host: str = typer.Option("127.0.0.1", "--host", help="Bind address for local UI."),
     port: int = typer.Option(8765, "--port", help="Bind port for local UI."),
+    warmup_models: bool = typer.Option(
+        False,
+        "--warmup/--no-warmup",
+        help="Warm the profile models in the background while the UI starts.",
+    ),
+    warmup_config: list[Path] = typer.Option(
+        [],
+        "--warmup-config",
+        help="Profile(s) to warm with --warmup. Defaults to configs/default.toml.",
+    ),
 ) -> None:
     """Run local UI for end-to-end dubbing workflow operations."""
+    from video_translate.ui import run_ui_server
+
     typer.echo(f"Video Translate UI starting at: http://{host}:{port}")
-    run_ui_server(host, port)
+    run_ui_server(
+        host,
+        port,
+        warmup_config_paths=(list(warmup_config) or [None]) if warmup_models else None,
+    )
+
+
+@app.command("translate-server")
+def translate_server(
+    config_path: Path | None = typer.Option(
+        None,
+        "--config",
+        help="Config whose [translate] backend the server runs. Defaults to configs/default.toml.",
+    ),
+    host: str | None = typer.Option(
+        None, "--host", help="Bind address. Defaults to the host of translate.service.url."
+    ),
+    port: int | None = typer.Option(
+        None, "--port", help="Bind port. Defaults to the port of translate.service.url."
+    ),
+) -> None:
+    """Serve translation to backend = "service" clients with one resident model."""
+    from urllib.parse import urlparse
+
+    from video_translate.translate.service import run_translation_service
+
+    try:
+        config = load_config(config_path)
+        service_url = urlparse(config.translate.service.url)
+        bind_host = host or service_url.hostname or "127.0.0.1"
+        bind_port = port or service_url.port or 8766
+        typer.echo(
+            f"Translation service ({config.translate.backend}) starting at: "
+            f"http://{bind_host}:{bind_port}"
+        )
+        run_translation_service(config.translate, host=bind_host, port=bind_port)
+    except FileNotFoundError as exc:
+        typer.echo(str(exc), err=True)
+        raise typer.Exit(code=43) from exc
+    except ValueError as exc:
+        typer.echo(f"Invalid translation service config: {exc}", err=True)
+        raise typer.Exit(code=44) from exc
 
 
 def main() -> None:
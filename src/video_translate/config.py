@@ -1,10 +1,17 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import os
+import threading
+import time
+import tomllib
+from collections import OrderedDict
+from dataclasses import dataclass, fields, is_dataclass, replace
 from pathlib import Path, PureWindowsPath
 from typing import Any
 
-import tomllib
+# Files modified this recently are re-read even when (mtime, size) match, because a
+# same-size rewrite within the filesystem timestamp granularity would look unchanged.
+_RACY_MTIME_WINDOW_SECONDS = 2.0
 
 
 @dataclass(frozen=True)
@@ -19,6 +26,13 @@ class PipelineConfig:
     audio_sample_rate: int
     audio_channels: int
     audio_codec: str
+    compact_json: bool = False
+    word_timestamp_sidecar: bool = False
+    ingest_mode: str = "single"
+    ingest_concurrent_fragments: int = 1
+    trace_format: str = "jsonl"
+    # Host profile written by ``autotune``, layered between default.toml and the override.
+    tuned_profile: Path | None = None
 
 
 @dataclass(frozen=True)
@@ -34,6 +48,25 @@ class ASRConfig:
     fallback_model: str
     fallback_device: str
     fallback_compute_type: str
+    # Two-tier mode: draft_model decodes everything, ``model`` re-decodes the windows
+    # whose mean word probability is below redecode_probability_threshold.
+    two_pass_enabled: bool = False
+    draft_model: str = "base"
+    redecode_probability_threshold: float = 0.6
+    redecode_merge_gap_seconds: float = 1.0
+    # Energy VAD pre-pass: ASR only reads speech regions of the normalized WAV.
+    energy_vad_enabled: bool = False
+    energy_vad_threshold_db: float = -45.0
+    energy_vad_hangover_seconds: float = 0.3
+    energy_vad_padding_seconds: float = 0.2
+    energy_vad_min_silence_seconds: float = 1.0
+    # Batched mode decodes batch_size 30 s windows per forward pass
+    # (faster-whisper BatchedInferencePipeline).
+    batched: bool = False
+    batch_size: int = 8
+    # CTranslate2 threading; cpu_threads = 0 keeps the library default.
+    cpu_threads: int = 0
+    num_workers: int = 1
 
 
 @dataclass(frozen=True)
@@ -45,6 +78,33 @@ class TranslateTransformersConfig:
     target_lang_code: str | None
 
 
+@dataclass(frozen=True)
+class TranslateCTranslate2Config:
+    model_id: str = "Helsinki-NLP/opus-mt-en-tr"
+    device: str = "cpu"
+    compute_type: str = "int8"
+    # Converted models are cached under cache_dir, keyed by model id and compute type.
+    cache_dir: Path = Path("runs/.cache/ctranslate2")
+    beam_size: int = 2
+    max_decoding_length: int = 256
+    # Token budget per batch (padded length x rows); 0 batches by translate.batch_size.
+    max_batch_tokens: int = 2048
+    cpu_threads: int = 0
+    source_lang_code: str | None = None
+    target_lang_code: str | None = None
+
+
+@dataclass(frozen=True)
+class TranslateServiceConfig:
+    # Client side: where backend = "service" sends requests.
+    url: str = "http://127.0.0.1:8766"
+    timeout_seconds: float = 600.0
+    # Server side: texts from concurrent jobs are coalesced into batches of up to
+    # max_batch_size, waiting at most max_wait_seconds for a batch to fill.
+    max_batch_size: int = 32
+    max_wait_seconds: float = 0.05
+
+
 @dataclass(frozen=True)
 class TranslateConfig:
     backend: str
@@ -63,6 +123,20 @@ class TranslateConfig:
     qa_fail_on_flags: bool
     qa_allowed_flags: tuple[str, ...]
     transformers: TranslateTransformersConfig
+    mock_item_latency_seconds: float = 0.0
+    ctranslate2: TranslateCTranslate2Config = TranslateCTranslate2Config()
+    service: TranslateServiceConfig = TranslateServiceConfig()
+    # Merge fragment segments into sentence units before MT and split the result back.
+    sentence_merge_enabled: bool = False
+    sentence_merge_max_gap_seconds: float = 0.6
+    sentence_merge_max_segments: int = 4
+    sentence_merge_max_words: int = 40
+    # Fit each translation to its segment duration; chars_per_second = 0 derives the rate
+    # from the TTS voice. candidates > 1 picks the best of n beam hypotheses.
+    length_control_enabled: bool = False
+    length_control_chars_per_second: float = 0.0
+    length_control_tolerance: float = 1.1
+    length_control_candidates: int = 1
 
 
 @dataclass(frozen=True)
@@ -92,6 +166,8 @@ class TTSConfig:
     piper_length_scale: float = 1.0
     piper_noise_scale: float = 0.667
     piper_noise_w: float = 0.8
+    piper_persistent_worker: bool = False
+    mock_item_latency_seconds: float = 0.0
 
 
 @dataclass(frozen=True)
@@ -184,21 +260,172 @@ def _read_toml(path: Path) -> dict[str, Any]:
     return data
 
 
-def load_config(config_path: Path | None = None) -> AppConfig:
+_LayerKey = tuple[str, int, int]
+# Caches keep only the newest version of each file (or file stack), and at most
+# _MAX_CACHED_CONFIGS entries, so a long-lived UI server that sees many profile edits
+# does not grow them without bound.
+_MAX_CACHED_CONFIGS = 32
+_TOML_LAYER_CACHE: OrderedDict[str, tuple[_LayerKey, dict[str, Any]]] = OrderedDict()
+_APP_CONFIG_CACHE: OrderedDict[tuple[str, ...], tuple[tuple[_LayerKey, ...], AppConfig]] = (
+    OrderedDict()
+)
+_INTERNED_CONFIGS: OrderedDict[AppConfig, AppConfig] = OrderedDict()
+_CONFIG_CACHE_LOCK = threading.Lock()
+
+
+def _evict_oldest(cache: OrderedDict[Any, Any]) -> None:
+    # Callers hold _CONFIG_CACHE_LOCK and move fresh entries to the end.
+    while len(cache) > _MAX_CACHED_CONFIGS:
+        cache.popitem(last=False)
+
+
+def clear_config_cache() -> None:
+    with _CONFIG_CACHE_LOCK:
+        _TOML_LAYER_CACHE.clear()
+        _APP_CONFIG_CACHE.clear()
+        _INTERNED_CONFIGS.clear()
+
+
+def _layer_key(path: Path) -> _LayerKey | None:
+    stat = os.stat(path)
+    if time.time() - stat.st_mtime < _RACY_MTIME_WINDOW_SECONDS:
+        return None
+    return (str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+
+
+def _read_toml_layer(path: Path) -> tuple[dict[str, Any], _LayerKey | None]:
+    # Cached tables are shared; callers must treat them as read-only (_deep_merge copies).
+    key = _layer_key(path)
+    if key is not None:
+        with _CONFIG_CACHE_LOCK:
+            cached = _TOML_LAYER_CACHE.get(key[0])
+        if cached is not None and cached[0] == key:
+            return cached[1], key
+    data = _read_toml(path)
+    if key is not None:
+        with _CONFIG_CACHE_LOCK:
+            _TOML_LAYER_CACHE[key[0]] = (key, data)
+            _TOML_LAYER_CACHE.move_to_end(key[0])
+            _evict_oldest(_TOML_LAYER_CACHE)
+    return data, key
+
+
+def _intern_config(config: AppConfig) -> AppConfig:
+    with _CONFIG_CACHE_LOCK:
+        interned = _INTERNED_CONFIGS.setdefault(config, config)
+        _INTERNED_CONFIGS.move_to_end(interned)
+        _evict_oldest(_INTERNED_CONFIGS)
+        return interned
+
+
+def _tuned_profile_path(data: dict[str, Any], root: Path) -> Path | None:
+    raw = data.get("pipeline", {}).get("tuned_profile", None)
+    text = str(raw).strip() if raw is not None else ""
+    if not text:
+        return None
+    path = Path(text)
+    return path if path.is_absolute() else root / path
+
+
+def load_config(
+    config_path: Path | None = None,
+    *,
+    tuned_profile_path: Path | None = None,
+) -> AppConfig:
+    """Load default.toml merged with an optional override into a validated AppConfig.
+
+    A host profile written by ``autotune`` (``tuned_profile_path``, or
+    ``pipeline.tuned_profile`` in either file) is layered between the defaults and the
+    override, so explicit override values still win.
+
+    Parsed TOML layers are cached by (path, mtime, size) and validated configs are
+    interned, so repeated loads of unchanged files return the same object.
+    """
     root = Path(__file__).resolve().parents[2]
     default_path = root / "configs" / "default.toml"
-    data = _read_toml(default_path)
+    default_data, default_key = _read_toml_layer(default_path)
+    layer_keys: list[_LayerKey | None] = [default_key]
 
+    override: dict[str, Any] = {}
+    override_key: _LayerKey | None = None
+    if config_path is not None:
+        override, override_key = _read_toml_layer(config_path)
+    if tuned_profile_path is None:
+        tuned_profile_path = _tuned_profile_path(_deep_merge(default_data, override), root)
+
+    data = default_data
+    if tuned_profile_path is not None:
+        if not tuned_profile_path.exists():
+            raise ValueError(
+                f"Config field 'pipeline.tuned_profile' points to a missing file: "
+                f"{tuned_profile_path}"
+            )
+        tuned, tuned_key = _read_toml_layer(tuned_profile_path)
+        data = _deep_merge(data, tuned)
+        layer_keys.append(tuned_key)
     if config_path is not None:
-        override = _read_toml(config_path)
         data = _deep_merge(data, override)
+        layer_keys.append(override_key)
+    if tuned_profile_path is not None:
+        # Record the layer actually applied, also when it came from the argument.
+        data = _deep_merge(data, {"pipeline": {"tuned_profile": str(tuned_profile_path)}})
+
+    cache_key: tuple[_LayerKey, ...] | None = None
+    if all(key is not None for key in layer_keys):
+        cache_key = tuple(key for key in layer_keys if key is not None)
+        with _CONFIG_CACHE_LOCK:
+            cached = _APP_CONFIG_CACHE.get(tuple(key[0] for key in cache_key))
+        if cached is not None and cached[0] == cache_key:
+            return cached[1]
+
+    config = _intern_config(_build_app_config(data, root))
+    if cache_key is not None:
+        layer_paths = tuple(key[0] for key in cache_key)
+        with _CONFIG_CACHE_LOCK:
+            _APP_CONFIG_CACHE[layer_paths] = (cache_key, config)
+            _APP_CONFIG_CACHE.move_to_end(layer_paths)
+            _evict_oldest(_APP_CONFIG_CACHE)
+    return config
+
+
+def _derive_section(section: Any, overrides: dict[str, Any], prefix: str) -> Any:
+    known = {field.name for field in fields(section)}
+    changes: dict[str, Any] = {}
+    for name, value in overrides.items():
+        if name not in known:
+            raise ValueError(f"Unknown config field '{prefix}.{name}'.")
+        current = getattr(section, name)
+        if isinstance(value, dict) and is_dataclass(current):
+            value = _derive_section(current, value, f"{prefix}.{name}")
+        changes[name] = value
+    return replace(section, **changes)
+
+
+def derive_config(config: AppConfig, **section_overrides: dict[str, Any]) -> AppConfig:
+    """Return an interned variant of ``config`` with per-section field overrides.
+
+    Example: ``derive_config(config, tts={"qa_fail_on_flags": True})``. No disk access
+    or re-validation happens; override values must already have the field's type.
+    """
+    changes: dict[str, Any] = {}
+    for section_name, overrides in section_overrides.items():
+        if not hasattr(config, section_name):
+            raise ValueError(f"Unknown config section '{section_name}'.")
+        changes[section_name] = _derive_section(
+            getattr(config, section_name), overrides, section_name
+        )
+    return _intern_config(replace(config, **changes))
+
 
+def _build_app_config(data: dict[str, Any], root: Path) -> AppConfig:
     tools_table = data.get("tools", {})
     pipeline_table = data.get("pipeline", {})
     asr_table = data.get("asr", {})
     translate_table = data.get("translate", {})
     tts_table = data.get("tts", {})
     translate_transformers_table = translate_table.get("transformers", {})
+    translate_ctranslate2_table = translate_table.get("ctranslate2", {})
+    translate_service_table = translate_table.get("service", {})
 
     yt_dlp = _required_non_empty_str(tools_table.get("yt_dlp", "yt-dlp"), "tools.yt_dlp")
     ffmpeg = _required_non_empty_str(tools_table.get("ffmpeg", "ffmpeg"), "tools.ffmpeg")
@@ -214,6 +441,23 @@ def load_config(config_path: Path | None = None) -> AppConfig:
     audio_codec = _required_non_empty_str(
         pipeline_table.get("audio_codec", "pcm_s16le"), "pipeline.audio_codec"
     )
+    compact_json = bool(pipeline_table.get("compact_json", False))
+    word_timestamp_sidecar = bool(pipeline_table.get("word_timestamp_sidecar", False))
+    ingest_mode = _required_non_empty_str(
+        pipeline_table.get("ingest_mode", "single"), "pipeline.ingest_mode"
+    ).lower()
+    if ingest_mode not in {"single", "split"}:
+        raise ValueError("Config field 'pipeline.ingest_mode' must be one of: single, split.")
+    ingest_concurrent_fragments = _required_positive_int(
+        pipeline_table.get("ingest_concurrent_fragments", 1),
+        "pipeline.ingest_concurrent_fragments",
+    )
+    trace_format = _required_non_empty_str(
+        pipeline_table.get("trace_format", "jsonl"), "pipeline.trace_format"
+    ).lower()
+    if trace_format not in {"off", "jsonl", "chrome"}:
+        raise ValueError("Config field 'pipeline.trace_format' must be one of: off, jsonl, chrome.")
+    tuned_profile = _tuned_profile_path(data, root)
     asr_model = _required_non_empty_str(asr_table.get("model", "medium"), "asr.model")
     asr_device = _required_non_empty_str(asr_table.get("device", "auto"), "asr.device")
     compute_type = _required_non_empty_str(
@@ -230,6 +474,37 @@ def load_config(config_path: Path | None = None) -> AppConfig:
     fallback_compute_type = _required_non_empty_str(
         asr_table.get("fallback_compute_type", "int8"), "asr.fallback_compute_type"
     )
+    draft_model = _required_non_empty_str(asr_table.get("draft_model", "base"), "asr.draft_model")
+    redecode_probability_threshold = _required_positive_float(
+        asr_table.get("redecode_probability_threshold", 0.6),
+        "asr.redecode_probability_threshold",
+    )
+    if redecode_probability_threshold > 1.0:
+        raise ValueError("Config field 'asr.redecode_probability_threshold' must be <= 1.")
+    redecode_merge_gap_seconds = _required_non_negative_float(
+        asr_table.get("redecode_merge_gap_seconds", 1.0),
+        "asr.redecode_merge_gap_seconds",
+    )
+    energy_vad_threshold_db = float(asr_table.get("energy_vad_threshold_db", -45.0))
+    if energy_vad_threshold_db >= 0.0:
+        raise ValueError("Config field 'asr.energy_vad_threshold_db' must be < 0 (dBFS).")
+    energy_vad_hangover_seconds = _required_non_negative_float(
+        asr_table.get("energy_vad_hangover_seconds", 0.3),
+        "asr.energy_vad_hangover_seconds",
+    )
+    energy_vad_padding_seconds = _required_non_negative_float(
+        asr_table.get("energy_vad_padding_seconds", 0.2),
+        "asr.energy_vad_padding_seconds",
+    )
+    energy_vad_min_silence_seconds = _required_non_negative_float(
+        asr_table.get("energy_vad_min_silence_seconds", 1.0),
+        "asr.energy_vad_min_silence_seconds",
+    )
+    asr_batch_size = _required_positive_int(asr_table.get("batch_size", 8), "asr.batch_size")
+    asr_cpu_threads = _required_non_negative_int(
+        asr_table.get("cpu_threads", 0), "asr.cpu_threads"
+    )
+    asr_num_workers = _required_positive_int(asr_table.get("num_workers", 1), "asr.num_workers")
     translate_backend = _required_non_empty_str(
         translate_table.get("backend", "mock"), "translate.backend"
     )
@@ -275,6 +550,71 @@ def load_config(config_path: Path | None = None) -> AppConfig:
         if target_lang_code_raw is not None
         else None
     )
+    # Unset ctranslate2 fields follow the transformers table, so switching the backend of a
+    # profile compares the same model.
+    ctranslate2_model_id = _required_non_empty_str(
+        translate_ctranslate2_table.get("model_id", transformers_model_id),
+        "translate.ctranslate2.model_id",
+    )
+    ctranslate2_device = _required_non_empty_str(
+        translate_ctranslate2_table.get("device", "cpu"), "translate.ctranslate2.device"
+    )
+    if ctranslate2_device not in {"cpu", "cuda", "auto"}:
+        raise ValueError(
+            "Config field 'translate.ctranslate2.device' must be one of: cpu, cuda, auto."
+        )
+    ctranslate2_compute_type = _required_non_empty_str(
+        translate_ctranslate2_table.get("compute_type", "int8"),
+        "translate.ctranslate2.compute_type",
+    )
+    ctranslate2_cache_text = str(translate_ctranslate2_table.get("cache_dir", "")).strip()
+    ctranslate2_cache_dir = (
+        Path(ctranslate2_cache_text)
+        if ctranslate2_cache_text
+        else Path(workspace_dir) / ".cache" / "ctranslate2"
+    )
+    ctranslate2_beam_size = _required_positive_int(
+        translate_ctranslate2_table.get("beam_size", 2), "translate.ctranslate2.beam_size"
+    )
+    ctranslate2_max_decoding_length = _required_positive_int(
+        translate_ctranslate2_table.get("max_decoding_length", transformers_max_new_tokens),
+        "translate.ctranslate2.max_decoding_length",
+    )
+    ctranslate2_max_batch_tokens = _required_non_negative_int(
+        translate_ctranslate2_table.get("max_batch_tokens", 2048),
+        "translate.ctranslate2.max_batch_tokens",
+    )
+    ctranslate2_cpu_threads = _required_non_negative_int(
+        translate_ctranslate2_table.get("cpu_threads", 0), "translate.ctranslate2.cpu_threads"
+    )
+    ctranslate2_source_raw = translate_ctranslate2_table.get("source_lang_code", source_lang_code)
+    ctranslate2_target_raw = translate_ctranslate2_table.get("target_lang_code", target_lang_code)
+    ctranslate2_source_lang_code = (
+        _required_non_empty_str(ctranslate2_source_raw, "translate.ctranslate2.source_lang_code")
+        if ctranslate2_source_raw is not None
+        else None
+    )
+    ctranslate2_target_lang_code = (
+        _required_non_empty_str(ctranslate2_target_raw, "translate.ctranslate2.target_lang_code")
+        if ctranslate2_target_raw is not None
+        else None
+    )
+    service_url = _required_non_empty_str(
+        translate_service_table.get("url", "http://127.0.0.1:8766"), "translate.service.url"
+    )
+    if not service_url.startswith(("http://", "https://")):
+        raise ValueError("Config field 'translate.service.url' must be an http(s) URL.")
+    service_timeout_seconds = _required_positive_float(
+        translate_service_table.get("timeout_seconds", 600.0),
+        "translate.service.timeout_seconds",
+    )
+    service_max_batch_size = _required_positive_int(
+        translate_service_table.get("max_batch_size", 32), "translate.service.max_batch_size"
+    )
+    service_max_wait_seconds = _required_non_negative_float(
+        translate_service_table.get("max_wait_seconds", 0.05),
+        "translate.service.max_wait_seconds",
+    )
     glossary_raw = translate_table.get("glossary_path", None)
     glossary_path: Path | None
     if glossary_raw is None:
@@ -305,6 +645,36 @@ def load_config(config_path: Path | None = None) -> AppConfig:
         translate_table.get("qa_allowed_flags", []),
         "translate.qa_allowed_flags",
     )
+    translate_mock_item_latency_seconds = _required_non_negative_float(
+        translate_table.get("mock_item_latency_seconds", 0.0),
+        "translate.mock_item_latency_seconds",
+    )
+    sentence_merge_enabled = bool(translate_table.get("sentence_merge_enabled", False))
+    sentence_merge_max_gap_seconds = _required_non_negative_float(
+        translate_table.get("sentence_merge_max_gap_seconds", 0.6),
+        "translate.sentence_merge_max_gap_seconds",
+    )
+    sentence_merge_max_segments = _required_positive_int(
+        translate_table.get("sentence_merge_max_segments", 4),
+        "translate.sentence_merge_max_segments",
+    )
+    sentence_merge_max_words = _required_positive_int(
+        translate_table.get("sentence_merge_max_words", 40),
+        "translate.sentence_merge_max_words",
+    )
+    length_control_enabled = bool(translate_table.get("length_control_enabled", False))
+    length_control_chars_per_second = _required_non_negative_float(
+        translate_table.get("length_control_chars_per_second", 0.0),
+        "translate.length_control_chars_per_second",
+    )
+    length_control_tolerance = _required_positive_float(
+        translate_table.get("length_control_tolerance", 1.1),
+        "translate.length_control_tolerance",
+    )
+    length_control_candidates = _required_positive_int(
+        translate_table.get("length_control_candidates", 1),
+        "translate.length_control_candidates",
+    )
     tts_backend = _required_non_empty_str(tts_table.get("backend", "mock"), "tts.backend")
     if tts_backend not in {"mock", "espeak", "piper"}:
         raise ValueError(
@@ -319,6 +689,10 @@ def load_config(config_path: Path | None = None) -> AppConfig:
         tts_table.get("mock_base_tone_hz", 220),
         "tts.mock_base_tone_hz",
     )
+    tts_mock_item_latency_seconds = _required_non_negative_float(
+        tts_table.get("mock_item_latency_seconds", 0.0),
+        "tts.mock_item_latency_seconds",
+    )
     tts_espeak_bin = _required_non_empty_str(tts_table.get("espeak_bin", "espeak"), "tts.espeak_bin")
     tts_espeak_bin = _resolve_binary_command(tts_espeak_bin, root)
     tts_espeak_voice = _required_non_empty_str(tts_table.get("espeak_voice", "tr"), "tts.espeak_voice")
@@ -418,6 +792,7 @@ def load_config(config_path: Path | None = None) -> AppConfig:
         tts_table.get("piper_noise_w", 0.8),
         "tts.piper_noise_w",
     )
+    tts_piper_persistent_worker = bool(tts_table.get("piper_persistent_worker", False))
 
     return AppConfig(
         tools=ToolConfig(
@@ -429,6 +804,12 @@ def load_config(config_path: Path | None = None) -> AppConfig:
             audio_sample_rate=audio_sample_rate,
             audio_channels=audio_channels,
             audio_codec=audio_codec,
+            compact_json=compact_json,
+            word_timestamp_sidecar=word_timestamp_sidecar,
+            ingest_mode=ingest_mode,
+            ingest_concurrent_fragments=ingest_concurrent_fragments,
+            trace_format=trace_format,
+            tuned_profile=tuned_profile,
         ),
         asr=ASRConfig(
             model=asr_model,
@@ -442,6 +823,19 @@ def load_config(config_path: Path | None = None) -> AppConfig:
             fallback_model=fallback_model,
             fallback_device=fallback_device,
             fallback_compute_type=fallback_compute_type,
+            two_pass_enabled=bool(asr_table.get("two_pass_enabled", False)),
+            draft_model=draft_model,
+            redecode_probability_threshold=redecode_probability_threshold,
+            redecode_merge_gap_seconds=redecode_merge_gap_seconds,
+            energy_vad_enabled=bool(asr_table.get("energy_vad_enabled", False)),
+            energy_vad_threshold_db=energy_vad_threshold_db,
+            energy_vad_hangover_seconds=energy_vad_hangover_seconds,
+            energy_vad_padding_seconds=energy_vad_padding_seconds,
+            energy_vad_min_silence_seconds=energy_vad_min_silence_seconds,
+            batched=bool(asr_table.get("batched", False)),
+            batch_size=asr_batch_size,
+            cpu_threads=asr_cpu_threads,
+            num_workers=asr_num_workers,
         ),
         translate=TranslateConfig(
             backend=translate_backend,
@@ -466,6 +860,33 @@ def load_config(config_path: Path | None = None) -> AppConfig:
                 source_lang_code=source_lang_code,
                 target_lang_code=target_lang_code,
             ),
+            mock_item_latency_seconds=translate_mock_item_latency_seconds,
+            ctranslate2=TranslateCTranslate2Config(
+                model_id=ctranslate2_model_id,
+                device=ctranslate2_device,
+                compute_type=ctranslate2_compute_type,
+                cache_dir=ctranslate2_cache_dir,
+                beam_size=ctranslate2_beam_size,
+                max_decoding_length=ctranslate2_max_decoding_length,
+                max_batch_tokens=ctranslate2_max_batch_tokens,
+                cpu_threads=ctranslate2_cpu_threads,
+                source_lang_code=ctranslate2_source_lang_code,
+                target_lang_code=ctranslate2_target_lang_code,
+            ),
+            service=TranslateServiceConfig(
+                url=service_url.rstrip("/"),
+                timeout_seconds=service_timeout_seconds,
+                max_batch_size=service_max_batch_size,
+                max_wait_seconds=service_max_wait_seconds,
+            ),
+            sentence_merge_enabled=sentence_merge_enabled,
+            sentence_merge_max_gap_seconds=sentence_merge_max_gap_seconds,
+            sentence_merge_max_segments=sentence_merge_max_segments,
+            sentence_merge_max_words=sentence_merge_max_words,
+            length_control_enabled=length_control_enabled,
+            length_control_chars_per_second=length_control_chars_per_second,
+            length_control_tolerance=length_control_tolerance,
+            length_control_candidates=length_control_candidates,
         ),
         tts=TTSConfig(
             backend=tts_backend,
@@ -493,5 +914,7 @@ def load_config(config_path: Path | None = None) -> AppConfig:
             piper_length_scale=tts_piper_length_scale,
             piper_noise_scale=tts_piper_noise_scale,
             piper_noise_w=tts_piper_noise_w,
+            piper_persistent_worker=tts_piper_persistent_worker,
+            mock_item_latency_seconds=tts_mock_item_latency_seconds,
         ),
     )
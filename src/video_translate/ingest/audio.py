@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 from video_translate.utils.subprocess_utils import run_command
@@ -39,15 +40,19 @@ def normalize_audio_for_asr(
     timeout_seconds: float | None = 3600.0,
 ) -> Path:
     output_wav.parent.mkdir(parents=True, exist_ok=True)
+    # Write under a temporary name so an existing output_wav is always complete;
+    # resumed runs reuse it.
+    partial_wav = output_wav.with_name(f"{output_wav.stem}.partial{output_wav.suffix}")
     command = build_ffmpeg_normalize_command(
         ffmpeg_bin=ffmpeg_bin,
         input_media=input_media,
-        output_wav=output_wav,
+        output_wav=partial_wav,
         sample_rate=sample_rate,
         channels=channels,
         codec=codec,
     )
-    run_command(command, timeout_seconds=timeout_seconds)
-    if not output_wav.exists():
+    run_command(command, timeout_seconds=timeout_seconds, binary=True)
+    if not partial_wav.exists():
         raise FileNotFoundError(f"Expected normalized audio was not created: {output_wav}")
+    os.replace(partial_wav, output_wav)
     return output_wav
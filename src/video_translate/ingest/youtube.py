@@ -1,46 +1,138 @@
 from __future__ import annotations
 
+import subprocess
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import suppress
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any
 
 from video_translate.models import DownloadResult
 from video_translate.utils.subprocess_utils import run_command
 
+AUDIO_ONLY_FORMAT = "bestaudio/best"
+VIDEO_ONLY_FORMAT = "bestvideo/best"
+
+
+class _ChildProcessSlot:
+    """Holds the background yt-dlp process so another thread can stop it."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._process: subprocess.Popen[Any] | None = None
+        self._cancelled = False
+
+    def attach(self, process: subprocess.Popen[Any]) -> None:
+        with self._lock:
+            self._process = process
+            cancelled = self._cancelled
+        if cancelled:
+            process.terminate()
+
+    def terminate(self) -> None:
+        with self._lock:
+            self._cancelled = True
+            process = self._process
+        if process is not None and process.poll() is None:
+            process.terminate()
+
+
+@dataclass(frozen=True)
+class SplitDownload:
+    audio: DownloadResult
+    video: Future[Path]
+    _video_process: _ChildProcessSlot = field(
+        default_factory=_ChildProcessSlot, repr=False, compare=False
+    )
+
+    def cancel(self, timeout_seconds: float = 10.0) -> None:
+        """Stop the background video download and wait for its thread to exit."""
+        if self.video.cancel():
+            return
+        self._video_process.terminate()
+        # A terminated download fails by design; only its thread exit matters here.
+        with suppress(Exception):
+            self.video.result(timeout=timeout_seconds)
 
-def build_yt_dlp_command(yt_dlp_bin: str, url: str, output_template: Path) -> list[str]:
-    return [
-        yt_dlp_bin,
-        "--no-playlist",
-        "--no-progress",
-        "--write-info-json",
-        "--output",
-        str(output_template),
-        url,
-    ]
+
+def build_yt_dlp_command(
+    yt_dlp_bin: str,
+    url: str,
+    output_template: Path,
+    *,
+    format_selector: str | None = None,
+    concurrent_fragments: int = 1,
+    write_info_json: bool = True,
+) -> list[str]:
+    command = [yt_dlp_bin, "--no-playlist", "--no-progress"]
+    if write_info_json:
+        command.append("--write-info-json")
+    command.extend(["--output", str(output_template)])
+    if format_selector:
+        command.extend(["--format", format_selector])
+    if concurrent_fragments > 1:
+        command.extend(["--concurrent-fragments", str(concurrent_fragments)])
+    command.append(url)
+    return command
 
 
-def _discover_downloaded_media(input_dir: Path) -> Path:
+def _discover_downloaded_media(input_dir: Path, stem: str | None = None) -> Path:
     candidates = [
         p
         for p in input_dir.iterdir()
         if p.is_file()
+        and (stem is None or p.name.startswith(f"{stem}."))
         and not p.name.endswith(".part")
         and not p.name.endswith(".ytdl")
         and p.suffix not in {".json", ".description", ".txt"}
     ]
     if not candidates:
-        raise FileNotFoundError(f"No media file found in {input_dir}")
+        label = f"'{stem}' media" if stem else "media"
+        raise FileNotFoundError(f"No {label} file found in {input_dir}")
     return max(candidates, key=lambda p: p.stat().st_size)
 
 
+def find_existing_download(
+    url: str, output_dir: Path, *, split: bool
+) -> tuple[DownloadResult, Path | None] | None:
+    """Media a previous run of the same ingest mode finished downloading, if any.
+
+    yt-dlp only renames a file to its final name once it is complete, so finished files
+    can be reused. Split mode needs both streams and returns the video path as well.
+    """
+    stem = "source_audio" if split else "source"
+    try:
+        media_path = _discover_downloaded_media(output_dir, stem=stem)
+        video_path = (
+            _discover_downloaded_media(output_dir, stem="source_video") if split else None
+        )
+    except FileNotFoundError:
+        return None
+    info_json_path = output_dir / f"{stem}.info.json"
+    download = DownloadResult(
+        source_url=url,
+        media_path=media_path,
+        info_json_path=info_json_path if info_json_path.exists() else None,
+    )
+    return download, video_path
+
+
 def download_youtube_source(
     url: str,
     output_dir: Path,
     yt_dlp_bin: str,
     timeout_seconds: float | None = 3600.0,
+    concurrent_fragments: int = 1,
 ) -> DownloadResult:
     output_dir.mkdir(parents=True, exist_ok=True)
     output_template = output_dir / "source.%(ext)s"
-    command = build_yt_dlp_command(yt_dlp_bin=yt_dlp_bin, url=url, output_template=output_template)
+    command = build_yt_dlp_command(
+        yt_dlp_bin=yt_dlp_bin,
+        url=url,
+        output_template=output_template,
+        concurrent_fragments=concurrent_fragments,
+    )
     run_command(command, timeout_seconds=timeout_seconds)
 
     media_path = _discover_downloaded_media(output_dir)
@@ -50,3 +142,72 @@ def download_youtube_source(
         media_path=media_path,
         info_json_path=info_json_path if info_json_path.exists() else None,
     )
+
+
+def _download_video_stream(
+    *,
+    url: str,
+    output_dir: Path,
+    yt_dlp_bin: str,
+    timeout_seconds: float | None,
+    concurrent_fragments: int,
+    process_slot: _ChildProcessSlot,
+) -> Path:
+    command = build_yt_dlp_command(
+        yt_dlp_bin=yt_dlp_bin,
+        url=url,
+        output_template=output_dir / "source_video.%(ext)s",
+        format_selector=VIDEO_ONLY_FORMAT,
+        concurrent_fragments=concurrent_fragments,
+        write_info_json=False,
+    )
+    run_command(command, timeout_seconds=timeout_seconds, on_start=process_slot.attach)
+    return _discover_downloaded_media(output_dir, stem="source_video")
+
+
+def start_split_youtube_download(
+    url: str,
+    output_dir: Path,
+    yt_dlp_bin: str,
+    timeout_seconds: float | None = 3600.0,
+    concurrent_fragments: int = 1,
+) -> SplitDownload:
+    """Download the audio-only stream, then fetch video in the background.
+
+    Returns as soon as audio is on disk so normalization and ASR can start while
+    the video stream (only needed for delivery) is still downloading.
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    command = build_yt_dlp_command(
+        yt_dlp_bin=yt_dlp_bin,
+        url=url,
+        output_template=output_dir / "source_audio.%(ext)s",
+        format_selector=AUDIO_ONLY_FORMAT,
+        concurrent_fragments=concurrent_fragments,
+    )
+    run_command(command, timeout_seconds=timeout_seconds)
+    audio_path = _discover_downloaded_media(output_dir, stem="source_audio")
+    info_json_path = output_dir / "source_audio.info.json"
+
+    process_slot = _ChildProcessSlot()
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="yt-dlp-video")
+    video_future = executor.submit(
+        _download_video_stream,
+        url=url,
+        output_dir=output_dir,
+        yt_dlp_bin=yt_dlp_bin,
+        timeout_seconds=timeout_seconds,
+        concurrent_fragments=concurrent_fragments,
+        process_slot=process_slot,
+    )
+    # Let the worker thread exit on its own once the video download finishes.
+    executor.shutdown(wait=False)
+    return SplitDownload(
+        audio=DownloadResult(
+            source_url=url,
+            media_path=audio_path,
+            info_json_path=info_json_path if info_json_path.exists() else None,
+        ),
+        video=video_future,
+        _video_process=process_slot,
+    )
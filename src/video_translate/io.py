@@ -1,13 +1,24 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass, is_dataclass, replace
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
 from video_translate.models import TranscriptDocument, TranscriptSegment
 
+try:  # Optional fast JSON backends; stdlib json stays the fallback.
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None  # type: ignore[assignment]
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - depends on environment
+    msgspec = None  # type: ignore[assignment, unused-ignore]
+
+JSON_BACKENDS = ("orjson", "msgspec", "json")
+
 
 @dataclass(frozen=True)
 class RunPaths:
@@ -18,8 +29,15 @@ class RunPaths:
     output_qa_dir: Path
     logs_dir: Path
 
+    @property
+    def work_dir(self) -> Path:
+        return self.root / "work"
+
 
-def create_run_paths(workspace_dir: Path, run_id: str | None) -> RunPaths:
+def create_run_paths(workspace_dir: Path, run_id: str | None, *, resume: bool = False) -> RunPaths:
+    """Create a fresh run directory; ``resume`` reuses an existing one of ``run_id``."""
+    if resume and not run_id:
+        raise ValueError("Resuming a run requires an explicit run id.")
     timestamp = datetime.now(tz=UTC).strftime("%Y%m%d_%H%M%S")
     selected_run_id = run_id or f"m1_{timestamp}"
     root = workspace_dir / selected_run_id
@@ -39,16 +57,132 @@ def create_run_paths(workspace_dir: Path, run_id: str | None) -> RunPaths:
         paths.output_qa_dir,
         paths.logs_dir,
     ):
-        directory.mkdir(parents=True, exist_ok=False)
+        directory.mkdir(parents=True, exist_ok=resume)
     return paths
 
 
-def write_transcript_json(path: Path, doc: TranscriptDocument) -> None:
-    path.write_text(json.dumps(doc.to_dict(), ensure_ascii=False, indent=2), encoding="utf-8")
+def available_json_backends() -> list[str]:
+    available: list[str] = []
+    if orjson is not None:
+        available.append("orjson")
+    if msgspec is not None:
+        available.append("msgspec")
+    available.append("json")
+    return available
+
+
+def default_json_backend() -> str:
+    return available_json_backends()[0]
+
+
+def _resolve_json_backend(backend: str | None) -> str:
+    selected = (backend or default_json_backend()).strip().lower()
+    if selected not in JSON_BACKENDS:
+        raise ValueError(
+            f"Unsupported JSON backend '{backend}'. Supported backends: {', '.join(JSON_BACKENDS)}."
+        )
+    if selected not in available_json_backends():
+        raise RuntimeError(f"JSON backend '{selected}' is not installed.")
+    return selected
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, Path):
+        return str(value)
+    if is_dataclass(value) and not isinstance(value, type):
+        # Only reached on the stdlib path; orjson/msgspec encode dataclasses natively.
+        return asdict(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps_json(payload: Any, *, compact: bool = False, backend: str | None = None) -> bytes:
+    """Encode a dict or contract dataclass to UTF-8 JSON bytes.
+
+    Dataclass payloads are encoded without the intermediate ``asdict`` copy when a
+    fast backend is installed.
+    """
+    selected = _resolve_json_backend(backend)
+    if selected == "orjson":
+        option = orjson.OPT_NON_STR_KEYS
+        if not compact:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(payload, default=_json_default, option=option)
+    if selected == "msgspec":
+        encoded: bytes = msgspec.json.encode(payload, enc_hook=_json_default)
+        return encoded if compact else bytes(msgspec.json.format(encoded, indent=2))
+    if compact:
+        text = json.dumps(payload, ensure_ascii=False, separators=(",", ":"), default=_json_default)
+    else:
+        text = json.dumps(payload, ensure_ascii=False, indent=2, default=_json_default)
+    return text.encode("utf-8")
+
+
+def loads_json(data: bytes | str, *, backend: str | None = None) -> Any:
+    selected = _resolve_json_backend(backend)
+    if selected == "orjson":
+        return orjson.loads(data)
+    if selected == "msgspec":
+        return msgspec.json.decode(data)
+    return json.loads(data)
+
+
+def read_json(path: Path) -> dict[str, Any]:
+    payload = loads_json(path.read_bytes())
+    if not isinstance(payload, dict):
+        raise ValueError(f"JSON root must be an object: {path}")
+    return payload
+
+
+def write_json(
+    path: Path,
+    payload: Any,
+    *,
+    compact: bool = False,
+    backend: str | None = None,
+) -> None:
+    path.write_bytes(dumps_json(payload, compact=compact, backend=backend))
+
+
+def read_transcript_json(path: Path, *, backend: str | None = None) -> TranscriptDocument:
+    """Decode a transcript JSON file into the contract dataclasses.
+
+    With msgspec the bytes decode straight into ``TranscriptDocument``. A file that does
+    not match the contract exactly (a missing field, a loosely typed value) falls back to
+    the lenient ``TranscriptDocument.from_dict``, so every backend accepts the same files.
+    """
+    data = path.read_bytes()
+    selected = _resolve_json_backend(backend)
+    if selected == "msgspec":
+        try:
+            doc: TranscriptDocument = msgspec.json.decode(data, type=TranscriptDocument)
+            return doc
+        except msgspec.ValidationError:
+            pass
+    payload = loads_json(data, backend=selected)
+    if not isinstance(payload, dict):
+        raise ValueError(f"JSON root must be an object: {path}")
+    return TranscriptDocument.from_dict(payload)
 
 
-def write_json(path: Path, payload: dict[str, Any]) -> None:
-    path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+def write_transcript_json(
+    path: Path,
+    doc: TranscriptDocument,
+    *,
+    compact: bool = False,
+    word_columns_path: Path | None = None,
+) -> None:
+    if word_columns_path is None:
+        write_json(path, doc, compact=compact)
+        return
+    # Words live in the columnar sidecar; keep segments light and point at it.
+    payload = {
+        "language": doc.language,
+        "language_probability": doc.language_probability,
+        "duration": doc.duration,
+        "segments": [replace(segment, words=[]) for segment in doc.segments],
+        "word_timestamps_path": word_columns_path.name,
+    }
+    write_json(path, payload, compact=compact)
 
 
 def _format_srt_time(seconds: float) -> str:
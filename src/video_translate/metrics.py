@@ -0,0 +1,296 @@
+from __future__ import annotations
+
+import math
+import threading
+from bisect import bisect_left
+from typing import Any, TypeVar
+
+from video_translate.tracing import Span
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+DEFAULT_SECONDS_BUCKETS: tuple[float, ...] = (
+    0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1800.0, 3600.0,
+)
+RATIO_BUCKETS: tuple[float, ...] = (0.05, 0.1, 0.2, 0.3, 0.5, 0.75, 1.0, 1.5, 2.0, 4.0)
+RATE_BUCKETS: tuple[float, ...] = (0.5, 1.0, 2.0, 5.0, 10.0, 20.0, 50.0, 100.0, 250.0, 1000.0)
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labelnames: tuple[str, ...], values: tuple[str, ...], extra: str = "") -> str:
+    parts = [
+        f'{name}="{_escape_label_value(value)}"'
+        for name, value in zip(labelnames, values, strict=True)
+    ]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value == int(value):
+        return str(int(value))
+    return repr(value)
+
+
+class _Metric:
+    metric_type = "untyped"
+
+    def __init__(self, name: str, help_text: str, labelnames: tuple[str, ...] = ()) -> None:
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = labelnames
+        self._lock = threading.Lock()
+
+    def _label_values(self, labels: dict[str, Any]) -> tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(
+                f"Metric '{self.name}' expects labels: {', '.join(self.labelnames) or '(none)'}."
+            )
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _sample_lines(self) -> list[str]:
+        raise NotImplementedError
+
+    def render(self) -> list[str]:
+        return [
+            f"# HELP {self.name} {self.help_text}",
+            f"# TYPE {self.name} {self.metric_type}",
+            *self._sample_lines(),
+        ]
+
+
+class Counter(_Metric):
+    metric_type = "counter"
+
+    def __init__(self, name: str, help_text: str, labelnames: tuple[str, ...] = ()) -> None:
+        super().__init__(name, help_text, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only increase.")
+        key = self._label_values(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: Any) -> float:
+        with self._lock:
+            return self._values.get(self._label_values(labels), 0.0)
+
+    def _sample_lines(self) -> list[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in items
+        ]
+
+
+class Gauge(_Metric):
+    metric_type = "gauge"
+
+    def __init__(self, name: str, help_text: str, labelnames: tuple[str, ...] = ()) -> None:
+        super().__init__(name, help_text, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def set(self, value: float, **labels: Any) -> None:
+        key = self._label_values(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        key = self._label_values(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: Any) -> None:
+        self.inc(-amount, **labels)
+
+    def value(self, **labels: Any) -> float:
+        with self._lock:
+            return self._values.get(self._label_values(labels), 0.0)
+
+    def _sample_lines(self) -> list[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        if not items and not self.labelnames:
+            items = [((), 0.0)]
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in items
+        ]
+
+
+class Histogram(_Metric):
+    metric_type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: tuple[str, ...] = (),
+        *,
+        buckets: tuple[float, ...] = DEFAULT_SECONDS_BUCKETS,
+    ) -> None:
+        super().__init__(name, help_text, labelnames)
+        if list(buckets) != sorted(buckets) or not buckets:
+            raise ValueError(f"Histogram '{name}' buckets must be sorted and non-empty.")
+        self.buckets = tuple(buckets)
+        # Per label set: non-cumulative bucket counts (last slot is +Inf), sum, count.
+        self._series: dict[tuple[str, ...], tuple[list[int], list[float]]] = {}
+
+    def observe(self, value: float, **labels: Any) -> None:
+        key = self._label_values(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = ([0] * (len(self.buckets) + 1), [0.0, 0.0])
+                self._series[key] = series
+            series[0][index] += 1
+            series[1][0] += value
+            series[1][1] += 1
+
+    def count(self, **labels: Any) -> int:
+        with self._lock:
+            series = self._series.get(self._label_values(labels))
+            return int(series[1][1]) if series is not None else 0
+
+    def _sample_lines(self) -> list[str]:
+        with self._lock:
+            snapshot = sorted(
+                (key, list(counts), list(totals)) for key, (counts, totals) in self._series.items()
+            )
+        lines: list[str] = []
+        for key, counts, (total, count) in snapshot:
+            cumulative = 0
+            for bound, bucket_count in zip((*self.buckets, math.inf), counts, strict=True):
+                cumulative += bucket_count
+                le = f'le="{_format_value(bound)}"'
+                labels = _format_labels(self.labelnames, key, le)
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {_format_value(count)}")
+        return lines
+
+
+M = TypeVar("M", bound=_Metric)
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: M) -> M:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric already registered: {metric.name}")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines: list[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+JOBS_QUEUED = REGISTRY.register(
+    Gauge("video_translate_jobs_queued", "UI jobs accepted but not started yet.")
+)
+JOBS_RUNNING = REGISTRY.register(
+    Gauge("video_translate_jobs_running", "UI jobs currently running.")
+)
+JOBS_FINISHED = REGISTRY.register(
+    Counter("video_translate_jobs_total", "Finished UI jobs by final status.", ("status",))
+)
+JOB_DURATION = REGISTRY.register(
+    Histogram("video_translate_job_duration_seconds", "Wall time of finished UI jobs.")
+)
+STAGE_DURATION = REGISTRY.register(
+    Histogram(
+        "video_translate_stage_duration_seconds",
+        "Wall time of pipeline stages.",
+        ("stage",),
+    )
+)
+STAGE_FAILURES = REGISTRY.register(
+    Counter("video_translate_stage_failures_total", "Pipeline stages that raised.", ("stage",))
+)
+ASR_REAL_TIME_FACTOR = REGISTRY.register(
+    Histogram(
+        "video_translate_asr_real_time_factor",
+        "ASR decode seconds per second of audio.",
+        buckets=RATIO_BUCKETS,
+    )
+)
+ASR_AUDIO_SECONDS = REGISTRY.register(
+    Counter("video_translate_asr_audio_seconds_total", "Seconds of audio decoded by ASR.")
+)
+MT_SEGMENTS = REGISTRY.register(
+    Counter("video_translate_mt_segments_total", "Unique texts sent to the translation backend.")
+)
+MT_SEGMENTS_PER_SECOND = REGISTRY.register(
+    Histogram(
+        "video_translate_mt_segments_per_second",
+        "Translation backend throughput per M2 run.",
+        buckets=RATE_BUCKETS,
+    )
+)
+TTS_SEGMENTS = REGISTRY.register(
+    Counter("video_translate_tts_segments_total", "Segments synthesized by the TTS backend.")
+)
+TTS_SEGMENTS_PER_SECOND = REGISTRY.register(
+    Histogram(
+        "video_translate_tts_segments_per_second",
+        "TTS synthesis throughput per M3 run.",
+        buckets=RATE_BUCKETS,
+    )
+)
+FFMPEG_MERGE_DURATION = REGISTRY.register(
+    Histogram("video_translate_ffmpeg_merge_seconds", "Wall time of the final ffmpeg merge.")
+)
+
+_STAGE_SPANS = frozenset({"m1", "m2", "m3", "delivery"})
+
+
+def observe_span(record: Span) -> None:
+    """Span observer that maps finished pipeline spans onto the metrics above."""
+    name = record.name
+    seconds = record.duration_seconds
+    if name in _STAGE_SPANS:
+        STAGE_DURATION.observe(seconds, stage=name)
+        if record.status != "ok":
+            STAGE_FAILURES.inc(stage=name)
+        return
+    if record.status != "ok":
+        return
+    attributes = record.attributes
+    if name == "asr.decode":
+        audio_seconds = float(attributes.get("audio_seconds", 0.0))
+        if audio_seconds > 0.0:
+            ASR_AUDIO_SECONDS.inc(audio_seconds)
+            ASR_REAL_TIME_FACTOR.observe(seconds / audio_seconds)
+    elif name == "mt.translate":
+        text_count = int(attributes.get("text_count", 0))
+        MT_SEGMENTS.inc(text_count)
+        if text_count > 0 and seconds > 0.0:
+            MT_SEGMENTS_PER_SECOND.observe(text_count / seconds)
+    elif name == "tts.synthesize":
+        synthesized = int(attributes.get("synthesized_segment_count", 0))
+        TTS_SEGMENTS.inc(synthesized)
+        if synthesized > 0 and seconds > 0.0:
+            TTS_SEGMENTS_PER_SECOND.observe(synthesized / seconds)
+    elif name == "ffmpeg.merge":
+        FFMPEG_MERGE_DURATION.observe(seconds)
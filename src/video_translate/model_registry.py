@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from video_translate.config import AppConfig
+
+MODEL_REGISTRY_FILENAME = "model_registry.json"
+
+
+@dataclass(frozen=True)
+class ModelReference:
+    """A model named by a profile: ``source`` tells how ``name`` resolves to local files."""
+
+    kind: str
+    name: str
+    source: str
+
+    @property
+    def key(self) -> str:
+        return f"{self.kind}:{self.name}"
+
+
+@dataclass(frozen=True)
+class RegisteredModel:
+    kind: str
+    name: str
+    source: str
+    local_path: Path
+    files: dict[str, str]
+    size_bytes: int
+    registered_at: str
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "kind": self.kind,
+            "name": self.name,
+            "source": self.source,
+            "local_path": str(self.local_path),
+            "files": self.files,
+            "size_bytes": self.size_bytes,
+            "registered_at": self.registered_at,
+        }
+
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any]) -> RegisteredModel:
+        return cls(
+            kind=str(payload["kind"]),
+            name=str(payload["name"]),
+            source=str(payload["source"]),
+            local_path=Path(payload["local_path"]),
+            files={str(key): str(value) for key, value in payload["files"].items()},
+            size_bytes=int(payload["size_bytes"]),
+            registered_at=str(payload["registered_at"]),
+        )
+
+
+# Called with a reference, returns the local file or directory holding the model.
+ModelResolver = Callable[[ModelReference], Path]
+
+
+def model_references(config: AppConfig) -> list[ModelReference]:
+    """Every downloadable or on-disk model the profile can load during a run."""
+    references: list[ModelReference] = []
+
+    def add(kind: str, name: str, source: str) -> None:
+        reference = ModelReference(kind=kind, name=name, source=source)
+        if all(item.key != reference.key for item in references):
+            references.append(reference)
+
+    asr = config.asr
+    add("asr", asr.model, "faster_whisper")
+    if asr.fallback_on_oom:
+        add("asr", asr.fallback_model, "faster_whisper")
+    if asr.two_pass_enabled:
+        add("asr", asr.draft_model, "faster_whisper")
+    translate_backend = config.translate.backend.strip().lower()
+    if translate_backend == "transformers":
+        add("mt", config.translate.transformers.model_id, "huggingface")
+    if translate_backend == "ctranslate2":
+        model_id = config.translate.ctranslate2.model_id
+        # An already converted model directory is a local file; a hub id is fetched and
+        # converted on first use.
+        source = "file" if Path(model_id, "model.bin").is_file() else "huggingface"
+        add("mt", model_id, source)
+    if config.tts.backend.strip().lower() == "piper" and config.tts.piper_model_path is not None:
+        add("tts", str(config.tts.piper_model_path), "file")
+        if config.tts.piper_config_path is not None:
+            add("tts", str(config.tts.piper_config_path), "file")
+    return references
+
+
+def resolve_model(reference: ModelReference) -> Path:
+    """Download (or find in the library cache) the files behind ``reference``."""
+    if reference.source == "file":
+        path = Path(reference.name)
+        if not path.exists():
+            raise FileNotFoundError(f"Model file not found: {path}")
+        return path
+    if reference.source == "faster_whisper":
+        if Path(reference.name).is_dir():
+            return Path(reference.name)
+        # Same cache WhisperModel uses, so a later run finds the files without network.
+        from faster_whisper.utils import download_model
+
+        return Path(download_model(reference.name))
+    if reference.source == "huggingface":
+        from huggingface_hub import snapshot_download
+
+        return Path(snapshot_download(reference.name))
+    raise ValueError(f"Unsupported model source '{reference.source}'.")
+
+
+def _model_files(local_path: Path) -> list[tuple[str, Path]]:
+    if local_path.is_file():
+        return [(local_path.name, local_path)]
+    return [
+        (path.relative_to(local_path).as_posix(), path)
+        for path in sorted(local_path.rglob("*"))
+        if path.is_file()
+    ]
+
+
+def file_checksums(local_path: Path) -> dict[str, str]:
+    checksums: dict[str, str] = {}
+    for relative, path in _model_files(local_path):
+        with path.open("rb") as handle:
+            checksums[relative] = hashlib.file_digest(handle, "sha256").hexdigest()
+    return checksums
+
+
+class ModelRegistry:
+    """JSON index of resolved models with a sha256 per file, kept under the workspace.
+
+    Checksums are recorded when a model is first registered; ``verify`` re-hashes the
+    files so a truncated download or a corrupted cache is caught before a job loads it.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.entries: dict[str, RegisteredModel] = {}
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+            models = payload.get("models", {}) if isinstance(payload, dict) else {}
+            for key, value in models.items():
+                self.entries[str(key)] = RegisteredModel.from_dict(value)
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            # Missing or unreadable registry: models are simply registered again.
+            self.entries = {}
+
+    def get(self, reference: ModelReference) -> RegisteredModel | None:
+        entry = self.entries.get(reference.key)
+        if entry is None or not entry.local_path.exists():
+            return None
+        return entry
+
+    def register(self, reference: ModelReference, local_path: Path) -> RegisteredModel:
+        files = file_checksums(local_path)
+        entry = RegisteredModel(
+            kind=reference.kind,
+            name=reference.name,
+            source=reference.source,
+            local_path=local_path,
+            files=files,
+            size_bytes=sum(path.stat().st_size for _, path in _model_files(local_path)),
+            registered_at=datetime.now(tz=UTC).isoformat(timespec="seconds"),
+        )
+        self.entries[reference.key] = entry
+        return entry
+
+    def verify(self, entry: RegisteredModel) -> list[str]:
+        """Relative paths whose checksum no longer matches, including missing files."""
+        current = file_checksums(entry.local_path)
+        return sorted(
+            relative
+            for relative, checksum in entry.files.items()
+            if current.get(relative) != checksum
+        )
+
+    def save(self) -> None:
+        payload = {"models": {key: entry.to_dict() for key, entry in self.entries.items()}}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        temp_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+        os.replace(temp_path, self.path)
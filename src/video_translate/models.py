@@ -5,7 +5,7 @@ from pathlib import Path
 from typing import Any
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WordTimestamp:
     word: str
     start: float
@@ -13,7 +13,7 @@ class WordTimestamp:
     probability: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TranscriptSegment:
     id: int
     start: float
@@ -32,6 +32,42 @@ class TranscriptDocument:
     def to_dict(self) -> dict[str, Any]:
         return asdict(self)
 
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any]) -> TranscriptDocument:
+        """Lenient decode: missing fields get defaults and malformed words are skipped."""
+        segments_payload = payload.get("segments", [])
+        if not isinstance(segments_payload, list):
+            raise ValueError("Transcript payload field 'segments' must be a list.")
+        segments: list[TranscriptSegment] = []
+        for raw in segments_payload:
+            if not isinstance(raw, dict):
+                raise ValueError("Each transcript segment must be an object.")
+            start = float(raw.get("start", 0.0))
+            segments.append(
+                TranscriptSegment(
+                    id=int(raw.get("id", len(segments))),
+                    start=start,
+                    end=float(raw.get("end", start)),
+                    text=str(raw.get("text", "")),
+                    words=[
+                        WordTimestamp(
+                            word=str(word.get("word", "")),
+                            start=float(word.get("start", 0.0)),
+                            end=float(word.get("end", 0.0)),
+                            probability=float(word.get("probability", 0.0)),
+                        )
+                        for word in raw.get("words") or []
+                        if isinstance(word, dict)
+                    ],
+                )
+            )
+        return cls(
+            language=str(payload.get("language", "")),
+            language_probability=float(payload.get("language_probability", 0.0)),
+            duration=float(payload.get("duration", 0.0)),
+            segments=segments,
+        )
+
 
 @dataclass(frozen=True)
 class DownloadResult:
@@ -49,3 +85,5 @@ class M1Artifacts:
     transcript_srt: Path | None
     qa_report: Path
     run_manifest: Path
+    word_columns: Path | None = None
+    source_audio: Path | None = None
@@ -0,0 +1,442 @@
+from __future__ import annotations
+
+import importlib.util
+import os
+import platform
+import re
+import sys
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+from video_translate.asr.whisper import WhisperModelFactory, transcribe_audio
+from video_translate.config import AppConfig, derive_config, load_config
+from video_translate.io import write_json
+from video_translate.pipeline.m1_benchmark import write_synthetic_speech_fixture
+from video_translate.tracing import Span, current_tracer, trace_run
+from video_translate.translate.backends import build_translation_backend
+from video_translate.tts.backends import build_tts_backend
+
+AUTOTUNE_REPORT_FILENAME = "autotune_report.json"
+# Rough working set of one 30 s window in a decoder batch (features + beam state).
+_ASR_BATCH_SLOT_BYTES = 256 * 1024 * 1024
+_ASR_BATCH_CANDIDATES: tuple[int, ...] = (4, 8, 16)
+_MT_BATCH_CANDIDATES: tuple[int, ...] = (1, 4, 8, 16, 32)
+# A trial within this margin of the fastest one counts as a tie; the cheaper setting wins.
+_TIE_MARGIN = 0.05
+_FIXTURE_TEXTS: tuple[str, ...] = (
+    "Welcome back to the channel, today we are looking at something new.",
+    "The first step is to open the settings menu.",
+    "This part is important, so take your time.",
+    "If you have any questions, leave them in the comments below.",
+    "Let me show you how the whole process works from start to finish.",
+    "It only takes a few minutes.",
+    "Now we connect the two pieces together and check the result.",
+    "As you can see, the difference is quite large.",
+)
+
+
+@dataclass(frozen=True)
+class HostProbe:
+    hostname: str
+    system: str
+    machine: str
+    logical_cores: int
+    usable_cores: int
+    total_ram_bytes: int | None
+    available_ram_bytes: int | None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "hostname": self.hostname,
+            "system": self.system,
+            "machine": self.machine,
+            "logical_cores": self.logical_cores,
+            "usable_cores": self.usable_cores,
+            "total_ram_bytes": self.total_ram_bytes,
+            "available_ram_bytes": self.available_ram_bytes,
+        }
+
+
+@dataclass(frozen=True)
+class AutotuneTrial:
+    stage: str
+    settings: dict[str, Any]
+    seconds: float | None
+    item_count: int
+    error: str | None = None
+
+    @property
+    def items_per_second(self) -> float | None:
+        if self.seconds is None or self.seconds <= 0.0:
+            return None
+        return self.item_count / self.seconds
+
+    def to_dict(self) -> dict[str, Any]:
+        rate = self.items_per_second
+        return {
+            "stage": self.stage,
+            "settings": self.settings,
+            "seconds": round(self.seconds, 6) if self.seconds is not None else None,
+            "item_count": self.item_count,
+            "items_per_second": round(rate, 3) if rate is not None else None,
+            "error": self.error,
+        }
+
+
+@dataclass(frozen=True)
+class AutotuneArtifacts:
+    profile_path: Path
+    report_path: Path
+    host: HostProbe
+    selected: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+
+def _windows_ram_bytes() -> tuple[int | None, int | None]:
+    if sys.platform != "win32":
+        return None, None
+    import ctypes
+
+    class _MemoryStatus(ctypes.Structure):
+        _fields_ = [
+            ("dwLength", ctypes.c_ulong),
+            ("dwMemoryLoad", ctypes.c_ulong),
+            ("ullTotalPhys", ctypes.c_ulonglong),
+            ("ullAvailPhys", ctypes.c_ulonglong),
+            ("ullTotalPageFile", ctypes.c_ulonglong),
+            ("ullAvailPageFile", ctypes.c_ulonglong),
+            ("ullTotalVirtual", ctypes.c_ulonglong),
+            ("ullAvailVirtual", ctypes.c_ulonglong),
+            ("ullAvailExtendedVirtual", ctypes.c_ulonglong),
+        ]
+
+    status = _MemoryStatus()
+    status.dwLength = ctypes.sizeof(_MemoryStatus)
+    kernel32 = ctypes.windll.kernel32
+    if not kernel32.GlobalMemoryStatusEx(ctypes.byref(status)):
+        return None, None
+    return int(status.ullTotalPhys), int(status.ullAvailPhys)
+
+
+def _ram_bytes() -> tuple[int | None, int | None]:
+    try:
+        page_size = os.sysconf("SC_PAGE_SIZE")
+        total = os.sysconf("SC_PHYS_PAGES") * page_size
+    except (AttributeError, ValueError, OSError):
+        return _windows_ram_bytes()
+    try:
+        available: int | None = os.sysconf("SC_AVPHYS_PAGES") * page_size
+    except (ValueError, OSError):
+        # macOS has no SC_AVPHYS_PAGES.
+        available = None
+    return total, available
+
+
+def probe_host() -> HostProbe:
+    logical_cores = os.cpu_count() or 1
+    try:
+        usable_cores = len(os.sched_getaffinity(0))
+    except AttributeError:
+        usable_cores = logical_cores
+    total_ram, available_ram = _ram_bytes()
+    return HostProbe(
+        hostname=platform.node() or "host",
+        system=platform.system(),
+        machine=platform.machine(),
+        logical_cores=logical_cores,
+        usable_cores=max(1, usable_cores),
+        total_ram_bytes=total_ram,
+        available_ram_bytes=available_ram,
+    )
+
+
+def _slug(text: str) -> str:
+    normalized = re.sub(r"[^a-zA-Z0-9]+", "_", text).strip("_")
+    return normalized.lower() or "host"
+
+
+def _thread_candidates(usable_cores: int) -> list[int]:
+    return sorted({max(1, usable_cores // 4), max(1, usable_cores // 2), usable_cores})
+
+
+def _asr_batch_candidates(host: HostProbe) -> list[int]:
+    ram = host.available_ram_bytes or host.total_ram_bytes
+    if ram is None:
+        return list(_ASR_BATCH_CANDIDATES)
+    # Leave half of the memory to the model weights and the rest of the pipeline.
+    return [size for size in _ASR_BATCH_CANDIDATES if size * _ASR_BATCH_SLOT_BYTES <= ram // 2]
+
+
+def _pick_fastest(trials: list[AutotuneTrial]) -> AutotuneTrial | None:
+    """Fastest successful trial; candidates are ordered cheapest first, so ties go early."""
+    timed = [trial for trial in trials if trial.seconds is not None]
+    if not timed:
+        return None
+    best_seconds = min(trial.seconds for trial in timed if trial.seconds is not None)
+    for trial in timed:
+        if trial.seconds is not None and trial.seconds <= best_seconds * (1.0 + _TIE_MARGIN):
+            return trial
+    return None
+
+
+def _spans_since(before: int) -> list[Span]:
+    tracer = current_tracer()
+    return list(tracer.spans[before:]) if tracer is not None else []
+
+
+def _span_count() -> int:
+    tracer = current_tracer()
+    return len(tracer.spans) if tracer is not None else 0
+
+
+def _timed_trial(
+    stage: str,
+    settings: dict[str, Any],
+    run: Callable[[], int],
+    *,
+    span_names: tuple[str, ...],
+) -> AutotuneTrial:
+    """Run one candidate; time comes from ``span_names`` spans, else from wall time.
+
+    Model loads have their own spans, so only the decode or batch work is compared.
+    """
+    before = _span_count()
+    started = perf_counter()
+    try:
+        item_count = run()
+    except Exception as exc:  # noqa: BLE001
+        return AutotuneTrial(
+            stage=stage,
+            settings=settings,
+            seconds=None,
+            item_count=0,
+            error=f"{type(exc).__name__}: {exc}",
+        )
+    wall_seconds = perf_counter() - started
+    spans = [item for item in _spans_since(before) if item.name in span_names]
+    seconds = sum(item.duration_seconds for item in spans) if spans else wall_seconds
+    return AutotuneTrial(stage=stage, settings=settings, seconds=seconds, item_count=item_count)
+
+
+def _tune_asr(
+    config: AppConfig,
+    *,
+    audio_path: Path,
+    host: HostProbe,
+    model_factory: WhisperModelFactory | None,
+) -> tuple[dict[str, Any], list[AutotuneTrial]]:
+    if model_factory is None and importlib.util.find_spec("faster_whisper") is None:
+        skipped = AutotuneTrial(
+            stage="asr",
+            settings={},
+            seconds=None,
+            item_count=0,
+            error="faster-whisper is not installed.",
+        )
+        return {}, [skipped]
+
+    def trial(settings: dict[str, Any]) -> AutotuneTrial:
+        asr_config = derive_config(config, asr=settings).asr
+        return _timed_trial(
+            "asr",
+            settings,
+            lambda: len(
+                transcribe_audio(audio_path, asr_config, model_factory=model_factory).segments
+            ),
+            span_names=("asr.features", "asr.decode"),
+        )
+
+    # Coordinate search: thread count on the sequential path first, then batch sizes.
+    thread_trials = [
+        trial({"cpu_threads": threads, "batched": False})
+        for threads in _thread_candidates(host.usable_cores)
+    ]
+    best_threads = _pick_fastest(thread_trials)
+    if best_threads is None:
+        return {}, thread_trials
+    cpu_threads = best_threads.settings["cpu_threads"]
+    batch_trials = [
+        trial({"cpu_threads": cpu_threads, "batched": True, "batch_size": size})
+        for size in _asr_batch_candidates(host)
+    ]
+    best = _pick_fastest([best_threads, *batch_trials])
+    selected = dict(best.settings) if best is not None else dict(best_threads.settings)
+    return selected, thread_trials + batch_trials
+
+
+def _tune_mt(config: AppConfig, *, item_count: int) -> tuple[dict[str, Any], list[AutotuneTrial]]:
+    texts = [_FIXTURE_TEXTS[index % len(_FIXTURE_TEXTS)] for index in range(item_count)]
+    try:
+        backend = build_translation_backend(config.translate)
+    except Exception as exc:  # noqa: BLE001
+        failed = AutotuneTrial(
+            stage="mt",
+            settings={},
+            seconds=None,
+            item_count=0,
+            error=f"{type(exc).__name__}: {exc}",
+        )
+        return {}, [failed]
+
+    def run(batch_size: int) -> int:
+        return len(
+            backend.translate_batch(
+                texts,
+                source_language=config.translate.source_language,
+                target_language=config.translate.target_language,
+                batch_size=batch_size,
+            )
+        )
+
+    def trial(size: int) -> AutotuneTrial:
+        return _timed_trial(
+            "mt", {"batch_size": size}, lambda: run(size), span_names=("mt.batch",)
+        )
+
+    trials = [trial(size) for size in _MT_BATCH_CANDIDATES if size <= max(1, item_count)]
+    best = _pick_fastest(trials)
+    return (dict(best.settings) if best is not None else {}), trials
+
+
+def _tune_tts(
+    config: AppConfig, *, item_count: int, work_dir: Path
+) -> tuple[dict[str, Any], list[AutotuneTrial]]:
+    # Piper's persistent worker is the only TTS throughput switch; other backends are
+    # timed for the report only.
+    if config.tts.backend.strip().lower() == "piper":
+        candidates: list[dict[str, Any]] = [
+            {"piper_persistent_worker": False},
+            {"piper_persistent_worker": True},
+        ]
+    else:
+        candidates = [{}]
+    texts = [_FIXTURE_TEXTS[index % len(_FIXTURE_TEXTS)] for index in range(item_count)]
+
+    def run(settings: dict[str, Any], label: str) -> int:
+        backend = build_tts_backend(derive_config(config, tts=settings).tts)
+        (work_dir / label).mkdir(parents=True, exist_ok=True)
+        for index, text in enumerate(texts):
+            backend.synthesize_to_wav(
+                text=text,
+                output_wav=work_dir / label / f"seg_{index:06d}.wav",
+                target_duration=2.0,
+                sample_rate=config.tts.sample_rate,
+            )
+        return len(texts)
+
+    def trial(index: int, settings: dict[str, Any]) -> AutotuneTrial:
+        return _timed_trial(
+            "tts", settings, lambda: run(settings, f"candidate_{index}"), span_names=()
+        )
+
+    trials = [trial(index, settings) for index, settings in enumerate(candidates)]
+    best = _pick_fastest(trials)
+    return (dict(best.settings) if best is not None else {}), trials
+
+
+def _toml_value(value: object) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, str):
+        return f'"{value}"'
+    return str(value)
+
+
+def _write_profile(
+    path: Path, *, host: HostProbe, selected: dict[str, dict[str, Any]], generated_at: str
+) -> None:
+    ram = host.total_ram_bytes
+    ram_text = f"{ram / (1024 ** 3):.1f} GiB RAM" if ram is not None else "unknown RAM"
+    lines = [
+        f"# Generated by `video-translate autotune` on {host.hostname} at {generated_at}.",
+        f"# {host.usable_cores} usable cores, {ram_text}. Regenerate after hardware changes.",
+        f'# Layer it under a profile with: [pipeline] tuned_profile = "{path.as_posix()}"',
+    ]
+    for section, values in selected.items():
+        if not values:
+            continue
+        lines.append("")
+        lines.append(f"[{section}]")
+        lines.extend(f"{key} = {_toml_value(value)}" for key, value in values.items())
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def run_autotune(
+    *,
+    run_root: Path,
+    output_config_path: Path | None = None,
+    config_path: Path | None = None,
+    fixture_seconds: float = 10.0,
+    mt_item_count: int = 32,
+    tts_item_count: int = 4,
+    model_factory: WhisperModelFactory | None = None,
+    host: HostProbe | None = None,
+) -> AutotuneArtifacts:
+    """Probe the host, micro-benchmark ASR, MT and TTS and write a tuned profile TOML.
+
+    ASR tries ``asr.cpu_threads`` candidates from the usable core count, then batched
+    decoding at batch sizes that fit in available RAM; MT tries ``translate.batch_size``
+    values; TTS tries piper's persistent worker. A stage whose trials all fail keeps the
+    configured values and is left out of the profile.
+    """
+    if fixture_seconds <= 0:
+        raise ValueError("Autotune fixture seconds must be > 0.")
+    if mt_item_count <= 0 or tts_item_count <= 0:
+        raise ValueError("Autotune item counts must be > 0.")
+    config = load_config(config_path)
+    host = host or probe_host()
+    benchmark_dir = run_root / "benchmarks"
+    fixture = write_synthetic_speech_fixture(
+        benchmark_dir / "fixtures" / "autotune_speech.wav", seconds=fixture_seconds
+    )
+
+    # Spans are only collected for timing; no trace file is written.
+    with trace_run("autotune", trace_format="jsonl"):
+        asr_settings, asr_trials = _tune_asr(
+            config, audio_path=fixture, host=host, model_factory=model_factory
+        )
+        mt_settings, mt_trials = _tune_mt(config, item_count=mt_item_count)
+        tts_settings, tts_trials = _tune_tts(
+            config, item_count=tts_item_count, work_dir=benchmark_dir / "autotune_tts"
+        )
+
+    selected = {"asr": asr_settings, "translate": mt_settings, "tts": tts_settings}
+    generated_at = datetime.now(tz=UTC).isoformat(timespec="seconds")
+    profile_path = output_config_path or (
+        Path("configs") / "profiles" / f"autotune_{_slug(host.hostname)}.toml"
+    )
+    _write_profile(profile_path, host=host, selected=selected, generated_at=generated_at)
+
+    report_path = benchmark_dir / AUTOTUNE_REPORT_FILENAME
+    write_json(
+        report_path,
+        {
+            "stage": "autotune",
+            "generated_at_utc": generated_at,
+            "config_path": str(config_path) if config_path is not None else None,
+            "host": host.to_dict(),
+            "audio_fixture": str(fixture),
+            "model_factory": (
+                getattr(model_factory, "__name__", type(model_factory).__name__)
+                if model_factory is not None
+                else "faster_whisper.WhisperModel"
+            ),
+            "trials": {
+                "asr": [trial.to_dict() for trial in asr_trials],
+                "mt": [trial.to_dict() for trial in mt_trials],
+                "tts": [trial.to_dict() for trial in tts_trials],
+            },
+            "selected": selected,
+            "profile_path": str(profile_path),
+        },
+    )
+    return AutotuneArtifacts(
+        profile_path=profile_path,
+        report_path=report_path,
+        host=host,
+        selected=selected,
+    )
@@ -8,6 +8,7 @@ from pathlib import Path
 from typing import Any
 
 from video_translate.io import write_json
+from video_translate.tracing import span
 from video_translate.utils.subprocess_utils import run_command
 
 PROJECT_ROOT = Path(__file__).resolve().parents[3]
@@ -156,7 +157,8 @@ def deliver_final_video(
         dubbed_audio=dubbed_audio,
         output_mp4=dubbed_video_mp4,
     )
-    run_command(command)
+    with span("ffmpeg.merge", output=str(dubbed_video_mp4)):
+        run_command(command, binary=True)
     if not dubbed_video_mp4.exists():
         raise FileNotFoundError(f"Final dubbed video was not created: {dubbed_video_mp4}")
 
@@ -169,7 +171,8 @@ def deliver_final_video(
     write_json(quality_summary_json, summary_payload)
 
     if cleanup_intermediate:
-        cleanup_run_workspace(run_root)
+        with span("cleanup"):
+            cleanup_run_workspace(run_root)
 
     return FinalDeliveryArtifacts(
         downloads_dir=downloads_dir,
@@ -0,0 +1,446 @@
+from __future__ import annotations
+
+import shutil
+import stat
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from video_translate.config import AppConfig, derive_config, load_config
+from video_translate.io import write_json
+from video_translate.pipeline.delivery import deliver_final_video
+from video_translate.pipeline.full_run import run_full_dub_stages
+from video_translate.pipeline.m1_benchmark import synthetic_whisper_factory
+from video_translate.tracing import Span, current_tracer, span, trace_file_path, trace_run
+from video_translate.utils.subprocess_utils import run_command
+
+# Stage spans reported per case; nested spans are summed by name.
+E2E_STAGE_SPANS: tuple[str, ...] = (
+    "m1",
+    "download",
+    "normalize",
+    "asr",
+    "write_transcript",
+    "m2",
+    "mt.translate",
+    "m3",
+    "tts.synthesize",
+    "stitch",
+    "qa",
+    "delivery",
+    "ffmpeg.merge",
+    "cleanup",
+)
+# Time spent inside a backend or an external tool. Everything else under the case root is
+# orchestration: manifests, JSON I/O, QA, prep steps and glue between stages.
+_WORK_SPANS: tuple[str, ...] = (
+    "download",
+    "normalize",
+    "asr",
+    "mt.translate",
+    "tts.synthesize",
+    "stitch",
+    "ffmpeg.merge",
+)
+_MIN_SEGMENT_PERIOD_SECONDS = 0.5
+
+_YT_DLP_STAND_IN = """\
+import shutil, sys
+from pathlib import Path
+
+args = sys.argv[1:]
+template = args[args.index("--output") + 1]
+fmt = args[args.index("--format") + 1] if "--format" in args else "best"
+source = Path(args[-1].removeprefix("file://"))
+ext = "m4a" if fmt.startswith("bestaudio") else "mp4"
+shutil.copyfile(source, template.replace("%(ext)s", ext))
+if "--write-info-json" in args:
+    Path(template.replace("%(ext)s", "info.json")).write_text(
+        '{"title": "e2e benchmark source"}', encoding="utf-8"
+    )
+"""
+
+
+@dataclass(frozen=True)
+class E2ECaseResult:
+    label: str
+    media_seconds: float
+    segment_period_seconds: float
+    status: str
+    segment_count: int = 0
+    total_seconds: float = 0.0
+    stage_seconds: dict[str, float] = field(default_factory=dict)
+    trace_jsonl: Path | None = None
+    error: str | None = None
+
+    @property
+    def work_seconds(self) -> float:
+        return sum(self.stage_seconds.get(name, 0.0) for name in _WORK_SPANS)
+
+    @property
+    def orchestration_seconds(self) -> float:
+        return max(0.0, self.total_seconds - self.work_seconds)
+
+    @property
+    def orchestration_seconds_per_segment(self) -> float | None:
+        if self.segment_count <= 0:
+            return None
+        return self.orchestration_seconds / self.segment_count
+
+
+def write_yt_dlp_stand_in(path: Path) -> Path:
+    """Write an executable yt-dlp stand-in that copies a local ``file://`` URL."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(f"#!{sys.executable}\n{_YT_DLP_STAND_IN}", encoding="utf-8")
+    path.chmod(path.stat().st_mode | stat.S_IEXEC)
+    return path
+
+
+def synthesize_source_media(
+    *,
+    ffmpeg_bin: str,
+    output_path: Path,
+    seconds: float,
+    segment_period_seconds: float,
+) -> Path:
+    """Render a small MP4 whose audio is one tone burst per ``segment_period_seconds``.
+
+    The bursts are what ``SyntheticWhisperModel`` turns into transcript segments, so the
+    period controls the segment count of every downstream stage.
+    """
+    if seconds <= 0:
+        raise ValueError("Synthetic media seconds must be > 0.")
+    if segment_period_seconds < _MIN_SEGMENT_PERIOD_SECONDS:
+        raise ValueError(f"Segment period must be >= {_MIN_SEGMENT_PERIOD_SECONDS} seconds.")
+    gap_seconds = max(0.2, segment_period_seconds * 0.25)
+    burst_seconds = segment_period_seconds - gap_seconds
+    audio_expr = (
+        f"0.3*sin(2*PI*180*t)*lt(mod(t\\,{segment_period_seconds:g})\\,{burst_seconds:g})"
+    )
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    run_command(
+        [
+            ffmpeg_bin,
+            "-y",
+            "-f",
+            "lavfi",
+            "-i",
+            f"testsrc2=size=320x180:rate=15:duration={seconds:g}",
+            "-f",
+            "lavfi",
+            "-i",
+            f"aevalsrc={audio_expr}:s=16000:d={seconds:g}",
+            "-c:v",
+            "libx264",
+            "-preset",
+            "ultrafast",
+            "-pix_fmt",
+            "yuv420p",
+            "-c:a",
+            "aac",
+            "-shortest",
+            str(output_path),
+        ],
+        binary=True,
+    )
+    if not output_path.exists():
+        raise FileNotFoundError(f"Synthetic source media was not created: {output_path}")
+    return output_path
+
+
+def _benchmark_config(
+    base: AppConfig,
+    *,
+    yt_dlp_bin: Path,
+    ffmpeg_bin: str,
+    workspace_dir: Path,
+    mt_item_seconds: float,
+    tts_item_seconds: float,
+) -> AppConfig:
+    return derive_config(
+        base,
+        tools={"yt_dlp": str(yt_dlp_bin), "ffmpeg": ffmpeg_bin},
+        pipeline={"workspace_dir": workspace_dir},
+        translate={
+            "backend": "mock",
+            "mock_item_latency_seconds": mt_item_seconds,
+            "qa_fail_on_flags": False,
+        },
+        tts={
+            "backend": "mock",
+            "mock_item_latency_seconds": tts_item_seconds,
+            "qa_fail_on_flags": False,
+        },
+    )
+
+
+def _stage_seconds(spans: list[Span]) -> dict[str, float]:
+    totals = {name: 0.0 for name in E2E_STAGE_SPANS}
+    for item in spans:
+        if item.name in totals:
+            totals[item.name] += item.duration_seconds
+    return {name: round(value, 6) for name, value in totals.items()}
+
+
+def _segment_count(spans: list[Span]) -> int:
+    for item in spans:
+        if item.name == "asr":
+            return int(item.attributes.get("segment_count", 0))
+    return 0
+
+
+def linear_fit(points: list[tuple[float, float]]) -> dict[str, float] | None:
+    """Least-squares ``y = intercept + slope * x``; ``None`` without two distinct x values."""
+    if len({x for x, _ in points}) < 2:
+        return None
+    count = len(points)
+    mean_x = sum(x for x, _ in points) / count
+    mean_y = sum(y for _, y in points) / count
+    sxx = sum((x - mean_x) ** 2 for x, _ in points)
+    sxy = sum((x - mean_x) * (y - mean_y) for x, y in points)
+    slope = sxy / sxx
+    intercept = mean_y - slope * mean_x
+    ss_total = sum((y - mean_y) ** 2 for _, y in points)
+    ss_residual = sum((y - (intercept + slope * x)) ** 2 for x, y in points)
+    r_squared = 1.0 - ss_residual / ss_total if ss_total > 0 else 1.0
+    return {
+        "slope": round(slope, 6),
+        "intercept": round(intercept, 6),
+        "r_squared": round(r_squared, 4),
+    }
+
+
+def _scaling_curves(results: list[E2ECaseResult], x_key: str) -> dict[str, Any]:
+    curves: dict[str, Any] = {}
+    series_names = ("total", "orchestration", *E2E_STAGE_SPANS)
+    for name in series_names:
+        points: list[tuple[float, float]] = []
+        for result in results:
+            x = float(result.segment_count if x_key == "segment_count" else result.media_seconds)
+            if name == "total":
+                y = result.total_seconds
+            elif name == "orchestration":
+                y = result.orchestration_seconds
+            else:
+                y = result.stage_seconds.get(name, 0.0)
+            points.append((x, round(y, 6)))
+        curves[name] = {
+            "points": [list(point) for point in sorted(points)],
+            "fit": linear_fit(points),
+        }
+    return curves
+
+
+def _case_to_dict(result: E2ECaseResult) -> dict[str, Any]:
+    per_segment = result.orchestration_seconds_per_segment
+    return {
+        "label": result.label,
+        "media_seconds": result.media_seconds,
+        "segment_period_seconds": result.segment_period_seconds,
+        "status": result.status,
+        "segment_count": result.segment_count,
+        "total_seconds": round(result.total_seconds, 6),
+        "work_seconds": round(result.work_seconds, 6),
+        "orchestration_seconds": round(result.orchestration_seconds, 6),
+        "orchestration_seconds_per_segment": (
+            round(per_segment, 6) if per_segment is not None else None
+        ),
+        "stage_seconds": result.stage_seconds,
+        "trace_jsonl": str(result.trace_jsonl) if result.trace_jsonl else None,
+        "error": result.error,
+    }
+
+
+def evaluate_overhead_gate(
+    results: list[E2ECaseResult],
+    max_orchestration_seconds_per_segment: float | None,
+) -> dict[str, Any]:
+    """Fail when any case failed or spent too much non-backend time per segment."""
+    successful = [item for item in results if item.status == "ok"]
+    measured = [
+        (item.label, item.orchestration_seconds_per_segment)
+        for item in successful
+        if item.orchestration_seconds_per_segment is not None
+    ]
+    worst_label, worst_value = max(measured, key=lambda item: item[1], default=(None, None))
+    passed = len(successful) == len(results)
+    if max_orchestration_seconds_per_segment is not None:
+        passed = passed and bool(measured)
+        passed = passed and all(
+            value <= max_orchestration_seconds_per_segment for _, value in measured
+        )
+    return {
+        "metric": "orchestration_seconds_per_segment",
+        "threshold": max_orchestration_seconds_per_segment,
+        "worst_case": worst_label,
+        "worst_value": round(worst_value, 6) if worst_value is not None else None,
+        "passed": passed,
+    }
+
+
+def _run_case(
+    *,
+    config: AppConfig,
+    label: str,
+    media_path: Path,
+    media_seconds: float,
+    segment_period_seconds: float,
+    workspace_dir: Path,
+    downloads_root: Path,
+    trace_path: Path,
+    asr_model_factory: Any,
+) -> E2ECaseResult:
+    run_id = f"e2e_{label}"
+    # create_run_paths refuses existing run dirs; clear leftovers of an aborted case.
+    stale_run_root = workspace_dir / run_id
+    if stale_run_root.exists():
+        shutil.rmtree(stale_run_root)
+    target_lang = config.translate.target_language
+    try:
+        with trace_run(
+            "e2e_benchmark_case",
+            trace_format="jsonl",
+            output_path=trace_path,
+            case=label,
+            media_seconds=media_seconds,
+        ):
+            tracer = current_tracer()
+            artifacts = run_full_dub_stages(
+                source_url=media_path.resolve().as_uri(),
+                config=config,
+                target_lang=target_lang,
+                workspace_dir=workspace_dir,
+                run_id=run_id,
+                asr_model_factory=asr_model_factory,
+            )
+            with span("delivery"):
+                deliver_final_video(
+                    run_root=artifacts.run_root,
+                    source_video=artifacts.m1_artifacts.source_media,
+                    dubbed_audio=artifacts.m3_artifacts.stitched_preview_wav,
+                    ffmpeg_bin=config.tools.ffmpeg,
+                    target_lang=target_lang,
+                    downloads_root=downloads_root,
+                    cleanup_intermediate=True,
+                )
+    except Exception as exc:  # noqa: BLE001
+        return E2ECaseResult(
+            label=label,
+            media_seconds=media_seconds,
+            segment_period_seconds=segment_period_seconds,
+            status="failed_run",
+            trace_jsonl=trace_path if trace_path.exists() else None,
+            error=str(exc),
+        )
+    spans = list(tracer.spans) if tracer is not None else []
+    root = next(item for item in spans if item.name == "e2e_benchmark_case")
+    return E2ECaseResult(
+        label=label,
+        media_seconds=media_seconds,
+        segment_period_seconds=segment_period_seconds,
+        status="ok",
+        segment_count=_segment_count(spans),
+        total_seconds=root.duration_seconds,
+        stage_seconds=_stage_seconds(spans),
+        trace_jsonl=trace_path,
+    )
+
+
+def run_e2e_benchmark(
+    *,
+    output_root: Path,
+    media_seconds: list[float],
+    segment_periods: list[float],
+    base_config_path: Path | None = None,
+    ffmpeg_bin: str | None = None,
+    asr_load_seconds: float = 0.0,
+    asr_segment_seconds: float = 0.0,
+    mt_item_seconds: float = 0.0,
+    tts_item_seconds: float = 0.0,
+    max_orchestration_seconds_per_segment: float | None = None,
+) -> Path:
+    """Run the M1 -> M2 -> M3 -> delivery chain on synthesized media with mock backends.
+
+    Every (length, segment period) pair is one case. ASR uses ``SyntheticWhisperModel``,
+    MT and TTS use the mock backends, each with the given per-item latency, so per-stage
+    timings isolate pipeline orchestration cost from model cost. ``output_root`` must stay
+    under the project root because delivery writes there.
+    """
+    if not media_seconds:
+        raise ValueError("At least one media length is required for benchmark.")
+    if not segment_periods:
+        raise ValueError("At least one segment period is required for benchmark.")
+    for value in (asr_load_seconds, asr_segment_seconds, mt_item_seconds, tts_item_seconds):
+        if value < 0.0:
+            raise ValueError("Simulated backend latencies must be >= 0.")
+
+    base = load_config(base_config_path)
+    resolved_ffmpeg = ffmpeg_bin or base.tools.ffmpeg
+    benchmark_dir = output_root / "benchmarks"
+    benchmark_dir.mkdir(parents=True, exist_ok=True)
+    workspace_dir = output_root / "runs"
+    config = _benchmark_config(
+        base,
+        yt_dlp_bin=write_yt_dlp_stand_in(output_root / "bin" / "yt_dlp_stand_in"),
+        ffmpeg_bin=resolved_ffmpeg,
+        workspace_dir=workspace_dir,
+        mt_item_seconds=mt_item_seconds,
+        tts_item_seconds=tts_item_seconds,
+    )
+    asr_model_factory = synthetic_whisper_factory(
+        load_seconds=asr_load_seconds,
+        segment_seconds=asr_segment_seconds,
+    )
+
+    results: list[E2ECaseResult] = []
+    for seconds in media_seconds:
+        for period in segment_periods:
+            label = f"{seconds:g}s_p{period:g}".replace(".", "_")
+            media_path = synthesize_source_media(
+                ffmpeg_bin=resolved_ffmpeg,
+                output_path=output_root / "media" / f"source_{label}.mp4",
+                seconds=seconds,
+                segment_period_seconds=period,
+            )
+            results.append(
+                _run_case(
+                    config=config,
+                    label=label,
+                    media_path=media_path,
+                    media_seconds=seconds,
+                    segment_period_seconds=period,
+                    workspace_dir=workspace_dir,
+                    downloads_root=output_root / "downloads",
+                    trace_path=trace_file_path(benchmark_dir, f"e2e.{label}", "jsonl"),
+                    asr_model_factory=asr_model_factory,
+                )
+            )
+
+    successful = [item for item in results if item.status == "ok"]
+    gate = evaluate_overhead_gate(results, max_orchestration_seconds_per_segment)
+    report_path = benchmark_dir / "e2e_benchmark.json"
+    payload = {
+        "stage": "e2e_benchmark",
+        "output_root": str(output_root),
+        "simulated_latency_seconds": {
+            "asr_model_load": asr_load_seconds,
+            "asr_per_segment": asr_segment_seconds,
+            "mt_per_item": mt_item_seconds,
+            "tts_per_item": tts_item_seconds,
+        },
+        "cases": [_case_to_dict(item) for item in results],
+        "scaling": {
+            "by_segment_count": _scaling_curves(successful, "segment_count"),
+            "by_media_seconds": _scaling_curves(successful, "media_seconds"),
+        },
+        "gate": gate,
+        "summary": {
+            "case_count": len(results),
+            "success_count": len(successful),
+            "failed_count": len(results) - len(successful),
+            "gate_passed": gate["passed"],
+        },
+    }
+    write_json(report_path, payload)
+    return report_path
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import asdict, is_dataclass
+from typing import Any
+
+
+def segment_fingerprint(*, text: str, start: float, end: float, duration: float) -> str:
+    # Round timings so float noise from JSON round-trips does not mark segments dirty.
+    raw = json.dumps(
+        [text.strip(), round(float(start), 6), round(float(end), 6), round(float(duration), 6)],
+        ensure_ascii=False,
+    )
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def config_fingerprint(
+    config: Any,
+    *,
+    exclude_prefixes: tuple[str, ...] = ("qa_",),
+    extra: object = None,
+) -> str:
+    if is_dataclass(config) and not isinstance(config, type):
+        values = asdict(config)
+    else:
+        values = dict(config)
+    # QA thresholds do not change generated artifacts, so they must not invalidate reuse.
+    filtered = {
+        key: value
+        for key, value in values.items()
+        if not any(key.startswith(prefix) for prefix in exclude_prefixes)
+    }
+    raw = json.dumps(
+        {"config": filtered, "extra": extra}, ensure_ascii=False, sort_keys=True, default=str
+    )
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from functools import partial
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+from video_translate.io import available_json_backends, dumps_json, loads_json, write_json
+from video_translate.models import TranscriptDocument, TranscriptSegment, WordTimestamp
+from video_translate.translate.contracts import TranslationOutputDocument, TranslationOutputSegment
+from video_translate.tts.contracts import TTSOutputDocument, TTSOutputSegment
+
+_SAMPLE_WORDS = ("local", "pipeline", "keeps", "every", "segment", "aligned", "with", "speech")
+
+
+def _sample_text(index: int, word_count: int) -> str:
+    return " ".join(
+        _SAMPLE_WORDS[(index + offset) % len(_SAMPLE_WORDS)] for offset in range(word_count)
+    )
+
+
+def build_sample_transcript(
+    segment_count: int, *, words_per_segment: int = 8
+) -> TranscriptDocument:
+    segments: list[TranscriptSegment] = []
+    for index in range(segment_count):
+        start = index * 2.0
+        words = [
+            WordTimestamp(
+                word=_SAMPLE_WORDS[(index + offset) % len(_SAMPLE_WORDS)],
+                start=round(start + offset * 0.2, 3),
+                end=round(start + offset * 0.2 + 0.18, 3),
+                probability=0.9,
+            )
+            for offset in range(words_per_segment)
+        ]
+        segments.append(
+            TranscriptSegment(
+                id=index,
+                start=start,
+                end=start + 1.8,
+                text=_sample_text(index, words_per_segment),
+                words=words,
+            )
+        )
+    return TranscriptDocument(
+        language="en",
+        language_probability=0.99,
+        duration=segment_count * 2.0,
+        segments=segments,
+    )
+
+
+def build_sample_translation_output(segment_count: int) -> TranslationOutputDocument:
+    segments = [
+        TranslationOutputSegment(
+            id=index,
+            start=index * 2.0,
+            end=index * 2.0 + 1.8,
+            duration=1.8,
+            source_text=_sample_text(index, 8),
+            target_text=_sample_text(index + 3, 7),
+            source_word_count=8,
+            target_word_count=7,
+            length_ratio=0.875,
+        )
+        for index in range(segment_count)
+    ]
+    return TranslationOutputDocument(
+        schema_version="1.0",
+        stage="m2_translation_output",
+        generated_at_utc="2026-01-01T00:00:00+00:00",
+        backend="mock",
+        source_language="en",
+        target_language="tr",
+        segment_count=segment_count,
+        total_source_word_count=segment_count * 8,
+        total_target_word_count=segment_count * 7,
+        segments=segments,
+    )
+
+
+def build_sample_tts_output(segment_count: int) -> TTSOutputDocument:
+    segments = [
+        TTSOutputSegment(
+            id=index,
+            start=index * 2.0,
+            end=index * 2.0 + 1.8,
+            target_duration=1.8,
+            synthesized_duration=1.8,
+            duration_delta=0.0,
+            target_text=_sample_text(index + 3, 7),
+            audio_path=f"output/tts/segments/seg_{index:06d}.wav",
+        )
+        for index in range(segment_count)
+    ]
+    return TTSOutputDocument(
+        schema_version="1.0",
+        stage="m3_tts_output",
+        generated_at_utc="2026-01-01T00:00:00+00:00",
+        backend="mock",
+        language="tr",
+        sample_rate=24000,
+        segment_count=segment_count,
+        segments=segments,
+    )
+
+
+_CONTRACT_BUILDERS: dict[str, Callable[[int], Any]] = {
+    "transcript": build_sample_transcript,
+    "translation_output": build_sample_translation_output,
+    "tts_output": build_sample_tts_output,
+}
+
+
+def _baseline_dumps(doc: Any) -> bytes:
+    return dumps_json(doc.to_dict(), backend="json")
+
+
+def _best_seconds(func: Callable[[], object], repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        started = perf_counter()
+        func()
+        best = min(best, perf_counter() - started)
+    return best
+
+
+def run_json_io_benchmark(
+    *,
+    output_json_path: Path,
+    segment_counts: list[int] | None = None,
+    repeats: int = 3,
+) -> Path:
+    """Time encode/decode of synthetic contract documents for every installed JSON backend."""
+    counts = segment_counts or [100, 1000, 10000]
+    if any(count <= 0 for count in counts):
+        raise ValueError("Segment counts must be > 0.")
+    if repeats <= 0:
+        raise ValueError("repeats must be > 0.")
+
+    backends = available_json_backends()
+    cases: list[dict[str, Any]] = []
+    for contract_name, builder in _CONTRACT_BUILDERS.items():
+        for segment_count in counts:
+            doc = builder(segment_count)
+            # Baseline mirrors the previous writer: asdict copy + stdlib indented dump.
+            baseline_bytes = _baseline_dumps(doc)
+            baseline_encode = _best_seconds(partial(_baseline_dumps, doc), repeats)
+            for backend in backends:
+                for compact in (False, True):
+                    encoded = dumps_json(doc, compact=compact, backend=backend)
+                    encode_seconds = _best_seconds(
+                        partial(dumps_json, doc, compact=compact, backend=backend), repeats
+                    )
+                    decode_seconds = _best_seconds(
+                        partial(loads_json, encoded, backend=backend), repeats
+                    )
+                    cases.append(
+                        {
+                            "contract": contract_name,
+                            "segment_count": segment_count,
+                            "backend": backend,
+                            "compact": compact,
+                            "bytes": len(encoded),
+                            "encode_seconds": round(encode_seconds, 6),
+                            "decode_seconds": round(decode_seconds, 6),
+                            "baseline_bytes": len(baseline_bytes),
+                            "baseline_encode_seconds": round(baseline_encode, 6),
+                            "encode_speedup_vs_baseline": (
+                                round(baseline_encode / encode_seconds, 3)
+                                if encode_seconds > 0
+                                else None
+                            ),
+                        }
+                    )
+
+    payload = {
+        "stage": "io_benchmark",
+        "backends": backends,
+        "segment_counts": counts,
+        "repeats": repeats,
+        "cases": cases,
+    }
+    output_json_path.parent.mkdir(parents=True, exist_ok=True)
+    write_json(output_json_path, payload)
+    return output_json_path
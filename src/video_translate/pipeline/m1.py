@@ -3,26 +3,109 @@ from __future__ import annotations
 from dataclasses import asdict
 from datetime import UTC, datetime
 from pathlib import Path
+from time import perf_counter
 from typing import Callable
 
-from video_translate.asr.whisper import transcribe_audio
+from video_translate.asr.checkpoint import CHECKPOINT_FILENAME
+from video_translate.asr.two_pass import TwoPassStats
+from video_translate.asr.vad import (
+    MIN_SKIP_RATIO,
+    SPEECH_MAP_FILENAME,
+    SpeechMap,
+    SpeechOnlyAudio,
+    detect_speech_map,
+    read_speech_map,
+    write_speech_map,
+    write_speech_only_wav,
+)
+from video_translate.asr.whisper import WhisperModelFactory, transcribe_audio
 from video_translate.config import AppConfig
 from video_translate.ingest.audio import normalize_audio_for_asr
-from video_translate.ingest.youtube import download_youtube_source
+from video_translate.ingest.youtube import (
+    download_youtube_source,
+    find_existing_download,
+    start_split_youtube_download,
+)
 from video_translate.io import create_run_paths, write_json, write_srt, write_transcript_json
 from video_translate.models import M1Artifacts
 from video_translate.preflight import PreflightReport
-from video_translate.qa.m1_report import build_m1_qa_report
+from video_translate.qa.m1_report import (
+    M1QAStats,
+    build_m1_qa_report,
+    build_m1_qa_report_from_files,
+)
+from video_translate.tracing import span, trace_file_path, trace_run
+from video_translate.transcript_columns import (
+    word_columns_path_for,
+    write_word_columns,
+)
+from video_translate.utils.subprocess_utils import command_stats_since, command_stats_snapshot
 
 M1ProgressHook = Callable[[str], None]
 
 
+def _run_energy_vad(
+    *, config: AppConfig, normalized_audio: Path, work_dir: Path, work_audio_dir: Path
+) -> tuple[SpeechMap, SpeechOnlyAudio | None]:
+    with span("vad") as vad_span:
+        speech_map = detect_speech_map(
+            normalized_audio,
+            threshold_db=config.asr.energy_vad_threshold_db,
+            hangover_seconds=config.asr.energy_vad_hangover_seconds,
+            padding_seconds=config.asr.energy_vad_padding_seconds,
+            min_silence_seconds=config.asr.energy_vad_min_silence_seconds,
+        )
+        write_speech_map(work_dir / SPEECH_MAP_FILENAME, speech_map)
+        speech_only: SpeechOnlyAudio | None = None
+        # No detected speech usually means a too strict threshold; decode everything then.
+        if speech_map.regions and speech_map.skipped_ratio >= MIN_SKIP_RATIO:
+            speech_only = write_speech_only_wav(
+                normalized_audio, speech_map, work_audio_dir / "speech_only_16k_mono.wav"
+            )
+        vad_span.set(
+            audio_seconds=speech_map.duration,
+            speech_seconds=speech_map.speech_seconds,
+            region_count=len(speech_map.regions),
+        )
+    return speech_map, speech_only
+
+
+def _speech_map_metrics(
+    *,
+    speech_map: SpeechMap,
+    speech_only: SpeechOnlyAudio | None,
+    map_path: Path,
+    vad_seconds: float,
+    asr_seconds: float,
+) -> dict[str, object]:
+    # ASR cost scales with decoded audio, so the skipped share is extrapolated from it.
+    saved = 0.0
+    if speech_only is not None and speech_map.speech_seconds > 0.0:
+        saved = asr_seconds * speech_map.skipped_seconds / speech_map.speech_seconds
+    return {
+        "path": str(map_path),
+        "asr_input": "speech_only" if speech_only is not None else "full_audio",
+        "duration_seconds": round(speech_map.duration, 3),
+        "speech_seconds": round(speech_map.speech_seconds, 3),
+        "skipped_seconds": round(speech_map.skipped_seconds, 3),
+        "skipped_ratio": round(speech_map.skipped_ratio, 4),
+        "region_count": len(speech_map.regions),
+        "vad_seconds": round(vad_seconds, 3),
+        "asr_seconds": round(asr_seconds, 3),
+        "estimated_asr_saved_seconds": round(saved, 3),
+        "estimated_net_saved_seconds": round(saved - vad_seconds, 3),
+    }
+
+
 def _build_run_manifest(
     *,
     source_url: str,
     config: AppConfig,
     artifacts: M1Artifacts,
     preflight_report: PreflightReport | None,
+    ingest_metrics: dict[str, object] | None = None,
+    asr_two_pass: dict[str, object] | None = None,
+    speech_map_metrics: dict[str, object] | None = None,
 ) -> dict[str, object]:
     manifest: dict[str, object] = {
         "stage": "m1",
@@ -35,18 +118,31 @@ def _build_run_manifest(
                 "audio_sample_rate": config.pipeline.audio_sample_rate,
                 "audio_channels": config.pipeline.audio_channels,
                 "audio_codec": config.pipeline.audio_codec,
+                "compact_json": config.pipeline.compact_json,
+                "word_timestamp_sidecar": config.pipeline.word_timestamp_sidecar,
+                "ingest_mode": config.pipeline.ingest_mode,
+                "ingest_concurrent_fragments": config.pipeline.ingest_concurrent_fragments,
+                "trace_format": config.pipeline.trace_format,
             },
             "asr": asdict(config.asr),
         },
         "artifacts": {
             "run_root": str(artifacts.run_root),
             "source_media": str(artifacts.source_media),
+            "source_audio": str(artifacts.source_audio) if artifacts.source_audio else None,
             "normalized_audio": str(artifacts.normalized_audio),
             "transcript_json": str(artifacts.transcript_json),
             "transcript_srt": str(artifacts.transcript_srt) if artifacts.transcript_srt else None,
             "qa_report": str(artifacts.qa_report),
+            "word_columns": str(artifacts.word_columns) if artifacts.word_columns else None,
         },
     }
+    if ingest_metrics is not None:
+        manifest["ingest"] = ingest_metrics
+    if asr_two_pass is not None:
+        manifest["asr_two_pass"] = asr_two_pass
+    if speech_map_metrics is not None:
+        manifest["speech_map"] = speech_map_metrics
     if preflight_report is not None:
         manifest["preflight"] = {
             "python_version": preflight_report.python_version,
@@ -58,6 +154,21 @@ def _build_run_manifest(
     return manifest
 
 
+def rebuild_m1_qa_report(*, run_root: Path, output_json_path: Path | None = None) -> Path:
+    """Rewrite the M1 QA report of ``run_root`` from its transcript and speech map."""
+    transcript_json = run_root / "output" / "transcript" / "transcript.en.json"
+    if not transcript_json.exists():
+        raise FileNotFoundError(f"Transcript JSON not found: {transcript_json}")
+    report = build_m1_qa_report_from_files(
+        transcript_json,
+        speech_map=read_speech_map(run_root / "work" / SPEECH_MAP_FILENAME),
+    )
+    output = output_json_path or (run_root / "output" / "qa" / "m1_qa_report.json")
+    output.parent.mkdir(parents=True, exist_ok=True)
+    write_json(output, report)
+    return output
+
+
 def run_m1_pipeline(
     *,
     source_url: str,
@@ -67,75 +178,211 @@ def run_m1_pipeline(
     emit_srt: bool = True,
     preflight_report: PreflightReport | None = None,
     progress_hook: M1ProgressHook | None = None,
+    asr_model_factory: WhisperModelFactory | None = None,
+    resume: bool = False,
 ) -> M1Artifacts:
+    """Run ingest, normalization and ASR.
+
+    ``resume`` reopens the existing run ``run_id`` (for example after a crash) and
+    continues ASR after the last segment in its ``work/asr_checkpoint.jsonl``. Finished
+    downloads and the normalized WAV of that run are reused instead of fetched again.
+    """
     effective_workspace = workspace_dir or config.pipeline.workspace_dir
-    paths = create_run_paths(effective_workspace, run_id)
-
-    if progress_hook is not None:
-        progress_hook("M1: YouTube indiriliyor...")
-    download = download_youtube_source(
-        url=source_url,
-        output_dir=paths.input_dir,
-        yt_dlp_bin=config.tools.yt_dlp,
-    )
+    paths = create_run_paths(effective_workspace, run_id, resume=resume)
+    trace_format = config.pipeline.trace_format
+    with trace_run(
+        "m1",
+        trace_format=trace_format,
+        output_path=trace_file_path(paths.logs_dir, "m1", trace_format),
+        run_id=paths.root.name,
+    ):
+        if progress_hook is not None:
+            progress_hook("M1: YouTube indiriliyor...")
+        ingest_started = perf_counter()
+        commands_before = command_stats_snapshot()
+        split_download = None
+        normalized_wav = paths.work_audio_dir / "source_16k_mono.wav"
+        reused_ingest = (
+            find_existing_download(
+                source_url, paths.input_dir, split=config.pipeline.ingest_mode == "split"
+            )
+            if resume and normalized_wav.exists()
+            else None
+        )
+        reused_video: Path | None = None
+        try:
+            with span(
+                "download", mode=config.pipeline.ingest_mode, reused=reused_ingest is not None
+            ):
+                if reused_ingest is not None:
+                    download, reused_video = reused_ingest
+                elif config.pipeline.ingest_mode == "split":
+                    split_download = start_split_youtube_download(
+                        url=source_url,
+                        output_dir=paths.input_dir,
+                        yt_dlp_bin=config.tools.yt_dlp,
+                        concurrent_fragments=config.pipeline.ingest_concurrent_fragments,
+                    )
+                    download = split_download.audio
+                else:
+                    download = download_youtube_source(
+                        url=source_url,
+                        output_dir=paths.input_dir,
+                        yt_dlp_bin=config.tools.yt_dlp,
+                        concurrent_fragments=config.pipeline.ingest_concurrent_fragments,
+                    )
+            audio_ready_seconds = perf_counter() - ingest_started
 
-    if progress_hook is not None:
-        progress_hook("M1: Ses normalize ediliyor...")
-    normalized_audio = normalize_audio_for_asr(
-        ffmpeg_bin=config.tools.ffmpeg,
-        input_media=download.media_path,
-        output_wav=paths.work_audio_dir / "source_16k_mono.wav",
-        sample_rate=config.pipeline.audio_sample_rate,
-        channels=config.pipeline.audio_channels,
-        codec=config.pipeline.audio_codec,
-    )
+            if progress_hook is not None:
+                progress_hook("M1: Ses normalize ediliyor...")
+            with span("normalize", reused=reused_ingest is not None):
+                if reused_ingest is not None:
+                    normalized_audio = normalized_wav
+                else:
+                    normalized_audio = normalize_audio_for_asr(
+                        ffmpeg_bin=config.tools.ffmpeg,
+                        input_media=download.media_path,
+                        output_wav=normalized_wav,
+                        sample_rate=config.pipeline.audio_sample_rate,
+                        channels=config.pipeline.audio_channels,
+                        codec=config.pipeline.audio_codec,
+                    )
 
-    if progress_hook is not None:
-        progress_hook("M1: ASR basladi (ilk calismada model indirilebilir)...")
+            speech_map: SpeechMap | None = None
+            speech_only: SpeechOnlyAudio | None = None
+            vad_seconds = 0.0
+            if config.asr.energy_vad_enabled:
+                vad_started = perf_counter()
+                speech_map, speech_only = _run_energy_vad(
+                    config=config,
+                    normalized_audio=normalized_audio,
+                    work_dir=paths.work_dir,
+                    work_audio_dir=paths.work_audio_dir,
+                )
+                vad_seconds = perf_counter() - vad_started
 
-    def _on_asr_segment(index: int) -> None:
-        if progress_hook is None:
-            return
-        if index <= 3 or index % 8 == 0:
-            progress_hook(f"M1: ASR segment cozuluyor... ({index})")
+            if progress_hook is not None:
+                progress_hook("M1: ASR basladi (ilk calismada model indirilebilir)...")
 
-    transcript_doc = transcribe_audio(
-        normalized_audio,
-        config.asr,
-        on_segment_collected=_on_asr_segment,
-    )
-    transcript_json = paths.output_transcript_dir / "transcript.en.json"
-    if progress_hook is not None:
-        progress_hook("M1: Transcript yaziliyor...")
-    write_transcript_json(transcript_json, transcript_doc)
-
-    transcript_srt: Path | None = None
-    if emit_srt:
-        transcript_srt = paths.output_transcript_dir / "transcript.en.srt"
-        write_srt(transcript_srt, transcript_doc.segments)
-
-    qa_report = paths.output_qa_dir / "m1_qa_report.json"
-    write_json(qa_report, build_m1_qa_report(transcript_doc))
-    if progress_hook is not None:
-        progress_hook("M1: QA raporu yazildi.")
-
-    run_manifest = paths.root / "run_manifest.json"
-    artifacts = M1Artifacts(
-        run_root=paths.root,
-        source_media=download.media_path,
-        normalized_audio=normalized_audio,
-        transcript_json=transcript_json,
-        transcript_srt=transcript_srt,
-        qa_report=qa_report,
-        run_manifest=run_manifest,
-    )
-    write_json(
-        run_manifest,
-        _build_run_manifest(
-            source_url=source_url,
-            config=config,
-            artifacts=artifacts,
-            preflight_report=preflight_report,
-        ),
-    )
-    return artifacts
+            def _on_asr_segment(index: int) -> None:
+                if progress_hook is None:
+                    return
+                if index <= 3 or index % 8 == 0:
+                    progress_hook(f"M1: ASR segment cozuluyor... ({index})")
+
+            qa_stats = M1QAStats()
+            two_pass_stats = TwoPassStats() if config.asr.two_pass_enabled else None
+            asr_started = perf_counter()
+            with span("asr") as asr_span:
+                transcript_doc = transcribe_audio(
+                    speech_only.path if speech_only is not None else normalized_audio,
+                    config.asr,
+                    on_segment_collected=_on_asr_segment,
+                    model_factory=asr_model_factory,
+                    qa_stats=qa_stats,
+                    two_pass_stats=two_pass_stats,
+                    checkpoint_path=paths.work_dir / CHECKPOINT_FILENAME,
+                )
+                if speech_only is not None and speech_map is not None:
+                    transcript_doc = speech_only.remap_document(
+                        transcript_doc, duration=speech_map.duration
+                    )
+                    # Remapping can stretch a segment across a removed silence.
+                    qa_stats = M1QAStats.from_document(transcript_doc)
+                asr_span.set(
+                    audio_seconds=transcript_doc.duration,
+                    segment_count=len(transcript_doc.segments),
+                )
+            asr_seconds = perf_counter() - asr_started
+            transcript_json = paths.output_transcript_dir / "transcript.en.json"
+            if progress_hook is not None:
+                progress_hook("M1: Transcript yaziliyor...")
+            word_columns: Path | None = None
+            transcript_srt: Path | None = None
+            with span("write_transcript"):
+                if config.pipeline.word_timestamp_sidecar:
+                    word_columns = word_columns_path_for(transcript_json)
+                    write_word_columns(word_columns, transcript_doc)
+                write_transcript_json(
+                    transcript_json,
+                    transcript_doc,
+                    compact=config.pipeline.compact_json,
+                    word_columns_path=word_columns,
+                )
+                if emit_srt:
+                    transcript_srt = paths.output_transcript_dir / "transcript.en.srt"
+                    write_srt(transcript_srt, transcript_doc.segments)
+
+            qa_report = paths.output_qa_dir / "m1_qa_report.json"
+            with span("qa"):
+                # Word statistics were accumulated while ASR produced the segments.
+                write_json(
+                    qa_report,
+                    build_m1_qa_report(transcript_doc, stats=qa_stats, speech_map=speech_map),
+                )
+            if progress_hook is not None:
+                progress_hook("M1: QA raporu yazildi.")
+
+            source_media = download.media_path
+            source_audio: Path | None = None
+            video_wait_seconds = 0.0
+            if split_download is not None:
+                if progress_hook is not None and not split_download.video.done():
+                    progress_hook("M1: Video akisi bekleniyor...")
+                wait_started = perf_counter()
+                with span("download.video_wait"):
+                    source_media = split_download.video.result()
+                video_wait_seconds = perf_counter() - wait_started
+                source_audio = download.media_path
+            elif reused_video is not None:
+                source_media = reused_video
+                source_audio = download.media_path
+
+            run_manifest = paths.root / "run_manifest.json"
+            artifacts = M1Artifacts(
+                run_root=paths.root,
+                source_media=source_media,
+                normalized_audio=normalized_audio,
+                transcript_json=transcript_json,
+                transcript_srt=transcript_srt,
+                qa_report=qa_report,
+                run_manifest=run_manifest,
+                word_columns=word_columns,
+                source_audio=source_audio,
+            )
+            write_json(
+                run_manifest,
+                _build_run_manifest(
+                    source_url=source_url,
+                    config=config,
+                    artifacts=artifacts,
+                    preflight_report=preflight_report,
+                    ingest_metrics={
+                        "mode": config.pipeline.ingest_mode,
+                        "concurrent_fragments": config.pipeline.ingest_concurrent_fragments,
+                        "reused_existing_media": reused_ingest is not None,
+                        "audio_ready_seconds": round(audio_ready_seconds, 3),
+                        "video_wait_seconds": round(video_wait_seconds, 3),
+                        "m1_elapsed_seconds": round(perf_counter() - ingest_started, 3),
+                        # Per-tool spawn overhead of yt-dlp/ffmpeg calls made by this run.
+                        "subprocess": command_stats_since(commands_before),
+                    },
+                    asr_two_pass=two_pass_stats.to_dict() if two_pass_stats is not None else None,
+                    speech_map_metrics=(
+                        _speech_map_metrics(
+                            speech_map=speech_map,
+                            speech_only=speech_only,
+                            map_path=paths.work_dir / SPEECH_MAP_FILENAME,
+                            vad_seconds=vad_seconds,
+                            asr_seconds=asr_seconds,
+                        )
+                        if speech_map is not None
+                        else None
+                    ),
+                ),
+            )
+            return artifacts
+        finally:
+            # A failed run must not leave the background yt-dlp video download behind.
+            if split_download is not None and not split_download.video.done():
+                split_download.cancel()
@@ -0,0 +1,485 @@
+from __future__ import annotations
+
+import importlib.util
+import math
+import re
+import struct
+import time
+import wave
+from array import array
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+from video_translate.asr.whisper import WhisperModelFactory, transcribe_audio
+from video_translate.config import load_config
+from video_translate.io import write_json
+from video_translate.tracing import Span, current_tracer, trace_file_path, trace_run
+
+_SYNTHETIC_WORDS = ("local", "speech", "sample", "for", "timing", "the", "decoder")
+
+
+@dataclass(frozen=True)
+class M1FixtureResult:
+    audio_path: Path
+    audio_seconds: float
+    model_load_seconds: float
+    decode_seconds: float
+    segment_count: int
+    attempt_count: int
+
+    @property
+    def decode_rtf(self) -> float | None:
+        return self.decode_seconds / self.audio_seconds if self.audio_seconds > 0 else None
+
+
+@dataclass(frozen=True)
+class M1BenchmarkResult:
+    profile_name: str
+    config_path: Path
+    status: str
+    model: str | None
+    device: str | None
+    compute_type: str | None
+    batch_size: int | None = None
+    fixtures: list[M1FixtureResult] = field(default_factory=list)
+    peak_rss_bytes: int | None = None
+    rss_growth_bytes: int | None = None
+    trace_jsonl: Path | None = None
+    error: str | None = None
+
+    @property
+    def audio_seconds(self) -> float:
+        return sum(item.audio_seconds for item in self.fixtures)
+
+    @property
+    def decode_seconds(self) -> float:
+        return sum(item.decode_seconds for item in self.fixtures)
+
+    @property
+    def decode_rtf(self) -> float | None:
+        audio_seconds = self.audio_seconds
+        return self.decode_seconds / audio_seconds if audio_seconds > 0 else None
+
+
+def write_synthetic_speech_fixture(
+    path: Path,
+    *,
+    seconds: float,
+    sample_rate: int = 16000,
+    burst_seconds: float = 1.6,
+    gap_seconds: float = 0.4,
+) -> Path:
+    """Write a mono PCM16 WAV of voiced-like tone bursts separated by silence."""
+    if seconds <= 0:
+        raise ValueError("Synthetic fixture seconds must be > 0.")
+    frame_count = int(round(seconds * sample_rate))
+    period = burst_seconds + gap_seconds
+    samples = array("h", bytes(2 * frame_count))
+    for index in range(frame_count):
+        t = index / sample_rate
+        phase = t % period
+        if phase >= burst_seconds:
+            continue
+        # Two harmonics with a slow envelope keep energy detectors honest.
+        envelope = math.sin(math.pi * phase / burst_seconds)
+        value = 0.55 * math.sin(2 * math.pi * 180.0 * t)
+        value += 0.25 * math.sin(2 * math.pi * 360.0 * t)
+        samples[index] = int(9000 * envelope * value)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with wave.open(str(path), "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes(samples.tobytes())
+    return path
+
+
+@dataclass(frozen=True)
+class _SyntheticWord:
+    word: str
+    start: float
+    end: float
+    probability: float
+
+
+@dataclass(frozen=True)
+class _SyntheticSegment:
+    id: int
+    start: float
+    end: float
+    text: str
+    words: list[_SyntheticWord]
+
+
+@dataclass(frozen=True)
+class _SyntheticInfo:
+    language: str
+    language_probability: float
+    duration: float
+
+
+class SyntheticWhisperModel:
+    """Deterministic stand-in for ``faster_whisper.WhisperModel`` used by CI benchmarks.
+
+    ``transcribe`` reads a PCM16 WAV, finds energy regions in 100 ms frames and emits one
+    segment per voiced region with evenly spaced placeholder words. ``load_seconds`` and
+    ``segment_seconds`` add simulated model-load and per-segment decode latency; with a
+    ``batch_size`` the decode latency is paid once per batch of segments.
+    """
+
+    frame_seconds = 0.1
+    energy_threshold = 500.0
+
+    def __init__(
+        self,
+        model_size_or_path: str,
+        device: str = "cpu",
+        compute_type: str = "default",
+        cpu_threads: int = 0,
+        num_workers: int = 1,
+        *,
+        load_seconds: float = 0.0,
+        segment_seconds: float = 0.0,
+    ):
+        self.model_size_or_path = model_size_or_path
+        self.device = device
+        self.compute_type = compute_type
+        self.cpu_threads = cpu_threads
+        self.num_workers = num_workers
+        self.segment_seconds = segment_seconds
+        if load_seconds > 0.0:
+            time.sleep(load_seconds)
+
+    def _voiced_regions(self, audio_path: Path) -> tuple[float, list[tuple[float, float]]]:
+        with wave.open(str(audio_path), "rb") as wav_file:
+            if wav_file.getsampwidth() != 2:
+                raise ValueError(f"Synthetic model only reads 16-bit PCM WAV: {audio_path}")
+            channels = wav_file.getnchannels()
+            sample_rate = wav_file.getframerate()
+            raw = wav_file.readframes(wav_file.getnframes())
+        samples = array("h")
+        samples.frombytes(raw)
+        if channels > 1:
+            samples = samples[::channels]
+        duration = len(samples) / sample_rate if sample_rate > 0 else 0.0
+        frame_size = max(1, int(sample_rate * self.frame_seconds))
+        regions: list[tuple[float, float]] = []
+        region_start: float | None = None
+        for offset in range(0, len(samples), frame_size):
+            frame = samples[offset : offset + frame_size]
+            rms = math.sqrt(sum(value * value for value in frame) / len(frame))
+            frame_start = offset / sample_rate
+            if rms >= self.energy_threshold:
+                if region_start is None:
+                    region_start = frame_start
+            elif region_start is not None:
+                regions.append((region_start, frame_start))
+                region_start = None
+        if region_start is not None:
+            regions.append((region_start, duration))
+        return duration, regions
+
+    def transcribe(
+        self, audio: str, *, batch_size: int = 1, **_kwargs: Any
+    ) -> tuple[Iterator[_SyntheticSegment], Any]:
+        duration, regions = self._voiced_regions(Path(audio))
+
+        def _segments() -> Iterator[_SyntheticSegment]:
+            for index, (start, end) in enumerate(regions):
+                if self.segment_seconds > 0.0 and index % batch_size == 0:
+                    time.sleep(self.segment_seconds)
+                word_count = max(1, int((end - start) / 0.3))
+                step = (end - start) / word_count
+                words = [
+                    _SyntheticWord(
+                        word=" " + _SYNTHETIC_WORDS[(index + offset) % len(_SYNTHETIC_WORDS)],
+                        start=round(start + offset * step, 3),
+                        end=round(start + (offset + 1) * step, 3),
+                        probability=0.9,
+                    )
+                    for offset in range(word_count)
+                ]
+                yield _SyntheticSegment(
+                    id=index,
+                    start=round(start, 3),
+                    end=round(end, 3),
+                    text="".join(word.word for word in words),
+                    words=words,
+                )
+
+        info = _SyntheticInfo(language="en", language_probability=1.0, duration=duration)
+        return _segments(), info
+
+
+def synthetic_whisper_factory(
+    *, load_seconds: float = 0.0, segment_seconds: float = 0.0
+) -> WhisperModelFactory:
+    """Return a ``SyntheticWhisperModel`` factory with simulated load and decode latency."""
+    if load_seconds < 0.0 or segment_seconds < 0.0:
+        raise ValueError("Synthetic model latencies must be >= 0.")
+    return partial(
+        SyntheticWhisperModel,
+        load_seconds=load_seconds,
+        segment_seconds=segment_seconds,
+    )
+
+
+def _slug(text: str) -> str:
+    normalized = re.sub(r"[^a-zA-Z0-9]+", "_", text).strip("_")
+    return normalized.lower() or "profile"
+
+
+def _wav_duration_seconds(path: Path) -> float | None:
+    try:
+        with wave.open(str(path), "rb") as wav_file:
+            rate = wav_file.getframerate()
+            return wav_file.getnframes() / rate if rate > 0 else None
+    except (wave.Error, EOFError, struct.error):
+        return None
+
+
+def _span_seconds(spans: list[Span], name: str) -> float:
+    return sum(item.duration_seconds for item in spans if item.name == name)
+
+
+def _benchmark_fixture(
+    *,
+    audio_path: Path,
+    asr_config: Any,
+    model_factory: WhisperModelFactory | None,
+) -> tuple[M1FixtureResult, list[Span]]:
+    # Spans finished while this fixture ran are appended after ``before``.
+    tracer = current_tracer()
+    before = len(tracer.spans) if tracer is not None else 0
+    transcript = transcribe_audio(audio_path, asr_config, model_factory=model_factory)
+    spans = list(tracer.spans[before:]) if tracer is not None else []
+    audio_seconds = _wav_duration_seconds(audio_path) or transcript.duration
+    return (
+        M1FixtureResult(
+            audio_path=audio_path,
+            audio_seconds=round(audio_seconds, 3),
+            model_load_seconds=round(_span_seconds(spans, "asr.model_load"), 6),
+            decode_seconds=round(
+                _span_seconds(spans, "asr.features") + _span_seconds(spans, "asr.decode"), 6
+            ),
+            segment_count=len(transcript.segments),
+            attempt_count=sum(1 for item in spans if item.name == "asr.attempt"),
+        ),
+        spans,
+    )
+
+
+def _result_to_dict(result: M1BenchmarkResult) -> dict[str, Any]:
+    return {
+        "profile_name": result.profile_name,
+        "config_path": str(result.config_path),
+        "status": result.status,
+        "model": result.model,
+        "device": result.device,
+        "compute_type": result.compute_type,
+        "batch_size": result.batch_size,
+        "audio_seconds": round(result.audio_seconds, 3),
+        "model_load_seconds": (
+            result.fixtures[0].model_load_seconds if result.fixtures else None
+        ),
+        "decode_seconds": round(result.decode_seconds, 6) if result.fixtures else None,
+        "decode_rtf": round(result.decode_rtf, 4) if result.decode_rtf is not None else None,
+        "segment_count": sum(item.segment_count for item in result.fixtures),
+        "fallback_used": any(item.attempt_count > 1 for item in result.fixtures),
+        "peak_rss_bytes": result.peak_rss_bytes,
+        "rss_growth_bytes": result.rss_growth_bytes,
+        "fixtures": [
+            {
+                "audio_path": str(item.audio_path),
+                "audio_seconds": item.audio_seconds,
+                "model_load_seconds": item.model_load_seconds,
+                "decode_seconds": item.decode_seconds,
+                "decode_rtf": round(item.decode_rtf, 4) if item.decode_rtf is not None else None,
+                "segment_count": item.segment_count,
+                "attempt_count": item.attempt_count,
+            }
+            for item in result.fixtures
+        ],
+        "trace_jsonl": str(result.trace_jsonl) if result.trace_jsonl else None,
+        "error": result.error,
+    }
+
+
+def _batched_comparisons(results: list[M1BenchmarkResult]) -> list[dict[str, Any]]:
+    """Pair each batched profile with a sequential one using the same model settings."""
+    sequential = {
+        (item.model, item.device, item.compute_type): item
+        for item in results
+        if item.status == "ok" and item.batch_size is None
+    }
+    comparisons: list[dict[str, Any]] = []
+    for item in results:
+        if item.status != "ok" or item.batch_size is None:
+            continue
+        baseline = sequential.get((item.model, item.device, item.compute_type))
+        if baseline is None:
+            continue
+        speedup = (
+            baseline.decode_seconds / item.decode_seconds if item.decode_seconds > 0 else None
+        )
+        comparisons.append(
+            {
+                "sequential_profile": baseline.profile_name,
+                "batched_profile": item.profile_name,
+                "batch_size": item.batch_size,
+                "sequential_decode_seconds": round(baseline.decode_seconds, 6),
+                "batched_decode_seconds": round(item.decode_seconds, 6),
+                "decode_speedup": round(speedup, 3) if speedup is not None else None,
+                "segment_count_delta": (
+                    sum(fixture.segment_count for fixture in item.fixtures)
+                    - sum(fixture.segment_count for fixture in baseline.fixtures)
+                ),
+            }
+        )
+    return comparisons
+
+
+def run_m1_profile_benchmark(
+    *,
+    run_root: Path,
+    audio_paths: list[Path],
+    config_paths: list[Path],
+    model_factory: WhisperModelFactory | None = None,
+) -> Path:
+    """Run ``transcribe_audio`` for every profile on the same audio fixtures.
+
+    Model load and decode times come from the ASR tracing spans. Peak RSS is the process
+    high-water mark, so ``rss_growth_bytes`` (how far a profile raised it) is the
+    comparable number when several profiles run in one process. Batched profiles are
+    compared with the sequential profile of the same model under ``batched_comparisons``.
+    """
+    if not audio_paths:
+        raise ValueError("At least one audio fixture is required for benchmark.")
+    for audio_path in audio_paths:
+        if not audio_path.exists():
+            raise FileNotFoundError(f"Audio fixture not found: {audio_path}")
+    if not config_paths:
+        raise ValueError("At least one config path is required for benchmark.")
+
+    benchmark_dir = run_root / "benchmarks"
+    benchmark_dir.mkdir(parents=True, exist_ok=True)
+
+    results: list[M1BenchmarkResult] = []
+    profile_counts: dict[str, int] = {}
+    for config_path in config_paths:
+        config = load_config(config_path)
+        profile_name = config_path.stem
+        count = profile_counts.get(profile_name, 0) + 1
+        profile_counts[profile_name] = count
+        profile_label = profile_name if count == 1 else f"{profile_name}_{count}"
+        asr = config.asr
+        batch_size = asr.batch_size if asr.batched else None
+
+        if model_factory is None and importlib.util.find_spec("faster_whisper") is None:
+            results.append(
+                M1BenchmarkResult(
+                    profile_name=profile_label,
+                    config_path=config_path,
+                    status="failed_preflight",
+                    model=asr.model,
+                    device=asr.device,
+                    compute_type=asr.compute_type,
+                    batch_size=batch_size,
+                    error="faster-whisper is not installed.",
+                )
+            )
+            continue
+
+        trace_path = trace_file_path(benchmark_dir, f"m1.{_slug(profile_label)}", "jsonl")
+        fixtures: list[M1FixtureResult] = []
+        profile_spans: list[Span] = []
+        try:
+            with trace_run(
+                "m1_benchmark_profile",
+                trace_format="jsonl",
+                output_path=trace_path,
+                profile=profile_label,
+            ):
+                for audio_path in audio_paths:
+                    fixture, spans = _benchmark_fixture(
+                        audio_path=audio_path,
+                        asr_config=asr,
+                        model_factory=model_factory,
+                    )
+                    fixtures.append(fixture)
+                    profile_spans.extend(spans)
+        except Exception as exc:  # noqa: BLE001
+            results.append(
+                M1BenchmarkResult(
+                    profile_name=profile_label,
+                    config_path=config_path,
+                    status="failed_run",
+                    model=asr.model,
+                    device=asr.device,
+                    compute_type=asr.compute_type,
+                    batch_size=batch_size,
+                    fixtures=fixtures,
+                    trace_jsonl=trace_path if trace_path.exists() else None,
+                    error=str(exc),
+                )
+            )
+            continue
+
+        rss_values = [
+            item.peak_rss_bytes for item in profile_spans if item.peak_rss_bytes is not None
+        ]
+        growth_values = [
+            item.rss_growth_bytes
+            for item in profile_spans
+            if item.name == "asr.attempt" and item.rss_growth_bytes is not None
+        ]
+        results.append(
+            M1BenchmarkResult(
+                profile_name=profile_label,
+                config_path=config_path,
+                status="ok",
+                model=asr.model,
+                device=asr.device,
+                compute_type=asr.compute_type,
+                batch_size=batch_size,
+                fixtures=fixtures,
+                peak_rss_bytes=max(rss_values) if rss_values else None,
+                rss_growth_bytes=sum(growth_values) if growth_values else None,
+                trace_jsonl=trace_path,
+            )
+        )
+
+    successful = [result for result in results if result.status == "ok"]
+    ranked = sorted(
+        successful,
+        key=lambda item: (
+            item.decode_rtf if item.decode_rtf is not None else float("inf"),
+            item.fixtures[0].model_load_seconds if item.fixtures else float("inf"),
+        ),
+    )
+
+    report_path = benchmark_dir / "m1_profile_benchmark.json"
+    payload = {
+        "stage": "m1_benchmark",
+        "run_root": str(run_root),
+        "audio_fixtures": [str(path) for path in audio_paths],
+        "model_factory": (
+            getattr(model_factory, "__name__", type(model_factory).__name__)
+            if model_factory is not None
+            else "faster_whisper.WhisperModel"
+        ),
+        "profiles": [_result_to_dict(result) for result in results],
+        "ranking": [result.profile_name for result in ranked],
+        "batched_comparisons": _batched_comparisons(results),
+        "summary": {
+            "profile_count": len(results),
+            "success_count": len(successful),
+            "failed_count": len(results) - len(successful),
+            "recommended_profile": ranked[0].profile_name if ranked else None,
+        },
+    }
+    write_json(report_path, payload)
+    return report_path
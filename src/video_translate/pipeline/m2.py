@@ -1,20 +1,36 @@
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
 from pathlib import Path
 from time import perf_counter
 from typing import Any
 
-from video_translate.config import AppConfig
-from video_translate.io import write_json
+from video_translate.config import AppConfig, TranslateConfig
+from video_translate.io import read_json, write_json
+from video_translate.pipeline.incremental import config_fingerprint, segment_fingerprint
 from video_translate.qa.m2_report import build_m2_qa_report
-from video_translate.translate.backends import build_translation_backend
+from video_translate.tracing import span, trace_file_path, trace_run
+from video_translate.translate.backends import (
+    BudgetedTranslationBackend,
+    build_translation_backend,
+)
 from video_translate.translate.contracts import (
+    TranslationInputSegment,
     build_translation_output_document,
     parse_translation_input_document,
 )
 from video_translate.translate.glossary import apply_glossary, load_glossary
+from video_translate.translate.length_control import (
+    char_budget,
+    pick_candidate,
+    predicted_seconds,
+    voice_chars_per_second,
+)
+from video_translate.translate.sentence_merge import (
+    SentenceUnit,
+    merge_sentence_units,
+    split_target_text,
+)
 
 
 @dataclass(frozen=True)
@@ -25,13 +41,6 @@ class M2Artifacts:
     run_manifest_json: Path
 
 
-def _read_json(path: Path) -> dict[str, Any]:
-    payload = json.loads(path.read_text(encoding="utf-8"))
-    if not isinstance(payload, dict):
-        raise ValueError(f"JSON root must be an object: {path}")
-    return payload
-
-
 def _build_unique_text_index(texts: list[str]) -> tuple[list[str], list[int]]:
     unique_texts: list[str] = []
     unique_lookup: dict[str, int] = {}
@@ -47,6 +56,133 @@ def _build_unique_text_index(texts: list[str]) -> tuple[list[str], list[int]]:
     return unique_texts, text_to_unique_index
 
 
+def _sentence_units(
+    segments: list[TranslationInputSegment],
+    pending_indices: list[int],
+    config: TranslateConfig,
+) -> list[SentenceUnit]:
+    """Sentence units over the pending segments; positions index ``pending_indices``.
+
+    Units never span a segment reused from a previous run, so each run of consecutive
+    pending segments is merged on its own.
+    """
+    units: list[SentenceUnit] = []
+    run_start = 0
+    for position in range(1, len(pending_indices) + 1):
+        if (
+            position < len(pending_indices)
+            and pending_indices[position] == pending_indices[position - 1] + 1
+        ):
+            continue
+        run = [segments[index] for index in pending_indices[run_start:position]]
+        for unit in merge_sentence_units(
+            run,
+            max_gap_seconds=config.sentence_merge_max_gap_seconds,
+            max_segments=config.sentence_merge_max_segments,
+            max_words=config.sentence_merge_max_words,
+        ):
+            units.append(
+                SentenceUnit(
+                    positions=tuple(run_start + item for item in unit.positions),
+                    text=unit.text,
+                )
+            )
+        run_start = position
+    return units
+
+
+def _translate_within_budgets(
+    backend: BudgetedTranslationBackend,
+    texts: list[str],
+    durations: list[float],
+    *,
+    chars_per_second: float,
+    source_language: str,
+    target_language: str,
+    config: TranslateConfig,
+) -> tuple[list[str], int, int]:
+    """Translations fitted to each text's speech duration, with the switched-candidate and
+    capped-retranslation counts.
+
+    Texts whose every candidate hit the decoding cap are translated again without the
+    budget instead of keeping a sentence cut short.
+    """
+    budgets = [
+        char_budget(duration, chars_per_second, config.length_control_tolerance)
+        for duration in durations
+    ]
+    candidates = backend.translate_batch_with_budget(
+        texts,
+        source_language=source_language,
+        target_language=target_language,
+        batch_size=config.batch_size,
+        char_budgets=budgets,
+        num_candidates=config.length_control_candidates,
+    )
+    translations: list[str] = []
+    capped_positions: list[int] = []
+    switched_count = 0
+    for position, (items, budget) in enumerate(zip(candidates, budgets, strict=True)):
+        picked = pick_candidate(items, budget)
+        if picked is None:
+            capped_positions.append(position)
+            translations.append("")
+            continue
+        switched_count += int(picked != items[0])
+        translations.append(picked.text)
+    if capped_positions:
+        # Its own span name: these texts are already counted by the enclosing mt.translate
+        # span, which the metrics observer turns into throughput samples.
+        with span("mt.retranslate_capped", text_count=len(capped_positions)):
+            retranslated = backend.translate_batch(
+                [texts[position] for position in capped_positions],
+                source_language=source_language,
+                target_language=target_language,
+                batch_size=config.batch_size,
+            )
+        for position, text in zip(capped_positions, retranslated, strict=True):
+            translations[position] = text
+    return translations, switched_count, len(capped_positions)
+
+
+def _load_previous_target_texts(
+    *,
+    output_json_path: Path,
+    run_manifest_json_path: Path,
+    expected_config_fingerprint: str,
+) -> dict[int, tuple[str, str]] | None:
+    """Map segment id -> (source fingerprint, target text) from the previous M2 run."""
+    if not output_json_path.exists() or not run_manifest_json_path.exists():
+        return None
+    try:
+        manifest_payload = read_json(run_manifest_json_path)
+        output_payload = read_json(output_json_path)
+    except ValueError:
+        return None
+    incremental_payload = manifest_payload.get("incremental", {})
+    if not isinstance(incremental_payload, dict):
+        return None
+    if incremental_payload.get("config_fingerprint") != expected_config_fingerprint:
+        return None
+    segments_payload = output_payload.get("segments", [])
+    if not isinstance(segments_payload, list):
+        return None
+    previous: dict[int, tuple[str, str]] = {}
+    for raw in segments_payload:
+        if not isinstance(raw, dict) or "id" not in raw:
+            continue
+        previous[int(raw["id"])] = (
+            segment_fingerprint(
+                text=str(raw.get("source_text", "")),
+                start=float(raw.get("start", 0.0)),
+                end=float(raw.get("end", 0.0)),
+                duration=float(raw.get("duration", 0.0)),
+            ),
+            str(raw.get("target_text", "")),
+        )
+    return previous
+
+
 def _blocked_quality_flags(qa_report: dict[str, Any], allowed_flags: tuple[str, ...]) -> list[str]:
     allowed = set(allowed_flags)
     raw_flags = qa_report.get("quality_flags", [])
@@ -64,120 +200,324 @@ def run_m2_pipeline(
     run_manifest_json_path: Path,
     config: AppConfig,
     target_language_override: str | None = None,
+    incremental: bool = False,
 ) -> M2Artifacts:
-    pipeline_start = perf_counter()
-    if not translation_input_json_path.exists():
-        raise FileNotFoundError(f"Translation input JSON not found: {translation_input_json_path}")
-
-    read_start = perf_counter()
-    input_payload = _read_json(translation_input_json_path)
-    input_doc = parse_translation_input_document(input_payload)
-    read_seconds = perf_counter() - read_start
-
-    target_language = target_language_override or config.translate.target_language
-    if input_doc.target_language != target_language:
-        input_doc = parse_translation_input_document(
-            {
-                **input_doc.to_dict(),
-                "target_language": target_language,
-            }
+    trace_format = config.pipeline.trace_format
+    with trace_run(
+        "m2",
+        trace_format=trace_format,
+        output_path=trace_file_path(run_manifest_json_path.parent / "logs", "m2", trace_format),
+    ):
+        pipeline_start = perf_counter()
+        if not translation_input_json_path.exists():
+            raise FileNotFoundError(
+                f"Translation input JSON not found: {translation_input_json_path}"
+            )
+
+        read_start = perf_counter()
+        with span("read_input"):
+            input_payload = read_json(translation_input_json_path)
+            input_doc = parse_translation_input_document(input_payload)
+        read_seconds = perf_counter() - read_start
+
+        target_language = target_language_override or config.translate.target_language
+        if input_doc.target_language != target_language:
+            input_doc = parse_translation_input_document(
+                {
+                    **input_doc.to_dict(),
+                    "target_language": target_language,
+                }
+            )
+
+        with span("mt.load", backend=config.translate.backend):
+            backend = build_translation_backend(config.translate)
+            glossary = load_glossary(config.translate.glossary_path)
+        length_control = config.translate.length_control_enabled
+        chars_per_second = voice_chars_per_second(
+            config.tts, config.translate.length_control_chars_per_second
+        )
+        translate_config_fingerprint = config_fingerprint(
+            config.translate,
+            extra={
+                "source_language": input_doc.source_language,
+                "target_language": input_doc.target_language,
+                "glossary": glossary,
+                # The budgets follow the TTS voice rate when length control is on.
+                "chars_per_second": chars_per_second if length_control else None,
+            },
         )
+        previous_targets = (
+            _load_previous_target_texts(
+                output_json_path=output_json_path,
+                run_manifest_json_path=run_manifest_json_path,
+                expected_config_fingerprint=translate_config_fingerprint,
+            )
+            if incremental
+            else None
+        )
+        source_texts = [segment.source_text for segment in input_doc.segments]
+        translated_texts: list[str] = ["" for _ in source_texts]
+        pending_indices: list[int] = []
+        for index, segment in enumerate(input_doc.segments):
+            previous = previous_targets.get(segment.id) if previous_targets is not None else None
+            if previous is not None and previous[0] == segment_fingerprint(
+                text=segment.source_text,
+                start=segment.start,
+                end=segment.end,
+                duration=segment.duration,
+            ):
+                # Reuse the stored target text as-is so manual edits survive re-runs.
+                translated_texts[index] = previous[1]
+            else:
+                pending_indices.append(index)
+        reused_segment_count = len(source_texts) - len(pending_indices)
 
-    backend = build_translation_backend(config.translate)
-    glossary = load_glossary(config.translate.glossary_path)
-    source_texts = [segment.source_text for segment in input_doc.segments]
-    unique_texts, text_to_unique_index = _build_unique_text_index(source_texts)
-    translate_start = perf_counter()
-    translated_unique_texts = backend.translate_batch(
-        unique_texts,
-        source_language=input_doc.source_language,
-        target_language=input_doc.target_language,
-        batch_size=config.translate.batch_size,
-    )
-    translate_seconds = perf_counter() - translate_start
-    translated_texts = [translated_unique_texts[index] for index in text_to_unique_index]
-    if config.translate.apply_glossary_postprocess and glossary:
-        glossary_start = perf_counter()
-        translated_texts = [
-            apply_glossary(
-                text,
-                glossary,
-                case_sensitive=config.translate.glossary_case_sensitive,
+        pending_texts = [source_texts[index] for index in pending_indices]
+        unique_texts, _ = _build_unique_text_index(pending_texts)
+        units = (
+            _sentence_units(input_doc.segments, pending_indices, config.translate)
+            if config.translate.sentence_merge_enabled
+            else None
+        )
+        mt_inputs = [unit.text for unit in units] if units is not None else pending_texts
+        unique_inputs, input_to_unique_index = _build_unique_text_index(mt_inputs)
+        # Seconds of speech available to each unique MT input (the shortest occurrence).
+        unique_input_durations = [float("inf")] * len(unique_inputs)
+        for input_position, unique_index in enumerate(input_to_unique_index):
+            positions = units[input_position].positions if units is not None else (input_position,)
+            duration = sum(input_doc.segments[pending_indices[p]].duration for p in positions)
+            unique_input_durations[unique_index] = min(
+                unique_input_durations[unique_index], duration
             )
-            for text in translated_texts
+        budgeted_backend: BudgetedTranslationBackend | None = None
+        if length_control and isinstance(backend, BudgetedTranslationBackend):
+            budgeted_backend = backend
+        length_control_applied = budgeted_backend is not None
+        switched_candidate_count = 0
+        capped_retranslation_count = 0
+        translate_start = perf_counter()
+        translated_unique_inputs: list[str] = []
+        split_fallback_positions: list[int] = []
+        if unique_inputs:
+            with span(
+                "mt.translate",
+                text_count=len(unique_inputs),
+                sentence_merge=units is not None,
+                length_control=length_control_applied,
+            ):
+                if budgeted_backend is not None:
+                    translated_unique_inputs, switched, capped = _translate_within_budgets(
+                        budgeted_backend,
+                        unique_inputs,
+                        unique_input_durations,
+                        chars_per_second=chars_per_second,
+                        source_language=input_doc.source_language,
+                        target_language=input_doc.target_language,
+                        config=config.translate,
+                    )
+                    switched_candidate_count += switched
+                    capped_retranslation_count += capped
+                else:
+                    translated_unique_inputs = backend.translate_batch(
+                        unique_inputs,
+                        source_language=input_doc.source_language,
+                        target_language=input_doc.target_language,
+                        batch_size=config.translate.batch_size,
+                    )
+        translated_inputs = [translated_unique_inputs[index] for index in input_to_unique_index]
+        if units is None:
+            pending_translations = translated_inputs
+        else:
+            pending_translations = ["" for _ in pending_texts]
+            for unit, translated_unit in zip(units, translated_inputs, strict=True):
+                parts = split_target_text(
+                    translated_unit,
+                    [input_doc.segments[pending_indices[p]].duration for p in unit.positions],
+                )
+                if parts is None:
+                    # Too few target words to give every segment its own; translate them
+                    # one by one instead.
+                    split_fallback_positions.extend(unit.positions)
+                    continue
+                for position, part in zip(unit.positions, parts, strict=True):
+                    pending_translations[position] = part
+            if split_fallback_positions:
+                fallback_texts = [pending_texts[position] for position in split_fallback_positions]
+                with span("mt.translate", text_count=len(split_fallback_positions)):
+                    if budgeted_backend is not None:
+                        fallback_translations, switched, capped = _translate_within_budgets(
+                            budgeted_backend,
+                            fallback_texts,
+                            [
+                                input_doc.segments[pending_indices[position]].duration
+                                for position in split_fallback_positions
+                            ],
+                            chars_per_second=chars_per_second,
+                            source_language=input_doc.source_language,
+                            target_language=input_doc.target_language,
+                            config=config.translate,
+                        )
+                        switched_candidate_count += switched
+                        capped_retranslation_count += capped
+                    else:
+                        fallback_translations = backend.translate_batch(
+                            fallback_texts,
+                            source_language=input_doc.source_language,
+                            target_language=input_doc.target_language,
+                            batch_size=config.translate.batch_size,
+                        )
+                for position, text in zip(
+                    split_fallback_positions, fallback_translations, strict=True
+                ):
+                    pending_translations[position] = text
+        translate_seconds = perf_counter() - translate_start
+        mt_input_count = len(unique_inputs) + len(split_fallback_positions)
+        # Per-input cost of this run applied to the inputs merging avoided; an estimate,
+        # since merged inputs are longer than the fragments they replace.
+        estimated_seconds_saved = (
+            translate_seconds / mt_input_count * (len(unique_texts) - mt_input_count)
+            if units is not None and mt_input_count > 0
+            else 0.0
+        )
+        if config.translate.apply_glossary_postprocess and glossary:
+            glossary_start = perf_counter()
+            with span("glossary"):
+                pending_translations = [
+                    apply_glossary(
+                        text,
+                        glossary,
+                        case_sensitive=config.translate.glossary_case_sensitive,
+                    )
+                    for text in pending_translations
+                ]
+            glossary_seconds = perf_counter() - glossary_start
+        else:
+            glossary_seconds = 0.0
+        for index, translated_text in zip(pending_indices, pending_translations, strict=True):
+            translated_texts[index] = translated_text
+
+        # Predicted with the voice rate whether or not length control ran, so runs with
+        # and without it compare directly.
+        predicted_overruns = [
+            predicted_seconds(text, chars_per_second) - segment.duration
+            for segment, text in zip(input_doc.segments, translated_texts, strict=True)
         ]
-        glossary_seconds = perf_counter() - glossary_start
-    else:
-        glossary_seconds = 0.0
-
-    output_contract_start = perf_counter()
-    output_doc = build_translation_output_document(
-        input_doc=input_doc,
-        translated_texts=translated_texts,
-        backend=backend.name,
-    )
-    output_contract_seconds = perf_counter() - output_contract_start
+        tolerance = config.translate.length_control_tolerance
+        over_budget_segment_count = sum(
+            1
+            for segment, text in zip(input_doc.segments, translated_texts, strict=True)
+            if predicted_seconds(text, chars_per_second) > segment.duration * tolerance
+        )
 
-    qa_start = perf_counter()
-    qa_report = build_m2_qa_report(
-        output_doc,
-        config.translate,
-        glossary=glossary,
-    )
-    qa_seconds = perf_counter() - qa_start
-
-    output_json_path.parent.mkdir(parents=True, exist_ok=True)
-    qa_report_json_path.parent.mkdir(parents=True, exist_ok=True)
-    run_manifest_json_path.parent.mkdir(parents=True, exist_ok=True)
-    write_start = perf_counter()
-    write_json(output_json_path, output_doc.to_dict())
-    write_json(qa_report_json_path, qa_report)
-    write_seconds = perf_counter() - write_start
-    blocked_flags = _blocked_quality_flags(qa_report, config.translate.qa_allowed_flags)
-    qa_gate_passed = not blocked_flags
-    total_seconds = perf_counter() - pipeline_start
-    write_json(
-        run_manifest_json_path,
-        {
-            "stage": "m2",
-            "backend": backend.name,
-            "inputs": {
-                "translation_input_json": str(translation_input_json_path),
-            },
-            "outputs": {
-                "translation_output_json": str(output_json_path),
-                "qa_report_json": str(qa_report_json_path),
-            },
-            "speed": {
-                "source_segment_count": len(source_texts),
-                "unique_source_text_count": len(unique_texts),
-                "translation_reuse_count": len(source_texts) - len(unique_texts),
-            },
-            "timings_seconds": {
-                "read_input": read_seconds,
-                "translate_backend": translate_seconds,
-                "glossary_postprocess": glossary_seconds,
-                "build_output_contract": output_contract_seconds,
-                "build_qa_report": qa_seconds,
-                "write_outputs": write_seconds,
-                "total_pipeline": total_seconds,
-            },
-            "qa_gate": {
-                "enabled": config.translate.qa_fail_on_flags,
-                "passed": qa_gate_passed,
-                "allowed_flags": list(config.translate.qa_allowed_flags),
-                "blocked_flags": blocked_flags,
+        output_contract_start = perf_counter()
+        output_doc = build_translation_output_document(
+            input_doc=input_doc,
+            translated_texts=translated_texts,
+            backend=backend.name,
+        )
+        output_contract_seconds = perf_counter() - output_contract_start
+
+        qa_start = perf_counter()
+        with span("qa"):
+            qa_report = build_m2_qa_report(
+                output_doc,
+                config.translate,
+                glossary=glossary,
+            )
+        qa_seconds = perf_counter() - qa_start
+
+        output_json_path.parent.mkdir(parents=True, exist_ok=True)
+        qa_report_json_path.parent.mkdir(parents=True, exist_ok=True)
+        run_manifest_json_path.parent.mkdir(parents=True, exist_ok=True)
+        write_start = perf_counter()
+        with span("write_outputs"):
+            write_json(output_json_path, output_doc, compact=config.pipeline.compact_json)
+            write_json(qa_report_json_path, qa_report)
+        write_seconds = perf_counter() - write_start
+        blocked_flags = _blocked_quality_flags(qa_report, config.translate.qa_allowed_flags)
+        qa_gate_passed = not blocked_flags
+        total_seconds = perf_counter() - pipeline_start
+        write_json(
+            run_manifest_json_path,
+            {
+                "stage": "m2",
+                "backend": backend.name,
+                "inputs": {
+                    "translation_input_json": str(translation_input_json_path),
+                },
+                "outputs": {
+                    "translation_output_json": str(output_json_path),
+                    "qa_report_json": str(qa_report_json_path),
+                },
+                "speed": {
+                    "source_segment_count": len(source_texts),
+                    "unique_source_text_count": len(unique_texts),
+                    "translation_reuse_count": len(pending_texts) - len(unique_texts),
+                    "mt_input_count": mt_input_count,
+                    "sentence_merge": {
+                        "enabled": units is not None,
+                        "unit_count": len(units) if units is not None else 0,
+                        "merged_unit_count": (
+                            sum(1 for unit in units if len(unit.positions) > 1)
+                            if units is not None
+                            else 0
+                        ),
+                        "split_fallback_segment_count": len(split_fallback_positions),
+                        "mt_input_count_without_merge": len(unique_texts),
+                        "estimated_translate_seconds_saved": round(estimated_seconds_saved, 6),
+                    },
+                },
+                "length_control": {
+                    "enabled": length_control,
+                    "applied": length_control_applied,
+                    "chars_per_second": round(chars_per_second, 4),
+                    # "estimated" rates come from length_control's unmeasured defaults.
+                    "chars_per_second_source": (
+                        "configured"
+                        if config.translate.length_control_chars_per_second > 0.0
+                        else "estimated"
+                    ),
+                    "tolerance": tolerance,
+                    "candidates": config.translate.length_control_candidates,
+                    "switched_candidate_count": switched_candidate_count,
+                    "capped_retranslation_count": capped_retranslation_count,
+                    "predicted_over_budget_segment_count": over_budget_segment_count,
+                    "predicted_overrun_seconds": round(
+                        sum(max(0.0, overrun) for overrun in predicted_overruns), 6
+                    ),
+                },
+                "incremental": {
+                    "enabled": incremental,
+                    "previous_output_used": previous_targets is not None,
+                    "config_fingerprint": translate_config_fingerprint,
+                    "reused_segment_count": reused_segment_count,
+                    "changed_segment_count": len(pending_indices),
+                },
+                "timings_seconds": {
+                    "read_input": read_seconds,
+                    "translate_backend": translate_seconds,
+                    "glossary_postprocess": glossary_seconds,
+                    "build_output_contract": output_contract_seconds,
+                    "build_qa_report": qa_seconds,
+                    "write_outputs": write_seconds,
+                    "total_pipeline": total_seconds,
+                },
+                "qa_gate": {
+                    "enabled": config.translate.qa_fail_on_flags,
+                    "passed": qa_gate_passed,
+                    "allowed_flags": list(config.translate.qa_allowed_flags),
+                    "blocked_flags": blocked_flags,
+                },
             },
-        },
-    )
-    if config.translate.qa_fail_on_flags and not qa_gate_passed:
-        raise RuntimeError(
-            "M2 QA gate failed. Blocked quality flags: " + ", ".join(blocked_flags)
         )
+        if config.translate.qa_fail_on_flags and not qa_gate_passed:
+            raise RuntimeError(
+                "M2 QA gate failed. Blocked quality flags: " + ", ".join(blocked_flags)
+            )
 
-    return M2Artifacts(
-        translation_input_json=translation_input_json_path,
-        translation_output_json=output_json_path,
-        qa_report_json=qa_report_json_path,
-        run_manifest_json=run_manifest_json_path,
-    )
+        return M2Artifacts(
+            translation_input_json=translation_input_json_path,
+            translation_output_json=output_json_path,
+            qa_report_json=qa_report_json_path,
+            run_manifest_json=run_manifest_json_path,
+        )
@@ -6,9 +6,10 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
-from video_translate.config import load_config
+from video_translate.config import AppConfig, load_config
+from video_translate.io import read_json
 from video_translate.pipeline.m2 import M2Artifacts, run_m2_pipeline
-from video_translate.preflight import preflight_errors, run_preflight
+from video_translate.preflight import PREFLIGHT_CACHE_TTL_SECONDS, preflight_errors, run_preflight
 
 
 @dataclass(frozen=True)
@@ -23,13 +24,9 @@ class M2BenchmarkResult:
     quality_flag_count: int | None
     quality_flags: list[str]
     error: str | None
-
-
-def _read_json(path: Path) -> dict[str, Any]:
-    payload = json.loads(path.read_text(encoding="utf-8"))
-    if not isinstance(payload, dict):
-        raise ValueError(f"JSON root must be an object: {path}")
-    return payload
+    backend: str = "mock"
+    model_id: str | None = None
+    translate_backend_seconds: float | None = None
 
 
 def _slug(text: str) -> str:
@@ -41,6 +38,48 @@ def _profile_name_from_path(config_path: Path) -> str:
     return config_path.stem
 
 
+def _backend_model_id(config: AppConfig) -> str | None:
+    backend = config.translate.backend.strip().lower()
+    if backend == "transformers":
+        return config.translate.transformers.model_id
+    if backend == "ctranslate2":
+        return config.translate.ctranslate2.model_id
+    return None
+
+
+def _backend_comparisons(results: list[M2BenchmarkResult]) -> list[dict[str, Any]]:
+    """Pair each ctranslate2 profile with a transformers profile running the same model."""
+    baselines = {
+        item.model_id: item
+        for item in results
+        if item.status == "ok" and item.backend == "transformers"
+    }
+    comparisons: list[dict[str, Any]] = []
+    for item in results:
+        if item.status != "ok" or item.backend != "ctranslate2":
+            continue
+        baseline = baselines.get(item.model_id)
+        if baseline is None:
+            continue
+        baseline_seconds = baseline.translate_backend_seconds or 0.0
+        item_seconds = item.translate_backend_seconds or 0.0
+        speedup = baseline_seconds / item_seconds if item_seconds > 0 else None
+        comparisons.append(
+            {
+                "model_id": item.model_id,
+                "transformers_profile": baseline.profile_name,
+                "ctranslate2_profile": item.profile_name,
+                "transformers_translate_seconds": round(baseline_seconds, 6),
+                "ctranslate2_translate_seconds": round(item_seconds, 6),
+                "translate_speedup": round(speedup, 3) if speedup is not None else None,
+                "quality_flag_count_delta": (
+                    (item.quality_flag_count or 0) - (baseline.quality_flag_count or 0)
+                ),
+            }
+        )
+    return comparisons
+
+
 def run_m2_profile_benchmark(
     *,
     run_root: Path,
@@ -66,12 +105,15 @@ def run_m2_profile_benchmark(
         profile_counts[profile_name] = count
         profile_label = profile_name if count == 1 else f"{profile_name}_{count}"
         profile_slug = _slug(profile_label)
+        backend = config.translate.backend.strip().lower()
+        model_id = _backend_model_id(config)
 
         preflight = run_preflight(
             yt_dlp_bin=config.tools.yt_dlp,
             ffmpeg_bin=config.tools.ffmpeg,
             translate_backend=config.translate.backend,
             check_translate_backend=True,
+            cache_ttl_seconds=PREFLIGHT_CACHE_TTL_SECONDS,
         )
         issues = preflight_errors(preflight)
         if issues:
@@ -87,6 +129,8 @@ def run_m2_profile_benchmark(
                     quality_flag_count=None,
                     quality_flags=[],
                     error="; ".join(issues),
+                    backend=backend,
+                    model_id=model_id,
                 )
             )
             continue
@@ -104,10 +148,11 @@ def run_m2_profile_benchmark(
                 config=config,
                 target_language_override=config.translate.target_language,
             )
-            manifest_payload = _read_json(artifacts.run_manifest_json)
-            qa_payload = _read_json(artifacts.qa_report_json)
+            manifest_payload = read_json(artifacts.run_manifest_json)
+            qa_payload = read_json(artifacts.qa_report_json)
             timings_payload = manifest_payload.get("timings_seconds", {})
             total_pipeline_seconds = float(timings_payload.get("total_pipeline", 0.0))
+            translate_backend_seconds = float(timings_payload.get("translate_backend", 0.0))
             quality_flags_raw = qa_payload.get("quality_flags", [])
             if not isinstance(quality_flags_raw, list):
                 quality_flags_raw = []
@@ -124,6 +169,9 @@ def run_m2_profile_benchmark(
                     quality_flag_count=len(quality_flags),
                     quality_flags=quality_flags,
                     error=None,
+                    backend=backend,
+                    model_id=model_id,
+                    translate_backend_seconds=translate_backend_seconds,
                 )
             )
         except Exception as exc:  # noqa: BLE001
@@ -139,6 +187,8 @@ def run_m2_profile_benchmark(
                     quality_flag_count=None,
                     quality_flags=[],
                     error=str(exc),
+                    backend=backend,
+                    model_id=model_id,
                 )
             )
 
@@ -161,10 +211,13 @@ def run_m2_profile_benchmark(
                 "profile_name": result.profile_name,
                 "config_path": str(result.config_path),
                 "status": result.status,
+                "backend": result.backend,
+                "model_id": result.model_id,
                 "output_json": str(result.output_json) if result.output_json else None,
                 "qa_report_json": str(result.qa_report_json) if result.qa_report_json else None,
                 "run_manifest_json": str(result.run_manifest_json) if result.run_manifest_json else None,
                 "total_pipeline_seconds": result.total_pipeline_seconds,
+                "translate_backend_seconds": result.translate_backend_seconds,
                 "quality_flag_count": result.quality_flag_count,
                 "quality_flags": result.quality_flags,
                 "error": result.error,
@@ -172,6 +225,7 @@ def run_m2_profile_benchmark(
             for result in results
         ],
         "ranking": [result.profile_name for result in ranked],
+        "backend_comparisons": _backend_comparisons(results),
         "summary": {
             "profile_count": len(results),
             "success_count": len(successful),
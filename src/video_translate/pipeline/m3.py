@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import json
+import math
 import struct
 import wave
 from dataclasses import dataclass
@@ -8,15 +8,20 @@ from pathlib import Path
 from time import perf_counter
 from typing import Any
 
+from video_translate.asr.vad import SPEECH_MAP_FILENAME, SpeechMap, read_speech_map
 from video_translate.config import AppConfig
-from video_translate.io import write_json
+from video_translate.io import read_json, write_json
+from video_translate.pipeline.incremental import config_fingerprint, segment_fingerprint
 from video_translate.qa.m3_report import build_m3_qa_report
-from video_translate.tts.backends import build_tts_backend
+from video_translate.tracing import span, trace_file_path, trace_run
+from video_translate.tts.backends import TTSBackend, build_tts_backend
 from video_translate.tts.contracts import (
+    TTSInputSegment,
     TTSOutputDocument,
     build_tts_output_document,
     parse_tts_input_document,
 )
+from video_translate.utils.subprocess_utils import command_stats_since, command_stats_snapshot
 
 
 @dataclass(frozen=True)
@@ -28,13 +33,6 @@ class M3Artifacts:
     stitched_preview_wav: Path
 
 
-def _read_json(path: Path) -> dict[str, Any]:
-    payload = json.loads(path.read_text(encoding="utf-8"))
-    if not isinstance(payload, dict):
-        raise ValueError(f"JSON root must be an object: {path}")
-    return payload
-
-
 def _blocked_quality_flags(qa_report: dict[str, Any], allowed_flags: tuple[str, ...]) -> list[str]:
     allowed = set(allowed_flags)
     raw_flags = qa_report.get("quality_flags", [])
@@ -59,17 +57,18 @@ def _read_wav_mono_pcm16(path: Path) -> tuple[int, list[int]]:
     return sample_rate, samples
 
 
+def _pack_pcm16(samples: list[int]) -> bytes:
+    clamped = [max(-32768, min(32767, int(sample))) for sample in samples]
+    return struct.pack(f"<{len(clamped)}h", *clamped)
+
+
 def _write_wav_mono_pcm16(path: Path, sample_rate: int, samples: list[int]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     with wave.open(str(path), "wb") as wav_file:
         wav_file.setnchannels(1)
         wav_file.setsampwidth(2)
         wav_file.setframerate(sample_rate)
-        frame_blob = b"".join(
-            int(max(-32768, min(32767, sample))).to_bytes(2, byteorder="little", signed=True)
-            for sample in samples
-        )
-        wav_file.writeframes(frame_blob)
+        wav_file.writeframes(_pack_pcm16(samples))
 
 
 def _pad_wav_silence_to_duration(wav_path: Path, target_duration: float) -> float:
@@ -159,6 +158,170 @@ def _build_stitched_preview_wav(*, output_doc: TTSOutputDocument, preview_wav_pa
     return preview_wav_path
 
 
+def _wav_data_offset(path: Path) -> int | None:
+    with path.open("rb") as handle:
+        header = handle.read(12)
+        if len(header) < 12 or header[:4] != b"RIFF" or header[8:12] != b"WAVE":
+            return None
+        offset = 12
+        while True:
+            chunk_header = handle.read(8)
+            if len(chunk_header) < 8:
+                return None
+            chunk_id = chunk_header[:4]
+            chunk_size = int.from_bytes(chunk_header[4:8], byteorder="little")
+            if chunk_id == b"data":
+                return offset + 8
+            skip = chunk_size + (chunk_size & 1)
+            handle.seek(skip, 1)
+            offset += 8 + skip
+
+
+def _merge_frame_ranges(ranges: list[tuple[int, int]]) -> list[tuple[int, int]]:
+    merged: list[tuple[int, int]] = []
+    for start, end in sorted(item for item in ranges if item[1] > item[0]):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def _patch_stitched_preview_wav(
+    *,
+    output_doc: TTSOutputDocument,
+    preview_wav_path: Path,
+    dirty_ranges_seconds: list[tuple[float, float]],
+) -> bool:
+    """Re-mix only the dirty time ranges of an existing preview WAV.
+
+    Returns False when the existing preview cannot be patched in place (missing file,
+    different format or a changed total length); callers then rebuild it fully.
+    """
+    if not preview_wav_path.exists():
+        return False
+    with wave.open(str(preview_wav_path), "rb") as wav_file:
+        channels = wav_file.getnchannels()
+        sample_width = wav_file.getsampwidth()
+        sample_rate = wav_file.getframerate()
+        preview_frame_count = wav_file.getnframes()
+    if channels != 1 or sample_width != 2 or sample_rate <= 0:
+        return False
+
+    spans: list[tuple[int, int, Path]] = []
+    for segment in output_doc.segments:
+        audio_path = Path(segment.audio_path)
+        with wave.open(str(audio_path), "rb") as wav_file:
+            if wav_file.getframerate() != sample_rate:
+                return False
+            frame_count = wav_file.getnframes()
+        start_frame = max(0, int(round(float(segment.start) * sample_rate)))
+        spans.append((start_frame, start_frame + frame_count, audio_path))
+    expected_frame_count = max((end for _, end, _ in spans), default=0) or 1
+    if expected_frame_count != preview_frame_count:
+        return False
+
+    data_offset = _wav_data_offset(preview_wav_path)
+    if data_offset is None:
+        return False
+
+    # Widen by one frame on each side; re-mixing extra frames is exact, missing one is not.
+    frame_ranges = _merge_frame_ranges(
+        [
+            (
+                max(0, int(math.floor(start * sample_rate)) - 1),
+                min(expected_frame_count, int(math.ceil(end * sample_rate)) + 1),
+            )
+            for start, end in dirty_ranges_seconds
+        ]
+    )
+    sample_cache: dict[Path, list[int]] = {}
+    with preview_wav_path.open("r+b") as handle:
+        for range_start, range_end in frame_ranges:
+            mixed = [0] * (range_end - range_start)
+            for span_start, span_end, audio_path in spans:
+                if span_end <= range_start or span_start >= range_end:
+                    continue
+                samples = sample_cache.get(audio_path)
+                if samples is None:
+                    _, samples = _read_wav_mono_pcm16(audio_path)
+                    sample_cache[audio_path] = samples
+                overlap_start = max(range_start, span_start)
+                overlap_end = min(range_end, span_end)
+                for frame in range(overlap_start, overlap_end):
+                    mixed[frame - range_start] += samples[frame - span_start]
+            handle.seek(data_offset + range_start * 2)
+            handle.write(_pack_pcm16(mixed))
+    return True
+
+
+def _speech_alignment(
+    *, output_doc: TTSOutputDocument, speech_map: SpeechMap, map_path: Path
+) -> dict[str, Any]:
+    """How much stitched TTS audio lands where the source speech map found no speech."""
+    tts_seconds = 0.0
+    outside_seconds = 0.0
+    for segment in output_doc.segments:
+        start = float(segment.start)
+        end = start + float(segment.synthesized_duration)
+        tts_seconds += end - start
+        outside_seconds += (end - start) - speech_map.overlap_seconds(start, end)
+    return {
+        "path": str(map_path),
+        "source_speech_seconds": round(speech_map.speech_seconds, 3),
+        "tts_seconds": round(tts_seconds, 3),
+        "tts_seconds_outside_source_speech": round(outside_seconds, 3),
+        "outside_ratio": round(outside_seconds / tts_seconds, 4) if tts_seconds > 0 else None,
+    }
+
+
+def _synthesize_segment(
+    *,
+    backend: TTSBackend,
+    segment: TTSInputSegment,
+    output_wav: Path,
+    sample_rate: int,
+) -> tuple[float, float, float]:
+    """Synthesize one segment and post-fit it; returns (duration, padded, trimmed) seconds."""
+    with span("tts.synth"):
+        synthesized_duration = backend.synthesize_to_wav(
+            text=segment.target_text,
+            output_wav=output_wav,
+            target_duration=segment.duration,
+            sample_rate=sample_rate,
+        )
+    padded_seconds = 0.0
+    trimmed_seconds = 0.0
+    if synthesized_duration < segment.duration:
+        with span("tts.postfit", action="pad"):
+            padded_duration = _pad_wav_silence_to_duration(output_wav, segment.duration)
+        if padded_duration > synthesized_duration:
+            padded_seconds = padded_duration - synthesized_duration
+            synthesized_duration = padded_duration
+    elif synthesized_duration > segment.duration:
+        with span("tts.postfit", action="trim"):
+            trimmed_duration = _trim_wav_to_duration(output_wav, segment.duration)
+        if trimmed_duration < synthesized_duration:
+            trimmed_seconds = synthesized_duration - trimmed_duration
+            synthesized_duration = trimmed_duration
+    return synthesized_duration, padded_seconds, trimmed_seconds
+
+
+def _read_segment_index(path: Path, expected_config_fingerprint: str) -> dict[str, Any] | None:
+    if not path.exists():
+        return None
+    try:
+        payload = read_json(path)
+    except ValueError:
+        return None
+    if payload.get("config_fingerprint") != expected_config_fingerprint:
+        return None
+    segments = payload.get("segments", {})
+    if not isinstance(segments, dict):
+        return None
+    return segments
+
+
 def run_m3_pipeline(
     *,
     tts_input_json_path: Path,
@@ -166,130 +329,244 @@ def run_m3_pipeline(
     qa_report_json_path: Path,
     run_manifest_json_path: Path,
     config: AppConfig,
+    incremental: bool = False,
 ) -> M3Artifacts:
-    pipeline_start = perf_counter()
-    if not tts_input_json_path.exists():
-        raise FileNotFoundError(f"TTS input JSON not found: {tts_input_json_path}")
-
-    read_start = perf_counter()
-    input_payload = _read_json(tts_input_json_path)
-    input_doc = parse_tts_input_document(input_payload)
-    read_seconds = perf_counter() - read_start
-
-    backend = build_tts_backend(config.tts)
-    segment_audio_dir = output_json_path.parent / "segments"
-    segment_audio_dir.mkdir(parents=True, exist_ok=True)
-
-    synth_start = perf_counter()
-    segment_audio_paths: list[Path] = []
-    synthesized_durations: list[float] = []
-    duration_padding_applied = 0
-    total_padded_seconds = 0.0
-    duration_trim_applied = 0
-    total_trimmed_seconds = 0.0
-    for segment in input_doc.segments:
-        output_wav = segment_audio_dir / f"seg_{segment.id:06d}.wav"
-        synthesized_duration = backend.synthesize_to_wav(
-            text=segment.target_text,
-            output_wav=output_wav,
-            target_duration=segment.duration,
+    trace_format = config.pipeline.trace_format
+    with trace_run(
+        "m3",
+        trace_format=trace_format,
+        output_path=trace_file_path(run_manifest_json_path.parent / "logs", "m3", trace_format),
+    ):
+        pipeline_start = perf_counter()
+        if not tts_input_json_path.exists():
+            raise FileNotFoundError(f"TTS input JSON not found: {tts_input_json_path}")
+
+        read_start = perf_counter()
+        with span("read_input"):
+            input_payload = read_json(tts_input_json_path)
+            input_doc = parse_tts_input_document(input_payload)
+        read_seconds = perf_counter() - read_start
+
+        commands_before = command_stats_snapshot()
+        with span("tts.load", backend=config.tts.backend):
+            backend = build_tts_backend(config.tts)
+        segment_audio_dir = output_json_path.parent / "segments"
+        segment_audio_dir.mkdir(parents=True, exist_ok=True)
+
+        segment_index_path = segment_audio_dir / "segment_index.json"
+        tts_config_fingerprint = config_fingerprint(config.tts)
+        previous_index = (
+            _read_segment_index(segment_index_path, tts_config_fingerprint) if incremental else None
+        )
+        previous_states: dict[str, Any] = previous_index or {}
+
+        synth_start = perf_counter()
+        segment_audio_paths: list[Path] = []
+        synthesized_durations: list[float] = []
+        duration_padding_applied = 0
+        total_padded_seconds = 0.0
+        duration_trim_applied = 0
+        total_trimmed_seconds = 0.0
+        reused_segment_count = 0
+        dirty_ranges_seconds: list[tuple[float, float]] = []
+        segment_states: dict[str, dict[str, Any]] = {}
+        with span("tts.synthesize", segment_count=len(input_doc.segments)) as synth_span:
+            for segment in input_doc.segments:
+                output_wav = segment_audio_dir / f"seg_{segment.id:06d}.wav"
+                fingerprint = segment_fingerprint(
+                    text=segment.target_text,
+                    start=segment.start,
+                    end=segment.end,
+                    duration=segment.duration,
+                )
+                previous_state = previous_states.get(str(segment.id))
+                if (
+                    isinstance(previous_state, dict)
+                    and previous_state.get("fingerprint") == fingerprint
+                    and output_wav.exists()
+                ):
+                    synthesized_duration = float(previous_state.get("synthesized_duration", 0.0))
+                    padded_seconds = float(previous_state.get("padded_seconds", 0.0))
+                    trimmed_seconds = float(previous_state.get("trimmed_seconds", 0.0))
+                    reused_segment_count += 1
+                else:
+                    with span("tts.segment", segment_id=segment.id):
+                        synthesized_duration, padded_seconds, trimmed_seconds = _synthesize_segment(
+                            backend=backend,
+                            segment=segment,
+                            output_wav=output_wav,
+                            sample_rate=config.tts.sample_rate,
+                        )
+                    dirty_ranges_seconds.append(
+                        (segment.start, segment.start + synthesized_duration)
+                    )
+                    if isinstance(previous_state, dict):
+                        previous_start = float(previous_state.get("start", segment.start))
+                        previous_duration = float(previous_state.get("synthesized_duration", 0.0))
+                        dirty_ranges_seconds.append(
+                            (previous_start, previous_start + previous_duration)
+                        )
+                if padded_seconds > 0.0:
+                    duration_padding_applied += 1
+                    total_padded_seconds += padded_seconds
+                if trimmed_seconds > 0.0:
+                    duration_trim_applied += 1
+                    total_trimmed_seconds += trimmed_seconds
+                segment_audio_paths.append(output_wav)
+                synthesized_durations.append(synthesized_duration)
+                segment_states[str(segment.id)] = {
+                    "fingerprint": fingerprint,
+                    "start": segment.start,
+                    "synthesized_duration": synthesized_duration,
+                    "padded_seconds": padded_seconds,
+                    "trimmed_seconds": trimmed_seconds,
+                }
+            removed_segment_count = 0
+            for segment_key, previous_state in previous_states.items():
+                if segment_key in segment_states or not isinstance(previous_state, dict):
+                    continue
+                removed_segment_count += 1
+                previous_start = float(previous_state.get("start", 0.0))
+                previous_duration = float(previous_state.get("synthesized_duration", 0.0))
+                dirty_ranges_seconds.append((previous_start, previous_start + previous_duration))
+            synth_span.set(
+                synthesized_segment_count=len(input_doc.segments) - reused_segment_count
+            )
+        synth_seconds = perf_counter() - synth_start
+
+        build_output_start = perf_counter()
+        output_doc = build_tts_output_document(
+            input_doc=input_doc,
+            backend=backend.name,
             sample_rate=config.tts.sample_rate,
+            segment_audio_paths=segment_audio_paths,
+            synthesized_durations=synthesized_durations,
         )
-        if synthesized_duration < segment.duration:
-            padded_duration = _pad_wav_silence_to_duration(output_wav, segment.duration)
-            if padded_duration > synthesized_duration:
-                duration_padding_applied += 1
-                total_padded_seconds += padded_duration - synthesized_duration
-                synthesized_duration = padded_duration
-        elif synthesized_duration > segment.duration:
-            trimmed_duration = _trim_wav_to_duration(output_wav, segment.duration)
-            if trimmed_duration < synthesized_duration:
-                duration_trim_applied += 1
-                total_trimmed_seconds += synthesized_duration - trimmed_duration
-                synthesized_duration = trimmed_duration
-        segment_audio_paths.append(output_wav)
-        synthesized_durations.append(synthesized_duration)
-    synth_seconds = perf_counter() - synth_start
-
-    build_output_start = perf_counter()
-    output_doc = build_tts_output_document(
-        input_doc=input_doc,
-        backend=backend.name,
-        sample_rate=config.tts.sample_rate,
-        segment_audio_paths=segment_audio_paths,
-        synthesized_durations=synthesized_durations,
-    )
-    build_output_seconds = perf_counter() - build_output_start
-
-    qa_start = perf_counter()
-    qa_report = build_m3_qa_report(
-        output_doc,
-        config.tts,
-        postfit_padding_segments=duration_padding_applied,
-        postfit_trim_segments=duration_trim_applied,
-        postfit_total_padded_seconds=total_padded_seconds,
-        postfit_total_trimmed_seconds=total_trimmed_seconds,
-    )
-    qa_seconds = perf_counter() - qa_start
-
-    output_json_path.parent.mkdir(parents=True, exist_ok=True)
-    qa_report_json_path.parent.mkdir(parents=True, exist_ok=True)
-    run_manifest_json_path.parent.mkdir(parents=True, exist_ok=True)
-    write_start = perf_counter()
-    write_json(output_json_path, output_doc.to_dict())
-    write_json(qa_report_json_path, qa_report)
-    stitched_preview_wav = output_json_path.parent / f"tts_preview_stitched.{output_doc.language}.wav"
-    _build_stitched_preview_wav(output_doc=output_doc, preview_wav_path=stitched_preview_wav)
-    write_seconds = perf_counter() - write_start
-
-    blocked_flags = _blocked_quality_flags(qa_report, config.tts.qa_allowed_flags)
-    qa_gate_passed = not blocked_flags
-    total_seconds = perf_counter() - pipeline_start
-    write_json(
-        run_manifest_json_path,
-        {
-            "stage": "m3",
-            "backend": backend.name,
-            "inputs": {
-                "tts_input_json": str(tts_input_json_path),
-            },
-            "outputs": {
-                "tts_output_json": str(output_json_path),
-                "qa_report_json": str(qa_report_json_path),
-                "segment_audio_dir": str(segment_audio_dir),
-                "stitched_preview_wav": str(stitched_preview_wav),
-            },
-            "timings_seconds": {
-                "read_input": read_seconds,
-                "synthesize_segments": synth_seconds,
-                "build_output_contract": build_output_seconds,
-                "build_qa_report": qa_seconds,
-                "write_outputs": write_seconds,
-                "total_pipeline": total_seconds,
-            },
-            "duration_postfit": {
-                "silence_padding_applied_segments": duration_padding_applied,
-                "total_padded_seconds": total_padded_seconds,
-                "trim_applied_segments": duration_trim_applied,
-                "total_trimmed_seconds": total_trimmed_seconds,
+        build_output_seconds = perf_counter() - build_output_start
+
+        qa_start = perf_counter()
+        with span("qa"):
+            qa_report = build_m3_qa_report(
+                output_doc,
+                config.tts,
+                postfit_padding_segments=duration_padding_applied,
+                postfit_trim_segments=duration_trim_applied,
+                postfit_total_padded_seconds=total_padded_seconds,
+                postfit_total_trimmed_seconds=total_trimmed_seconds,
+            )
+        qa_seconds = perf_counter() - qa_start
+
+        output_json_path.parent.mkdir(parents=True, exist_ok=True)
+        qa_report_json_path.parent.mkdir(parents=True, exist_ok=True)
+        run_manifest_json_path.parent.mkdir(parents=True, exist_ok=True)
+        write_start = perf_counter()
+        with span("write_outputs"):
+            write_json(output_json_path, output_doc, compact=config.pipeline.compact_json)
+            write_json(qa_report_json_path, qa_report)
+        stitched_preview_wav = (
+            output_json_path.parent / f"tts_preview_stitched.{output_doc.language}.wav"
+        )
+        stitch_mode = "full"
+        with span("stitch") as stitch_span:
+            if (
+                previous_index is not None
+                and not dirty_ranges_seconds
+                and stitched_preview_wav.exists()
+            ):
+                stitch_mode = "unchanged"
+            elif previous_index is not None and _patch_stitched_preview_wav(
+                output_doc=output_doc,
+                preview_wav_path=stitched_preview_wav,
+                dirty_ranges_seconds=dirty_ranges_seconds,
+            ):
+                stitch_mode = "patched"
+            else:
+                _build_stitched_preview_wav(
+                    output_doc=output_doc, preview_wav_path=stitched_preview_wav
+                )
+            stitch_span.set(mode=stitch_mode)
+            # The M1 energy VAD map, when present, shows dubbed speech placed over
+            # source silence or music.
+            speech_map_path = run_manifest_json_path.parent / "work" / SPEECH_MAP_FILENAME
+            speech_map = read_speech_map(speech_map_path)
+            speech_alignment = (
+                _speech_alignment(
+                    output_doc=output_doc, speech_map=speech_map, map_path=speech_map_path
+                )
+                if speech_map is not None
+                else None
+            )
+        write_json(
+            segment_index_path,
+            {
+                "config_fingerprint": tts_config_fingerprint,
+                "segments": segment_states,
             },
-            "qa_gate": {
-                "enabled": config.tts.qa_fail_on_flags,
-                "passed": qa_gate_passed,
-                "allowed_flags": list(config.tts.qa_allowed_flags),
-                "blocked_flags": blocked_flags,
+        )
+        write_seconds = perf_counter() - write_start
+
+        blocked_flags = _blocked_quality_flags(qa_report, config.tts.qa_allowed_flags)
+        qa_gate_passed = not blocked_flags
+        total_seconds = perf_counter() - pipeline_start
+        write_json(
+            run_manifest_json_path,
+            {
+                "stage": "m3",
+                "backend": backend.name,
+                "inputs": {
+                    "tts_input_json": str(tts_input_json_path),
+                },
+                "outputs": {
+                    "tts_output_json": str(output_json_path),
+                    "qa_report_json": str(qa_report_json_path),
+                    "segment_audio_dir": str(segment_audio_dir),
+                    "segment_index_json": str(segment_index_path),
+                    "stitched_preview_wav": str(stitched_preview_wav),
+                },
+                "timings_seconds": {
+                    "read_input": read_seconds,
+                    "synthesize_segments": synth_seconds,
+                    "build_output_contract": build_output_seconds,
+                    "build_qa_report": qa_seconds,
+                    "write_outputs": write_seconds,
+                    "total_pipeline": total_seconds,
+                },
+                # Spawn overhead per TTS tool; worker_requests reuse a resident process.
+                "subprocess": command_stats_since(commands_before),
+                "speech_alignment": speech_alignment,
+                "incremental": {
+                    "enabled": incremental,
+                    "previous_index_used": previous_index is not None,
+                    "config_fingerprint": tts_config_fingerprint,
+                    "segment_count": len(input_doc.segments),
+                    "reused_segment_count": reused_segment_count,
+                    "changed_segment_count": len(input_doc.segments) - reused_segment_count,
+                    "removed_segment_count": removed_segment_count,
+                    "stitch_mode": stitch_mode,
+                },
+                "duration_postfit": {
+                    "silence_padding_applied_segments": duration_padding_applied,
+                    "total_padded_seconds": total_padded_seconds,
+                    "trim_applied_segments": duration_trim_applied,
+                    "total_trimmed_seconds": total_trimmed_seconds,
+                },
+                "qa_gate": {
+                    "enabled": config.tts.qa_fail_on_flags,
+                    "passed": qa_gate_passed,
+                    "allowed_flags": list(config.tts.qa_allowed_flags),
+                    "blocked_flags": blocked_flags,
+                },
             },
-        },
-    )
-    if config.tts.qa_fail_on_flags and not qa_gate_passed:
-        raise RuntimeError(
-            "M3 QA gate failed. Blocked quality flags: " + ", ".join(blocked_flags)
         )
+        if config.tts.qa_fail_on_flags and not qa_gate_passed:
+            raise RuntimeError(
+                "M3 QA gate failed. Blocked quality flags: " + ", ".join(blocked_flags)
+            )
 
-    return M3Artifacts(
-        tts_input_json=tts_input_json_path,
-        tts_output_json=output_json_path,
-        qa_report_json=qa_report_json_path,
-        run_manifest_json=run_manifest_json_path,
-        stitched_preview_wav=stitched_preview_wav,
-    )
+        return M3Artifacts(
+            tts_input_json=tts_input_json_path,
+            tts_output_json=output_json_path,
+            qa_report_json=qa_report_json_path,
+            run_manifest_json=run_manifest_json_path,
+            stitched_preview_wav=stitched_preview_wav,
+        )
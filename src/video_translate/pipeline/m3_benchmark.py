@@ -5,11 +5,11 @@ import re
 import shutil
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
 
 from video_translate.config import load_config
+from video_translate.io import read_json
 from video_translate.pipeline.m3 import M3Artifacts, run_m3_pipeline
-from video_translate.preflight import preflight_errors, run_preflight
+from video_translate.preflight import PREFLIGHT_CACHE_TTL_SECONDS, preflight_errors, run_preflight
 
 
 @dataclass(frozen=True)
@@ -32,13 +32,6 @@ class M3BenchmarkResult:
     error: str | None
 
 
-def _read_json(path: Path) -> dict[str, Any]:
-    payload = json.loads(path.read_text(encoding="utf-8"))
-    if not isinstance(payload, dict):
-        raise ValueError(f"JSON root must be an object: {path}")
-    return payload
-
-
 def _slug(text: str) -> str:
     normalized = re.sub(r"[^a-zA-Z0-9]+", "_", text).strip("_")
     return normalized.lower() or "profile"
@@ -85,6 +78,7 @@ def run_m3_profile_benchmark(
             piper_model_path=getattr(config.tts, "piper_model_path", None),
             check_translate_backend=False,
             check_tts_backend=True,
+            cache_ttl_seconds=PREFLIGHT_CACHE_TTL_SECONDS,
         )
         issues = preflight_errors(preflight)
         if issues:
@@ -122,8 +116,8 @@ def run_m3_profile_benchmark(
                 run_manifest_json_path=manifest_json,
                 config=config,
             )
-            manifest_payload = _read_json(artifacts.run_manifest_json)
-            qa_payload = _read_json(artifacts.qa_report_json)
+            manifest_payload = read_json(artifacts.run_manifest_json)
+            qa_payload = read_json(artifacts.qa_report_json)
             timings_payload = manifest_payload.get("timings_seconds", {})
             duration_payload = qa_payload.get("duration_metrics", {})
             postfit_payload = manifest_payload.get("duration_postfit", {})
@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
 
-from video_translate.config import AppConfig, TTSConfig, load_config
+from video_translate.config import AppConfig, derive_config, load_config
 from video_translate.pipeline.m3 import M3Artifacts, run_m3_pipeline
 from video_translate.pipeline.m3_espeak_tune import (
     M3EspeakTuningArtifacts,
@@ -24,33 +24,7 @@ class M3ClosureArtifacts:
 
 
 def _with_strict_tts_gate(config: AppConfig) -> AppConfig:
-    strict_tts = TTSConfig(
-        backend=config.tts.backend,
-        sample_rate=config.tts.sample_rate,
-        min_segment_seconds=config.tts.min_segment_seconds,
-        mock_base_tone_hz=config.tts.mock_base_tone_hz,
-        espeak_bin=config.tts.espeak_bin,
-        espeak_voice=config.tts.espeak_voice,
-        espeak_speed_wpm=config.tts.espeak_speed_wpm,
-        espeak_pitch=config.tts.espeak_pitch,
-        espeak_adaptive_rate_enabled=config.tts.espeak_adaptive_rate_enabled,
-        espeak_adaptive_rate_min_wpm=config.tts.espeak_adaptive_rate_min_wpm,
-        espeak_adaptive_rate_max_wpm=config.tts.espeak_adaptive_rate_max_wpm,
-        espeak_adaptive_rate_max_passes=config.tts.espeak_adaptive_rate_max_passes,
-        espeak_adaptive_rate_tolerance_seconds=config.tts.espeak_adaptive_rate_tolerance_seconds,
-        max_duration_delta_seconds=config.tts.max_duration_delta_seconds,
-        qa_max_postfit_segment_ratio=config.tts.qa_max_postfit_segment_ratio,
-        qa_max_postfit_seconds_ratio=config.tts.qa_max_postfit_seconds_ratio,
-        qa_fail_on_flags=True,
-        qa_allowed_flags=config.tts.qa_allowed_flags,
-    )
-    return AppConfig(
-        tools=config.tools,
-        pipeline=config.pipeline,
-        asr=config.asr,
-        translate=config.translate,
-        tts=strict_tts,
-    )
+    return derive_config(config, tts={"qa_fail_on_flags": True})
 
 
 def run_m3_closure_workflow(
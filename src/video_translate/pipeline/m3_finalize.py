@@ -7,6 +7,8 @@ from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
+from video_translate.io import read_json
+
 
 @dataclass(frozen=True)
 class M3FinalizationArtifacts:
@@ -16,13 +18,6 @@ class M3FinalizationArtifacts:
     recommended_profile: str
 
 
-def _read_json(path: Path) -> dict[str, Any]:
-    payload = json.loads(path.read_text(encoding="utf-8"))
-    if not isinstance(payload, dict):
-        raise ValueError(f"JSON root must be an object: {path}")
-    return payload
-
-
 def finalize_m3_profile_selection(
     *,
     run_root: Path,
@@ -36,7 +31,7 @@ def finalize_m3_profile_selection(
     if not benchmark_json.exists():
         raise FileNotFoundError(f"M3 benchmark report JSON not found: {benchmark_json}")
 
-    payload = _read_json(benchmark_json)
+    payload = read_json(benchmark_json)
     if str(payload.get("stage", "")).strip() != "m3_benchmark":
         raise ValueError("Expected stage 'm3_benchmark' in benchmark report.")
 
@@ -1,15 +1,8 @@
 from __future__ import annotations
 
-import json
 from pathlib import Path
-from typing import Any
 
-
-def _read_json(path: Path) -> dict[str, Any]:
-    payload = json.loads(path.read_text(encoding="utf-8"))
-    if not isinstance(payload, dict):
-        raise ValueError(f"JSON root must be an object: {path}")
-    return payload
+from video_translate.io import read_json
 
 
 def build_m3_tuning_report_markdown(
@@ -24,7 +17,7 @@ def build_m3_tuning_report_markdown(
     if not report_json.exists():
         raise FileNotFoundError(f"M3 benchmark report JSON not found: {report_json}")
 
-    payload = _read_json(report_json)
+    payload = read_json(report_json)
     stage = str(payload.get("stage", "")).strip()
     if stage != "m3_benchmark":
         raise ValueError("Expected stage 'm3_benchmark' in benchmark report.")
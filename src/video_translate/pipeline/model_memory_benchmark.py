@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import fields, make_dataclass
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+from video_translate.io import write_json
+from video_translate.models import TranscriptSegment, WordTimestamp
+from video_translate.translate.contracts import TranslationInputSegment, TranslationOutputSegment
+from video_translate.tts.contracts import TTSInputSegment, TTSOutputSegment
+
+_SAMPLE_VALUES: dict[str, Any] = {
+    "id": 0,
+    "start": 1.25,
+    "end": 2.5,
+    "duration": 1.25,
+    "target_duration": 1.25,
+    "synthesized_duration": 1.2,
+    "duration_delta": -0.05,
+    "word": "hello",
+    "probability": 0.93,
+    "text": "hello world",
+    "words": [],
+    "source_text": "hello world",
+    "target_text": "merhaba dunya",
+    "source_word_count": 2,
+    "target_word_count": 2,
+    "length_ratio": 1.0,
+    "audio_path": "output/tts/segments/seg_000000.wav",
+}
+
+CONTRACT_MODELS: tuple[type, ...] = (
+    WordTimestamp,
+    TranscriptSegment,
+    TranslationInputSegment,
+    TranslationOutputSegment,
+    TTSInputSegment,
+    TTSOutputSegment,
+)
+
+
+def _unslotted_variant(model: type) -> type:
+    # Same fields as the contract model, laid out like the pre-slots dataclass.
+    return make_dataclass(
+        f"Unslotted{model.__name__}",
+        [(field.name, field.type) for field in fields(model)],
+        frozen=True,
+    )
+
+
+def _bytes_per_instance(factory: Callable[[], object], instance_count: int) -> float:
+    tracemalloc.start()
+    try:
+        baseline, _ = tracemalloc.get_traced_memory()
+        # Field values are shared, so the delta is the per-instance container overhead.
+        instances = [factory() for _ in range(instance_count)]
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    list_overhead = 8 * len(instances)
+    return max(0.0, (current - baseline - list_overhead) / instance_count)
+
+
+def run_model_memory_benchmark(
+    *,
+    output_json_path: Path,
+    instance_count: int = 20000,
+) -> Path:
+    """Measure per-instance memory of contract models against unslotted equivalents."""
+    if instance_count <= 0:
+        raise ValueError("instance_count must be > 0.")
+
+    models: list[dict[str, Any]] = []
+    for model in CONTRACT_MODELS:
+        kwargs = {field.name: _SAMPLE_VALUES[field.name] for field in fields(model)}
+        unslotted = _unslotted_variant(model)
+        before = _bytes_per_instance(partial(unslotted, **kwargs), instance_count)
+        after = _bytes_per_instance(partial(model, **kwargs), instance_count)
+        models.append(
+            {
+                "model": model.__name__,
+                "slotted": not hasattr(model(**kwargs), "__dict__"),
+                "bytes_per_instance_before": round(before, 1),
+                "bytes_per_instance_after": round(after, 1),
+                "saved_ratio": round(1.0 - after / before, 3) if before > 0 else None,
+            }
+        )
+
+    payload = {
+        "stage": "model_memory_benchmark",
+        "instance_count": instance_count,
+        "models": models,
+    }
+    output_json_path.parent.mkdir(parents=True, exist_ok=True)
+    write_json(output_json_path, payload)
+    return output_json_path
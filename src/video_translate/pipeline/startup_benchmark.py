@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+from statistics import median
+from time import perf_counter
+
+from video_translate.io import write_json
+
+DEFAULT_STARTUP_COMMANDS: tuple[tuple[str, ...], ...] = (
+    ("--help",),
+    ("doctor",),
+    ("run-m2", "--help"),
+)
+_PACKAGE_PARENT = Path(__file__).resolve().parents[2]
+
+
+def _cli_env() -> dict[str, str]:
+    # Make the spawned interpreter import this checkout even when it is not installed.
+    env = os.environ.copy()
+    existing = env.get("PYTHONPATH")
+    env["PYTHONPATH"] = (
+        f"{_PACKAGE_PARENT}{os.pathsep}{existing}" if existing else str(_PACKAGE_PARENT)
+    )
+    return env
+
+
+def _time_cli_invocation(args: tuple[str, ...], timeout_seconds: float) -> tuple[float, int]:
+    started = perf_counter()
+    # Spawned directly (not via run_command) so non-zero exits such as a failing
+    # doctor check are recorded instead of raised.
+    completed = subprocess.run(
+        [sys.executable, "-m", "video_translate.cli", *args],
+        check=False,
+        capture_output=True,
+        timeout=timeout_seconds,
+        env=_cli_env(),
+    )
+    return perf_counter() - started, completed.returncode
+
+
+def _time_bare_interpreter(timeout_seconds: float) -> float:
+    started = perf_counter()
+    subprocess.run([sys.executable, "-c", "pass"], check=False, timeout=timeout_seconds)
+    return perf_counter() - started
+
+
+def run_cli_startup_benchmark(
+    *,
+    output_json_path: Path,
+    commands: list[tuple[str, ...]] | None = None,
+    repeats: int = 5,
+    timeout_seconds: float = 60.0,
+) -> Path:
+    """Measure wall-clock startup of CLI commands in fresh interpreter processes."""
+    if repeats <= 0:
+        raise ValueError("repeats must be > 0.")
+    selected = commands or list(DEFAULT_STARTUP_COMMANDS)
+
+    interpreter_runs = [_time_bare_interpreter(timeout_seconds) for _ in range(repeats)]
+    interpreter_median = median(interpreter_runs)
+    results: list[dict[str, object]] = []
+    for args in selected:
+        runs: list[float] = []
+        returncodes: set[int] = set()
+        for _ in range(repeats):
+            seconds, returncode = _time_cli_invocation(args, timeout_seconds)
+            runs.append(seconds)
+            returncodes.add(returncode)
+        command_median = median(runs)
+        results.append(
+            {
+                "command": " ".join(args),
+                "returncodes": sorted(returncodes),
+                "min_seconds": round(min(runs), 4),
+                "median_seconds": round(command_median, 4),
+                "max_seconds": round(max(runs), 4),
+                "median_over_interpreter_seconds": round(command_median - interpreter_median, 4),
+            }
+        )
+
+    payload = {
+        "stage": "cli_startup_benchmark",
+        "python_executable": sys.executable,
+        "repeats": repeats,
+        "interpreter_median_seconds": round(interpreter_median, 4),
+        "commands": results,
+    }
+    output_json_path.parent.mkdir(parents=True, exist_ok=True)
+    write_json(output_json_path, payload)
+    return output_json_path
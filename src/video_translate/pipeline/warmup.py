@@ -0,0 +1,265 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass, field, replace
+from datetime import UTC, datetime
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+from video_translate.asr.whisper import WhisperModelFactory, transcribe_audio
+from video_translate.config import AppConfig, derive_config, load_config
+from video_translate.io import write_json
+from video_translate.model_registry import (
+    MODEL_REGISTRY_FILENAME,
+    ModelReference,
+    ModelRegistry,
+    ModelResolver,
+    RegisteredModel,
+    model_references,
+    resolve_model,
+)
+from video_translate.pipeline.m1_benchmark import write_synthetic_speech_fixture
+from video_translate.translate.backends import build_translation_backend
+from video_translate.tts.backends import build_tts_backend
+
+_WARMUP_TEXT_EN = "Hello, this is a short warm-up sentence."
+_WARMUP_TEXT_TR = "Merhaba, bu kisa bir isinma cumlesi."
+
+
+@dataclass(frozen=True)
+class WarmupResult:
+    reference: ModelReference
+    status: str
+    resolved_from: str | None = None
+    local_path: Path | None = None
+    resolve_seconds: float = 0.0
+    checksum_seconds: float = 0.0
+    cold_inference_seconds: float | None = None
+    warm_inference_seconds: float | None = None
+    mismatched_files: list[str] = field(default_factory=list)
+    error: str | None = None
+
+    @property
+    def cold_first_job_seconds(self) -> float | None:
+        # What the first job paid before warm-up: fetching the model plus a cold load.
+        if self.cold_inference_seconds is None:
+            return None
+        return self.resolve_seconds + self.cold_inference_seconds
+
+    def to_dict(self) -> dict[str, Any]:
+        cold = self.cold_first_job_seconds
+        warm = self.warm_inference_seconds
+        return {
+            "kind": self.reference.kind,
+            "name": self.reference.name,
+            "source": self.reference.source,
+            "status": self.status,
+            "resolved_from": self.resolved_from,
+            "local_path": str(self.local_path) if self.local_path is not None else None,
+            "resolve_seconds": round(self.resolve_seconds, 6),
+            "checksum_seconds": round(self.checksum_seconds, 6),
+            "cold_inference_seconds": (
+                round(self.cold_inference_seconds, 6)
+                if self.cold_inference_seconds is not None
+                else None
+            ),
+            "warm_inference_seconds": round(warm, 6) if warm is not None else None,
+            "cold_first_job_seconds": round(cold, 6) if cold is not None else None,
+            "warm_first_job_seconds": round(warm, 6) if warm is not None else None,
+            "mismatched_files": self.mismatched_files,
+            "error": self.error,
+        }
+
+
+@dataclass(frozen=True)
+class WarmupArtifacts:
+    report_path: Path
+    registry_path: Path
+    results: list[WarmupResult]
+
+    @property
+    def ok(self) -> bool:
+        return all(result.status == "ok" for result in self.results)
+
+
+def model_registry_path(config: AppConfig) -> Path:
+    return config.pipeline.workspace_dir / ".cache" / MODEL_REGISTRY_FILENAME
+
+
+def _inference_step(
+    reference: ModelReference,
+    config: AppConfig,
+    *,
+    work_dir: Path,
+    model_factory: WhisperModelFactory | None,
+) -> Callable[[], object] | None:
+    """One tiny inference with the model, or None when it is not loaded on its own."""
+    if reference.kind == "asr":
+        fixture = write_synthetic_speech_fixture(work_dir / "warmup_speech.wav", seconds=2.0)
+        asr_config = derive_config(
+            config, asr={"model": reference.name, "two_pass_enabled": False}
+        ).asr
+        return lambda: transcribe_audio(fixture, asr_config, model_factory=model_factory)
+    if reference.kind == "mt":
+        mt_backend = build_translation_backend(config.translate)
+        return lambda: mt_backend.translate_batch(
+            [_WARMUP_TEXT_EN],
+            source_language=config.translate.source_language,
+            target_language=config.translate.target_language,
+            batch_size=1,
+        )
+    if reference.kind == "tts" and reference.name == str(config.tts.piper_model_path):
+        tts_backend = build_tts_backend(config.tts)
+        return lambda: tts_backend.synthesize_to_wav(
+            text=_WARMUP_TEXT_TR,
+            output_wav=work_dir / "warmup_tts.wav",
+            target_duration=2.0,
+            sample_rate=config.tts.sample_rate,
+        )
+    # Piper's JSON voice config is read together with the model.
+    return None
+
+
+def _resolve_entry(
+    reference: ModelReference,
+    registry: ModelRegistry,
+    *,
+    resolver: ModelResolver,
+    refresh: bool,
+) -> tuple[RegisteredModel, str, float, float, list[str]]:
+    entry = None if refresh else registry.get(reference)
+    if entry is not None:
+        checksum_started = perf_counter()
+        mismatched = registry.verify(entry)
+        return entry, "registry", 0.0, perf_counter() - checksum_started, mismatched
+    resolve_started = perf_counter()
+    local_path = resolver(reference)
+    resolve_seconds = perf_counter() - resolve_started
+    checksum_started = perf_counter()
+    entry = registry.register(reference, local_path)
+    return entry, "resolver", resolve_seconds, perf_counter() - checksum_started, []
+
+
+def _warm_reference(
+    reference: ModelReference,
+    config: AppConfig,
+    registry: ModelRegistry,
+    *,
+    resolver: ModelResolver,
+    refresh: bool,
+    work_dir: Path,
+    model_factory: WhisperModelFactory | None,
+) -> WarmupResult:
+    try:
+        entry, resolved_from, resolve_seconds, checksum_seconds, mismatched = _resolve_entry(
+            reference, registry, resolver=resolver, refresh=refresh
+        )
+    except Exception as exc:  # noqa: BLE001
+        return WarmupResult(
+            reference=reference, status="failed", error=f"{type(exc).__name__}: {exc}"
+        )
+    resolved = WarmupResult(
+        reference=reference,
+        status="ok",
+        resolved_from=resolved_from,
+        local_path=entry.local_path,
+        resolve_seconds=resolve_seconds,
+        checksum_seconds=checksum_seconds,
+    )
+    if mismatched:
+        # Loading a corrupted model would fail (or worse, work badly) inside a job.
+        return replace(
+            resolved,
+            status="checksum_mismatch",
+            mismatched_files=mismatched,
+            error="Model files changed since registration; re-download or use --refresh.",
+        )
+    try:
+        step = _inference_step(reference, config, work_dir=work_dir, model_factory=model_factory)
+        if step is None:
+            return resolved
+        cold_started = perf_counter()
+        step()
+        cold_seconds = perf_counter() - cold_started
+        warm_started = perf_counter()
+        step()
+        warm_seconds = perf_counter() - warm_started
+    except Exception as exc:  # noqa: BLE001
+        return replace(resolved, status="failed", error=f"{type(exc).__name__}: {exc}")
+    return replace(
+        resolved,
+        cold_inference_seconds=cold_seconds,
+        warm_inference_seconds=warm_seconds,
+    )
+
+
+def run_warmup(
+    *,
+    config_paths: list[Path | None],
+    output_json_path: Path,
+    resolver: ModelResolver = resolve_model,
+    model_factory: WhisperModelFactory | None = None,
+    refresh: bool = False,
+) -> WarmupArtifacts:
+    """Resolve, checksum and warm every model the given profiles reference.
+
+    Models shared by several profiles are warmed once. The registry lives under the
+    first profile's workspace (``.cache/model_registry.json``). Each model runs one tiny
+    inference twice; the report compares the cold first-job latency (fetch + first
+    inference) with the warm one (second inference).
+    """
+    configs = [load_config(path) for path in (config_paths or [None])]
+    registry_path = model_registry_path(configs[0])
+    registry = ModelRegistry(registry_path)
+    work_dir = registry_path.parent / "warmup"
+    work_dir.mkdir(parents=True, exist_ok=True)
+
+    results: list[WarmupResult] = []
+    seen: set[str] = set()
+    for config in configs:
+        for reference in model_references(config):
+            if reference.key in seen:
+                continue
+            seen.add(reference.key)
+            results.append(
+                _warm_reference(
+                    reference,
+                    config,
+                    registry,
+                    resolver=resolver,
+                    refresh=refresh,
+                    work_dir=work_dir,
+                    model_factory=model_factory,
+                )
+            )
+    registry.save()
+
+    cold_total = sum(item.cold_first_job_seconds or 0.0 for item in results)
+    warm_total = sum(item.warm_inference_seconds or 0.0 for item in results)
+    output_json_path.parent.mkdir(parents=True, exist_ok=True)
+    write_json(
+        output_json_path,
+        {
+            "stage": "warmup",
+            "generated_at_utc": datetime.now(tz=UTC).isoformat(timespec="seconds"),
+            "config_paths": [str(path) if path is not None else None for path in config_paths],
+            "registry_path": str(registry_path),
+            "models": [item.to_dict() for item in results],
+            "summary": {
+                "model_count": len(results),
+                "ok_count": sum(1 for item in results if item.status == "ok"),
+                "resolved_count": sum(1 for item in results if item.resolved_from == "resolver"),
+                "checksum_mismatch_count": sum(
+                    1 for item in results if item.status == "checksum_mismatch"
+                ),
+                "failed_count": sum(1 for item in results if item.status == "failed"),
+                "cold_first_job_seconds": round(cold_total, 6),
+                "warm_first_job_seconds": round(warm_total, 6),
+                "saved_seconds": round(cold_total - warm_total, 6),
+            },
+        },
+    )
+    return WarmupArtifacts(
+        report_path=output_json_path, registry_path=registry_path, results=results
+    )
@@ -1,10 +1,27 @@
 from __future__ import annotations
 
+import hashlib
 import importlib.util
+import json
+import os
 import shutil
 import sys
-from dataclasses import dataclass
+import threading
+import time
+from dataclasses import asdict, dataclass
 from pathlib import Path, PureWindowsPath
+from typing import Any
+
+from video_translate.utils.subprocess_utils import CommandExecutionError, run_command
+
+PREFLIGHT_CACHE_TTL_SECONDS = 300.0
+_VERSION_PROBE_ARGS: dict[str, list[str]] = {
+    "yt-dlp": ["--version"],
+    "ffmpeg": ["-version"],
+    "espeak": ["--version"],
+    # piper has no stable --version flag across releases; --help proves it starts.
+    "piper": ["--help"],
+}
 
 
 @dataclass(frozen=True)
@@ -12,10 +29,13 @@ class ToolCheck:
     name: str
     command: str
     path: str | None
+    version: str | None = None
+    probed: bool = False
 
     @property
     def ok(self) -> bool:
-        return self.path is not None
+        # A deep check also requires the tool to answer its version probe.
+        return self.path is not None and (not self.probed or self.version is not None)
 
 
 @dataclass(frozen=True)
@@ -33,6 +53,7 @@ class PreflightReport:
     piper: ToolCheck | None = None
     piper_model_path: str | None = None
     piper_model_exists: bool | None = None
+    ctranslate2_available: bool | None = None
 
     @property
     def ok(self) -> bool:
@@ -44,6 +65,12 @@ class PreflightReport:
                 and bool(self.sentencepiece_available)
                 and bool(self.torch_available)
             )
+        if self.translate_backend == "ctranslate2" and self.ctranslate2_available is not None:
+            translate_ok = (
+                bool(self.ctranslate2_available)
+                and bool(self.transformers_available)
+                and bool(self.sentencepiece_available)
+            )
         tts_ok = True
         if self.tts_backend == "espeak" and self.espeak is not None:
             tts_ok = self.espeak is not None and self.espeak.ok
@@ -128,17 +155,17 @@ def _resolve_command_path(command: str) -> str | None:
     return shutil.which(normalized)
 
 
-def run_preflight(
+def _run_preflight_uncached(
     *,
     yt_dlp_bin: str,
     ffmpeg_bin: str,
-    translate_backend: str = "mock",
-    tts_backend: str = "mock",
-    espeak_bin: str = "espeak",
-    piper_bin: str = "piper",
-    piper_model_path: Path | None = None,
-    check_translate_backend: bool = False,
-    check_tts_backend: bool = False,
+    translate_backend: str,
+    tts_backend: str,
+    espeak_bin: str,
+    piper_bin: str,
+    piper_model_path: Path | None,
+    check_translate_backend: bool,
+    check_tts_backend: bool,
 ) -> PreflightReport:
     yt_dlp_path = shutil.which(yt_dlp_bin)
     ffmpeg_path = shutil.which(ffmpeg_bin)
@@ -149,10 +176,17 @@ def run_preflight(
     transformers_available: bool | None = None
     sentencepiece_available: bool | None = None
     torch_available: bool | None = None
+    ctranslate2_available: bool | None = None
     if check_translate_backend and backend == "transformers":
         transformers_available = importlib.util.find_spec("transformers") is not None
         sentencepiece_available = importlib.util.find_spec("sentencepiece") is not None
         torch_available = importlib.util.find_spec("torch") is not None
+    if check_translate_backend and backend == "ctranslate2":
+        # transformers is only used for conversion and tokenization; torch is not needed
+        # to translate once a converted model is cached.
+        ctranslate2_available = importlib.util.find_spec("ctranslate2") is not None
+        transformers_available = importlib.util.find_spec("transformers") is not None
+        sentencepiece_available = importlib.util.find_spec("sentencepiece") is not None
     espeak: ToolCheck | None = None
     piper: ToolCheck | None = None
     piper_model_path_text: str | None = None
@@ -182,19 +216,244 @@ def run_preflight(
         piper=piper,
         piper_model_path=piper_model_path_text,
         piper_model_exists=piper_model_exists,
+        ctranslate2_available=ctranslate2_available,
+    )
+
+
+def _probe_tool_version(check: ToolCheck | None) -> ToolCheck | None:
+    if check is None or check.path is None:
+        return check
+    args = _VERSION_PROBE_ARGS.get(check.name, ["--version"])
+    version: str | None = None
+    try:
+        result = run_command([check.path, *args], timeout_seconds=15.0)
+    except (CommandExecutionError, OSError):
+        version = None
+    else:
+        output = (result.stdout or result.stderr or "").strip()
+        version = output.splitlines()[0].strip() if output else check.name
+    return ToolCheck(
+        name=check.name,
+        command=check.command,
+        path=check.path,
+        version=version,
+        probed=True,
+    )
+
+
+def _probe_report_versions(report: PreflightReport) -> PreflightReport:
+    return PreflightReport(
+        python_version=report.python_version,
+        yt_dlp=_probe_tool_version(report.yt_dlp) or report.yt_dlp,
+        ffmpeg=_probe_tool_version(report.ffmpeg) or report.ffmpeg,
+        faster_whisper_available=report.faster_whisper_available,
+        translate_backend=report.translate_backend,
+        transformers_available=report.transformers_available,
+        sentencepiece_available=report.sentencepiece_available,
+        torch_available=report.torch_available,
+        tts_backend=report.tts_backend,
+        espeak=_probe_tool_version(report.espeak),
+        piper=_probe_tool_version(report.piper),
+        piper_model_path=report.piper_model_path,
+        piper_model_exists=report.piper_model_exists,
+        ctranslate2_available=report.ctranslate2_available,
+    )
+
+
+def _report_from_dict(payload: dict[str, Any]) -> PreflightReport:
+    def _tool(raw: object) -> ToolCheck | None:
+        return ToolCheck(**raw) if isinstance(raw, dict) else None
+
+    values = dict(payload)
+    for field in ("yt_dlp", "ffmpeg", "espeak", "piper"):
+        values[field] = _tool(values.get(field))
+    return PreflightReport(**values)
+
+
+@dataclass(frozen=True)
+class _PreflightCacheEntry:
+    created_at: float
+    file_mtimes: dict[str, int | None]
+    report: PreflightReport
+
+
+# In-process cache shared by UI jobs and benchmark profile loops; key -> entry.
+_PREFLIGHT_CACHE: dict[str, _PreflightCacheEntry] = {}
+_PREFLIGHT_CACHE_LOCK = threading.Lock()
+
+
+def clear_preflight_cache() -> None:
+    with _PREFLIGHT_CACHE_LOCK:
+        _PREFLIGHT_CACHE.clear()
+
+
+def _mtime_ns(path: str) -> int | None:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _preflight_cache_key(arguments: dict[str, object]) -> str:
+    # PATH and site-packages directory mtimes change when tools or packages are
+    # installed/removed, which invalidates the cached which()/find_spec() results.
+    path_entries = [entry for entry in os.environ.get("PATH", "").split(os.pathsep) if entry]
+    search_dirs = path_entries + [entry for entry in sys.path if entry]
+    raw = json.dumps(
+        {
+            "arguments": arguments,
+            "python": sys.executable,
+            "path": os.environ.get("PATH", ""),
+            "dir_mtimes": [[entry, _mtime_ns(entry)] for entry in search_dirs],
+        },
+        sort_keys=True,
+        default=str,
     )
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def _report_file_mtimes(report: PreflightReport) -> dict[str, int | None]:
+    paths = [
+        check.path
+        for check in (report.yt_dlp, report.ffmpeg, report.espeak, report.piper)
+        if check is not None and check.path is not None
+    ]
+    if report.piper_model_path:
+        paths.append(report.piper_model_path)
+    return {path: _mtime_ns(path) for path in paths}
+
+
+def _cache_entry_valid(created: object, mtimes: object, ttl_seconds: float) -> bool:
+    if not isinstance(created, (int, float)) or time.time() - created > ttl_seconds:
+        return False
+    if not isinstance(mtimes, dict):
+        return False
+    return all(_mtime_ns(path) == mtime for path, mtime in mtimes.items())
+
+
+def _read_disk_cache(cache_path: Path) -> dict[str, Any]:
+    try:
+        payload = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return payload if isinstance(payload, dict) else {}
+
+
+def _write_disk_cache(cache_path: Path, key: str, entry: _PreflightCacheEntry) -> None:
+    payload = _read_disk_cache(cache_path)
+    payload[key] = asdict(entry)
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        temp_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+        os.replace(temp_path, cache_path)
+    except OSError:
+        # The cache is an optimization; an unwritable location must not fail preflight.
+        pass
+
+
+def run_preflight(
+    *,
+    yt_dlp_bin: str,
+    ffmpeg_bin: str,
+    translate_backend: str = "mock",
+    tts_backend: str = "mock",
+    espeak_bin: str = "espeak",
+    piper_bin: str = "piper",
+    piper_model_path: Path | None = None,
+    check_translate_backend: bool = False,
+    check_tts_backend: bool = False,
+    deep: bool = False,
+    cache_ttl_seconds: float | None = None,
+    cache_path: Path | None = None,
+) -> PreflightReport:
+    """Check tools and Python packages needed by the pipeline.
+
+    ``deep`` also runs each resolved tool once with a version flag. With
+    ``cache_ttl_seconds`` set, results are reused in-process (and via ``cache_path``
+    across processes) while PATH, search directory mtimes, tool binary mtimes and
+    the arguments are unchanged and the entry is younger than the TTL.
+    """
+    arguments: dict[str, object] = {
+        "yt_dlp_bin": yt_dlp_bin,
+        "ffmpeg_bin": ffmpeg_bin,
+        "translate_backend": translate_backend,
+        "tts_backend": tts_backend,
+        "espeak_bin": espeak_bin,
+        "piper_bin": piper_bin,
+        "piper_model_path": str(piper_model_path) if piper_model_path is not None else None,
+        "check_translate_backend": check_translate_backend,
+        "check_tts_backend": check_tts_backend,
+        "deep": deep,
+    }
+
+    def _compute() -> PreflightReport:
+        report = _run_preflight_uncached(
+            yt_dlp_bin=yt_dlp_bin,
+            ffmpeg_bin=ffmpeg_bin,
+            translate_backend=translate_backend,
+            tts_backend=tts_backend,
+            espeak_bin=espeak_bin,
+            piper_bin=piper_bin,
+            piper_model_path=piper_model_path,
+            check_translate_backend=check_translate_backend,
+            check_tts_backend=check_tts_backend,
+        )
+        return _probe_report_versions(report) if deep else report
+
+    if cache_ttl_seconds is None or cache_ttl_seconds <= 0:
+        return _compute()
+
+    key = _preflight_cache_key(arguments)
+    with _PREFLIGHT_CACHE_LOCK:
+        entry = _PREFLIGHT_CACHE.get(key)
+    if entry is not None and _cache_entry_valid(
+        entry.created_at, entry.file_mtimes, cache_ttl_seconds
+    ):
+        return entry.report
+    if cache_path is not None:
+        disk_entry = _read_disk_cache(cache_path).get(key)
+        if isinstance(disk_entry, dict) and _cache_entry_valid(
+            disk_entry.get("created_at"), disk_entry.get("file_mtimes"), cache_ttl_seconds
+        ):
+            try:
+                report = _report_from_dict(disk_entry["report"])
+            except (KeyError, TypeError):
+                report = None
+            if report is not None:
+                with _PREFLIGHT_CACHE_LOCK:
+                    _PREFLIGHT_CACHE[key] = _PreflightCacheEntry(
+                        created_at=float(disk_entry["created_at"]),
+                        file_mtimes=dict(disk_entry["file_mtimes"]),
+                        report=report,
+                    )
+                return report
+
+    report = _compute()
+    new_entry = _PreflightCacheEntry(
+        created_at=time.time(),
+        file_mtimes=_report_file_mtimes(report),
+        report=report,
+    )
+    with _PREFLIGHT_CACHE_LOCK:
+        _PREFLIGHT_CACHE[key] = new_entry
+    if cache_path is not None:
+        _write_disk_cache(cache_path, key, new_entry)
+    return report
+
+
+def _tool_error(check: ToolCheck, label: str) -> str:
+    if check.path is None:
+        return f"Missing {label} executable on PATH (configured command: '{check.command}')."
+    return f"{label} executable at '{check.path}' did not respond to a version probe."
 
 
 def preflight_errors(report: PreflightReport) -> list[str]:
     errors: list[str] = []
     if not report.yt_dlp.ok:
-        errors.append(
-            f"Missing yt-dlp executable on PATH (configured command: '{report.yt_dlp.command}')."
-        )
+        errors.append(_tool_error(report.yt_dlp, "yt-dlp"))
     if not report.ffmpeg.ok:
-        errors.append(
-            f"Missing ffmpeg executable on PATH (configured command: '{report.ffmpeg.command}')."
-        )
+        errors.append(_tool_error(report.ffmpeg, "ffmpeg"))
     if not report.faster_whisper_available:
         errors.append("Python package 'faster_whisper' is not installed.")
     if report.translate_backend == "transformers" and report.transformers_available is not None:
@@ -204,14 +463,21 @@ def preflight_errors(report: PreflightReport) -> list[str]:
             errors.append("Python package 'sentencepiece' is not installed.")
         if not report.torch_available:
             errors.append("Python package 'torch' is not installed.")
+    if report.translate_backend == "ctranslate2" and report.ctranslate2_available is not None:
+        if not report.ctranslate2_available:
+            errors.append("Python package 'ctranslate2' is not installed.")
+        if not report.transformers_available:
+            errors.append("Python package 'transformers' is not installed.")
+        if not report.sentencepiece_available:
+            errors.append("Python package 'sentencepiece' is not installed.")
     if report.tts_backend == "espeak":
         if report.espeak is None or not report.espeak.ok:
-            command = report.espeak.command if report.espeak is not None else "espeak"
-            errors.append(f"Missing espeak executable on PATH (configured command: '{command}').")
+            check = report.espeak or ToolCheck(name="espeak", command="espeak", path=None)
+            errors.append(_tool_error(check, "espeak"))
     if report.tts_backend == "piper":
         if report.piper is None or not report.piper.ok:
-            command = report.piper.command if report.piper is not None else "piper"
-            errors.append(f"Missing piper executable on PATH (configured command: '{command}').")
+            check = report.piper or ToolCheck(name="piper", command="piper", path=None)
+            errors.append(_tool_error(check, "piper"))
         if report.piper_model_exists is not True:
             target = report.piper_model_path or "tts.piper_model_path"
             errors.append(f"Piper model file not found: '{target}'.")
@@ -1,9 +1,24 @@
 from __future__ import annotations
 
-from statistics import mean
-from typing import Any
+import math
+from collections.abc import Iterable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
+from video_translate.io import read_transcript_json
 from video_translate.models import TranscriptDocument
+from video_translate.transcript_columns import (
+    WordColumns,
+    open_word_columns,
+    word_columns_path_for,
+)
+
+if TYPE_CHECKING:
+    from video_translate.asr.vad import SpeechMap
+
+LOW_CONFIDENCE_THRESHOLD = 0.60
+PROBABILITY_HISTOGRAM_BINS = 20
+PROBABILITY_PERCENTILES: tuple[int, ...] = (5, 10, 25, 50, 75, 90)
 
 
 def _safe_ratio(numerator: float, denominator: float) -> float | None:
@@ -12,24 +27,155 @@ def _safe_ratio(numerator: float, denominator: float) -> float | None:
     return numerator / denominator
 
 
-def build_m1_qa_report(doc: TranscriptDocument) -> dict[str, Any]:
-    segment_count = len(doc.segments)
-    segment_durations = [max(0.0, segment.end - segment.start) for segment in doc.segments]
-    speech_duration = sum(segment_durations)
-    empty_segment_count = sum(1 for segment in doc.segments if not segment.text.strip())
+def _add_exact(partials: list[float], value: float) -> None:
+    # Shewchuk's exact summation (the algorithm behind math.fsum), kept incremental.
+    index = 0
+    for partial in partials:
+        if abs(value) < abs(partial):
+            value, partial = partial, value
+        high = value + partial
+        low = partial - (high - value)
+        if low:
+            partials[index] = low
+            index += 1
+        value = high
+    partials[index:] = [value]
+
+
+class M1QAStats:
+    """Online accumulator for the M1 QA report, fed segment by segment.
+
+    Keeps counts, exact sums, min/max and a fixed probability histogram, so memory does
+    not grow with the transcript. Percentiles are estimated from the histogram.
+    """
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self.segment_count = 0
+        self.empty_segment_count = 0
+        self.text_word_count = 0
+        self._duration_partials: list[float] = []
+        self.word_count = 0
+        self.low_confidence_count = 0
+        self.min_probability: float | None = None
+        self.max_probability: float | None = None
+        self._probability_partials: list[float] = []
+        self.histogram = [0] * PROBABILITY_HISTOGRAM_BINS
+
+    @classmethod
+    def from_document(
+        cls,
+        doc: TranscriptDocument,
+        *,
+        word_columns: WordColumns | None = None,
+    ) -> M1QAStats:
+        stats = cls()
+        for segment in doc.segments:
+            stats.add_segment(
+                start=segment.start,
+                end=segment.end,
+                text=segment.text,
+                probabilities=(
+                    () if word_columns is not None else (word.probability for word in segment.words)
+                ),
+            )
+        if word_columns is not None:
+            # Memory-mapped column; no per-word objects are materialized.
+            stats.add_probabilities(word_columns.probability)
+        return stats
+
+    def add_segment(
+        self,
+        *,
+        start: float,
+        end: float,
+        text: str,
+        probabilities: Iterable[float] = (),
+    ) -> None:
+        self.segment_count += 1
+        _add_exact(self._duration_partials, max(0.0, end - start))
+        if not text.strip():
+            self.empty_segment_count += 1
+        self.text_word_count += len(text.split())
+        self.add_probabilities(probabilities)
+
+    def add_probabilities(self, probabilities: Iterable[float]) -> None:
+        last_bin = PROBABILITY_HISTOGRAM_BINS - 1
+        histogram = self.histogram
+        for probability in probabilities:
+            self.word_count += 1
+            _add_exact(self._probability_partials, probability)
+            if probability < LOW_CONFIDENCE_THRESHOLD:
+                self.low_confidence_count += 1
+            if self.min_probability is None or probability < self.min_probability:
+                self.min_probability = probability
+            if self.max_probability is None or probability > self.max_probability:
+                self.max_probability = probability
+            histogram[min(last_bin, max(0, int(probability * PROBABILITY_HISTOGRAM_BINS)))] += 1
 
-    words = [word for segment in doc.segments for word in segment.words]
-    has_word_timestamps = bool(words)
-    if words:
-        word_count = len(words)
-        probabilities = [word.probability for word in words]
+    @property
+    def speech_duration(self) -> float:
+        return math.fsum(self._duration_partials)
+
+    @property
+    def avg_probability(self) -> float | None:
+        if self.word_count == 0:
+            return None
+        return math.fsum(self._probability_partials) / self.word_count
+
+    def probability_percentile(self, percentile: float) -> float | None:
+        """Estimate a probability percentile by interpolating inside histogram bins."""
+        if self.word_count == 0 or self.min_probability is None or self.max_probability is None:
+            return None
+        rank = percentile / 100.0 * self.word_count
+        width = 1.0 / PROBABILITY_HISTOGRAM_BINS
+        cumulative = 0
+        estimate = self.max_probability
+        for index, count in enumerate(self.histogram):
+            if count and cumulative + count >= rank:
+                estimate = (index + (rank - cumulative) / count) * width
+                break
+            cumulative += count
+        return min(self.max_probability, max(self.min_probability, estimate))
+
+
+def build_m1_qa_report(
+    doc: TranscriptDocument,
+    *,
+    word_columns: WordColumns | None = None,
+    stats: M1QAStats | None = None,
+    speech_map: SpeechMap | None = None,
+) -> dict[str, Any]:
+    """Build the M1 QA report; pass ``stats`` fed during ASR to skip walking ``doc``.
+
+    With a ``speech_map`` from the energy VAD pre-pass, ``speech_coverage_ratio`` is the
+    share of the audio the map marks as speech instead of the share covered by segments.
+    """
+    if stats is None:
+        stats = M1QAStats.from_document(doc, word_columns=word_columns)
+    segment_count = stats.segment_count
+    speech_duration = stats.speech_duration
+    empty_segment_count = stats.empty_segment_count
+
+    has_word_timestamps = stats.word_count > 0
+    if has_word_timestamps:
+        word_count = stats.word_count
+        low_conf_word_count = stats.low_confidence_count
     else:
         # Fallback when word timestamps are disabled or not available.
-        word_count = sum(len(segment.text.split()) for segment in doc.segments)
-        probabilities = []
+        word_count = stats.text_word_count
+        low_conf_word_count = 0
+
+    if speech_map is not None:
+        speech_coverage_ratio = _safe_ratio(speech_map.speech_seconds, speech_map.duration)
+        speech_coverage_source = "speech_map"
+    else:
+        speech_coverage_ratio = _safe_ratio(speech_duration, doc.duration)
+        speech_coverage_source = "asr_segments"
 
-    low_conf_threshold = 0.60
-    low_conf_word_count = sum(1 for p in probabilities if p < low_conf_threshold)
+    low_conf_threshold = LOW_CONFIDENCE_THRESHOLD
     low_conf_word_ratio = _safe_ratio(float(low_conf_word_count), float(word_count))
 
     quality_flags: list[str] = []
@@ -48,9 +194,10 @@ def build_m1_qa_report(doc: TranscriptDocument) -> dict[str, Any]:
         "segment_metrics": {
             "count": segment_count,
             "empty_count": empty_segment_count,
-            "avg_duration_seconds": mean(segment_durations) if segment_durations else 0.0,
+            "avg_duration_seconds": speech_duration / segment_count if segment_count else 0.0,
             "speech_duration_seconds": speech_duration,
-            "speech_coverage_ratio": _safe_ratio(speech_duration, doc.duration),
+            "speech_coverage_ratio": speech_coverage_ratio,
+            "speech_coverage_source": speech_coverage_source,
         },
         "word_metrics": {
             "has_word_timestamps": has_word_timestamps,
@@ -58,10 +205,35 @@ def build_m1_qa_report(doc: TranscriptDocument) -> dict[str, Any]:
             "low_confidence_threshold": low_conf_threshold,
             "low_confidence_count": low_conf_word_count,
             "low_confidence_ratio": low_conf_word_ratio,
-            "avg_probability": mean(probabilities) if probabilities else None,
-            "min_probability": min(probabilities) if probabilities else None,
-            "max_probability": max(probabilities) if probabilities else None,
+            "avg_probability": stats.avg_probability,
+            "min_probability": stats.min_probability,
+            "max_probability": stats.max_probability,
+            "probability_percentiles_estimated": {
+                f"p{percentile}": (
+                    round(value, 4)
+                    if (value := stats.probability_percentile(percentile)) is not None
+                    else None
+                )
+                for percentile in PROBABILITY_PERCENTILES
+            },
         },
         "quality_flags": quality_flags,
     }
 
+
+def build_m1_qa_report_from_files(
+    transcript_json_path: Path,
+    *,
+    speech_map: SpeechMap | None = None,
+) -> dict[str, Any]:
+    """Build the M1 QA report from a written transcript.
+
+    When M1 moved the words to a columnar sidecar, word statistics are read from the
+    memory-mapped columns instead of materializing ``WordTimestamp`` objects.
+    """
+    doc = read_transcript_json(transcript_json_path)
+    columns_path = word_columns_path_for(transcript_json_path)
+    if columns_path.exists() and not any(segment.words for segment in doc.segments):
+        with open_word_columns(columns_path) as columns:
+            return build_m1_qa_report(doc, word_columns=columns, speech_map=speech_map)
+    return build_m1_qa_report(doc, speech_map=speech_map)
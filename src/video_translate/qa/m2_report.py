@@ -1,17 +1,20 @@
 from __future__ import annotations
 
 import re
+from collections.abc import Sequence
+from dataclasses import dataclass, field
 from statistics import mean
 from typing import Any
 
 from video_translate.config import TranslateConfig
 from video_translate.translate.contracts import TranslationOutputDocument
-from video_translate.translate.glossary import contains_term
-
+from video_translate.translate.glossary import compile_term_pattern
 
 _TERMINAL_PUNCTUATION = {".", "!", "?"}
 _PAUSE_PUNCTUATION = {",", ";", ":"}
-_WORD_PATTERN = re.compile(r"[A-Za-z\u00C7\u011E\u0130\u00D6\u015E\u00DC\u00E7\u011F\u0131\u00F6\u015F\u00FC']+")
+_WORD_PATTERN = re.compile(
+    r"[A-Za-z\u00C7\u011E\u0130\u00D6\u015E\u00DC\u00E7\u011F\u0131\u00F6\u015F\u00FC']+"
+)
 _TURKISH_CHARACTERS = set(
     "\u00E7\u011F\u0131\u00F6\u015F\u00FC\u00C7\u011E\u0130\u00D6\u015E\u00DC"
 )
@@ -36,12 +39,27 @@ _TURKISH_STOPWORDS = {
 _LANGUAGE_MISMATCH_RATIO_THRESHOLD = 0.50
 
 
+# Stopword lookup for ASCII text, matched on word edges of the lowercased text.
+_ASCII_STOPWORD_PATTERN = re.compile(
+    r"(?<![A-Za-z'])(?:" + "|".join(sorted(_TURKISH_STOPWORDS)) + r")(?![A-Za-z'])"
+)
+# Glossary index tokens follow the \b word boundary of the term patterns.
+_INDEX_TOKEN_PATTERN = re.compile(r"\w+")
+_NON_ASCII_PATTERN = re.compile(r"[^\x00-\x7f]")
+# ASCII letters that re.IGNORECASE also equates with a non-ASCII letter (dotted and
+# dotless I, long s, Kelvin sign) fold to "_" like every non-ASCII character.
+_CASE_FOLD_TABLE = str.maketrans({"i": "_", "s": "_", "k": "_"})
+_SAMPLE_LIMIT = 20
+
+
 def _looks_like_turkish(text: str) -> bool:
     normalized = text.strip()
     if not normalized:
         return True
-    if any(char in _TURKISH_CHARACTERS for char in normalized):
+    if not _TURKISH_CHARACTERS.isdisjoint(normalized):
         return True
+    if normalized.isascii():
+        return _ASCII_STOPWORD_PATTERN.search(normalized.lower()) is not None
 
     words = [token.lower() for token in _WORD_PATTERN.findall(normalized)]
     if not words:
@@ -62,14 +80,183 @@ def _terminal_punctuation(text: str) -> str | None:
     return None
 
 
+class _GlossaryIndex:
+    """Source-token posting lists restricted to the word runs of the glossary terms.
+
+    Every word run of a ``\\b``-bounded term is a whole word token of any text it
+    matches, so intersecting the runs' posting lists bounds the candidate segments.
+    Case-insensitive keys are deliberately coarse: tokens that ``re.IGNORECASE`` treats
+    as equal always share a key, and every candidate is confirmed with the term regex.
+    """
+
+    def __init__(self, source_terms: list[str], *, case_sensitive: bool) -> None:
+        self.case_sensitive = case_sensitive
+        self._fold_cache: dict[str, str] = {}
+        # Per term: folded run keys, or None for terms without word characters.
+        self.term_keys: list[set[str] | None] = []
+        for term in source_terms:
+            runs = _INDEX_TOKEN_PATTERN.findall(term)
+            self.term_keys.append({self._fold(run) for run in runs} if runs else None)
+        self._wanted = set().union(*(keys for keys in self.term_keys if keys))
+        self.postings: dict[str, list[int]] = {key: [] for key in self._wanted}
+
+    def _fold(self, token: str) -> str:
+        if self.case_sensitive:
+            return token
+        key = self._fold_cache.get(token)
+        if key is None:
+            key = _NON_ASCII_PATTERN.sub("_", token).lower().translate(_CASE_FOLD_TABLE)
+            self._fold_cache[token] = key
+        return key
+
+    def _text_keys(self, text: str) -> set[str]:
+        if self.case_sensitive:
+            return set(_INDEX_TOKEN_PATTERN.findall(text))
+        if text.isascii():
+            # ASCII folding keeps every character's word/non-word class, so folding the
+            # whole text before tokenizing gives the same keys as folding each token.
+            return set(_INDEX_TOKEN_PATTERN.findall(text.lower().translate(_CASE_FOLD_TABLE)))
+        return {self._fold(token) for token in _INDEX_TOKEN_PATTERN.findall(text)}
+
+    def add(self, index: int, text: str) -> None:
+        for key in self._text_keys(text) & self._wanted:
+            self.postings[key].append(index)
+
+    def candidates(self, term_index: int, segment_count: int) -> Sequence[int]:
+        keys = self.term_keys[term_index]
+        if keys is None:
+            return range(segment_count)
+        lists = sorted((self.postings[key] for key in keys), key=len)
+        if len(lists) == 1 or not lists[0]:
+            return lists[0]
+        return sorted(set(lists[0]).intersection(*lists[1:]))
+
+
+@dataclass
+class _SegmentColumns:
+    """Per-segment QA features computed in one pass, one list per feature."""
+
+    ids: list[int] = field(default_factory=list)
+    target_texts: list[str] = field(default_factory=list)
+    empty_target: list[bool] = field(default_factory=list)
+    ratios: list[float] = field(default_factory=list)
+    source_terminals: list[str | None] = field(default_factory=list)
+    target_terminals: list[str | None] = field(default_factory=list)
+    target_word_counts: list[int] = field(default_factory=list)
+    # Only filled for long segments, None elsewhere.
+    pause_punct_counts: list[int | None] = field(default_factory=list)
+    # Only filled when the language check runs, None for empty targets.
+    target_like: list[bool | None] = field(default_factory=list)
+
+
+def _collect_columns(
+    doc: TranslationOutputDocument,
+    config: TranslateConfig,
+    *,
+    language_check_enabled: bool,
+    glossary_index: _GlossaryIndex | None,
+) -> _SegmentColumns:
+    columns = _SegmentColumns()
+    check_punctuation = config.qa_check_terminal_punctuation
+    check_fluency = config.qa_check_long_segment_fluency
+    word_threshold = config.qa_long_segment_word_threshold
+    add_id = columns.ids.append
+    add_target_text = columns.target_texts.append
+    add_empty_target = columns.empty_target.append
+    add_ratio = columns.ratios.append
+    add_source_terminal = columns.source_terminals.append
+    add_target_terminal = columns.target_terminals.append
+    add_target_word_count = columns.target_word_counts.append
+    add_pause_punct_count = columns.pause_punct_counts.append
+    add_target_like = columns.target_like.append
+    for index, segment in enumerate(doc.segments):
+        target_text = segment.target_text.strip()
+        target_word_count = segment.target_word_count
+        add_id(segment.id)
+        add_target_text(target_text)
+        add_empty_target(not target_text)
+        if segment.length_ratio is not None:
+            add_ratio(segment.length_ratio)
+        add_target_terminal(
+            _terminal_punctuation(target_text) if check_punctuation or check_fluency else None
+        )
+        add_source_terminal(
+            _terminal_punctuation(segment.source_text) if check_punctuation else None
+        )
+        add_target_word_count(target_word_count)
+        if check_fluency and target_word_count >= word_threshold:
+            add_pause_punct_count(sum(target_text.count(mark) for mark in _PAUSE_PUNCTUATION))
+        else:
+            add_pause_punct_count(None)
+        add_target_like(
+            _looks_like_turkish(target_text) if language_check_enabled and target_text else None
+        )
+        if glossary_index is not None:
+            glossary_index.add(index, segment.source_text)
+    return columns
+
+
+def _glossary_hits(
+    doc: TranslationOutputDocument,
+    glossary_map: dict[str, str],
+    glossary_index: _GlossaryIndex,
+) -> list[tuple[int, int, bool]]:
+    """Return (segment index, term index, target matched) for every expected term."""
+    case_sensitive = glossary_index.case_sensitive
+    segments = doc.segments
+    hits: list[tuple[int, int, bool]] = []
+    for term_index, (source_term, target_term) in enumerate(glossary_map.items()):
+        if not source_term.strip():
+            continue
+        candidates = glossary_index.candidates(term_index, len(segments))
+        if not candidates:
+            continue
+        source_pattern = compile_term_pattern(source_term, case_sensitive=case_sensitive)
+        target_pattern = (
+            compile_term_pattern(target_term, case_sensitive=case_sensitive)
+            if target_term.strip()
+            else None
+        )
+        for index in candidates:
+            if source_pattern.search(segments[index].source_text) is None:
+                continue
+            target_text = segments[index].target_text
+            matched = (
+                target_pattern is not None
+                and bool(target_text.strip())
+                and target_pattern.search(target_text) is not None
+            )
+            hits.append((index, term_index, matched))
+    # Samples keep the segment-major, glossary-order of a nested scan.
+    hits.sort()
+    return hits
+
+
 def build_m2_qa_report(
     doc: TranslationOutputDocument,
     config: TranslateConfig,
     *,
     glossary: dict[str, str] | None = None,
 ) -> dict[str, Any]:
-    empty_target_count = sum(1 for segment in doc.segments if not segment.target_text.strip())
-    ratios = [segment.length_ratio for segment in doc.segments if segment.length_ratio is not None]
+    """Build the M2 QA report from one pass over the segments.
+
+    Segment features land in ``_SegmentColumns``; every metric and sample list below is
+    derived from those columns. Glossary checks use a source-token index instead of a
+    segments x terms scan, so the cost stays linear in segments plus term hits.
+    """
+    glossary_map = glossary or {}
+    language_check_enabled = doc.target_language.strip().lower() == "tr"
+    glossary_index = (
+        _GlossaryIndex(list(glossary_map), case_sensitive=config.glossary_case_sensitive)
+        if glossary_map
+        else None
+    )
+    columns = _collect_columns(
+        doc, config, language_check_enabled=language_check_enabled, glossary_index=glossary_index
+    )
+
+    empty_target_count = sum(columns.empty_target)
+    ratios = columns.ratios
     low_ratio_count = sum(1 for ratio in ratios if ratio < config.min_length_ratio)
     high_ratio_count = sum(1 for ratio in ratios if ratio > config.max_length_ratio)
 
@@ -77,102 +264,83 @@ def build_m2_qa_report(
     source_terminal_count = 0
     target_terminal_count = 0
     if config.qa_check_terminal_punctuation:
-        for segment in doc.segments:
-            source_terminal = _terminal_punctuation(segment.source_text)
-            target_terminal = _terminal_punctuation(segment.target_text)
-            if source_terminal is not None:
-                source_terminal_count += 1
-            if target_terminal is not None:
-                target_terminal_count += 1
-            if source_terminal != target_terminal:
-                punctuation_mismatch_count += 1
+        source_terminal_count = sum(1 for item in columns.source_terminals if item is not None)
+        target_terminal_count = sum(1 for item in columns.target_terminals if item is not None)
+        punctuation_mismatch_count = sum(
+            1
+            for source_terminal, target_terminal in zip(
+                columns.source_terminals, columns.target_terminals, strict=True
+            )
+            if source_terminal != target_terminal
+        )
 
     long_segment_count = 0
     long_segment_missing_terminal_count = 0
     long_segment_excessive_pause_count = 0
     fluency_issue_samples: list[dict[str, object]] = []
     if config.qa_check_long_segment_fluency:
-        for segment in doc.segments:
-            target_text = segment.target_text.strip()
-            target_word_count = segment.target_word_count
-            if target_word_count < config.qa_long_segment_word_threshold:
+        max_pause = config.qa_long_segment_max_pause_punct
+        for index, pause_punct_count in enumerate(columns.pause_punct_counts):
+            if pause_punct_count is None:
                 continue
             long_segment_count += 1
-
-            target_terminal = _terminal_punctuation(target_text)
-            if target_terminal is None:
+            target_word_count = columns.target_word_counts[index]
+            if columns.target_terminals[index] is None:
                 long_segment_missing_terminal_count += 1
-                if len(fluency_issue_samples) < 20:
+                if len(fluency_issue_samples) < _SAMPLE_LIMIT:
                     fluency_issue_samples.append(
                         {
-                            "segment_id": segment.id,
+                            "segment_id": columns.ids[index],
                             "issue": "missing_terminal_punctuation",
                             "target_word_count": target_word_count,
                         }
                     )
-
-            pause_punct_count = sum(target_text.count(mark) for mark in _PAUSE_PUNCTUATION)
-            if pause_punct_count > config.qa_long_segment_max_pause_punct:
+            if pause_punct_count > max_pause:
                 long_segment_excessive_pause_count += 1
-                if len(fluency_issue_samples) < 20:
+                if len(fluency_issue_samples) < _SAMPLE_LIMIT:
                     fluency_issue_samples.append(
                         {
-                            "segment_id": segment.id,
+                            "segment_id": columns.ids[index],
                             "issue": "excessive_pause_punctuation",
                             "target_word_count": target_word_count,
                             "pause_punctuation_count": pause_punct_count,
-                            "max_allowed": config.qa_long_segment_max_pause_punct,
+                            "max_allowed": max_pause,
                         }
                     )
 
-    glossary_map = glossary or {}
-    expected_term_count = 0
-    matched_term_count = 0
-    missed_term_count = 0
-    term_miss_samples: list[dict[str, object]] = []
-    for segment in doc.segments:
-        for source_term, target_term in glossary_map.items():
-            if contains_term(
-                segment.source_text,
-                source_term,
-                case_sensitive=config.glossary_case_sensitive,
-            ):
-                expected_term_count += 1
-                if contains_term(
-                    segment.target_text,
-                    target_term,
-                    case_sensitive=config.glossary_case_sensitive,
-                ):
-                    matched_term_count += 1
-                else:
-                    missed_term_count += 1
-                    if len(term_miss_samples) < 20:
-                        term_miss_samples.append(
-                            {
-                                "segment_id": segment.id,
-                                "source_term": source_term,
-                                "expected_target_term": target_term,
-                            }
-                        )
+    hits = (
+        _glossary_hits(doc, glossary_map, glossary_index) if glossary_index is not None else []
+    )
+    terms = list(glossary_map.items())
+    expected_term_count = len(hits)
+    matched_term_count = sum(1 for _, _, matched in hits if matched)
+    missed_term_count = expected_term_count - matched_term_count
+    term_miss_samples: list[dict[str, object]] = [
+        {
+            "segment_id": columns.ids[index],
+            "source_term": terms[term_index][0],
+            "expected_target_term": terms[term_index][1],
+        }
+        for index, term_index, matched in hits
+        if not matched
+    ][:_SAMPLE_LIMIT]
 
-    language_check_enabled = doc.target_language.strip().lower() == "tr"
     non_target_like_segment_count = 0
     non_target_like_segment_samples: list[dict[str, object]] = []
     non_empty_target_segment_count = 0
     if language_check_enabled:
-        for segment in doc.segments:
-            target_text = segment.target_text.strip()
-            if not target_text:
+        for index, target_like in enumerate(columns.target_like):
+            if target_like is None:
                 continue
             non_empty_target_segment_count += 1
-            if _looks_like_turkish(target_text):
+            if target_like:
                 continue
             non_target_like_segment_count += 1
-            if len(non_target_like_segment_samples) < 20:
+            if len(non_target_like_segment_samples) < _SAMPLE_LIMIT:
                 non_target_like_segment_samples.append(
                     {
-                        "segment_id": segment.id,
-                        "target_text": target_text,
+                        "segment_id": columns.ids[index],
+                        "target_text": columns.target_texts[index],
                     }
                 )
     non_target_like_segment_ratio = (
@@ -246,7 +414,9 @@ def build_m2_qa_report(
             "expected_term_count": expected_term_count,
             "matched_term_count": matched_term_count,
             "missed_term_count": missed_term_count,
-            "match_ratio": (matched_term_count / expected_term_count) if expected_term_count > 0 else None,
+            "match_ratio": (
+                (matched_term_count / expected_term_count) if expected_term_count > 0 else None
+            ),
             "miss_samples": term_miss_samples,
         },
         "language_consistency_metrics": {
@@ -0,0 +1,285 @@
+from __future__ import annotations
+
+import itertools
+import os
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from video_translate.io import dumps_json, write_json
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows has no resource module.
+    resource = None  # type: ignore[assignment]
+
+TRACE_FORMATS: tuple[str, ...] = ("off", "jsonl", "chrome")
+SpanObserver = Callable[["Span"], None]
+_SPAN_OBSERVERS: list[SpanObserver] = []
+# ru_maxrss is reported in kilobytes on Linux and in bytes on macOS.
+_MAXRSS_SCALE = 1 if sys.platform == "darwin" else 1024
+
+
+def _peak_rss_bytes() -> int | None:
+    if resource is None:
+        return None
+    return int(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss) * _MAXRSS_SCALE
+
+
+def _children_cpu_seconds() -> float:
+    # Covers waited-for subprocesses such as ffmpeg, espeak and piper. RUSAGE_CHILDREN
+    # is process-wide, so concurrent jobs in one process share this counter.
+    if resource is None:
+        return 0.0
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+
+@dataclass
+class Span:
+    span_id: int
+    parent_id: int | None
+    name: str
+    start_seconds: float
+    thread_id: int
+    attributes: dict[str, Any] = field(default_factory=dict)
+    duration_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    process_child_cpu_seconds: float = 0.0
+    peak_rss_bytes: int | None = None
+    rss_growth_bytes: int | None = None
+    status: str = "ok"
+    error: str | None = None
+
+    def set(self, **attributes: Any) -> None:
+        self.attributes.update(attributes)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "start_seconds": round(self.start_seconds, 6),
+            "duration_seconds": round(self.duration_seconds, 6),
+            "cpu_seconds": round(self.cpu_seconds, 6),
+            "process_child_cpu_seconds": round(self.process_child_cpu_seconds, 6),
+            "peak_rss_bytes": self.peak_rss_bytes,
+            "rss_growth_bytes": self.rss_growth_bytes,
+            "thread_id": self.thread_id,
+            "status": self.status,
+            "error": self.error,
+            "attributes": self.attributes,
+        }
+
+
+class _NullSpan:
+    """Stand-in yielded when no trace is active; attribute updates are dropped."""
+
+    def set(self, **attributes: Any) -> None:
+        del attributes
+
+
+NULL_SPAN = _NullSpan()
+
+
+def add_span_observer(observer: SpanObserver) -> None:
+    """Call ``observer`` with every finished span, even when trace export is off."""
+    if observer not in _SPAN_OBSERVERS:
+        _SPAN_OBSERVERS.append(observer)
+
+
+def remove_span_observer(observer: SpanObserver) -> None:
+    if observer in _SPAN_OBSERVERS:
+        _SPAN_OBSERVERS.remove(observer)
+
+
+def _notify_observers(record: Span) -> None:
+    for observer in tuple(_SPAN_OBSERVERS):
+        try:
+            observer(record)
+        except Exception:  # noqa: BLE001
+            # Observers feed metrics; they must never fail the pipeline stage.
+            pass
+
+
+class Tracer:
+    """Collects nested spans with wall time, process CPU time and peak RSS.
+
+    With ``trace_format="off"`` spans are only handed to span observers and not kept.
+    """
+
+    def __init__(self, *, trace_format: str = "jsonl") -> None:
+        if trace_format not in TRACE_FORMATS:
+            raise ValueError("trace_format must be one of: off, jsonl, chrome.")
+        self.trace_format = trace_format
+        self.started_at_utc = datetime.now(tz=UTC).isoformat()
+        self.output_path: Path | None = None
+        self._origin = time.perf_counter()
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self.spans: list[Span] = []
+
+    @contextmanager
+    def span(self, name: str, parent: Span | None, attributes: dict[str, Any]) -> Iterator[Span]:
+        record = Span(
+            span_id=next(self._ids),
+            parent_id=parent.span_id if parent is not None else None,
+            name=name,
+            start_seconds=time.perf_counter() - self._origin,
+            thread_id=threading.get_ident(),
+            attributes=dict(attributes),
+        )
+        rss_before = _peak_rss_bytes()
+        # Thread CPU keeps concurrent UI jobs out of each other's spans; work done on
+        # native pools (CTranslate2, torch intra-op threads) is not included.
+        cpu_before = time.thread_time()
+        children_before = _children_cpu_seconds()
+        wall_before = time.perf_counter()
+        try:
+            yield record
+        except BaseException as exc:
+            record.status = "error"
+            record.error = f"{type(exc).__name__}: {exc}"
+            raise
+        finally:
+            record.duration_seconds = time.perf_counter() - wall_before
+            record.cpu_seconds = time.thread_time() - cpu_before
+            record.process_child_cpu_seconds = _children_cpu_seconds() - children_before
+            record.peak_rss_bytes = _peak_rss_bytes()
+            if rss_before is not None and record.peak_rss_bytes is not None:
+                record.rss_growth_bytes = record.peak_rss_bytes - rss_before
+            if self.trace_format != "off":
+                with self._lock:
+                    self.spans.append(record)
+            _notify_observers(record)
+
+    def _sorted_spans(self) -> list[Span]:
+        with self._lock:
+            return sorted(self.spans, key=lambda item: (item.start_seconds, item.span_id))
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        pid = os.getpid()
+        events = [
+            {
+                "name": item.name,
+                "cat": "video_translate",
+                "ph": "X",
+                "ts": round(item.start_seconds * 1_000_000, 3),
+                "dur": round(item.duration_seconds * 1_000_000, 3),
+                "pid": pid,
+                "tid": item.thread_id,
+                "args": {
+                    **item.attributes,
+                    "cpu_seconds": round(item.cpu_seconds, 6),
+                    "process_child_cpu_seconds": round(item.process_child_cpu_seconds, 6),
+                    "peak_rss_bytes": item.peak_rss_bytes,
+                    "rss_growth_bytes": item.rss_growth_bytes,
+                    "status": item.status,
+                },
+            }
+            for item in self._sorted_spans()
+        ]
+        return {
+            "traceEvents": events,
+            "displayTimeUnit": "ms",
+            "otherData": {"started_at_utc": self.started_at_utc},
+        }
+
+    def export(self, path: Path) -> Path:
+        if self.trace_format == "off":
+            raise ValueError("Tracer with trace_format='off' cannot be exported.")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if self.trace_format == "chrome":
+            write_json(path, self.to_chrome_trace(), compact=True)
+            return path
+        with path.open("wb") as handle:
+            for item in self._sorted_spans():
+                handle.write(dumps_json(item.to_dict(), compact=True))
+                handle.write(b"\n")
+        return path
+
+
+_ACTIVE_TRACER: ContextVar[Tracer | None] = ContextVar("video_translate_tracer", default=None)
+_ACTIVE_SPAN: ContextVar[Span | None] = ContextVar("video_translate_span", default=None)
+
+
+def current_tracer() -> Tracer | None:
+    return _ACTIVE_TRACER.get()
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Span | _NullSpan]:
+    """Record a child span of the active span; a no-op when tracing is off."""
+    tracer = _ACTIVE_TRACER.get()
+    if tracer is None:
+        yield NULL_SPAN
+        return
+    with tracer.span(name, _ACTIVE_SPAN.get(), attributes) as record:
+        token = _ACTIVE_SPAN.set(record)
+        try:
+            yield record
+        finally:
+            _ACTIVE_SPAN.reset(token)
+
+
+def configured_trace_format(config: Any) -> str:
+    pipeline = getattr(config, "pipeline", None)
+    return str(getattr(pipeline, "trace_format", "off"))
+
+
+def set_trace_output_path(path: Path, *, replace: bool = False) -> None:
+    """Choose the export path of the active trace once the run directory is known.
+
+    An already chosen path is kept unless ``replace`` is set, so an outer run decides
+    where its trace goes.
+    """
+    tracer = _ACTIVE_TRACER.get()
+    if tracer is not None and (replace or tracer.output_path is None):
+        tracer.output_path = path
+
+
+def trace_file_path(logs_dir: Path, stem: str, trace_format: str) -> Path:
+    suffix = ".trace.json" if trace_format == "chrome" else ".jsonl"
+    return logs_dir / f"trace_{stem}{suffix}"
+
+
+@contextmanager
+def trace_run(
+    name: str,
+    *,
+    trace_format: str,
+    output_path: Path | None = None,
+    **attributes: Any,
+) -> Iterator[Span | _NullSpan]:
+    """Open the root span of a run, or a child span when a run trace is already active.
+
+    Only the outermost call owns the tracer and exports it on exit, so the stage trace
+    of a standalone ``run-m2`` and the combined trace of a full dub use the same code.
+    When ``output_path`` is not known up front, call ``set_trace_output_path`` inside the
+    block; a trace without an output path is discarded.
+    """
+    if _ACTIVE_TRACER.get() is not None:
+        with span(name, **attributes) as record:
+            yield record
+        return
+    if trace_format == "off" and not _SPAN_OBSERVERS:
+        yield NULL_SPAN
+        return
+
+    tracer = Tracer(trace_format=trace_format)
+    tracer.output_path = output_path
+    tracer_token = _ACTIVE_TRACER.set(tracer)
+    try:
+        with span(name, **attributes) as record:
+            yield record
+    finally:
+        _ACTIVE_TRACER.reset(tracer_token)
+        if tracer.output_path is not None and trace_format != "off":
+            tracer.export(tracer.output_path)
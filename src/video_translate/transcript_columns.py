@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import mmap
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Any, Literal
+
+from video_translate.models import TranscriptDocument, WordTimestamp
+
+# Fixed little-endian layout so the file can also be opened with numpy.memmap:
+#   header: magic(8s) version(u32) reserved(u32) word_count(u64) segment_count(u64)
+#   start[f64 * n] end[f64 * n] probability[f64 * n] segment_id[u32 * n] (padded to 8)
+#   text_offsets[u64 * (n + 1)] text_blob[utf-8]
+COLUMNS_MAGIC = b"VTWORDS\x00"
+COLUMNS_VERSION = 1
+COLUMNS_SUFFIX = ".words.bin"
+_HEADER = struct.Struct("<8sIIQQ")
+
+_Typecode = Literal["d", "I", "Q"]
+
+
+def word_columns_path_for(transcript_json_path: Path) -> Path:
+    return transcript_json_path.with_name(transcript_json_path.stem + COLUMNS_SUFFIX)
+
+
+def _column_bytes(typecode: _Typecode, values: Any) -> bytes:
+    column = array(typecode, values)
+    if sys.byteorder != "little":
+        column.byteswap()
+    return column.tobytes()
+
+
+def _pad8(size: int) -> int:
+    return (-size) % 8
+
+
+def write_word_columns(path: Path, doc: TranscriptDocument) -> int:
+    """Write word timestamps of ``doc`` as a columnar sidecar and return the word count."""
+    starts: list[float] = []
+    ends: list[float] = []
+    probabilities: list[float] = []
+    segment_ids: list[int] = []
+    offsets: list[int] = [0]
+    blob = bytearray()
+    for segment in doc.segments:
+        for word in segment.words:
+            starts.append(word.start)
+            ends.append(word.end)
+            probabilities.append(word.probability)
+            segment_ids.append(segment.id)
+            blob += word.word.encode("utf-8")
+            offsets.append(len(blob))
+
+    word_count = len(starts)
+    segment_id_bytes = _column_bytes("I", segment_ids)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("wb") as handle:
+        handle.write(_HEADER.pack(COLUMNS_MAGIC, COLUMNS_VERSION, 0, word_count, len(doc.segments)))
+        handle.write(_column_bytes("d", starts))
+        handle.write(_column_bytes("d", ends))
+        handle.write(_column_bytes("d", probabilities))
+        handle.write(segment_id_bytes)
+        handle.write(b"\x00" * _pad8(len(segment_id_bytes)))
+        handle.write(_column_bytes("Q", offsets))
+        handle.write(bytes(blob))
+    return word_count
+
+
+class WordColumns:
+    """Read-only, memory-mapped view over a word timestamp sidecar.
+
+    Numeric columns are exposed as ``memoryview`` objects backed by the mapping, so
+    aggregations never build per-word Python objects.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._handle = path.open("rb")
+        size = path.stat().st_size
+        if size < _HEADER.size:
+            self._handle.close()
+            raise ValueError(f"Word columns file is truncated: {path}")
+        self._mmap = mmap.mmap(self._handle.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, _reserved, word_count, segment_count = _HEADER.unpack_from(self._mmap, 0)
+        if magic != COLUMNS_MAGIC or version != COLUMNS_VERSION:
+            self.close()
+            raise ValueError(f"Unsupported word columns file: {path}")
+        self.word_count = int(word_count)
+        self.segment_count = int(segment_count)
+
+        n = self.word_count
+        segment_id_size = 4 * n + _pad8(4 * n)
+        self._blob_start = _HEADER.size + 24 * n + segment_id_size + 8 * (n + 1)
+        if self._blob_start > size:
+            self.close()
+            raise ValueError(f"Word columns file is truncated: {path}")
+        cursor = _HEADER.size
+        self.start = self._column("d", cursor, n)
+        cursor += 8 * n
+        self.end = self._column("d", cursor, n)
+        cursor += 8 * n
+        self.probability = self._column("d", cursor, n)
+        cursor += 8 * n
+        self.segment_id = self._column("I", cursor, n)
+        cursor += segment_id_size
+        self._offsets = self._column("Q", cursor, n + 1)
+        if self._blob_start + self._offsets[n] > size:
+            self.close()
+            raise ValueError(f"Word columns file is truncated: {path}")
+
+    def _column(self, typecode: _Typecode, offset: int, count: int) -> Any:
+        itemsize = array(typecode).itemsize
+        raw = memoryview(self._mmap)[offset : offset + itemsize * count]
+        if sys.byteorder == "little":
+            return raw.cast(typecode)
+        # Big-endian hosts pay for a swapped copy; the on-disk layout stays fixed.
+        column = array(typecode, raw.tobytes())
+        column.byteswap()
+        return memoryview(column)
+
+    def __len__(self) -> int:
+        return self.word_count
+
+    def word(self, index: int) -> str:
+        start = self._blob_start + self._offsets[index]
+        end = self._blob_start + self._offsets[index + 1]
+        return self._mmap[start:end].decode("utf-8")
+
+    def word_timestamp(self, index: int) -> WordTimestamp:
+        return WordTimestamp(
+            word=self.word(index),
+            start=self.start[index],
+            end=self.end[index],
+            probability=self.probability[index],
+        )
+
+    def close(self) -> None:
+        for name in ("start", "end", "probability", "segment_id", "_offsets"):
+            view = self.__dict__.pop(name, None)
+            if isinstance(view, memoryview):
+                view.release()
+        if not self._mmap.closed:
+            self._mmap.close()
+        self._handle.close()
+
+    def __enter__(self) -> WordColumns:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+
+def open_word_columns(path: Path) -> WordColumns:
+    if not path.exists():
+        raise FileNotFoundError(f"Word columns file not found: {path}")
+    return WordColumns(path)
@@ -1,13 +1,25 @@
 ﻿from __future__ import annotations
 
+import json
+import os
+import re
+import shutil
+import threading
+import time
+import urllib.error
+import urllib.request
 from dataclasses import dataclass
-from typing import Protocol
+from pathlib import Path
+from typing import Any, Protocol, runtime_checkable
 
 from video_translate.config import TranslateConfig
+from video_translate.tracing import span
+from video_translate.translate.length_control import TranslationCandidate, budget_max_tokens
 
 
 class TranslationBackend(Protocol):
-    name: str
+    @property
+    def name(self) -> str: ...
 
     def translate_batch(
         self,
@@ -20,9 +32,26 @@ class TranslationBackend(Protocol):
         """Translate a batch of texts."""
 
 
+@runtime_checkable
+class BudgetedTranslationBackend(TranslationBackend, Protocol):
+    def translate_batch_with_budget(
+        self,
+        texts: list[str],
+        *,
+        source_language: str,
+        target_language: str,
+        batch_size: int,
+        char_budgets: list[int],
+        num_candidates: int,
+    ) -> list[list[TranslationCandidate]]:
+        """Up to ``num_candidates`` ranked candidates per text, decoding capped per budget."""
+
+
 @dataclass(frozen=True)
 class MockTranslationBackend:
     name: str = "mock"
+    # Simulated per-text model latency for throughput benchmarks.
+    item_latency_seconds: float = 0.0
 
     def translate_batch(
         self,
@@ -33,10 +62,16 @@ class MockTranslationBackend:
         batch_size: int,
     ) -> list[str]:
         del source_language, target_language, batch_size
+        if self.item_latency_seconds > 0.0:
+            time.sleep(self.item_latency_seconds * len(texts))
         # Deterministic placeholder backend for pipeline validation.
         return [text.strip() for text in texts]
 
 
+# Models kept loaded by resident transformers backends, keyed by (model_id, device).
+_RESIDENT_TRANSFORMERS: dict[tuple[str, int], tuple[Any, Any]] = {}
+
+
 @dataclass(frozen=True)
 class TransformersTranslationBackend:
     model_id: str
@@ -45,6 +80,9 @@ class TransformersTranslationBackend:
     source_lang_code: str | None
     target_lang_code: str | None
     name: str = "transformers"
+    # Keep the loaded model across calls (translation service); otherwise every call loads
+    # it again and the memory is released with the job.
+    resident: bool = False
 
     @staticmethod
     def _repair_common_mojibake(text: str) -> str:
@@ -96,6 +134,50 @@ class TransformersTranslationBackend:
         target_language: str,
         batch_size: int,
     ) -> list[str]:
+        candidates = self._translate(
+            texts,
+            source_language=source_language,
+            target_language=target_language,
+            batch_size=batch_size,
+            char_budgets=None,
+            num_candidates=1,
+        )
+        return [items[0].text for items in candidates]
+
+    def translate_batch_with_budget(
+        self,
+        texts: list[str],
+        *,
+        source_language: str,
+        target_language: str,
+        batch_size: int,
+        char_budgets: list[int],
+        num_candidates: int,
+    ) -> list[list[TranslationCandidate]]:
+        """Up to ``num_candidates`` beam hypotheses per text, decoding capped per batch.
+
+        Texts are batched in budget order, so each batch's ``max_new_tokens`` follows the
+        largest character budget in it.
+        """
+        return self._translate(
+            texts,
+            source_language=source_language,
+            target_language=target_language,
+            batch_size=batch_size,
+            char_budgets=char_budgets,
+            num_candidates=num_candidates,
+        )
+
+    def _translate(
+        self,
+        texts: list[str],
+        *,
+        source_language: str,
+        target_language: str,
+        batch_size: int,
+        char_budgets: list[int] | None,
+        num_candidates: int,
+    ) -> list[list[TranslationCandidate]]:
         if not texts:
             return []
 
@@ -108,8 +190,14 @@ class TransformersTranslationBackend:
                 "Install with: pip install transformers sentencepiece torch"
             ) from exc
 
-        tokenizer = AutoTokenizer.from_pretrained(self.model_id)
-        model = AutoModelForSeq2SeqLM.from_pretrained(self.model_id)
+        resident_key = (self.model_id, self.device)
+        loaded = _RESIDENT_TRANSFORMERS.get(resident_key) if self.resident else None
+        if loaded is None:
+            with span("mt.model_load", model_id=self.model_id):
+                tokenizer = AutoTokenizer.from_pretrained(self.model_id)
+                model = AutoModelForSeq2SeqLM.from_pretrained(self.model_id)
+        else:
+            tokenizer, model = loaded
 
         source_lang = self.source_lang_code or source_language
         target_lang = self.target_lang_code or target_language
@@ -130,29 +218,336 @@ class TransformersTranslationBackend:
                 except Exception:
                     forced_bos_token_id = None
 
-        if self.device >= 0 and torch.cuda.is_available():
-            model = model.to(f"cuda:{self.device}")
+        if loaded is None:
+            with span("mt.model_to_device", device=self.device):
+                if self.device >= 0 and torch.cuda.is_available():
+                    model = model.to(f"cuda:{self.device}")
+                else:
+                    model = model.to("cpu")
+            if self.resident:
+                _RESIDENT_TRANSFORMERS[resident_key] = (tokenizer, model)
+
+        order = list(range(len(texts)))
+        if char_budgets is not None:
+            order.sort(key=lambda index: char_budgets[index])
+        outputs: list[list[TranslationCandidate]] = [[] for _ in texts]
+        for start in range(0, len(order), batch_size):
+            indices = order[start : start + batch_size]
+            batch = [texts[index] for index in indices]
+            max_new_tokens = self.max_new_tokens
+            if char_budgets is not None:
+                max_new_tokens = budget_max_tokens(
+                    max(char_budgets[index] for index in indices), self.max_new_tokens
+                )
+            with span("mt.batch", size=len(batch), max_new_tokens=max_new_tokens):
+                encoded = tokenizer(batch, return_tensors="pt", padding=True, truncation=True)
+                encoded = {key: value.to(model.device) for key, value in encoded.items()}
+                generate_kwargs: dict[str, Any] = {"max_new_tokens": max_new_tokens}
+                if forced_bos_token_id is not None:
+                    generate_kwargs["forced_bos_token_id"] = forced_bos_token_id
+                if num_candidates > 1:
+                    generate_kwargs["num_beams"] = num_candidates
+                    generate_kwargs["num_return_sequences"] = num_candidates
+                generated = model.generate(**encoded, **generate_kwargs)
+                decoded = tokenizer.batch_decode(generated, skip_special_tokens=True)
+                # A row with no end token after the decoder start stopped at max_new_tokens.
+                eos_token_id = tokenizer.eos_token_id
+                capped = [
+                    eos_token_id is not None and eos_token_id not in row.tolist()[1:]
+                    for row in generated
+                ]
+            # generate returns num_candidates rows per input, best first.
+            for position, index in enumerate(indices):
+                rows = range(position * num_candidates, (position + 1) * num_candidates)
+                outputs[index] = [
+                    TranslationCandidate(
+                        text=self._repair_common_mojibake(decoded[row].strip()),
+                        hit_length_cap=capped[row],
+                    )
+                    for row in rows
+                ]
+        return outputs
+
+
+def token_batches(lengths: list[int], max_batch_tokens: int) -> list[list[int]]:
+    """Group item indices into batches whose padded size stays within ``max_batch_tokens``.
+
+    Items are sorted by length first, so each batch holds similar lengths and little
+    padding; a single item longer than the budget gets a batch of its own.
+    """
+    batches: list[list[int]] = []
+    current: list[int] = []
+    current_max = 0
+    for index in sorted(range(len(lengths)), key=lambda item: (lengths[item], item)):
+        length = max(1, lengths[index])
+        padded_max = max(current_max, length)
+        if current and padded_max * (len(current) + 1) > max_batch_tokens:
+            batches.append(current)
+            current = []
+            padded_max = length
+        current.append(index)
+        current_max = padded_max
+    if current:
+        batches.append(current)
+    return batches
+
+
+# Loaded (translator, tokenizer) pairs keyed by (model_dir, device, compute_type,
+# cpu_threads); one per process.
+_CT2_TRANSLATORS: dict[tuple[str, str, str, int], tuple[Any, Any]] = {}
+_CT2_TRANSLATORS_LOCK = threading.Lock()
+
+
+@dataclass(frozen=True)
+class CTranslate2TranslationBackend:
+    model_id: str
+    device: str
+    compute_type: str
+    cache_dir: Path
+    beam_size: int
+    max_decoding_length: int
+    max_batch_tokens: int
+    cpu_threads: int
+    source_lang_code: str | None
+    target_lang_code: str | None
+    name: str = "ctranslate2"
+
+    def converted_model_dir(self) -> Path:
+        # A model_id that already points at a converted model is used as-is.
+        local = Path(self.model_id)
+        if (local / "model.bin").is_file():
+            return local
+        slug = re.sub(r"[^a-zA-Z0-9]+", "_", self.model_id).strip("_").lower()
+        return self.cache_dir / f"{slug}-{self.compute_type}"
+
+    def _ensure_converted(self, ctranslate2: Any) -> Path:
+        model_dir = self.converted_model_dir()
+        if (model_dir / "model.bin").is_file():
+            return model_dir
+        # Convert next to the target and rename, so an interrupted conversion never leaves
+        # a half-written model that later runs would load.
+        temp_dir = model_dir.with_name(f"{model_dir.name}.{os.getpid()}.tmp")
+        shutil.rmtree(temp_dir, ignore_errors=True)
+        model_dir.parent.mkdir(parents=True, exist_ok=True)
+        with span("mt.model_convert", model_id=self.model_id, quantization=self.compute_type):
+            converter = ctranslate2.converters.TransformersConverter(self.model_id)
+            converter.convert(str(temp_dir), quantization=self.compute_type, force=True)
+        try:
+            os.replace(temp_dir, model_dir)
+        except OSError:
+            # Another process finished the same conversion first.
+            shutil.rmtree(temp_dir, ignore_errors=True)
+        return model_dir
+
+    @staticmethod
+    def _decode(tokenizer: Any, hypothesis: list[str], target_prefix: list[str] | None) -> str:
+        if target_prefix and hypothesis[: len(target_prefix)] == target_prefix:
+            hypothesis = hypothesis[len(target_prefix) :]
+        decoded = tokenizer.decode(
+            tokenizer.convert_tokens_to_ids(hypothesis), skip_special_tokens=True
+        )
+        return TransformersTranslationBackend._repair_common_mojibake(decoded.strip())
+
+    def _translator(
+        self, ctranslate2: Any, auto_tokenizer: Any, model_dir: Path
+    ) -> tuple[Any, Any]:
+        key = (str(model_dir), self.device, self.compute_type, self.cpu_threads)
+        with _CT2_TRANSLATORS_LOCK:
+            loaded = _CT2_TRANSLATORS.get(key)
+            if loaded is None:
+                with span("mt.model_load", model_id=self.model_id, device=self.device):
+                    translator = ctranslate2.Translator(
+                        str(model_dir),
+                        device=self.device,
+                        compute_type=self.compute_type,
+                        intra_threads=self.cpu_threads,
+                    )
+                with span("mt.tokenizer_load", model_id=self.model_id):
+                    tokenizer = auto_tokenizer.from_pretrained(self.model_id)
+                loaded = (translator, tokenizer)
+                _CT2_TRANSLATORS[key] = loaded
+        return loaded
+
+    def translate_batch(
+        self,
+        texts: list[str],
+        *,
+        source_language: str,
+        target_language: str,
+        batch_size: int,
+    ) -> list[str]:
+        candidates = self._translate(
+            texts,
+            source_language=source_language,
+            target_language=target_language,
+            batch_size=batch_size,
+            char_budgets=None,
+            num_candidates=1,
+        )
+        return [items[0].text for items in candidates]
+
+    def translate_batch_with_budget(
+        self,
+        texts: list[str],
+        *,
+        source_language: str,
+        target_language: str,
+        batch_size: int,
+        char_budgets: list[int],
+        num_candidates: int,
+    ) -> list[list[TranslationCandidate]]:
+        """Up to ``num_candidates`` hypotheses per text; each batch's decoding length
+        follows the largest character budget in it."""
+        return self._translate(
+            texts,
+            source_language=source_language,
+            target_language=target_language,
+            batch_size=batch_size,
+            char_budgets=char_budgets,
+            num_candidates=num_candidates,
+        )
+
+    def _translate(
+        self,
+        texts: list[str],
+        *,
+        source_language: str,
+        target_language: str,
+        batch_size: int,
+        char_budgets: list[int] | None,
+        num_candidates: int,
+    ) -> list[list[TranslationCandidate]]:
+        if not texts:
+            return []
+
+        try:
+            import ctranslate2
+            from transformers import AutoTokenizer
+        except ImportError as exc:
+            raise RuntimeError(
+                "CTranslate2 backend requires 'ctranslate2', 'transformers', and "
+                "'sentencepiece'. Install with: pip install ctranslate2 transformers sentencepiece"
+            ) from exc
+
+        model_dir = self._ensure_converted(ctranslate2)
+        translator, tokenizer = self._translator(ctranslate2, AutoTokenizer, model_dir)
+
+        source_lang = self.source_lang_code or source_language
+        target_lang = self.target_lang_code or target_language
+        # M2M100-style tokenizers add the source language token while encoding; the target
+        # language token is forced as the decoder prefix. The tokenizer is shared across
+        # calls, so setting src_lang and encoding happen under the cache lock.
+        target_prefix: list[str] | None = None
+        with _CT2_TRANSLATORS_LOCK:
+            lang_code_to_token = getattr(tokenizer, "lang_code_to_token", None)
+            if isinstance(lang_code_to_token, dict) and target_lang in lang_code_to_token:
+                if hasattr(tokenizer, "src_lang"):
+                    tokenizer.src_lang = source_lang
+                target_prefix = [str(lang_code_to_token[target_lang])]
+            source_tokens = [
+                tokenizer.convert_ids_to_tokens(tokenizer.encode(text)) for text in texts
+            ]
+        if self.max_batch_tokens > 0:
+            lengths = [len(tokens) for tokens in source_tokens]
+            batches = token_batches(lengths, self.max_batch_tokens)
         else:
-            model = model.to("cpu")
-
-        outputs: list[str] = []
-        for start in range(0, len(texts), batch_size):
-            batch = texts[start : start + batch_size]
-            encoded = tokenizer(batch, return_tensors="pt", padding=True, truncation=True)
-            encoded = {key: value.to(model.device) for key, value in encoded.items()}
-            generate_kwargs = {"max_new_tokens": self.max_new_tokens}
-            if forced_bos_token_id is not None:
-                generate_kwargs["forced_bos_token_id"] = forced_bos_token_id
-            generated = model.generate(**encoded, **generate_kwargs)
-            decoded = tokenizer.batch_decode(generated, skip_special_tokens=True)
-            outputs.extend(self._repair_common_mojibake(text.strip()) for text in decoded)
+            batches = [
+                list(range(start, min(start + batch_size, len(texts))))
+                for start in range(0, len(texts), batch_size)
+            ]
+
+        outputs: list[list[TranslationCandidate]] = [[] for _ in texts]
+        for indices in batches:
+            batch_tokens = [source_tokens[index] for index in indices]
+            max_decoding_length = self.max_decoding_length
+            if char_budgets is not None:
+                max_decoding_length = budget_max_tokens(
+                    max(char_budgets[index] for index in indices), self.max_decoding_length
+                )
+            with span(
+                "mt.batch",
+                size=len(indices),
+                tokens=max(len(tokens) for tokens in batch_tokens) * len(indices),
+                max_decoding_length=max_decoding_length,
+            ):
+                results = translator.translate_batch(
+                    batch_tokens,
+                    target_prefix=[target_prefix] * len(indices) if target_prefix else None,
+                    beam_size=max(self.beam_size, num_candidates),
+                    num_hypotheses=num_candidates,
+                    max_decoding_length=max_decoding_length,
+                )
+            # Hypotheses carry no end token; one as long as the cap stopped there.
+            for index, result in zip(indices, results, strict=True):
+                outputs[index] = [
+                    TranslationCandidate(
+                        text=self._decode(tokenizer, list(hypothesis), target_prefix),
+                        hit_length_cap=len(hypothesis) >= max_decoding_length,
+                    )
+                    for hypothesis in result.hypotheses[:num_candidates]
+                ]
         return outputs
 
 
+@dataclass(frozen=True)
+class TranslationServiceBackend:
+    """Client for ``video-translate translate-server``; the server owns model and batching."""
+
+    url: str
+    timeout_seconds: float
+    name: str = "service"
+
+    def translate_batch(
+        self,
+        texts: list[str],
+        *,
+        source_language: str,
+        target_language: str,
+        batch_size: int,
+    ) -> list[str]:
+        del batch_size
+        if not texts:
+            return []
+        body = json.dumps(
+            {
+                "texts": texts,
+                "source_language": source_language,
+                "target_language": target_language,
+            },
+            ensure_ascii=False,
+        ).encode("utf-8")
+        request = urllib.request.Request(
+            f"{self.url}/translate",
+            data=body,
+            headers={"Content-Type": "application/json; charset=utf-8"},
+            method="POST",
+        )
+        with span("mt.service_request", url=self.url, text_count=len(texts)):
+            try:
+                with urllib.request.urlopen(request, timeout=self.timeout_seconds) as response:
+                    payload = json.loads(response.read().decode("utf-8"))
+            except urllib.error.HTTPError as exc:
+                detail = exc.read().decode("utf-8", errors="replace")
+                raise RuntimeError(
+                    f"Translation service at {self.url} failed ({exc.code}): {detail}"
+                ) from exc
+            except (urllib.error.URLError, OSError) as exc:
+                raise RuntimeError(
+                    f"Translation service at {self.url} is not reachable: {exc}. "
+                    "Start it with: video-translate translate-server"
+                ) from exc
+        translations = payload.get("translations") if isinstance(payload, dict) else None
+        if not isinstance(translations, list) or len(translations) != len(texts):
+            raise RuntimeError(f"Translation service at {self.url} returned a malformed reply.")
+        return [str(text) for text in translations]
+
+
 def build_translation_backend(config: TranslateConfig) -> TranslationBackend:
     backend_name = config.backend.lower().strip()
     if backend_name == "mock":
-        return MockTranslationBackend()
+        return MockTranslationBackend(
+            item_latency_seconds=config.mock_item_latency_seconds,
+        )
     if backend_name == "transformers":
         return TransformersTranslationBackend(
             model_id=config.transformers.model_id,
@@ -161,8 +556,27 @@ def build_translation_backend(config: TranslateConfig) -> TranslationBackend:
             source_lang_code=config.transformers.source_lang_code,
             target_lang_code=config.transformers.target_lang_code,
         )
+    if backend_name == "ctranslate2":
+        ct2 = config.ctranslate2
+        return CTranslate2TranslationBackend(
+            model_id=ct2.model_id,
+            device=ct2.device,
+            compute_type=ct2.compute_type,
+            cache_dir=ct2.cache_dir,
+            beam_size=ct2.beam_size,
+            max_decoding_length=ct2.max_decoding_length,
+            max_batch_tokens=ct2.max_batch_tokens,
+            cpu_threads=ct2.cpu_threads,
+            source_lang_code=ct2.source_lang_code,
+            target_lang_code=ct2.target_lang_code,
+        )
+    if backend_name == "service":
+        return TranslationServiceBackend(
+            url=config.service.url,
+            timeout_seconds=config.service.timeout_seconds,
+        )
     raise ValueError(
         f"Unsupported translation backend '{config.backend}'. "
-        "Supported backends: mock, transformers."
+        "Supported backends: mock, transformers, ctranslate2, service."
     )
 
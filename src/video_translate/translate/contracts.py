@@ -4,8 +4,10 @@ from dataclasses import asdict, dataclass
 from datetime import UTC, datetime
 from typing import Any
 
+from video_translate.models import TranscriptDocument
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class TranslationInputSegment:
     id: int
     start: float
@@ -30,7 +32,7 @@ class TranslationInputDocument:
         return asdict(self)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TranslationOutputSegment:
     id: int
     start: float
@@ -69,31 +71,29 @@ def build_translation_input_document(
     transcript_payload: dict[str, Any],
     target_language: str,
 ) -> TranslationInputDocument:
-    source_language_raw = transcript_payload.get("language", "en")
-    source_language = str(source_language_raw).strip() or "en"
-    segments_payload = transcript_payload.get("segments", [])
-    if not isinstance(segments_payload, list):
-        raise ValueError("Transcript payload field 'segments' must be a list.")
+    return translation_input_from_transcript(
+        TranscriptDocument.from_dict(transcript_payload),
+        target_language=target_language,
+    )
 
+
+def translation_input_from_transcript(
+    doc: TranscriptDocument,
+    *,
+    target_language: str,
+) -> TranslationInputDocument:
+    source_language = doc.language.strip() or "en"
     segments: list[TranslationInputSegment] = []
-    for raw in segments_payload:
-        if not isinstance(raw, dict):
-            raise ValueError("Each transcript segment must be an object.")
-
-        segment_id = int(raw.get("id", len(segments)))
-        start = float(raw.get("start", 0.0))
-        end = float(raw.get("end", start))
-        duration = max(0.0, end - start)
-        source_text = str(raw.get("text", "")).strip()
-        source_word_count = _count_words(source_text)
+    for segment in doc.segments:
+        source_text = segment.text.strip()
         segments.append(
             TranslationInputSegment(
-                id=segment_id,
-                start=start,
-                end=end,
-                duration=duration,
+                id=segment.id,
+                start=segment.start,
+                end=segment.end,
+                duration=max(0.0, segment.end - segment.start),
                 source_text=source_text,
-                source_word_count=source_word_count,
+                source_word_count=_count_words(source_text),
             )
         )
 
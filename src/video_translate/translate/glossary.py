@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -31,6 +32,11 @@ def _term_pattern(term: str) -> str:
     return rf"\b{escaped}\b"
 
 
+@lru_cache(maxsize=4096)
+def compile_term_pattern(term: str, *, case_sensitive: bool) -> re.Pattern[str]:
+    return re.compile(_term_pattern(term), 0 if case_sensitive else re.IGNORECASE)
+
+
 def apply_glossary(
     text: str,
     glossary: dict[str, str],
@@ -51,6 +57,5 @@ def apply_glossary(
 def contains_term(text: str, term: str, *, case_sensitive: bool) -> bool:
     if not text.strip() or not term.strip():
         return False
-    flags = 0 if case_sensitive else re.IGNORECASE
-    return re.search(_term_pattern(term), text, flags=flags) is not None
+    return compile_term_pattern(term, case_sensitive=case_sensitive).search(text) is not None
 
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+
+from video_translate.config import TTSConfig
+
+# The rates below are rough, unmeasured defaults, not calibrations of any voice; set
+# translate.length_control_chars_per_second to a rate measured for the voice in use.
+# Average characters per spoken word in Turkish, separator included; converts eSpeak's
+# words-per-minute rate into characters per second.
+CHARS_PER_WORD = 6.5
+# Piper voices at length_scale 1.0 and the mock backend (which has no speaking rate).
+PIPER_CHARS_PER_SECOND = 15.0
+MOCK_CHARS_PER_SECOND = 15.0
+# SentencePiece tokens hold about three Turkish characters; used to turn a character
+# budget into a decoding-length cap. A low estimate only shortens the cap, and capped
+# hypotheses are flagged (see TranslationCandidate), so it cannot silently cut text.
+CHARS_PER_TOKEN = 3.0
+
+
+@dataclass(frozen=True)
+class TranslationCandidate:
+    text: str
+    # Decoding stopped at the length cap, so the text may end mid-sentence.
+    hit_length_cap: bool = False
+
+
+def voice_chars_per_second(tts: TTSConfig, override: float = 0.0) -> float:
+    """Characters per second the configured TTS voice speaks at its base rate.
+
+    Without an override this is an estimate from the constants above.
+    """
+    if override > 0.0:
+        return override
+    backend = tts.backend.strip().lower()
+    if backend == "espeak":
+        return tts.espeak_speed_wpm * CHARS_PER_WORD / 60.0
+    if backend == "piper":
+        return PIPER_CHARS_PER_SECOND / max(tts.piper_length_scale, 0.1)
+    return MOCK_CHARS_PER_SECOND
+
+
+def char_budget(duration: float, chars_per_second: float, tolerance: float) -> int:
+    return max(1, math.floor(duration * chars_per_second * tolerance))
+
+
+def budget_max_tokens(char_budget_value: int, ceiling: int) -> int:
+    """Decoding cap for a character budget.
+
+    The cap leaves 50% headroom over the budget, so the cap itself rarely cuts a
+    sentence; best-of-n selection does the fine fitting. Short budgets can still hit
+    the cap, which is why backends report ``hit_length_cap`` per candidate.
+    """
+    return max(8, min(ceiling, math.ceil(char_budget_value * 1.5 / CHARS_PER_TOKEN) + 4))
+
+
+def predicted_seconds(text: str, chars_per_second: float) -> float:
+    return len(text.strip()) / chars_per_second if chars_per_second > 0.0 else 0.0
+
+
+def pick_candidate(
+    candidates: list[TranslationCandidate], char_budget_value: int
+) -> TranslationCandidate | None:
+    """The highest-ranked complete candidate within the budget, else the shortest
+    complete one; ``None`` when every candidate hit the decoding cap."""
+    complete = [candidate for candidate in candidates if not candidate.hit_length_cap]
+    for candidate in complete:
+        if len(candidate.text.strip()) <= char_budget_value:
+            return candidate
+    if not complete:
+        return None
+    return min(complete, key=lambda candidate: len(candidate.text.strip()))
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from itertools import pairwise
+
+from video_translate.translate.contracts import TranslationInputSegment
+
+_TERMINAL_PUNCTUATION = (".", "!", "?", "…")
+_CLOSING_MARKS = "\"')]»”’"
+_BREAK_PUNCTUATION = (",", ";", ":", *_TERMINAL_PUNCTUATION)
+
+
+@dataclass(frozen=True)
+class SentenceUnit:
+    """Adjacent segments translated as one input; positions index the merged sequence."""
+
+    positions: tuple[int, ...]
+    text: str
+
+
+def _ends_sentence(text: str) -> bool:
+    return text.rstrip().rstrip(_CLOSING_MARKS).endswith(_TERMINAL_PUNCTUATION)
+
+
+def merge_sentence_units(
+    segments: list[TranslationInputSegment],
+    *,
+    max_gap_seconds: float,
+    max_segments: int,
+    max_words: int,
+) -> list[SentenceUnit]:
+    """Group consecutive segments into sentence units.
+
+    A unit ends after a segment with terminal punctuation, before a pause longer than
+    ``max_gap_seconds``, or when it would exceed ``max_segments`` or ``max_words``.
+    """
+    units: list[SentenceUnit] = []
+    current: list[int] = []
+    current_words = 0
+
+    def close() -> None:
+        nonlocal current, current_words
+        if current:
+            text = " ".join(segments[position].source_text.strip() for position in current)
+            units.append(SentenceUnit(positions=tuple(current), text=text))
+        current = []
+        current_words = 0
+
+    for position, segment in enumerate(segments):
+        if current:
+            previous = segments[current[-1]]
+            if (
+                segment.start - previous.end > max_gap_seconds
+                or len(current) >= max_segments
+                or current_words + segment.source_word_count > max_words
+            ):
+                close()
+        current.append(position)
+        current_words += segment.source_word_count
+        if _ends_sentence(segment.source_text):
+            close()
+    close()
+    return units
+
+
+def split_target_text(text: str, weights: list[float]) -> list[str] | None:
+    """Split a translated unit back into one text per segment, proportional to ``weights``.
+
+    Cuts fall on word boundaries near each segment's share of the characters and snap to
+    punctuation when it is close. Returns None when there are fewer words than segments.
+    """
+    if len(weights) == 1:
+        return [text.strip()]
+    words = text.split()
+    count = len(weights)
+    if len(words) < count:
+        return None
+    total_weight = sum(weights)
+    if total_weight <= 0.0:
+        weights = [1.0] * count
+        total_weight = float(count)
+
+    # chars_before[b]: characters in the first b words, separators included.
+    chars_before = [0]
+    for word in words:
+        chars_before.append(chars_before[-1] + len(word) + 1)
+    total_chars = chars_before[-1]
+
+    def score(cut: int, target: float) -> float:
+        distance = abs(chars_before[cut] - target) / total_chars
+        snapped = words[cut - 1].rstrip(_CLOSING_MARKS).endswith(_BREAK_PUNCTUATION)
+        return distance - (0.05 if snapped else 0.0)
+
+    cuts: list[int] = []
+    previous_cut = 0
+    cumulative_weight = 0.0
+    for index in range(1, count):
+        cumulative_weight += weights[index - 1]
+        target = total_chars * cumulative_weight / total_weight
+        lowest = previous_cut + 1
+        highest = len(words) - (count - index)
+        _, best = min((score(cut, target), cut) for cut in range(lowest, highest + 1))
+        cuts.append(best)
+        previous_cut = best
+
+    bounds = [0, *cuts, len(words)]
+    return [" ".join(words[start:end]) for start, end in pairwise(bounds)]
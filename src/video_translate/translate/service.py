@@ -0,0 +1,346 @@
+from __future__ import annotations
+
+import json
+import threading
+from collections import deque
+from dataclasses import dataclass, field, replace
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from time import perf_counter
+from typing import Any
+
+from video_translate.config import TranslateConfig
+from video_translate.metrics import (
+    PROMETHEUS_CONTENT_TYPE,
+    RATIO_BUCKETS,
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+)
+from video_translate.tracing import span
+from video_translate.translate.backends import (
+    TransformersTranslationBackend,
+    TranslationBackend,
+    build_translation_backend,
+)
+
+REQUESTS_PER_BATCH_BUCKETS: tuple[float, ...] = (1.0, 2.0, 3.0, 4.0, 6.0, 8.0, 16.0, 32.0)
+QUEUE_WAIT_BUCKETS: tuple[float, ...] = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0,
+)
+
+
+@dataclass
+class _PendingRequest:
+    texts: list[str]
+    source_language: str
+    target_language: str
+    enqueued_at: float
+    results: list[str | None]
+    remaining: int
+    done: threading.Event = field(default_factory=threading.Event)
+    error: str | None = None
+
+    @property
+    def language_pair(self) -> tuple[str, str]:
+        return self.source_language, self.target_language
+
+
+class MicroBatcher:
+    """Coalesce texts from concurrent callers into shared backend batches.
+
+    Texts queue in arrival order. A batch is cut once ``max_batch_size`` texts of the
+    oldest request's language pair are waiting, or once that request has waited
+    ``max_wait_seconds``. A request larger than one batch is spread over several, and
+    identical texts in a batch are translated once. One worker thread owns the backend,
+    so a single model stays loaded however many jobs send work.
+    """
+
+    def __init__(
+        self,
+        backend: TranslationBackend,
+        *,
+        max_batch_size: int,
+        max_wait_seconds: float,
+    ) -> None:
+        self.backend = backend
+        self.max_batch_size = max_batch_size
+        self.max_wait_seconds = max_wait_seconds
+        self._queue: deque[tuple[_PendingRequest, int]] = deque()
+        self._condition = threading.Condition()
+        self._closed = False
+        self._stats = {
+            "request_count": 0,
+            "text_count": 0,
+            "batch_count": 0,
+            "coalesced_batch_count": 0,
+            "failed_batch_count": 0,
+            "max_queue_depth": 0,
+            "batch_fill_total": 0.0,
+            "requests_per_batch_total": 0,
+        }
+        self.registry = MetricsRegistry()
+        self.queue_depth = self.registry.register(
+            Gauge("video_translate_mt_service_queue_depth", "Texts waiting for a batch.")
+        )
+        self.batches = self.registry.register(
+            Counter("video_translate_mt_service_batches_total", "Backend batches run.")
+        )
+        self.texts = self.registry.register(
+            Counter("video_translate_mt_service_texts_total", "Texts received from clients.")
+        )
+        self.batch_fill = self.registry.register(
+            Histogram(
+                "video_translate_mt_service_batch_fill_ratio",
+                "Texts per batch divided by max_batch_size.",
+                buckets=RATIO_BUCKETS,
+            )
+        )
+        self.requests_per_batch = self.registry.register(
+            Histogram(
+                "video_translate_mt_service_requests_per_batch",
+                "Client requests sharing one backend batch.",
+                buckets=REQUESTS_PER_BATCH_BUCKETS,
+            )
+        )
+        self.queue_wait = self.registry.register(
+            Histogram(
+                "video_translate_mt_service_queue_wait_seconds",
+                "Time from request arrival until its first batch starts.",
+                buckets=QUEUE_WAIT_BUCKETS,
+            )
+        )
+        self._worker = threading.Thread(target=self._run, name="mt-service-batcher", daemon=True)
+        self._worker.start()
+
+    def submit(
+        self,
+        texts: list[str],
+        *,
+        source_language: str,
+        target_language: str,
+        timeout_seconds: float | None = None,
+    ) -> list[str]:
+        if not texts:
+            return []
+        request = _PendingRequest(
+            texts=list(texts),
+            source_language=source_language,
+            target_language=target_language,
+            enqueued_at=perf_counter(),
+            results=[None] * len(texts),
+            remaining=len(texts),
+        )
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Translation service is shutting down.")
+            self._queue.extend((request, index) for index in range(len(texts)))
+            self._stats["request_count"] += 1
+            self._stats["text_count"] += len(texts)
+            self._stats["max_queue_depth"] = max(self._stats["max_queue_depth"], len(self._queue))
+            self.queue_depth.set(len(self._queue))
+            self._condition.notify_all()
+        self.texts.inc(len(texts))
+        if not request.done.wait(timeout_seconds):
+            raise TimeoutError(f"Translation did not finish within {timeout_seconds} s.")
+        if request.error is not None:
+            raise RuntimeError(request.error)
+        return [text or "" for text in request.results]
+
+    def _next_batch(self) -> list[tuple[_PendingRequest, int]] | None:
+        with self._condition:
+            while True:
+                if not self._queue:
+                    if self._closed:
+                        return None
+                    self._condition.wait()
+                    continue
+                head = self._queue[0][0]
+                pair = head.language_pair
+                ready = [item for item in self._queue if item[0].language_pair == pair]
+                remaining_wait = head.enqueued_at + self.max_wait_seconds - perf_counter()
+                if len(ready) >= self.max_batch_size or remaining_wait <= 0 or self._closed:
+                    batch = ready[: self.max_batch_size]
+                    taken = {id(item) for item in batch}
+                    self._queue = deque(item for item in self._queue if id(item) not in taken)
+                    self.queue_depth.set(len(self._queue))
+                    return batch
+                self._condition.wait(remaining_wait)
+
+    def _run(self) -> None:
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            self._translate(batch)
+
+    def _translate(self, batch: list[tuple[_PendingRequest, int]]) -> None:
+        started = perf_counter()
+        requests = list({id(request): request for request, _ in batch}.values())
+        for request in requests:
+            if request.remaining == len(request.texts):
+                self.queue_wait.observe(started - request.enqueued_at)
+        unique_texts = list(dict.fromkeys(request.texts[index] for request, index in batch))
+        source_language, target_language = requests[0].language_pair
+        error: str | None = None
+        translated: dict[str, str] = {}
+        try:
+            with span(
+                "mt.service_batch",
+                size=len(batch),
+                unique=len(unique_texts),
+                requests=len(requests),
+            ):
+                outputs = self.backend.translate_batch(
+                    unique_texts,
+                    source_language=source_language,
+                    target_language=target_language,
+                    batch_size=self.max_batch_size,
+                )
+            translated = dict(zip(unique_texts, outputs, strict=True))
+        except Exception as exc:  # noqa: BLE001
+            error = f"{type(exc).__name__}: {exc}"
+
+        fill = len(batch) / self.max_batch_size
+        self.batches.inc()
+        self.batch_fill.observe(fill)
+        self.requests_per_batch.observe(len(requests))
+        with self._condition:
+            self._stats["batch_count"] += 1
+            self._stats["batch_fill_total"] += fill
+            self._stats["requests_per_batch_total"] += len(requests)
+            if len(requests) > 1:
+                self._stats["coalesced_batch_count"] += 1
+            if error is not None:
+                self._stats["failed_batch_count"] += 1
+        for request, index in batch:
+            if error is not None:
+                request.error = error
+            else:
+                request.results[index] = translated.get(request.texts[index], "")
+            request.remaining -= 1
+            if request.remaining == 0 or error is not None:
+                request.done.set()
+
+    def stats(self) -> dict[str, Any]:
+        with self._condition:
+            stats = dict(self._stats)
+            queue_depth = len(self._queue)
+        batch_count = stats["batch_count"]
+        return {
+            "backend": self.backend.name,
+            "max_batch_size": self.max_batch_size,
+            "max_wait_seconds": self.max_wait_seconds,
+            "queue_depth": queue_depth,
+            "max_queue_depth": stats["max_queue_depth"],
+            "request_count": stats["request_count"],
+            "text_count": stats["text_count"],
+            "batch_count": batch_count,
+            "coalesced_batch_count": stats["coalesced_batch_count"],
+            "failed_batch_count": stats["failed_batch_count"],
+            "mean_batch_fill": (
+                round(stats["batch_fill_total"] / batch_count, 4) if batch_count else None
+            ),
+            "mean_requests_per_batch": (
+                round(stats["requests_per_batch_total"] / batch_count, 4) if batch_count else None
+            ),
+        }
+
+    def close(self) -> None:
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._worker.join(timeout=5.0)
+
+
+def build_service_backend(config: TranslateConfig) -> TranslationBackend:
+    """The backend the server runs; the transformers model is kept resident."""
+    if config.backend.lower().strip() == "service":
+        raise ValueError(
+            "The translation service needs a model backend; set translate.backend to "
+            "transformers, ctranslate2 or mock in the server config."
+        )
+    backend = build_translation_backend(config)
+    if isinstance(backend, TransformersTranslationBackend):
+        backend = replace(backend, resident=True)
+    return backend
+
+
+def build_service_handler(
+    batcher: MicroBatcher, *, timeout_seconds: float | None = None
+) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:  # noqa: N802
+            if self.path == "/health":
+                self._send_json(200, {"ok": True, "backend": batcher.backend.name})
+                return
+            if self.path == "/stats":
+                self._send_json(200, {"ok": True, **batcher.stats()})
+                return
+            if self.path == "/metrics":
+                encoded = batcher.registry.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", PROMETHEUS_CONTENT_TYPE)
+                self.send_header("Cache-Control", "no-store")
+                self.send_header("Content-Length", str(len(encoded)))
+                self.end_headers()
+                self.wfile.write(encoded)
+                return
+            self._send_json(404, {"ok": False, "error": "Not found"})
+
+        def do_POST(self) -> None:  # noqa: N802
+            if self.path != "/translate":
+                self._send_json(404, {"ok": False, "error": "Not found"})
+                return
+            length = int(self.headers.get("Content-Length", "0"))
+            try:
+                payload = json.loads(self.rfile.read(length).decode("utf-8"))
+                texts = payload["texts"]
+                source_language = str(payload["source_language"])
+                target_language = str(payload["target_language"])
+                if not isinstance(texts, list):
+                    raise TypeError("'texts' must be a list.")
+            except (ValueError, KeyError, TypeError) as exc:
+                self._send_json(400, {"ok": False, "error": f"Invalid request: {exc}"})
+                return
+            try:
+                translations = batcher.submit(
+                    [str(text) for text in texts],
+                    source_language=source_language,
+                    target_language=target_language,
+                    timeout_seconds=timeout_seconds,
+                )
+            except Exception as exc:  # noqa: BLE001
+                self._send_json(500, {"ok": False, "error": str(exc)})
+                return
+            self._send_json(200, {"ok": True, "translations": translations})
+
+        def log_message(self, format: str, *args: Any) -> None:  # noqa: A003
+            return
+
+        def _send_json(self, code: int, payload: dict[str, Any]) -> None:
+            encoded = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+            self.send_response(code)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(encoded)))
+            self.end_headers()
+            self.wfile.write(encoded)
+
+    return Handler
+
+
+def run_translation_service(config: TranslateConfig, *, host: str, port: int) -> None:
+    batcher = MicroBatcher(
+        build_service_backend(config),
+        max_batch_size=config.service.max_batch_size,
+        max_wait_seconds=config.service.max_wait_seconds,
+    )
+    server = ThreadingHTTPServer(
+        (host, port),
+        build_service_handler(batcher, timeout_seconds=config.service.timeout_seconds),
+    )
+    try:
+        server.serve_forever(poll_interval=0.2)
+    finally:
+        server.server_close()
+        batcher.close()
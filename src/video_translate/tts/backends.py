@@ -1,13 +1,26 @@
 from __future__ import annotations
 
+import json
 import math
 import shutil
+import time
 import wave
 from dataclasses import dataclass
 from pathlib import Path, PureWindowsPath
 
 from video_translate.config import TTSConfig
-from video_translate.utils.subprocess_utils import run_command
+from video_translate.utils.subprocess_utils import (
+    CommandExecutionError,
+    get_line_worker,
+    run_command,
+)
+
+# Piper's Windows launcher is a Python script; enforce UTF-8 stdin decoding.
+_PIPER_ENV_OVERRIDES = {
+    "PYTHONUTF8": "1",
+    "PYTHONIOENCODING": "utf-8",
+}
+_PIPER_WORKER_TIMEOUT_SECONDS = 120.0
 
 
 class TTSBackend:
@@ -30,6 +43,8 @@ class MockTTSBackend(TTSBackend):
     min_segment_seconds: float
     amplitude: int = 5000
     name: str = "mock"
+    # Simulated per-segment synthesis latency for throughput benchmarks.
+    item_latency_seconds: float = 0.0
 
     def synthesize_to_wav(
         self,
@@ -39,6 +54,8 @@ class MockTTSBackend(TTSBackend):
         target_duration: float,
         sample_rate: int,
     ) -> float:
+        if self.item_latency_seconds > 0.0:
+            time.sleep(self.item_latency_seconds)
         duration = max(float(target_duration), self.min_segment_seconds)
         frame_count = max(1, int(round(duration * sample_rate)))
         tone_hz = float(self.base_tone_hz + (len(text) % 40))
@@ -149,6 +166,60 @@ class PiperTTSBackend(TTSBackend):
     noise_w: float
     min_segment_seconds: float
     name: str = "piper"
+    # Keep one piper process (and its loaded voice) alive and stream --json-input lines
+    # to it. Needs a piper build that prints the written path per input line; answers
+    # are matched to requests by that path.
+    persistent_worker: bool = False
+
+    def _voice_args(self) -> list[str]:
+        args = [
+            "--length_scale",
+            f"{self.length_scale:.4f}",
+            "--noise_scale",
+            f"{self.noise_scale:.4f}",
+            "--noise_w",
+            f"{self.noise_w:.4f}",
+        ]
+        if self.config_path is not None:
+            args.extend(["--config", str(self.config_path)])
+        if self.speaker_id is not None:
+            args.extend(["--speaker", str(self.speaker_id)])
+        return args
+
+    def _synthesize_with_worker(self, text: str, output_wav: Path) -> bool:
+        worker = get_line_worker(
+            [
+                self.piper_bin,
+                "--model",
+                str(self.model_path),
+                "--json-input",
+                "--output_dir",
+                str(output_wav.parent),
+                *self._voice_args(),
+            ],
+            env_overrides=_PIPER_ENV_OVERRIDES,
+        )
+        if worker.disabled:
+            return False
+        if output_wav.exists():
+            output_wav.unlink()
+        request = json.dumps({"text": text, "output_file": str(output_wav)}, ensure_ascii=False)
+        try:
+            # piper prints the written path per input line; match on it so stray stdout
+            # lines cannot pair this segment with another segment's answer.
+            worker.request(
+                request,
+                timeout_seconds=_PIPER_WORKER_TIMEOUT_SECONDS,
+                matches=lambda response: response.strip().endswith(output_wav.name),
+            )
+        except CommandExecutionError:
+            # The worker disables itself; this and later segments spawn piper per call.
+            return False
+        if not output_wav.exists():
+            # Answered without writing the file: not a --json-input capable piper build.
+            worker.disable()
+            return False
+        return True
 
     def synthesize_to_wav(
         self,
@@ -162,32 +233,20 @@ class PiperTTSBackend(TTSBackend):
         if not safe_text:
             safe_text = " "
         output_wav.parent.mkdir(parents=True, exist_ok=True)
-        command = [
-            self.piper_bin,
-            "--model",
-            str(self.model_path),
-            "--output_file",
-            str(output_wav),
-            "--length_scale",
-            f"{self.length_scale:.4f}",
-            "--noise_scale",
-            f"{self.noise_scale:.4f}",
-            "--noise_w",
-            f"{self.noise_w:.4f}",
-        ]
-        if self.config_path is not None:
-            command.extend(["--config", str(self.config_path)])
-        if self.speaker_id is not None:
-            command.extend(["--speaker", str(self.speaker_id)])
-        # Piper Windows launcher is a Python script; enforce UTF-8 stdin decoding.
-        run_command(
-            command,
-            input_text=safe_text + "\n",
-            env_overrides={
-                "PYTHONUTF8": "1",
-                "PYTHONIOENCODING": "utf-8",
-            },
-        )
+        if not (self.persistent_worker and self._synthesize_with_worker(safe_text, output_wav)):
+            command = [
+                self.piper_bin,
+                "--model",
+                str(self.model_path),
+                "--output_file",
+                str(output_wav),
+                *self._voice_args(),
+            ]
+            run_command(
+                command,
+                input_text=safe_text + "\n",
+                env_overrides=_PIPER_ENV_OVERRIDES,
+            )
         duration = _wav_duration_seconds(output_wav)
         return max(duration, self.min_segment_seconds)
 
@@ -270,6 +329,7 @@ def build_tts_backend(config: TTSConfig) -> TTSBackend:
         return MockTTSBackend(
             base_tone_hz=config.mock_base_tone_hz,
             min_segment_seconds=config.min_segment_seconds,
+            item_latency_seconds=config.mock_item_latency_seconds,
         )
     if backend == "espeak":
         return EspeakTTSBackend(
@@ -296,6 +356,7 @@ def build_tts_backend(config: TTSConfig) -> TTSBackend:
             noise_scale=config.piper_noise_scale,
             noise_w=config.piper_noise_w,
             min_segment_seconds=config.min_segment_seconds,
+            persistent_worker=config.piper_persistent_worker,
         )
     raise ValueError(
         f"Unsupported TTS backend: '{config.backend}'. Supported backends: mock, espeak, piper."
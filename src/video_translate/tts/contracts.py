@@ -6,7 +6,7 @@ from pathlib import Path
 from typing import Any
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TTSInputSegment:
     id: int
     start: float
@@ -30,7 +30,7 @@ class TTSInputDocument:
         return asdict(self)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TTSOutputSegment:
     id: int
     start: float
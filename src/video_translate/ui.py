@@ -13,13 +13,31 @@ from typing import Any, Callable
 from urllib.parse import parse_qs, quote, urlparse
 
 from video_translate.config import load_config
+from video_translate.io import read_json
+from video_translate.metrics import (
+    JOB_DURATION,
+    JOBS_FINISHED,
+    JOBS_QUEUED,
+    JOBS_RUNNING,
+    PROMETHEUS_CONTENT_TYPE,
+    REGISTRY,
+    observe_span,
+)
 from video_translate.pipeline.delivery import deliver_final_video
 from video_translate.pipeline.m1 import run_m1_pipeline
 from video_translate.pipeline.m2 import run_m2_pipeline
 from video_translate.pipeline.m2_prep import prepare_m2_translation_input
 from video_translate.pipeline.m3 import run_m3_pipeline
 from video_translate.pipeline.m3_prep import prepare_m3_tts_input
-from video_translate.preflight import preflight_errors, run_preflight
+from video_translate.preflight import PREFLIGHT_CACHE_TTL_SECONDS, preflight_errors, run_preflight
+from video_translate.tracing import (
+    add_span_observer,
+    configured_trace_format,
+    set_trace_output_path,
+    span,
+    trace_file_path,
+    trace_run,
+)
 
 UI_VERSION = "2026-02-20-final-mp4-downloads"
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
@@ -40,6 +58,9 @@ class UIJob:
 
 JOB_STORE: dict[str, UIJob] = {}
 JOB_LOCK = threading.Lock()
+# Background model warm-up started with ``ui --warmup``; served at GET /warmup-status.
+WARMUP_STATE: dict[str, Any] = {"status": "disabled"}
+WARMUP_LOCK = threading.Lock()
 ProgressHook = Callable[[int, str], None]
 
 
@@ -66,13 +87,6 @@ class UIYoutubeRequest:
     cleanup_intermediate: bool = True
 
 
-def _read_json(path: Path) -> dict[str, Any]:
-    payload = json.loads(path.read_text(encoding="utf-8"))
-    if not isinstance(payload, dict):
-        raise ValueError(f"JSON root must be an object: {path}")
-    return payload
-
-
 def _to_ui_path(path: Path) -> str:
     resolved = path.resolve()
     try:
@@ -171,8 +185,8 @@ def execute_m3_run(request: UIM3Request) -> dict[str, Any]:
         run_manifest_json_path=run_manifest_json,
         config=config,
     )
-    qa_report = _read_json(qa_report_json)
-    output_payload = _read_json(output_json)
+    qa_report = read_json(qa_report_json)
+    output_payload = read_json(output_json)
     segments = output_payload.get("segments", [])
     preview_segments: list[dict[str, Any]] = []
     if isinstance(segments, list):
@@ -239,142 +253,153 @@ def execute_youtube_dub_run(
         piper_model_path=getattr(config.tts, "piper_model_path", None),
         check_translate_backend=True,
         check_tts_backend=request.run_m3,
+        cache_ttl_seconds=PREFLIGHT_CACHE_TTL_SECONDS,
     )
     issues = preflight_errors(preflight_report)
     if issues:
         raise RuntimeError("Preflight failed: " + " | ".join(issues))
     _notify_progress(progress_hook, 12, "On kontroller tamamlandi.")
 
-    _notify_progress(progress_hook, 18, "M1 basladi: indirme + ASR...")
-    m1_progress_state: dict[str, Any] = {
-        "percent": 18,
-        "phase": "M1 basladi: indirme + ASR...",
-    }
+    trace_format = configured_trace_format(config)
+    with trace_run("youtube_dub", trace_format=trace_format):
+        _notify_progress(progress_hook, 18, "M1 basladi: indirme + ASR...")
+        m1_progress_state: dict[str, Any] = {
+            "percent": 18,
+            "phase": "M1 basladi: indirme + ASR...",
+        }
 
-    def _m1_progress(message: str) -> None:
-        lowered = message.lower()
-        if "indiriliyor" in lowered:
-            m1_progress_state["percent"] = 22
-            m1_progress_state["phase"] = message
-            _notify_progress(progress_hook, 22, message)
-            return
-        if "normalize" in lowered:
-            m1_progress_state["percent"] = 27
-            m1_progress_state["phase"] = message
-            _notify_progress(progress_hook, 27, message)
-            return
-        if "asr basladi" in lowered:
-            m1_progress_state["percent"] = 31
-            m1_progress_state["phase"] = message
-            _notify_progress(progress_hook, 31, message)
-            return
-        if "asr segment" in lowered:
-            m1_progress_state["percent"] = 34
-            m1_progress_state["phase"] = message
-            _notify_progress(progress_hook, 34, message)
-            return
-        if "transcript" in lowered:
-            m1_progress_state["percent"] = 36
-            m1_progress_state["phase"] = message
-            _notify_progress(progress_hook, 36, message)
-            return
-        if "qa raporu" in lowered:
-            m1_progress_state["percent"] = 37
+        def _m1_progress(message: str) -> None:
+            lowered = message.lower()
+            if "indiriliyor" in lowered:
+                m1_progress_state["percent"] = 22
+                m1_progress_state["phase"] = message
+                _notify_progress(progress_hook, 22, message)
+                return
+            if "normalize" in lowered:
+                m1_progress_state["percent"] = 27
+                m1_progress_state["phase"] = message
+                _notify_progress(progress_hook, 27, message)
+                return
+            if "asr basladi" in lowered:
+                m1_progress_state["percent"] = 31
+                m1_progress_state["phase"] = message
+                _notify_progress(progress_hook, 31, message)
+                return
+            if "asr segment" in lowered:
+                m1_progress_state["percent"] = 34
+                m1_progress_state["phase"] = message
+                _notify_progress(progress_hook, 34, message)
+                return
+            if "transcript" in lowered:
+                m1_progress_state["percent"] = 36
+                m1_progress_state["phase"] = message
+                _notify_progress(progress_hook, 36, message)
+                return
+            if "qa raporu" in lowered:
+                m1_progress_state["percent"] = 37
+                m1_progress_state["phase"] = message
+                _notify_progress(progress_hook, 37, message)
+                return
+            m1_progress_state["percent"] = 33
             m1_progress_state["phase"] = message
-            _notify_progress(progress_hook, 37, message)
-            return
-        m1_progress_state["percent"] = 33
-        m1_progress_state["phase"] = message
-        _notify_progress(progress_hook, 33, message)
-
-    m1_stop_event = threading.Event()
-
-    def _m1_heartbeat() -> None:
-        start_time = time.monotonic()
-        while not m1_stop_event.wait(8.0):
-            elapsed_seconds = int(time.monotonic() - start_time)
-            percent = int(m1_progress_state["percent"])
-            phase = str(m1_progress_state["phase"])
-            _notify_progress(
-                progress_hook,
-                percent,
-                f"{phase} (suruyor: {elapsed_seconds}s)",
-            )
-
-    m1_heartbeat_thread = threading.Thread(target=_m1_heartbeat, daemon=True)
-    m1_heartbeat_thread.start()
+            _notify_progress(progress_hook, 33, message)
+
+        m1_stop_event = threading.Event()
+
+        def _m1_heartbeat() -> None:
+            start_time = time.monotonic()
+            while not m1_stop_event.wait(8.0):
+                elapsed_seconds = int(time.monotonic() - start_time)
+                percent = int(m1_progress_state["percent"])
+                phase = str(m1_progress_state["phase"])
+                _notify_progress(
+                    progress_hook,
+                    percent,
+                    f"{phase} (suruyor: {elapsed_seconds}s)",
+                )
 
-    try:
-        m1_artifacts = run_m1_pipeline(
-            source_url=source_url,
+        m1_heartbeat_thread = threading.Thread(target=_m1_heartbeat, daemon=True)
+        m1_heartbeat_thread.start()
+
+        try:
+            m1_artifacts = run_m1_pipeline(
+                source_url=source_url,
+                config=config,
+                workspace_dir=request.workspace_dir,
+                run_id=request.run_id,
+                emit_srt=request.emit_srt,
+                preflight_report=preflight_report,
+                progress_hook=_m1_progress,
+            )
+        finally:
+            m1_stop_event.set()
+            m1_heartbeat_thread.join(timeout=0.1)
+        _notify_progress(progress_hook, 38, "M1 tamamlandi.")
+        run_root = m1_artifacts.run_root
+        set_trace_output_path(trace_file_path(run_root / "logs", "youtube_dub", trace_format))
+        m2_input = run_root / "output" / "translate" / f"translation_input.en-{target_lang}.json"
+        m2_output = run_root / "output" / "translate" / f"translation_output.en-{target_lang}.json"
+        m2_qa = run_root / "output" / "qa" / "m2_qa_report.json"
+        m2_manifest = run_root / "run_m2_manifest.json"
+        _notify_progress(progress_hook, 44, "M2 hazirligi basladi...")
+        prepare_m2_translation_input(
+            transcript_json_path=m1_artifacts.transcript_json,
+            output_json_path=m2_input,
+            target_language=target_lang,
+        )
+        _notify_progress(progress_hook, 50, "M2 ceviri calisiyor...")
+        m2_artifacts = run_m2_pipeline(
+            translation_input_json_path=m2_input,
+            output_json_path=m2_output,
+            qa_report_json_path=m2_qa,
+            run_manifest_json_path=m2_manifest,
             config=config,
-            workspace_dir=request.workspace_dir,
-            run_id=request.run_id,
-            emit_srt=request.emit_srt,
-            preflight_report=preflight_report,
-            progress_hook=_m1_progress,
+            target_language_override=target_lang,
         )
-    finally:
-        m1_stop_event.set()
-        m1_heartbeat_thread.join(timeout=0.1)
-    _notify_progress(progress_hook, 38, "M1 tamamlandi.")
-    run_root = m1_artifacts.run_root
-    m2_input = run_root / "output" / "translate" / f"translation_input.en-{target_lang}.json"
-    m2_output = run_root / "output" / "translate" / f"translation_output.en-{target_lang}.json"
-    m2_qa = run_root / "output" / "qa" / "m2_qa_report.json"
-    m2_manifest = run_root / "run_m2_manifest.json"
-    _notify_progress(progress_hook, 44, "M2 hazirligi basladi...")
-    prepare_m2_translation_input(
-        transcript_json_path=m1_artifacts.transcript_json,
-        output_json_path=m2_input,
-        target_language=target_lang,
-    )
-    _notify_progress(progress_hook, 50, "M2 ceviri calisiyor...")
-    m2_artifacts = run_m2_pipeline(
-        translation_input_json_path=m2_input,
-        output_json_path=m2_output,
-        qa_report_json_path=m2_qa,
-        run_manifest_json_path=m2_manifest,
-        config=config,
-        target_language_override=target_lang,
-    )
-    _notify_progress(progress_hook, 64, "M2 tamamlandi.")
-
-    m2_payload = {
-        "qa_report_json": _to_ui_path(m2_artifacts.qa_report_json),
-        "run_manifest_json": _to_ui_path(m2_artifacts.run_manifest_json),
-    }
-    m3_input = run_root / "output" / "tts" / f"tts_input.{target_lang}.json"
-    _notify_progress(progress_hook, 70, "M3 hazirligi basladi...")
-    prepare_m3_tts_input(
-        translation_output_json_path=m2_artifacts.translation_output_json,
-        output_json_path=m3_input,
-        target_language=target_lang,
-    )
-    m3_output = run_root / "output" / "tts" / f"tts_output.{target_lang}.json"
-    m3_qa = run_root / "output" / "qa" / "m3_qa_report.json"
-    m3_manifest = run_root / "run_m3_manifest.json"
-    _notify_progress(progress_hook, 76, "M3 TTS dublaj uretiliyor...")
-    m3_artifacts = run_m3_pipeline(
-        tts_input_json_path=m3_input,
-        output_json_path=m3_output,
-        qa_report_json_path=m3_qa,
-        run_manifest_json_path=m3_manifest,
-        config=config,
-    )
-    _notify_progress(progress_hook, 90, "Final MP4 teslimi hazirlaniyor...")
+        _notify_progress(progress_hook, 64, "M2 tamamlandi.")
 
-    selected_downloads_dir = request.downloads_dir or Path("downloads")
-    delivery = deliver_final_video(
-        run_root=run_root,
-        source_video=m1_artifacts.source_media,
-        dubbed_audio=m3_artifacts.stitched_preview_wav,
-        ffmpeg_bin=config.tools.ffmpeg,
-        target_lang=target_lang,
-        downloads_root=selected_downloads_dir,
-        cleanup_intermediate=request.cleanup_intermediate,
-    )
-    _notify_progress(progress_hook, 100, "Final Turkce dublajli video hazir.")
+        m2_payload = {
+            "qa_report_json": _to_ui_path(m2_artifacts.qa_report_json),
+            "run_manifest_json": _to_ui_path(m2_artifacts.run_manifest_json),
+        }
+        m3_input = run_root / "output" / "tts" / f"tts_input.{target_lang}.json"
+        _notify_progress(progress_hook, 70, "M3 hazirligi basladi...")
+        prepare_m3_tts_input(
+            translation_output_json_path=m2_artifacts.translation_output_json,
+            output_json_path=m3_input,
+            target_language=target_lang,
+        )
+        m3_output = run_root / "output" / "tts" / f"tts_output.{target_lang}.json"
+        m3_qa = run_root / "output" / "qa" / "m3_qa_report.json"
+        m3_manifest = run_root / "run_m3_manifest.json"
+        _notify_progress(progress_hook, 76, "M3 TTS dublaj uretiliyor...")
+        m3_artifacts = run_m3_pipeline(
+            tts_input_json_path=m3_input,
+            output_json_path=m3_output,
+            qa_report_json_path=m3_qa,
+            run_manifest_json_path=m3_manifest,
+            config=config,
+        )
+        _notify_progress(progress_hook, 90, "Final MP4 teslimi hazirlaniyor...")
+
+        selected_downloads_dir = request.downloads_dir or Path("downloads")
+        with span("delivery"):
+            delivery = deliver_final_video(
+                run_root=run_root,
+                source_video=m1_artifacts.source_media,
+                dubbed_audio=m3_artifacts.stitched_preview_wav,
+                ffmpeg_bin=config.tools.ffmpeg,
+                target_lang=target_lang,
+                downloads_root=selected_downloads_dir,
+                cleanup_intermediate=request.cleanup_intermediate,
+            )
+        if delivery.cleanup_performed:
+            # The run directory is gone; keep the trace next to the delivered video.
+            set_trace_output_path(
+                trace_file_path(delivery.downloads_dir, "youtube_dub", trace_format),
+                replace=True,
+            )
+        _notify_progress(progress_hook, 100, "Final Turkce dublajli video hazir.")
 
     m3_payload: dict[str, Any] = {
         "qa_report_json": _to_ui_path(m3_artifacts.qa_report_json),
@@ -441,6 +466,7 @@ def _create_job() -> UIJob:
     with JOB_LOCK:
         JOB_STORE[job.job_id] = job
         _trim_job_history_unlocked()
+    JOBS_QUEUED.inc()
     return job
 
 
@@ -480,7 +506,16 @@ def _update_job(
         return updated
 
 
+def _record_job_finished(status: str, started: float) -> None:
+    JOBS_RUNNING.dec()
+    JOBS_FINISHED.inc(status=status)
+    JOB_DURATION.observe(time.monotonic() - started)
+
+
 def _run_youtube_job(job_id: str, request: UIYoutubeRequest) -> None:
+    JOBS_QUEUED.dec()
+    JOBS_RUNNING.inc()
+    started = time.monotonic()
     _update_job(job_id=job_id, status="running", progress_percent=2, phase="Islem baslatiliyor...")
 
     def _progress(percent: int, phase: str) -> None:
@@ -501,6 +536,7 @@ def _run_youtube_job(job_id: str, request: UIYoutubeRequest) -> None:
             phase="Hata",
             error=str(exc),
         )
+        _record_job_finished("failed", started)
         return
     _update_job(
         job_id=job_id,
@@ -510,6 +546,7 @@ def _run_youtube_job(job_id: str, request: UIYoutubeRequest) -> None:
         result=result,
         error=None,
     )
+    _record_job_finished("completed", started)
 
 
 def start_youtube_job(request: UIYoutubeRequest) -> dict[str, Any]:
@@ -1075,6 +1112,14 @@ def _build_handler() -> type[BaseHTTPRequestHandler]:
                     return
                 self._send_json(200, _job_to_payload(job))
                 return
+            if request_url.path == "/metrics":
+                self._send_metrics()
+                return
+            if request_url.path == "/warmup-status":
+                with WARMUP_LOCK:
+                    payload = dict(WARMUP_STATE)
+                self._send_json(200, payload)
+                return
             if request_url.path != "/":
                 self._send_json(404, {"ok": False, "error": "Not found"})
                 return
@@ -1138,6 +1183,15 @@ def _build_handler() -> type[BaseHTTPRequestHandler]:
             self.end_headers()
             self.wfile.write(encoded)
 
+        def _send_metrics(self) -> None:
+            encoded = REGISTRY.render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", PROMETHEUS_CONTENT_TYPE)
+            self.send_header("Cache-Control", "no-store")
+            self.send_header("Content-Length", str(len(encoded)))
+            self.end_headers()
+            self.wfile.write(encoded)
+
         def _send_file(self, path: Path) -> None:
             safe_filename = path.name.replace('"', "")
             encoded_filename = quote(path.name)
@@ -1187,7 +1241,49 @@ def _as_opt_text(form: dict[str, list[str]], key: str) -> str | None:
     return value if value else None
 
 
-def run_ui_server(host: str, port: int) -> None:
+def _run_background_warmup(config_paths: list[Path | None]) -> None:
+    from video_translate.pipeline.warmup import run_warmup
+
+    with WARMUP_LOCK:
+        WARMUP_STATE.clear()
+        WARMUP_STATE.update({"status": "running", "started_at": _utc_now_iso()})
+    try:
+        config = load_config(config_paths[0])
+        artifacts = run_warmup(
+            config_paths=config_paths,
+            output_json_path=config.pipeline.workspace_dir / ".cache" / "warmup_report.json",
+        )
+    except Exception as exc:  # noqa: BLE001
+        with WARMUP_LOCK:
+            WARMUP_STATE.update({"status": "failed", "error": str(exc)})
+        return
+    with WARMUP_LOCK:
+        WARMUP_STATE.update(
+            {
+                "status": "completed" if artifacts.ok else "completed_with_errors",
+                "finished_at": _utc_now_iso(),
+                "report_path": str(artifacts.report_path),
+                "models": [result.to_dict() for result in artifacts.results],
+            }
+        )
+
+
+def run_ui_server(
+    host: str,
+    port: int,
+    *,
+    warmup_config_paths: list[Path | None] | None = None,
+) -> None:
+    # Pipeline stages report through tracing spans; this also covers trace_format = "off".
+    add_span_observer(observe_span)
+    if warmup_config_paths is not None:
+        # Models load while the server already answers; jobs started meanwhile still work.
+        threading.Thread(
+            target=_run_background_warmup,
+            args=(warmup_config_paths,),
+            name="model-warmup",
+            daemon=True,
+        ).start()
     server = ThreadingHTTPServer((host, port), _build_handler())
     try:
         server.serve_forever(poll_interval=0.2)
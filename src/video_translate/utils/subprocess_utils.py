@@ -1,8 +1,22 @@
 from __future__ import annotations
 
+import atexit
 import os
+import queue
 import subprocess
+import tempfile
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+# Idle workers beyond this count are closed, oldest first.
+_MAX_LINE_WORKERS = 4
+_STDERR_TAIL_BYTES = 4096
 
 
 class CommandExecutionError(RuntimeError):
@@ -14,49 +28,378 @@ class CommandExecutionError(RuntimeError):
         self.stderr = stderr
 
 
+@dataclass
+class CommandStats:
+    """Per-tool counters; ``spawn_seconds`` covers fork/exec only, not the tool's work."""
+
+    calls: int = 0
+    spawns: int = 0
+    spawn_seconds: float = 0.0
+    wall_seconds: float = 0.0
+    worker_requests: int = 0
+
+
+_COMMAND_STATS: dict[str, CommandStats] = {}
+_STATS_LOCK = threading.Lock()
+
+
+def command_label(command: list[str]) -> str:
+    name = Path(command[0]).name.lower() if command else "unknown"
+    return name[:-4] if name.endswith(".exe") else name
+
+
+def _record_command(
+    label: str,
+    *,
+    wall_seconds: float,
+    spawn_seconds: float | None = None,
+    worker_request: bool = False,
+) -> None:
+    with _STATS_LOCK:
+        stats = _COMMAND_STATS.setdefault(label, CommandStats())
+        stats.calls += 1
+        stats.wall_seconds += wall_seconds
+        if spawn_seconds is not None:
+            stats.spawns += 1
+            stats.spawn_seconds += spawn_seconds
+        if worker_request:
+            stats.worker_requests += 1
+
+
+def _record_spawn(label: str, spawn_seconds: float) -> None:
+    with _STATS_LOCK:
+        stats = _COMMAND_STATS.setdefault(label, CommandStats())
+        stats.spawns += 1
+        stats.spawn_seconds += spawn_seconds
+
+
+def command_stats_snapshot() -> dict[str, CommandStats]:
+    with _STATS_LOCK:
+        return {label: CommandStats(**vars(stats)) for label, stats in _COMMAND_STATS.items()}
+
+
+def command_stats_since(before: dict[str, CommandStats]) -> dict[str, dict[str, Any]]:
+    """Summarize per-command activity since ``before`` for run manifests."""
+    summary: dict[str, dict[str, Any]] = {}
+    for label, current in sorted(command_stats_snapshot().items()):
+        previous = before.get(label, CommandStats())
+        calls = current.calls - previous.calls
+        spawns = current.spawns - previous.spawns
+        if calls <= 0 and spawns <= 0:
+            continue
+        spawn_seconds = current.spawn_seconds - previous.spawn_seconds
+        summary[label] = {
+            "calls": calls,
+            "spawns": spawns,
+            "worker_requests": current.worker_requests - previous.worker_requests,
+            "spawn_seconds": spawn_seconds,
+            "avg_spawn_ms": (spawn_seconds / spawns * 1000.0) if spawns else 0.0,
+            "wall_seconds": current.wall_seconds - previous.wall_seconds,
+        }
+    return summary
+
+
+@lru_cache(maxsize=32)
+def _merged_env_cached(overrides: tuple[tuple[str, str], ...]) -> dict[str, str]:
+    run_env = os.environ.copy()
+    run_env.update(overrides)
+    return run_env
+
+
+def merged_env(env_overrides: dict[str, str] | None) -> dict[str, str] | None:
+    """Return ``os.environ`` merged with overrides, built once per distinct override set.
+
+    The returned mapping is shared between calls and must not be mutated. Call
+    ``clear_env_cache`` after changing ``os.environ`` in-process.
+    """
+    if not env_overrides:
+        return None
+    return _merged_env_cached(tuple(sorted(env_overrides.items())))
+
+
+def clear_env_cache() -> None:
+    _merged_env_cached.cache_clear()
+
+
+def _decode_stream(data: str | bytes | None) -> str:
+    if data is None:
+        return ""
+    if isinstance(data, str):
+        return data
+    try:
+        return data.decode("utf-8", errors="replace")
+    except Exception:  # noqa: BLE001
+        return str(data)
+
+
 def run_command(
     command: list[str],
     cwd: Path | None = None,
     input_text: str | None = None,
     timeout_seconds: float | None = None,
     env_overrides: dict[str, str] | None = None,
-) -> subprocess.CompletedProcess[str]:
-    run_env: dict[str, str] | None = None
-    if env_overrides:
-        run_env = os.environ.copy()
-        run_env.update(env_overrides)
+    *,
+    binary: bool = False,
+    on_start: Callable[[subprocess.Popen[Any]], None] | None = None,
+) -> subprocess.CompletedProcess[Any]:
+    """Run ``command`` to completion and raise ``CommandExecutionError`` on failure.
 
-    try:
-        result = subprocess.run(
-            command,
-            cwd=str(cwd) if cwd else None,
-            check=False,
-            capture_output=True,
+    With ``binary=True`` stdout/stderr are returned as raw bytes and only decoded when
+    the command fails, which avoids decoding large ffmpeg logs on the happy path.
+    ``on_start`` receives the child process right after it is spawned, so a caller on
+    another thread can terminate it.
+    """
+    run_env = merged_env(env_overrides)
+    stream_kwargs: dict[str, Any] = (
+        {} if binary else {"text": True, "encoding": "utf-8", "errors": "replace"}
+    )
+    payload: str | bytes | None = input_text
+    if binary and input_text is not None:
+        payload = input_text.encode("utf-8")
+
+    label = command_label(command)
+    started = perf_counter()
+    with subprocess.Popen(
+        command,
+        cwd=str(cwd) if cwd else None,
+        stdin=subprocess.PIPE if payload is not None else None,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        env=run_env,
+        **stream_kwargs,
+    ) as process:
+        spawn_seconds = perf_counter() - started
+        try:
+            if on_start is not None:
+                on_start(process)
+            stdout, stderr = process.communicate(input=payload, timeout=timeout_seconds)
+        except subprocess.TimeoutExpired as exc:
+            process.kill()
+            _, killed_stderr = process.communicate()
+            _record_command(
+                label, wall_seconds=perf_counter() - started, spawn_seconds=spawn_seconds
+            )
+            timeout_label = (
+                f"{int(timeout_seconds)}s"
+                if timeout_seconds is not None
+                else "timeout"
+            )
+            stderr_text = _decode_stream(
+                exc.stderr if exc.stderr is not None else killed_stderr
+            ).strip()
+            message = f"Command timed out after {timeout_label}."
+            if stderr_text:
+                message = f"{message}\n{stderr_text}"
+            raise CommandExecutionError(command, -9, message) from exc
+        except BaseException:
+            process.kill()
+            raise
+    _record_command(label, wall_seconds=perf_counter() - started, spawn_seconds=spawn_seconds)
+    if process.returncode != 0:
+        raise CommandExecutionError(command, process.returncode, _decode_stream(stderr))
+    return subprocess.CompletedProcess(command, process.returncode, stdout, stderr)
+
+
+class LineProtocolWorker:
+    """Long-lived tool process that answers each stdin request line with one stdout line.
+
+    Spawning once and streaming requests avoids paying process start-up and model
+    loading per call. A worker that times out, exits or breaks the protocol is marked
+    ``disabled`` so callers can fall back to ``run_command``.
+    """
+
+    def __init__(
+        self,
+        command: list[str],
+        *,
+        cwd: Path | None = None,
+        env_overrides: dict[str, str] | None = None,
+    ) -> None:
+        self.command = list(command)
+        self.cwd = cwd
+        self.env_overrides = dict(env_overrides or {})
+        self.label = command_label(self.command)
+        self.disabled = False
+        self._process: subprocess.Popen[str] | None = None
+        self._lines: queue.Queue[str | None] = queue.Queue()
+        self._stderr_file: Any = None
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._process is not None and self._process.poll() is None
+
+    def _start(self) -> subprocess.Popen[str]:
+        self._stderr_file = tempfile.TemporaryFile()
+        self._lines = queue.Queue()
+        started = perf_counter()
+        process = subprocess.Popen(
+            self.command,
+            cwd=str(self.cwd) if self.cwd else None,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=self._stderr_file,
+            env=merged_env(self.env_overrides),
             text=True,
             encoding="utf-8",
             errors="replace",
-            input=input_text,
-            timeout=timeout_seconds,
-            env=run_env,
+            bufsize=1,
         )
-    except subprocess.TimeoutExpired as exc:
-        timeout_label = (
-            f"{int(timeout_seconds)}s"
-            if timeout_seconds is not None
-            else "timeout"
+        _record_spawn(self.label, perf_counter() - started)
+        # A reader thread keeps request timeouts portable; select() does not work on
+        # Windows pipes.
+        reader = threading.Thread(
+            target=self._pump_stdout,
+            args=(process, self._lines),
+            name=f"{self.label}-worker-stdout",
+            daemon=True,
         )
-        stderr_text = ""
-        if isinstance(exc.stderr, str):
-            stderr_text = exc.stderr.strip()
-        elif exc.stderr is not None:
-            try:
-                stderr_text = exc.stderr.decode("utf-8", errors="replace").strip()
-            except Exception:  # noqa: BLE001
-                stderr_text = str(exc.stderr)
-        message = f"Command timed out after {timeout_label}."
+        reader.start()
+        self._process = process
+        return process
+
+    @staticmethod
+    def _pump_stdout(process: subprocess.Popen[str], lines: queue.Queue[str | None]) -> None:
+        assert process.stdout is not None
+        for line in process.stdout:
+            lines.put(line)
+        lines.put(None)
+
+    def _stderr_tail(self) -> str:
+        if self._stderr_file is None:
+            return ""
+        try:
+            self._stderr_file.seek(0, os.SEEK_END)
+            size = self._stderr_file.tell()
+            self._stderr_file.seek(max(0, size - _STDERR_TAIL_BYTES))
+            return _decode_stream(self._stderr_file.read())
+        except (OSError, ValueError):
+            return ""
+
+    def _fail(self, message: str) -> CommandExecutionError:
+        stderr_text = self._stderr_tail().strip()
+        returncode = self._process.poll() if self._process is not None else None
+        self.disabled = True
+        self._shutdown()
         if stderr_text:
             message = f"{message}\n{stderr_text}"
-        raise CommandExecutionError(command, -9, message) from exc
-    if result.returncode != 0:
-        raise CommandExecutionError(command, result.returncode, result.stderr)
-    return result
+        return CommandExecutionError(
+            self.command, returncode if returncode is not None else -9, message
+        )
+
+    def request(
+        self,
+        line: str,
+        timeout_seconds: float | None = None,
+        *,
+        matches: Callable[[str], bool] | None = None,
+    ) -> str:
+        """Send one request line and return its answer.
+
+        Without ``matches`` the next stdout line is the answer. With it, lines the
+        predicate rejects (tool log output, a late answer to an earlier request) are
+        skipped, so one extra line cannot shift every later answer onto the wrong
+        request. ``timeout_seconds`` bounds the whole wait.
+        """
+        if "\n" in line:
+            raise ValueError("Worker request must be a single line.")
+        with self._lock:
+            if self.disabled:
+                raise CommandExecutionError(self.command, -1, "Worker is disabled.")
+            started = perf_counter()
+            process = self._process
+            if process is None or process.poll() is not None:
+                process = self._start()
+            stdin = process.stdin
+            assert stdin is not None
+            try:
+                stdin.write(line + "\n")
+                stdin.flush()
+            except (BrokenPipeError, OSError) as exc:
+                raise self._fail(f"Worker stdin closed: {exc}") from exc
+            deadline = None if timeout_seconds is None else started + timeout_seconds
+            while True:
+                remaining = None if deadline is None else max(0.0, deadline - perf_counter())
+                try:
+                    response = self._lines.get(timeout=remaining)
+                except queue.Empty:
+                    raise self._fail(
+                        f"Worker did not answer within {timeout_seconds:g}s."
+                    ) from None
+                if response is None:
+                    raise self._fail("Worker exited before answering.")
+                response = response.rstrip("\r\n")
+                if matches is None or matches(response):
+                    break
+            _record_command(
+                self.label, wall_seconds=perf_counter() - started, worker_request=True
+            )
+            return response
+
+    def _shutdown(self) -> None:
+        process = self._process
+        self._process = None
+        if process is not None:
+            try:
+                if process.stdin is not None:
+                    process.stdin.close()
+                process.wait(timeout=5.0)
+            except (OSError, subprocess.TimeoutExpired):
+                process.kill()
+                process.wait()
+        if self._stderr_file is not None:
+            self._stderr_file.close()
+            self._stderr_file = None
+
+    def disable(self) -> None:
+        with self._lock:
+            self.disabled = True
+            self._shutdown()
+
+    def close(self) -> None:
+        with self._lock:
+            self._shutdown()
+
+
+_WorkerKey = tuple[tuple[str, ...], str | None, tuple[tuple[str, str], ...]]
+_LINE_WORKERS: OrderedDict[_WorkerKey, LineProtocolWorker] = OrderedDict()
+_WORKERS_LOCK = threading.Lock()
+
+
+def get_line_worker(
+    command: list[str],
+    *,
+    cwd: Path | None = None,
+    env_overrides: dict[str, str] | None = None,
+) -> LineProtocolWorker:
+    """Return the shared worker for this exact command line, creating it on first use."""
+    key: _WorkerKey = (
+        tuple(command),
+        str(cwd) if cwd else None,
+        tuple(sorted((env_overrides or {}).items())),
+    )
+    evicted: list[LineProtocolWorker] = []
+    with _WORKERS_LOCK:
+        worker = _LINE_WORKERS.get(key)
+        if worker is None:
+            worker = LineProtocolWorker(command, cwd=cwd, env_overrides=env_overrides)
+            _LINE_WORKERS[key] = worker
+            while len(_LINE_WORKERS) > _MAX_LINE_WORKERS:
+                _, oldest = _LINE_WORKERS.popitem(last=False)
+                evicted.append(oldest)
+        else:
+            _LINE_WORKERS.move_to_end(key)
+    for oldest in evicted:
+        oldest.close()
+    return worker
+
+
+def close_line_workers() -> None:
+    with _WORKERS_LOCK:
+        workers = list(_LINE_WORKERS.values())
+        _LINE_WORKERS.clear()
+    for worker in workers:
+        worker.close()
+
+
+atexit.register(close_line_workers)
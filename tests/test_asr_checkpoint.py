@@ -0,0 +1,213 @@
+from dataclasses import replace
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from video_translate.asr.checkpoint import ASRCheckpoint
+from video_translate.asr.whisper import transcribe_audio
+from video_translate.config import ASRConfig
+from video_translate.models import TranscriptSegment
+from video_translate.qa.m1_report import M1QAStats
+from video_translate.tracing import current_tracer, trace_run
+
+
+def _segment(segment_id: int, start: float, end: float, text: str) -> Any:
+    words = [SimpleNamespace(word=f" {text}", start=start, end=end, probability=0.9)]
+    return SimpleNamespace(id=segment_id, start=start, end=end, text=f" {text}", words=words)
+
+
+_FULL = [
+    _segment(1, 0.0, 2.0, "one"),
+    _segment(2, 2.0, 4.0, "two"),
+    _segment(3, 4.0, 6.0, "three"),
+    _segment(4, 6.0, 8.0, "four"),
+]
+
+
+class _ResumableModel:
+    """Decodes ``_FULL`` from the clip offset and can fail after ``fail_after`` segments."""
+
+    def __init__(self, calls: list[dict[str, Any]], device: str, fail_after: int | None) -> None:
+        self.calls = calls
+        self.device = device
+        self.fail_after = fail_after
+
+    def transcribe(self, audio: str, **kwargs: Any) -> tuple[Any, Any]:
+        del audio
+        self.calls.append({"device": self.device, **kwargs})
+        offset = (kwargs.get("clip_timestamps") or [0.0])[0]
+        info = SimpleNamespace(language="en", language_probability=0.98, duration=8.0)
+
+        def _segments() -> Any:
+            # Re-numbered from 1 like faster-whisper does for every call.
+            for index, item in enumerate(
+                (segment for segment in _FULL if segment.start >= offset), start=1
+            ):
+                if self.fail_after is not None and index > self.fail_after:
+                    raise RuntimeError("CUDA out of memory")
+                yield SimpleNamespace(**{**vars(item), "id": index})
+
+        return _segments(), info
+
+
+def _asr_config(*, fallback_on_oom: bool = True) -> ASRConfig:
+    return ASRConfig(
+        model="small",
+        device="cuda",
+        compute_type="int8_float16",
+        beam_size=5,
+        language="en",
+        word_timestamps=True,
+        vad_filter=True,
+        fallback_on_oom=fallback_on_oom,
+        fallback_model="small",
+        fallback_device="cpu",
+        fallback_compute_type="int8",
+    )
+
+
+def _audio(tmp_path: Path) -> Path:
+    audio = tmp_path / "source_16k_mono.wav"
+    audio.write_bytes(b"RIFF" + b"\0" * 64)
+    return audio
+
+
+def test_fallback_resumes_after_last_committed_segment(tmp_path: Path) -> None:
+    calls: list[dict[str, Any]] = []
+
+    def factory(*, model_size_or_path: str, device: str, compute_type: str) -> _ResumableModel:
+        del model_size_or_path, compute_type
+        return _ResumableModel(calls, device, fail_after=2 if device == "cuda" else None)
+
+    qa_stats = M1QAStats()
+    checkpoint_path = tmp_path / "work" / "asr_checkpoint.jsonl"
+    doc = transcribe_audio(
+        _audio(tmp_path),
+        _asr_config(),
+        model_factory=factory,
+        qa_stats=qa_stats,
+        checkpoint_path=checkpoint_path,
+    )
+
+    assert [call["device"] for call in calls] == ["cuda", "cpu"]
+    assert calls[1]["clip_timestamps"] == [4.0]
+    assert [item.text for item in doc.segments] == ["one", "two", "three", "four"]
+    assert [item.id for item in doc.segments] == [1, 2, 3, 4]
+    assert qa_stats.segment_count == 4
+    assert checkpoint_path.read_text(encoding="utf-8").rstrip().endswith('"segment_count":4}')
+
+
+def test_restart_resumes_from_checkpoint_and_ignores_torn_line(tmp_path: Path) -> None:
+    calls: list[dict[str, Any]] = []
+    fail_after: list[int | None] = [3]
+
+    def factory(*, model_size_or_path: str, device: str, compute_type: str) -> _ResumableModel:
+        del model_size_or_path, compute_type
+        return _ResumableModel(calls, device, fail_after=fail_after[0])
+
+    audio = _audio(tmp_path)
+    checkpoint_path = tmp_path / "work" / "asr_checkpoint.jsonl"
+    with pytest.raises(RuntimeError, match="out of memory"):
+        transcribe_audio(
+            audio,
+            _asr_config(fallback_on_oom=False),
+            model_factory=factory,
+            checkpoint_path=checkpoint_path,
+        )
+    # Simulate a process killed in the middle of writing the next segment.
+    with checkpoint_path.open("ab") as handle:
+        handle.write(b'{"kind":"segment","id":4,"start":6.0,"en')
+
+    fail_after[0] = None
+    doc = transcribe_audio(
+        audio,
+        _asr_config(fallback_on_oom=False),
+        model_factory=factory,
+        checkpoint_path=checkpoint_path,
+    )
+
+    assert calls[-1]["clip_timestamps"] == [6.0]
+    assert [item.text for item in doc.segments] == ["one", "two", "three", "four"]
+    assert doc.language == "en"
+    assert doc.duration == 8.0
+
+    # A finished checkpoint is reused without loading a model at all.
+    calls.clear()
+    again = transcribe_audio(
+        audio,
+        _asr_config(),
+        model_factory=factory,
+        checkpoint_path=checkpoint_path,
+    )
+    assert calls == []
+    assert again.segments == doc.segments
+
+
+def test_resumed_decode_reports_only_the_decoded_audio(tmp_path: Path) -> None:
+    calls: list[dict[str, Any]] = []
+    fail_after: list[int | None] = [2]
+
+    def factory(*, model_size_or_path: str, device: str, compute_type: str) -> _ResumableModel:
+        del model_size_or_path, compute_type
+        return _ResumableModel(calls, device, fail_after=fail_after[0])
+
+    audio = _audio(tmp_path)
+    checkpoint_path = tmp_path / "work" / "asr_checkpoint.jsonl"
+    with pytest.raises(RuntimeError, match="out of memory"):
+        transcribe_audio(
+            audio,
+            _asr_config(fallback_on_oom=False),
+            model_factory=factory,
+            checkpoint_path=checkpoint_path,
+        )
+
+    fail_after[0] = None
+    with trace_run("m1", trace_format="jsonl", output_path=tmp_path / "trace.jsonl"):
+        transcribe_audio(
+            audio,
+            _asr_config(fallback_on_oom=False),
+            model_factory=factory,
+            checkpoint_path=checkpoint_path,
+        )
+        tracer = current_tracer()
+        assert tracer is not None
+        decode_spans = [item for item in tracer.spans if item.name == "asr.decode"]
+
+    # The file is 8 s long; the resumed attempt only decoded from 4 s on.
+    assert calls[-1]["clip_timestamps"] == [4.0]
+    assert [item.attributes["audio_seconds"] for item in decode_spans] == [4.0]
+
+
+def test_checkpoint_for_different_audio_is_discarded(tmp_path: Path) -> None:
+    audio = _audio(tmp_path)
+    checkpoint_path = tmp_path / "asr_checkpoint.jsonl"
+    checkpoint = ASRCheckpoint(checkpoint_path, audio_path=audio, asr_config=_asr_config())
+    checkpoint.open(SimpleNamespace(language="en", language_probability=0.9, duration=8.0))
+    checkpoint.append(TranscriptSegment(id=1, start=0.0, end=1.0, text="stale", words=[]))
+    checkpoint.close()
+
+    audio.write_bytes(b"RIFF" + b"\0" * 128)
+    reloaded = ASRCheckpoint(checkpoint_path, audio_path=audio, asr_config=_asr_config())
+
+    assert reloaded.segments == []
+    assert reloaded.resume_offset == 0.0
+
+
+def test_checkpoint_for_different_asr_settings_is_discarded(tmp_path: Path) -> None:
+    audio = _audio(tmp_path)
+    checkpoint_path = tmp_path / "asr_checkpoint.jsonl"
+    checkpoint = ASRCheckpoint(checkpoint_path, audio_path=audio, asr_config=_asr_config())
+    checkpoint.open(SimpleNamespace(language="en", language_probability=0.9, duration=8.0))
+    checkpoint.append(TranscriptSegment(id=1, start=0.0, end=1.0, text="small", words=[]))
+    checkpoint.close()
+
+    threads_only = replace(_asr_config(), cpu_threads=4)
+    other_model = replace(_asr_config(), model="medium")
+
+    kept = ASRCheckpoint(checkpoint_path, audio_path=audio, asr_config=threads_only)
+    assert [item.text for item in kept.segments] == ["small"]
+    discarded = ASRCheckpoint(checkpoint_path, audio_path=audio, asr_config=other_model)
+    assert discarded.segments == []
+
@@ -1,8 +1,10 @@
+from dataclasses import replace
 from pathlib import Path
 from typing import Any
 
 from video_translate.asr.whisper import _is_probable_oom_error, transcribe_audio
 from video_translate.config import ASRConfig
+from video_translate.qa.m1_report import M1QAStats
 
 
 class _DummyWord:
@@ -129,3 +131,59 @@ def test_transcribe_audio_falls_back_when_generator_raises_on_iteration(
     assert calls[1][1] == "cpu"
     assert result.language == "en"
     assert len(result.segments) == 1
+
+
+def test_transcribe_audio_feeds_qa_stats_only_from_successful_attempt(
+    monkeypatch: Any, tmp_path: Path
+) -> None:
+    calls: list[str] = []
+
+    def _partial_then_fail() -> Any:
+        yield _DummySegment()
+        raise RuntimeError("CUDA out of memory")
+
+    def fake_transcribe_with_settings(**kwargs: Any) -> tuple[Any, _DummyInfo]:
+        calls.append(kwargs["device"])
+        if len(calls) == 1:
+            return (_partial_then_fail(), _DummyInfo())
+        return ([_DummySegment(), _DummySegment()], _DummyInfo())
+
+    monkeypatch.setattr(
+        "video_translate.asr.whisper._transcribe_with_settings",
+        fake_transcribe_with_settings,
+    )
+
+    stats = M1QAStats()
+    result = transcribe_audio(tmp_path / "audio.wav", _asr_config(), qa_stats=stats)
+
+    assert calls == ["cuda", "cpu"]
+    assert len(result.segments) == 2
+    assert stats.segment_count == 2
+    assert stats.word_count == 2
+    assert stats.speech_duration == 2.0
+
+
+def test_batched_oom_keeps_batches_on_other_device_and_drops_them_on_same_device(
+    monkeypatch: Any, tmp_path: Path
+) -> None:
+    calls: list[tuple[str, int | None]] = []
+
+    def fake_transcribe_with_settings(**kwargs: Any) -> tuple[list[_DummySegment], _DummyInfo]:
+        calls.append((kwargs["device"], kwargs["batch_size"]))
+        if len(calls) % 2 == 1:
+            raise RuntimeError("CUDA out of memory")
+        return ([_DummySegment()], _DummyInfo())
+
+    monkeypatch.setattr(
+        "video_translate.asr.whisper._transcribe_with_settings",
+        fake_transcribe_with_settings,
+    )
+    batched = replace(_asr_config(), batched=True, batch_size=16)
+
+    transcribe_audio(tmp_path / "audio.wav", batched)
+    # Same device and settings: only the sequential retry is left.
+    same_device = replace(batched, device="cpu", compute_type="int8")
+    result = transcribe_audio(tmp_path / "audio.wav", same_device)
+
+    assert calls == [("cuda", 16), ("cpu", 16), ("cpu", 16), ("cpu", None)]
+    assert len(result.segments) == 1
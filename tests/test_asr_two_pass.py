@@ -0,0 +1,178 @@
+from dataclasses import replace
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from video_translate.asr.two_pass import (
+    TwoPassStats,
+    find_redecode_windows,
+    splice_redecoded_segments,
+)
+from video_translate.asr.whisper import transcribe_audio
+from video_translate.config import ASRConfig
+from video_translate.models import TranscriptSegment, WordTimestamp
+from video_translate.qa.m1_report import M1QAStats
+
+
+def _segment(segment_id: int, start: float, end: float, text: str, probability: float) -> Any:
+    words = [SimpleNamespace(word=f" {text}", start=start, end=end, probability=probability)]
+    return SimpleNamespace(id=segment_id, start=start, end=end, text=f" {text}", words=words)
+
+
+def _transcript_segment(
+    start: float, end: float, text: str, probability: float
+) -> TranscriptSegment:
+    return TranscriptSegment(
+        id=0,
+        start=start,
+        end=end,
+        text=text,
+        words=[WordTimestamp(word=text, start=start, end=end, probability=probability)],
+    )
+
+
+# Draft output over 10 s of audio: the second and third segments are unsure.
+_DRAFT = [
+    _segment(1, 0.0, 2.0, "hello", 0.95),
+    _segment(2, 2.5, 4.0, "wurld", 0.30),
+    _segment(3, 4.5, 5.5, "tree", 0.40),
+    _segment(4, 7.0, 10.0, "goodbye", 0.90),
+]
+_ACCURATE = [
+    _segment(1, 0.0, 2.0, "hello", 0.97),
+    _segment(2, 2.5, 4.0, "world", 0.92),
+    _segment(3, 4.5, 5.5, "three", 0.88),
+    _segment(4, 7.0, 10.0, "goodbye", 0.95),
+]
+
+
+class _ClipAwareModel:
+    def __init__(self, calls: list[dict[str, Any]], model_name: str) -> None:
+        self.calls = calls
+        self.model_name = model_name
+
+    def transcribe(self, audio: str, **kwargs: Any) -> tuple[Any, Any]:
+        del audio
+        self.calls.append({"model": self.model_name, **kwargs})
+        info = SimpleNamespace(language="en", language_probability=0.99, duration=10.0)
+        if self.model_name == "base":
+            return iter(_DRAFT), info
+        clips = kwargs["clip_timestamps"]
+        ranges = list(zip(clips[0::2], clips[1::2], strict=True))
+        chosen = [
+            item
+            for item in _ACCURATE
+            if any(start <= item.start and item.end <= end for start, end in ranges)
+        ]
+        return iter(chosen), info
+
+
+def _two_pass_config() -> ASRConfig:
+    return ASRConfig(
+        model="medium",
+        device="cpu",
+        compute_type="int8",
+        beam_size=5,
+        language="en",
+        word_timestamps=True,
+        vad_filter=True,
+        fallback_on_oom=True,
+        fallback_model="small",
+        fallback_device="cpu",
+        fallback_compute_type="int8",
+        two_pass_enabled=True,
+        draft_model="base",
+        redecode_probability_threshold=0.6,
+        redecode_merge_gap_seconds=1.0,
+    )
+
+
+def test_find_redecode_windows_merges_close_low_confidence_segments() -> None:
+    segments = [
+        _transcript_segment(0.0, 2.0, "a", 0.9),
+        _transcript_segment(2.5, 4.0, "b", 0.3),
+        _transcript_segment(4.5, 5.5, "c", 0.4),
+        _transcript_segment(8.0, 9.0, "d", 0.2),
+        TranscriptSegment(id=0, start=9.5, end=9.8, text="", words=[]),
+    ]
+
+    windows = find_redecode_windows(segments, probability_threshold=0.6, merge_gap_seconds=1.0)
+
+    assert windows == [(2.5, 5.5), (8.0, 9.0)]
+
+
+def test_splice_keeps_draft_when_window_has_no_redecoded_segments() -> None:
+    draft = [
+        _transcript_segment(0.0, 1.0, "a", 0.9),
+        _transcript_segment(1.0, 2.0, "b", 0.2),
+        _transcript_segment(3.0, 4.0, "c", 0.2),
+    ]
+    redecoded = [
+        _transcript_segment(1.0, 1.5, "b1", 0.9),
+        _transcript_segment(1.5, 2.0, "b2", 0.9),
+    ]
+
+    spliced = splice_redecoded_segments(draft, redecoded, [(1.0, 2.0), (3.0, 4.0)])
+
+    assert [item.text for item in spliced] == ["a", "b1", "b2", "c"]
+    assert [item.id for item in spliced] == [1, 2, 3, 4]
+
+
+def test_transcribe_audio_two_pass_redecodes_only_low_confidence_windows(
+    tmp_path: Path,
+) -> None:
+    calls: list[dict[str, Any]] = []
+
+    def factory(*, model_size_or_path: str, device: str, compute_type: str) -> _ClipAwareModel:
+        del device, compute_type
+        return _ClipAwareModel(calls, model_size_or_path)
+
+    stats = TwoPassStats()
+    qa_stats = M1QAStats()
+    doc = transcribe_audio(
+        tmp_path / "audio.wav",
+        _two_pass_config(),
+        model_factory=factory,
+        qa_stats=qa_stats,
+        two_pass_stats=stats,
+    )
+
+    assert [item["model"] for item in calls] == ["base", "medium"]
+    assert "clip_timestamps" not in calls[0]
+    assert calls[1]["clip_timestamps"] == [2.5, 5.5]
+    assert [item.text for item in doc.segments] == ["hello", "world", "three", "goodbye"]
+    assert [item.id for item in doc.segments] == [1, 2, 3, 4]
+    assert qa_stats.segment_count == 4
+
+    report = stats.to_dict()
+    assert report["window_count"] == 1
+    assert report["redecoded_seconds"] == pytest.approx(3.0)
+    assert report["redecoded_fraction"] == pytest.approx(0.3)
+    assert report["estimated_single_pass_seconds"] is not None
+    assert report["redecode_error"] is None
+
+
+def test_transcribe_audio_two_pass_keeps_draft_when_accurate_model_ooms(
+    tmp_path: Path,
+) -> None:
+    calls: list[dict[str, Any]] = []
+
+    def factory(*, model_size_or_path: str, device: str, compute_type: str) -> _ClipAwareModel:
+        del device, compute_type
+        if model_size_or_path != "base":
+            raise RuntimeError("CUDA out of memory")
+        return _ClipAwareModel(calls, model_size_or_path)
+
+    stats = TwoPassStats()
+    doc = transcribe_audio(
+        tmp_path / "audio.wav",
+        replace(_two_pass_config(), device="cuda"),
+        model_factory=factory,
+        two_pass_stats=stats,
+    )
+
+    assert [item.text for item in doc.segments] == ["hello", "wurld", "tree", "goodbye"]
+    assert stats.redecode_error is not None
+    assert stats.to_dict()["estimated_saved_seconds"] is None
@@ -0,0 +1,62 @@
+import json
+import tomllib
+from pathlib import Path
+
+from video_translate.config import load_config
+from video_translate.pipeline.autotune import HostProbe, run_autotune
+from video_translate.pipeline.m1_benchmark import synthetic_whisper_factory
+
+
+def _host(*, cores: int, ram_gib: int) -> HostProbe:
+    return HostProbe(
+        hostname="bench-box",
+        system="Linux",
+        machine="x86_64",
+        logical_cores=cores,
+        usable_cores=cores,
+        total_ram_bytes=ram_gib * 1024**3,
+        available_ram_bytes=ram_gib * 1024**3,
+    )
+
+
+def test_run_autotune_writes_profile_that_load_config_layers(tmp_path: Path) -> None:
+    artifacts = run_autotune(
+        run_root=tmp_path / "run",
+        output_config_path=tmp_path / "autotune.toml",
+        fixture_seconds=6.0,
+        mt_item_count=8,
+        tts_item_count=2,
+        model_factory=synthetic_whisper_factory(segment_seconds=0.01),
+        host=_host(cores=8, ram_gib=4),
+    )
+
+    profile = tomllib.loads(artifacts.profile_path.read_text(encoding="utf-8"))
+    # The synthetic model decodes a batch per sleep, so batching wins; 4 GiB leaves
+    # room for batch sizes 4 and 8 only.
+    assert profile["asr"]["cpu_threads"] in {2, 4, 8}
+    assert profile["asr"]["batched"] is True
+    assert profile["asr"]["batch_size"] in {4, 8}
+    assert profile["translate"]["batch_size"] in {1, 4, 8}
+    assert "tts" not in profile
+
+    report = json.loads(artifacts.report_path.read_text(encoding="utf-8"))
+    assert report["stage"] == "autotune"
+    assert report["host"]["usable_cores"] == 8
+    assert [trial["settings"]["cpu_threads"] for trial in report["trials"]["asr"][:3]] == [
+        2,
+        4,
+        8,
+    ]
+    assert [trial["settings"].get("batch_size") for trial in report["trials"]["asr"][3:]] == [
+        4,
+        8,
+    ]
+    assert all(trial["error"] is None for trial in report["trials"]["mt"])
+
+    override = tmp_path / "override.toml"
+    override.write_text("[translate]\nbatch_size = 3\n", encoding="utf-8")
+    config = load_config(override, tuned_profile_path=artifacts.profile_path)
+    assert config.asr.cpu_threads == profile["asr"]["cpu_threads"]
+    assert config.asr.batch_size == profile["asr"]["batch_size"]
+    assert config.translate.batch_size == 3
+    assert config.pipeline.tuned_profile == artifacts.profile_path
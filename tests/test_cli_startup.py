@@ -0,0 +1,71 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("typer")
+
+from video_translate.io import read_json  # noqa: E402
+from video_translate.pipeline.startup_benchmark import run_cli_startup_benchmark  # noqa: E402
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+# Generous budget for the whole `video_translate.cli` import (typer included); the
+# module checks below are the precise regression guard.
+CLI_IMPORT_BUDGET_SECONDS = 1.5
+HEAVY_MODULES = (
+    "video_translate.ui",
+    "video_translate.pipeline.m1",
+    "video_translate.pipeline.m2",
+    "video_translate.pipeline.m3",
+    "video_translate.pipeline.m3_closure",
+    "video_translate.pipeline.m3_espeak_tune",
+    "video_translate.pipeline.m2_benchmark",
+    "video_translate.pipeline.m3_benchmark",
+    "faster_whisper",
+    "transformers",
+    "torch",
+)
+
+
+def _import_times(module: str) -> dict[str, int]:
+    env = os.environ.copy()
+    env["PYTHONPATH"] = str(SRC_DIR)
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        check=True,
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+    cumulative: dict[str, int] = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        fields = line[len("import time:") :].split("|")
+        _self_us, cumulative_us, name = (part.strip() for part in fields)
+        if cumulative_us.isdigit():
+            cumulative[name] = int(cumulative_us)
+    return cumulative
+
+
+def test_cli_import_skips_pipeline_and_ui_modules() -> None:
+    imported = _import_times("video_translate.cli")
+
+    assert "video_translate.cli" in imported
+    assert [name for name in HEAVY_MODULES if name in imported] == []
+    assert imported["video_translate.cli"] / 1_000_000 < CLI_IMPORT_BUDGET_SECONDS
+
+
+def test_run_cli_startup_benchmark_writes_report(tmp_path: Path) -> None:
+    report_path = run_cli_startup_benchmark(
+        output_json_path=tmp_path / "cli_startup_benchmark.json",
+        commands=[("--help",)],
+        repeats=1,
+    )
+    payload = read_json(report_path)
+
+    assert payload["stage"] == "cli_startup_benchmark"
+    assert payload["commands"][0]["command"] == "--help"
+    assert payload["commands"][0]["returncodes"] == [0]
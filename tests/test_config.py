@@ -1,8 +1,11 @@
+import os
+import time
 from pathlib import Path
 
 import pytest
 
-from video_translate.config import load_config
+from video_translate import config as config_module
+from video_translate.config import clear_config_cache, derive_config, load_config
 
 
 def test_load_config_applies_override(tmp_path: Path) -> None:
@@ -13,6 +16,7 @@ def test_load_config_applies_override(tmp_path: Path) -> None:
                 "[pipeline]",
                 'workspace_dir = "custom_runs"',
                 "audio_sample_rate = 22050",
+                "compact_json = true",
                 "",
                 "[asr]",
                 "beam_size = 3",
@@ -25,6 +29,7 @@ def test_load_config_applies_override(tmp_path: Path) -> None:
 
     assert config.pipeline.workspace_dir == Path("custom_runs")
     assert config.pipeline.audio_sample_rate == 22050
+    assert config.pipeline.compact_json is True
     assert config.asr.beam_size == 3
     assert config.asr.fallback_on_oom is True
     assert config.asr.fallback_device == "cpu"
@@ -77,6 +82,54 @@ def test_load_config_rejects_non_positive_values(tmp_path: Path) -> None:
         load_config(override)
 
 
+def test_load_config_rejects_unknown_ingest_mode(tmp_path: Path) -> None:
+    override = tmp_path / "invalid.toml"
+    override.write_text(
+        "\n".join(
+            [
+                "[pipeline]",
+                'ingest_mode = "parallel"',
+            ]
+        ),
+        encoding="utf-8",
+    )
+
+    with pytest.raises(ValueError, match="pipeline.ingest_mode"):
+        load_config(override)
+
+
+def test_load_config_rejects_unknown_trace_format(tmp_path: Path) -> None:
+    override = tmp_path / "invalid.toml"
+    override.write_text(
+        "\n".join(
+            [
+                "[pipeline]",
+                'trace_format = "perfetto"',
+            ]
+        ),
+        encoding="utf-8",
+    )
+
+    with pytest.raises(ValueError, match="pipeline.trace_format"):
+        load_config(override)
+
+
+def test_load_config_rejects_negative_mock_item_latency(tmp_path: Path) -> None:
+    override = tmp_path / "invalid.toml"
+    override.write_text(
+        "\n".join(
+            [
+                "[tts]",
+                "mock_item_latency_seconds = -0.5",
+            ]
+        ),
+        encoding="utf-8",
+    )
+
+    with pytest.raises(ValueError, match="tts.mock_item_latency_seconds"):
+        load_config(override)
+
+
 def test_load_config_rejects_invalid_translate_ratio(tmp_path: Path) -> None:
     override = tmp_path / "invalid_translate.toml"
     override.write_text(
@@ -126,6 +179,99 @@ def test_load_config_rejects_negative_pause_punct_limit(tmp_path: Path) -> None:
         load_config(override)
 
 
+def test_load_config_rejects_non_negative_energy_vad_threshold(tmp_path: Path) -> None:
+    override = tmp_path / "invalid_energy_vad.toml"
+    override.write_text(
+        "\n".join(
+            [
+                "[asr]",
+                "energy_vad_threshold_db = 0.0",
+            ]
+        ),
+        encoding="utf-8",
+    )
+
+    with pytest.raises(ValueError, match="asr.energy_vad_threshold_db"):
+        load_config(override)
+
+
+def test_load_config_ctranslate2_follows_transformers_table(tmp_path: Path) -> None:
+    override = tmp_path / "override.toml"
+    override.write_text(
+        "\n".join(
+            [
+                "[pipeline]",
+                "workspace_dir = 'work'",
+                "[translate]",
+                "backend = 'ctranslate2'",
+                "[translate.transformers]",
+                "model_id = 'Helsinki-NLP/opus-mt-en-tr'",
+                "max_new_tokens = 128",
+                "[translate.ctranslate2]",
+                "max_batch_tokens = 0",
+            ]
+        ),
+        encoding="utf-8",
+    )
+
+    ct2 = load_config(override).translate.ctranslate2
+
+    assert ct2.model_id == "Helsinki-NLP/opus-mt-en-tr"
+    assert ct2.max_decoding_length == 128
+    assert ct2.max_batch_tokens == 0
+    assert ct2.compute_type == "int8"
+    assert ct2.cache_dir == Path("work") / ".cache" / "ctranslate2"
+
+
+def test_load_config_rejects_unknown_ctranslate2_device(tmp_path: Path) -> None:
+    override = tmp_path / "override.toml"
+    override.write_text("[translate.ctranslate2]\ndevice = 'tpu'\n", encoding="utf-8")
+
+    with pytest.raises(ValueError, match="translate.ctranslate2.device"):
+        load_config(override)
+
+
+def test_load_config_rejects_non_http_translate_service_url(tmp_path: Path) -> None:
+    override = tmp_path / "override.toml"
+    override.write_text("[translate.service]\nurl = '/tmp/mt.sock'\n", encoding="utf-8")
+
+    with pytest.raises(ValueError, match="translate.service.url"):
+        load_config(override)
+
+
+def test_load_config_layers_tuned_profile_under_override(tmp_path: Path) -> None:
+    tuned = tmp_path / "autotune_host.toml"
+    tuned.write_text("[asr]\ncpu_threads = 6\nbatch_size = 16\n", encoding="utf-8")
+    override = tmp_path / "profile.toml"
+    override.write_text(
+        "\n".join(
+            [
+                "[pipeline]",
+                f'tuned_profile = "{tuned.as_posix()}"',
+                "[asr]",
+                "batch_size = 4",
+            ]
+        ),
+        encoding="utf-8",
+    )
+
+    config = load_config(override)
+
+    assert config.pipeline.tuned_profile == tuned
+    assert config.asr.cpu_threads == 6
+    assert config.asr.batch_size == 4
+
+
+def test_load_config_rejects_missing_tuned_profile(tmp_path: Path) -> None:
+    override = tmp_path / "missing_tuned.toml"
+    override.write_text(
+        '[pipeline]\ntuned_profile = "configs/profiles/absent_host.toml"\n', encoding="utf-8"
+    )
+
+    with pytest.raises(ValueError, match="pipeline.tuned_profile"):
+        load_config(override)
+
+
 def test_load_config_rejects_non_list_allowed_flags(tmp_path: Path) -> None:
     override = tmp_path / "invalid_allowed_flags.toml"
     override.write_text(
@@ -305,3 +451,78 @@ def test_load_config_resolves_relative_piper_bin_path(tmp_path: Path) -> None:
     config = load_config(override)
     repo_root = Path(__file__).resolve().parents[1]
     assert config.tts.piper_bin == str(repo_root / ".venv" / "Scripts" / "piper.exe")
+
+
+def _age_file(path: Path, seconds: float = 60.0) -> None:
+    past = time.time() - seconds
+    os.utime(path, (past, past))
+
+
+def test_load_config_returns_cached_instance_for_unchanged_file(tmp_path: Path) -> None:
+    clear_config_cache()
+    override = tmp_path / "override.toml"
+    override.write_text("[asr]\nmodel = 'tiny'\n", encoding="utf-8")
+    _age_file(override)
+
+    first = load_config(override)
+    second = load_config(override)
+
+    assert first is second
+    assert first.asr.model == "tiny"
+
+
+def test_load_config_reparses_changed_file(tmp_path: Path) -> None:
+    clear_config_cache()
+    override = tmp_path / "override.toml"
+    override.write_text("[asr]\nmodel = 'tiny'\n", encoding="utf-8")
+    _age_file(override, seconds=120.0)
+    assert load_config(override).asr.model == "tiny"
+
+    override.write_text("[asr]\nmodel = 'base'\n", encoding="utf-8")
+    _age_file(override, seconds=60.0)
+
+    assert load_config(override).asr.model == "base"
+
+
+def test_load_config_keeps_only_the_latest_version_of_an_edited_file(tmp_path: Path) -> None:
+    clear_config_cache()
+    override = tmp_path / "override.toml"
+    for edit in range(5):
+        override.write_text(f"[asr]\nbeam_size = {edit + 1}\n", encoding="utf-8")
+        _age_file(override, seconds=600.0 - edit)
+        assert load_config(override).asr.beam_size == edit + 1
+
+    # default.toml plus one entry for the override, whatever the number of edits.
+    assert len(config_module._TOML_LAYER_CACHE) == 2
+    assert len(config_module._APP_CONFIG_CACHE) == 1
+
+
+def test_load_config_skips_cache_for_recently_modified_file(tmp_path: Path) -> None:
+    clear_config_cache()
+    override = tmp_path / "override.toml"
+    override.write_text("[asr]\nmodel = 'tiny'\n", encoding="utf-8")
+    assert load_config(override).asr.model == "tiny"
+
+    # Same size and (possibly) same mtime tick: must not be served from cache.
+    override.write_text("[asr]\nmodel = 'base'\n", encoding="utf-8")
+    assert load_config(override).asr.model == "base"
+
+
+def test_derive_config_overrides_field_and_interns_result() -> None:
+    clear_config_cache()
+    base = load_config(None)
+
+    strict = derive_config(base, tts={"qa_fail_on_flags": True})
+
+    assert strict.tts.qa_fail_on_flags is True
+    assert strict.tts.piper_bin == base.tts.piper_bin
+    assert strict.tts.piper_model_path == base.tts.piper_model_path
+    assert strict.asr is base.asr
+    assert derive_config(base, tts={"qa_fail_on_flags": True}) is strict
+
+
+def test_derive_config_rejects_unknown_field() -> None:
+    base = load_config(None)
+
+    with pytest.raises(ValueError, match="tts.not_a_field"):
+        derive_config(base, tts={"not_a_field": 1})
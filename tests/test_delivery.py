@@ -45,7 +45,7 @@ def test_deliver_final_video_writes_outputs_and_cleans_run_root(
     m2_qa.write_text(json.dumps({"quality_flags": []}), encoding="utf-8")
     m3_qa.write_text(json.dumps({"quality_flags": []}), encoding="utf-8")
 
-    def _fake_run_command(command: list[str], cwd: Path | None = None):  # noqa: ANN001
+    def _fake_run_command(command: list[str], cwd: Path | None = None, **_kwargs):  # noqa: ANN001
         output_path = Path(command[-1])
         output_path.parent.mkdir(parents=True, exist_ok=True)
         output_path.write_bytes(b"mp4")
@@ -88,7 +88,7 @@ def test_deliver_final_video_carries_quality_flags_without_cleanup(
     run_manifest.write_text("{}", encoding="utf-8")
     m2_qa.write_text(json.dumps({"quality_flags": ["glossary_miss"]}), encoding="utf-8")
 
-    def _fake_run_command(command: list[str], cwd: Path | None = None):  # noqa: ANN001
+    def _fake_run_command(command: list[str], cwd: Path | None = None, **_kwargs):  # noqa: ANN001
         output_path = Path(command[-1])
         output_path.parent.mkdir(parents=True, exist_ok=True)
         output_path.write_bytes(b"mp4")
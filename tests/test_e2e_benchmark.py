@@ -0,0 +1,133 @@
+import shutil
+import time
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from video_translate.config import load_config
+from video_translate.ingest.youtube import download_youtube_source
+from video_translate.io import read_json
+from video_translate.pipeline.e2e_benchmark import (
+    E2ECaseResult,
+    evaluate_overhead_gate,
+    linear_fit,
+    run_e2e_benchmark,
+    write_yt_dlp_stand_in,
+)
+from video_translate.pipeline.m1_benchmark import (
+    synthetic_whisper_factory,
+    write_synthetic_speech_fixture,
+)
+from video_translate.translate.backends import build_translation_backend
+from video_translate.tts.backends import build_tts_backend
+
+
+def test_yt_dlp_stand_in_copies_local_media(tmp_path: Path) -> None:
+    source = tmp_path / "media" / "source.mp4"
+    source.parent.mkdir()
+    source.write_bytes(b"fake-mp4" * 64)
+    stand_in = write_yt_dlp_stand_in(tmp_path / "bin" / "yt_dlp_stand_in")
+
+    result = download_youtube_source(
+        url=source.resolve().as_uri(),
+        output_dir=tmp_path / "run" / "input",
+        yt_dlp_bin=str(stand_in),
+    )
+
+    assert result.media_path.read_bytes() == source.read_bytes()
+    assert result.info_json_path is not None
+    assert read_json(result.info_json_path)["title"] == "e2e benchmark source"
+
+
+def test_mock_backends_apply_configured_item_latency(tmp_path: Path) -> None:
+    base = load_config(None)
+    translator = build_translation_backend(
+        replace(base.translate, mock_item_latency_seconds=0.01)
+    )
+    tts = build_tts_backend(replace(base.tts, mock_item_latency_seconds=0.02))
+
+    started = time.perf_counter()
+    translated = translator.translate_batch(
+        ["a", "b", "c"], source_language="en", target_language="tr", batch_size=8
+    )
+    tts.synthesize_to_wav(
+        text="merhaba", output_wav=tmp_path / "seg.wav", target_duration=0.2, sample_rate=16000
+    )
+    elapsed = time.perf_counter() - started
+
+    assert translated == ["a", "b", "c"]
+    assert elapsed >= 0.05
+
+
+def test_synthetic_whisper_factory_adds_load_and_segment_latency(tmp_path: Path) -> None:
+    audio = write_synthetic_speech_fixture(tmp_path / "speech.wav", seconds=4.0)
+    factory = synthetic_whisper_factory(load_seconds=0.02, segment_seconds=0.01)
+
+    started = time.perf_counter()
+    model = factory(model_size_or_path="synthetic", device="cpu", compute_type="int8")
+    segments, _info = model.transcribe(str(audio))
+    collected = list(segments)
+    elapsed = time.perf_counter() - started
+
+    assert len(collected) == 2
+    assert elapsed >= 0.04
+    with pytest.raises(ValueError, match=">= 0"):
+        synthetic_whisper_factory(segment_seconds=-1.0)
+
+
+def test_linear_fit_and_overhead_gate() -> None:
+    fit = linear_fit([(10.0, 3.0), (20.0, 5.0), (40.0, 9.0)])
+    assert fit == {"slope": 0.2, "intercept": 1.0, "r_squared": 1.0}
+    assert linear_fit([(10.0, 3.0), (10.0, 4.0)]) is None
+
+    fast = E2ECaseResult(
+        label="fast",
+        media_seconds=10.0,
+        segment_period_seconds=2.0,
+        status="ok",
+        segment_count=5,
+        total_seconds=2.0,
+        stage_seconds={"asr": 1.0, "mt.translate": 0.5},
+    )
+    slow = replace(fast, label="slow", total_seconds=4.0)
+    assert fast.orchestration_seconds == pytest.approx(0.5)
+
+    gate = evaluate_overhead_gate([fast, slow], 0.2)
+    assert gate["passed"] is False
+    assert gate["worst_case"] == "slow"
+    assert gate["worst_value"] == pytest.approx(0.5)
+    assert evaluate_overhead_gate([fast], 0.2)["passed"] is True
+    failed = E2ECaseResult(
+        label="broken", media_seconds=10.0, segment_period_seconds=2.0, status="failed_run"
+    )
+    assert evaluate_overhead_gate([fast, failed], None)["passed"] is False
+
+
+@pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg is not installed")
+def test_run_e2e_benchmark_runs_full_chain(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    # Delivery refuses download roots outside the project root.
+    monkeypatch.setattr("video_translate.pipeline.delivery.PROJECT_ROOT", tmp_path)
+
+    report_path = run_e2e_benchmark(
+        output_root=tmp_path / "e2e",
+        media_seconds=[4.0, 8.0],
+        segment_periods=[2.0],
+        mt_item_seconds=0.001,
+        tts_item_seconds=0.001,
+        max_orchestration_seconds_per_segment=60.0,
+    )
+
+    report = read_json(report_path)
+    assert report["stage"] == "e2e_benchmark"
+    assert report["summary"] == {
+        "case_count": 2,
+        "success_count": 2,
+        "failed_count": 0,
+        "gate_passed": True,
+    }
+    first, second = report["cases"]
+    assert first["segment_count"] < second["segment_count"]
+    assert first["stage_seconds"]["ffmpeg.merge"] > 0.0
+    assert Path(first["trace_jsonl"]).exists()
+    assert report["scaling"]["by_segment_count"]["total"]["fit"] is not None
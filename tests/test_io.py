@@ -1,6 +1,38 @@
+import json
 from pathlib import Path
 
-from video_translate.io import _format_srt_time, create_run_paths
+import pytest
+
+from video_translate.io import (
+    _format_srt_time,
+    available_json_backends,
+    create_run_paths,
+    dumps_json,
+    loads_json,
+    read_json,
+    read_transcript_json,
+    write_json,
+    write_transcript_json,
+)
+from video_translate.models import TranscriptDocument, TranscriptSegment, WordTimestamp
+from video_translate.pipeline.io_benchmark import run_json_io_benchmark
+
+
+def _sample_transcript() -> TranscriptDocument:
+    return TranscriptDocument(
+        language="en",
+        language_probability=0.98,
+        duration=2.0,
+        segments=[
+            TranscriptSegment(
+                id=0,
+                start=0.0,
+                end=1.5,
+                text="Merhaba dunya",
+                words=[WordTimestamp(word="Merhaba", start=0.0, end=0.6, probability=0.91)],
+            )
+        ],
+    )
 
 
 def test_format_srt_time() -> None:
@@ -17,3 +49,82 @@ def test_create_run_paths_creates_expected_structure(tmp_path: Path) -> None:
     assert paths.output_transcript_dir.exists()
     assert paths.output_qa_dir.exists()
     assert paths.logs_dir.exists()
+
+    with pytest.raises(FileExistsError):
+        create_run_paths(tmp_path, run_id="demo_run")
+    resumed = create_run_paths(tmp_path, run_id="demo_run", resume=True)
+    assert resumed == paths
+    assert resumed.work_dir == tmp_path / "demo_run" / "work"
+
+
+@pytest.mark.parametrize("backend", available_json_backends())
+def test_transcript_json_round_trip_matches_to_dict(tmp_path: Path, backend: str) -> None:
+    doc = _sample_transcript()
+    path = tmp_path / "transcript.json"
+    write_transcript_json(path, doc)
+
+    assert json.loads(path.read_text(encoding="utf-8")) == doc.to_dict()
+    assert loads_json(path.read_bytes(), backend=backend) == doc.to_dict()
+    assert read_transcript_json(path, backend=backend) == doc
+
+
+@pytest.mark.parametrize("backend", available_json_backends())
+def test_read_transcript_json_fills_missing_fields_on_every_backend(
+    tmp_path: Path, backend: str
+) -> None:
+    path = tmp_path / "transcript.json"
+    path.write_text(
+        json.dumps({"language": "en", "segments": [{"start": 1, "text": "Hi", "words": [7]}]}),
+        encoding="utf-8",
+    )
+
+    doc = read_transcript_json(path, backend=backend)
+
+    assert doc.duration == 0.0
+    assert doc.segments == [TranscriptSegment(id=0, start=1.0, end=1.0, text="Hi", words=[])]
+
+
+def test_write_json_compact_mode_drops_whitespace(tmp_path: Path) -> None:
+    indented_path = tmp_path / "indented.json"
+    compact_path = tmp_path / "compact.json"
+    payload = {"text": "çeviri", "values": [1, 2, 3]}
+    write_json(indented_path, payload)
+    write_json(compact_path, payload, compact=True)
+
+    assert read_json(compact_path) == read_json(indented_path) == payload
+    assert compact_path.stat().st_size < indented_path.stat().st_size
+    assert "\n" not in compact_path.read_text(encoding="utf-8")
+    assert "çeviri" in compact_path.read_text(encoding="utf-8")
+
+
+def test_dumps_json_stdlib_backend_encodes_paths_and_dataclasses() -> None:
+    encoded = dumps_json({"path": Path("a/b.wav"), "doc": _sample_transcript()}, backend="json")
+    payload = json.loads(encoded)
+    assert payload["path"] == str(Path("a/b.wav"))
+    assert payload["doc"]["segments"][0]["words"][0]["word"] == "Merhaba"
+
+
+def test_read_json_rejects_non_object_root(tmp_path: Path) -> None:
+    path = tmp_path / "list.json"
+    path.write_text("[1, 2]", encoding="utf-8")
+    with pytest.raises(ValueError, match="JSON root must be an object"):
+        read_json(path)
+
+
+def test_dumps_json_rejects_unknown_backend() -> None:
+    with pytest.raises(ValueError, match="Unsupported JSON backend"):
+        dumps_json({}, backend="yaml")
+
+
+def test_run_json_io_benchmark_writes_report(tmp_path: Path) -> None:
+    report_path = run_json_io_benchmark(
+        output_json_path=tmp_path / "io_benchmark.json",
+        segment_counts=[5],
+        repeats=1,
+    )
+    payload = read_json(report_path)
+    assert payload["stage"] == "io_benchmark"
+    contracts = {case["contract"] for case in payload["cases"]}
+    assert contracts == {"transcript", "translation_output", "tts_output"}
+    assert len(payload["cases"]) == 3 * len(available_json_backends()) * 2
+    assert all(case["bytes"] > 0 for case in payload["cases"])
@@ -0,0 +1,50 @@
+from dataclasses import replace
+
+import pytest
+
+from video_translate.config import load_config
+from video_translate.translate.length_control import (
+    TranslationCandidate,
+    budget_max_tokens,
+    char_budget,
+    pick_candidate,
+    voice_chars_per_second,
+)
+
+
+def test_voice_chars_per_second_follows_tts_voice() -> None:
+    tts = load_config().tts
+
+    espeak = voice_chars_per_second(replace(tts, backend="espeak", espeak_speed_wpm=180))
+    piper = voice_chars_per_second(replace(tts, backend="piper", piper_length_scale=1.25))
+
+    assert espeak == pytest.approx(180 * 6.5 / 60.0)
+    assert piper == pytest.approx(12.0)
+    assert voice_chars_per_second(tts, override=11.0) == 11.0
+
+
+def test_char_budget_and_decoding_cap() -> None:
+    assert char_budget(2.0, 15.0, 1.1) == 33
+    assert char_budget(0.0, 15.0, 1.1) == 1
+    assert budget_max_tokens(33, 256) == 21
+    assert budget_max_tokens(1000, 256) == 256
+    assert budget_max_tokens(1, 256) == 8
+
+
+def test_pick_candidate_prefers_rank_within_budget() -> None:
+    candidates = [
+        TranslationCandidate(text)
+        for text in ["en uzun aday cumle burada", "orta uzunlukta aday", "kisa aday"]
+    ]
+
+    assert pick_candidate(candidates, 40) == candidates[0]
+    assert pick_candidate(candidates, 20) == candidates[1]
+    assert pick_candidate(candidates, 5) == candidates[2]
+
+
+def test_pick_candidate_skips_candidates_cut_at_the_decoding_cap() -> None:
+    cut = TranslationCandidate("kisa", hit_length_cap=True)
+    complete = TranslationCandidate("tamamlanmis uzun aday")
+
+    assert pick_candidate([cut, complete], 10) == complete
+    assert pick_candidate([cut], 10) is None
@@ -0,0 +1,120 @@
+import json
+import wave
+from pathlib import Path
+
+import pytest
+
+from video_translate.pipeline.m1_benchmark import (
+    SyntheticWhisperModel,
+    run_m1_profile_benchmark,
+    synthetic_whisper_factory,
+    write_synthetic_speech_fixture,
+)
+
+
+def test_write_synthetic_speech_fixture_writes_pcm16_wav(tmp_path: Path) -> None:
+    fixture = write_synthetic_speech_fixture(tmp_path / "speech.wav", seconds=4.0)
+
+    with wave.open(str(fixture), "rb") as wav_file:
+        assert wav_file.getnchannels() == 1
+        assert wav_file.getsampwidth() == 2
+        assert wav_file.getnframes() == 4 * 16000
+
+
+def test_synthetic_whisper_model_emits_segment_per_voiced_region(tmp_path: Path) -> None:
+    fixture = write_synthetic_speech_fixture(tmp_path / "speech.wav", seconds=6.0)
+    model = SyntheticWhisperModel("small", device="cpu", compute_type="int8")
+
+    segments_iter, info = model.transcribe(str(fixture), word_timestamps=True)
+    segments = list(segments_iter)
+
+    assert info.duration == pytest.approx(6.0)
+    assert len(segments) == 3
+    assert all(segment.words for segment in segments)
+    assert segments[0].start < segments[0].end <= segments[1].start
+
+
+def test_run_m1_profile_benchmark_writes_report(tmp_path: Path) -> None:
+    fixture = write_synthetic_speech_fixture(tmp_path / "speech.wav", seconds=4.0)
+    config_a = tmp_path / "a.toml"
+    config_b = tmp_path / "b.toml"
+    config_a.write_text("[asr]\nmodel='small'\ndevice='cpu'\n", encoding="utf-8")
+    config_b.write_text("[asr]\nmodel='medium'\ndevice='cpu'\n", encoding="utf-8")
+
+    report_path = run_m1_profile_benchmark(
+        run_root=tmp_path / "run",
+        audio_paths=[fixture],
+        config_paths=[config_a, config_b],
+        model_factory=SyntheticWhisperModel,
+    )
+
+    assert report_path == tmp_path / "run" / "benchmarks" / "m1_profile_benchmark.json"
+    payload = json.loads(report_path.read_text(encoding="utf-8"))
+    assert payload["stage"] == "m1_benchmark"
+    assert payload["model_factory"] == "SyntheticWhisperModel"
+    assert payload["summary"]["profile_count"] == 2
+    assert payload["summary"]["success_count"] == 2
+    assert payload["summary"]["recommended_profile"] in {"a", "b"}
+    profile = payload["profiles"][0]
+    assert profile["model"] == "small"
+    assert profile["audio_seconds"] == pytest.approx(4.0)
+    assert profile["segment_count"] == 2
+    assert profile["decode_rtf"] is not None
+    assert profile["model_load_seconds"] is not None
+    assert Path(profile["trace_jsonl"]).exists()
+
+
+def test_run_m1_profile_benchmark_records_failed_profile(tmp_path: Path) -> None:
+    fixture = write_synthetic_speech_fixture(tmp_path / "speech.wav", seconds=2.0)
+    config = tmp_path / "a.toml"
+    config.write_text("[asr]\nfallback_on_oom=false\n", encoding="utf-8")
+
+    def _broken_factory(**_kwargs):
+        raise RuntimeError("model missing")
+
+    report_path = run_m1_profile_benchmark(
+        run_root=tmp_path / "run",
+        audio_paths=[fixture],
+        config_paths=[config],
+        model_factory=_broken_factory,
+    )
+
+    payload = json.loads(report_path.read_text(encoding="utf-8"))
+    assert payload["profiles"][0]["status"] == "failed_run"
+    assert "model missing" in payload["profiles"][0]["error"]
+    assert payload["summary"]["recommended_profile"] is None
+
+
+def test_run_m1_profile_benchmark_rejects_missing_fixture(tmp_path: Path) -> None:
+    with pytest.raises(FileNotFoundError, match="Audio fixture not found"):
+        run_m1_profile_benchmark(
+            run_root=tmp_path,
+            audio_paths=[tmp_path / "missing.wav"],
+            config_paths=[tmp_path / "a.toml"],
+            model_factory=SyntheticWhisperModel,
+        )
+
+
+def test_run_m1_profile_benchmark_compares_batched_profile(tmp_path: Path) -> None:
+    fixture = write_synthetic_speech_fixture(tmp_path / "speech.wav", seconds=8.0)
+    sequential = tmp_path / "cpu.toml"
+    batched = tmp_path / "cpu_batched.toml"
+    sequential.write_text("[asr]\nmodel='small'\ndevice='cpu'\n", encoding="utf-8")
+    batched.write_text(
+        "[asr]\nmodel='small'\ndevice='cpu'\nbatched=true\nbatch_size=4\n", encoding="utf-8"
+    )
+
+    report_path = run_m1_profile_benchmark(
+        run_root=tmp_path / "run",
+        audio_paths=[fixture],
+        config_paths=[sequential, batched],
+        model_factory=synthetic_whisper_factory(segment_seconds=0.02),
+    )
+
+    payload = json.loads(report_path.read_text(encoding="utf-8"))
+    assert [item["batch_size"] for item in payload["profiles"]] == [None, 4]
+    (comparison,) = payload["batched_comparisons"]
+    assert comparison["sequential_profile"] == "cpu"
+    assert comparison["batched_profile"] == "cpu_batched"
+    assert comparison["segment_count_delta"] == 0
+    assert comparison["decode_speedup"] > 1.0
@@ -4,7 +4,11 @@ from types import SimpleNamespace
 
 from pytest import MonkeyPatch
 
-from video_translate.pipeline.m2_benchmark import run_m2_profile_benchmark
+from video_translate.pipeline.m2_benchmark import (
+    M2BenchmarkResult,
+    _backend_comparisons,
+    run_m2_profile_benchmark,
+)
 
 
 def test_run_m2_profile_benchmark_writes_report(monkeypatch: MonkeyPatch, tmp_path: Path) -> None:
@@ -62,3 +66,47 @@ def test_run_m2_profile_benchmark_writes_report(monkeypatch: MonkeyPatch, tmp_pa
     assert payload["summary"]["profile_count"] == 2
     assert payload["summary"]["success_count"] == 2
     assert payload["summary"]["recommended_profile"] is not None
+    assert payload["profiles"][0]["backend"] == "mock"
+    assert payload["backend_comparisons"] == []
+
+
+def _result(
+    name: str, backend: str, model_id: str, seconds: float, flags: int
+) -> M2BenchmarkResult:
+    return M2BenchmarkResult(
+        profile_name=name,
+        config_path=Path(f"{name}.toml"),
+        status="ok",
+        output_json=None,
+        qa_report_json=None,
+        run_manifest_json=None,
+        total_pipeline_seconds=seconds + 0.5,
+        quality_flag_count=flags,
+        quality_flags=[],
+        error=None,
+        backend=backend,
+        model_id=model_id,
+        translate_backend_seconds=seconds,
+    )
+
+
+def test_backend_comparisons_pair_ctranslate2_with_same_transformers_model() -> None:
+    comparisons = _backend_comparisons(
+        [
+            _result("m2_transformers_cpu", "transformers", "facebook/m2m100_418M", 12.0, 1),
+            _result("m2_ctranslate2_cpu", "ctranslate2", "facebook/m2m100_418M", 3.0, 2),
+            _result("opus_ct2", "ctranslate2", "Helsinki-NLP/opus-mt-en-tr", 1.0, 0),
+        ]
+    )
+
+    assert comparisons == [
+        {
+            "model_id": "facebook/m2m100_418M",
+            "transformers_profile": "m2_transformers_cpu",
+            "ctranslate2_profile": "m2_ctranslate2_cpu",
+            "transformers_translate_seconds": 12.0,
+            "ctranslate2_translate_seconds": 3.0,
+            "translate_speedup": 4.0,
+            "quality_flag_count_delta": 1,
+        }
+    ]
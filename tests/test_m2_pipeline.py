@@ -1,4 +1,5 @@
 import json
+from dataclasses import replace
 from pathlib import Path
 
 import pytest
@@ -12,7 +13,10 @@ from video_translate.config import (
     TranslateConfig,
     TranslateTransformersConfig,
 )
+from video_translate.metrics import MT_SEGMENTS, MT_SEGMENTS_PER_SECOND, observe_span
 from video_translate.pipeline.m2 import run_m2_pipeline
+from video_translate.tracing import add_span_observer, remove_span_observer
+from video_translate.translate.length_control import TranslationCandidate
 
 
 def _build_app_config() -> AppConfig:
@@ -226,3 +230,348 @@ def test_run_m2_pipeline_fails_when_qa_gate_blocks_flags(tmp_path: Path) -> None
     manifest_payload = json.loads(run_manifest_json.read_text(encoding="utf-8"))
     assert manifest_payload["qa_gate"]["enabled"] is True
     assert manifest_payload["qa_gate"]["passed"] is False
+
+
+def test_run_m2_pipeline_incremental_keeps_unchanged_segment_edits(
+    tmp_path: Path, monkeypatch
+) -> None:
+    translation_input = tmp_path / "output" / "translate" / "translation_input.en-tr.json"
+    output_json = tmp_path / "output" / "translate" / "translation_output.en-tr.json"
+    qa_report_json = tmp_path / "output" / "qa" / "m2_qa_report.json"
+    run_manifest_json = tmp_path / "run_m2_manifest.json"
+
+    def _write_input(texts: list[str]) -> None:
+        translation_input.parent.mkdir(parents=True, exist_ok=True)
+        translation_input.write_text(
+            json.dumps(
+                {
+                    "schema_version": "1.0",
+                    "stage": "m2_translation_input",
+                    "generated_at_utc": "2026-02-16T10:00:00Z",
+                    "source_language": "en",
+                    "target_language": "tr",
+                    "segment_count": len(texts),
+                    "total_source_word_count": len(texts),
+                    "segments": [
+                        {
+                            "id": index,
+                            "start": float(index),
+                            "end": float(index) + 1.0,
+                            "duration": 1.0,
+                            "source_text": text,
+                            "source_word_count": 1,
+                        }
+                        for index, text in enumerate(texts)
+                    ],
+                }
+            ),
+            encoding="utf-8",
+        )
+
+    translated_batches: list[list[str]] = []
+
+    class _RecordingBackend:
+        name = "recording"
+
+        def translate_batch(self, texts: list[str], **_: object) -> list[str]:
+            translated_batches.append(list(texts))
+            return [f"tr:{text}" for text in texts]
+
+    monkeypatch.setattr(
+        "video_translate.pipeline.m2.build_translation_backend",
+        lambda *_: _RecordingBackend(),
+    )
+
+    def _run() -> None:
+        run_m2_pipeline(
+            translation_input_json_path=translation_input,
+            output_json_path=output_json,
+            qa_report_json_path=qa_report_json,
+            run_manifest_json_path=run_manifest_json,
+            config=_build_app_config(),
+            incremental=True,
+        )
+
+    _write_input(["one", "two", "three"])
+    _run()
+    assert translated_batches == [["one", "two", "three"]]
+
+    output_payload = json.loads(output_json.read_text(encoding="utf-8"))
+    output_payload["segments"][0]["target_text"] = "bir (duzeltildi)"
+    output_json.write_text(json.dumps(output_payload), encoding="utf-8")
+
+    _write_input(["one", "two!", "three"])
+    _run()
+    assert translated_batches[1] == ["two!"]
+    output_payload = json.loads(output_json.read_text(encoding="utf-8"))
+    assert [segment["target_text"] for segment in output_payload["segments"]] == [
+        "bir (duzeltildi)",
+        "tr:two!",
+        "tr:three",
+    ]
+    manifest = json.loads(run_manifest_json.read_text(encoding="utf-8"))
+    assert manifest["incremental"]["reused_segment_count"] == 2
+    assert manifest["incremental"]["changed_segment_count"] == 1
+
+
+def test_run_m2_pipeline_sentence_merge_translates_units_and_resplits(
+    tmp_path: Path, monkeypatch
+) -> None:
+    fragments = [
+        (0.0, 1.0, "So today we are going"),
+        (1.1, 3.1, "to look at the elephants here."),
+        (3.2, 4.2, "They live in herds."),
+    ]
+    translation_input = tmp_path / "translation_input.en-tr.json"
+    translation_input.write_text(
+        json.dumps(
+            {
+                "schema_version": "1.0",
+                "stage": "m2_translation_input",
+                "generated_at_utc": "2026-02-16T10:00:00Z",
+                "source_language": "en",
+                "target_language": "tr",
+                "segment_count": len(fragments),
+                "total_source_word_count": sum(len(text.split()) for _, _, text in fragments),
+                "segments": [
+                    {
+                        "id": index,
+                        "start": start,
+                        "end": end,
+                        "duration": end - start,
+                        "source_text": text,
+                        "source_word_count": len(text.split()),
+                    }
+                    for index, (start, end, text) in enumerate(fragments)
+                ],
+            }
+        ),
+        encoding="utf-8",
+    )
+    batches: list[list[str]] = []
+
+    def record_translate_batch(self, texts, **kwargs):
+        batches.append(list(texts))
+        return [text.strip() for text in texts]
+
+    monkeypatch.setattr(
+        "video_translate.translate.backends.MockTranslationBackend.translate_batch",
+        record_translate_batch,
+    )
+    base = _build_app_config()
+    config = replace(base, translate=replace(base.translate, sentence_merge_enabled=True))
+    output_json = tmp_path / "translation_output.en-tr.json"
+    run_manifest_json = tmp_path / "run_m2_manifest.json"
+
+    run_m2_pipeline(
+        translation_input_json_path=translation_input,
+        output_json_path=output_json,
+        qa_report_json_path=tmp_path / "m2_qa_report.json",
+        run_manifest_json_path=run_manifest_json,
+        config=config,
+    )
+
+    assert batches == [
+        [
+            "So today we are going to look at the elephants here.",
+            "They live in herds.",
+        ]
+    ]
+    segments = json.loads(output_json.read_text(encoding="utf-8"))["segments"]
+    assert [segment["id"] for segment in segments] == [0, 1, 2]
+    # The merged translation is split back by duration (1 s vs 2 s) on word boundaries.
+    assert segments[0]["target_text"] == "So today we are"
+    assert segments[1]["target_text"] == "going to look at the elephants here."
+    assert segments[2]["target_text"] == "They live in herds."
+    speed = json.loads(run_manifest_json.read_text(encoding="utf-8"))["speed"]
+    assert speed["mt_input_count"] == 2
+    assert speed["sentence_merge"]["enabled"] is True
+    assert speed["sentence_merge"]["merged_unit_count"] == 1
+    assert speed["sentence_merge"]["mt_input_count_without_merge"] == 3
+    assert speed["sentence_merge"]["estimated_translate_seconds_saved"] >= 0.0
+
+
+class _CandidateBackend:
+    name = "candidates"
+
+    def __init__(self) -> None:
+        self.budgets: list[list[int]] = []
+
+    def translate_batch(self, texts, *, source_language, target_language, batch_size):
+        return ["Bu gercekten cok uzun bir ceviri cumlesidir." for _ in texts]
+
+    def translate_batch_with_budget(
+        self, texts, *, source_language, target_language, batch_size, char_budgets, num_candidates
+    ):
+        self.budgets.append(list(char_budgets))
+        return [
+            [
+                TranslationCandidate("Bu gercekten cok uzun bir ceviri cumlesidir."),
+                TranslationCandidate("Kisa ceviri."),
+            ][:num_candidates]
+            for _ in texts
+        ]
+
+
+def test_run_m2_pipeline_length_control_picks_candidate_within_budget(
+    tmp_path: Path, monkeypatch
+) -> None:
+    translation_input = tmp_path / "translation_input.en-tr.json"
+    translation_input.write_text(
+        json.dumps(
+            {
+                "schema_version": "1.0",
+                "stage": "m2_translation_input",
+                "generated_at_utc": "2026-02-16T10:00:00Z",
+                "source_language": "en",
+                "target_language": "tr",
+                "segment_count": 1,
+                "total_source_word_count": 3,
+                "segments": [
+                    {
+                        "id": 0,
+                        "start": 0.0,
+                        "end": 1.0,
+                        "duration": 1.0,
+                        "source_text": "A short line.",
+                        "source_word_count": 3,
+                    }
+                ],
+            }
+        ),
+        encoding="utf-8",
+    )
+    backend = _CandidateBackend()
+    monkeypatch.setattr("video_translate.pipeline.m2.build_translation_backend", lambda _: backend)
+    base = _build_app_config()
+
+    def run(name: str, **translate_changes) -> tuple[dict, dict]:
+        config = replace(base, translate=replace(base.translate, **translate_changes))
+        output_json = tmp_path / f"translation_output.{name}.json"
+        manifest_json = tmp_path / f"run_m2_manifest.{name}.json"
+        run_m2_pipeline(
+            translation_input_json_path=translation_input,
+            output_json_path=output_json,
+            qa_report_json_path=tmp_path / f"m2_qa_report.{name}.json",
+            run_manifest_json_path=manifest_json,
+            config=config,
+        )
+        return (
+            json.loads(output_json.read_text(encoding="utf-8"))["segments"][0],
+            json.loads(manifest_json.read_text(encoding="utf-8"))["length_control"],
+        )
+
+    baseline_segment, baseline = run("baseline")
+    controlled_segment, controlled = run(
+        "controlled", length_control_enabled=True, length_control_candidates=2
+    )
+
+    # Mock TTS speaks 15 chars/s: a 1 s segment with 10% tolerance fits 16 characters.
+    assert backend.budgets == [[16]]
+    assert baseline_segment["target_text"] == "Bu gercekten cok uzun bir ceviri cumlesidir."
+    assert controlled_segment["target_text"] == "Kisa ceviri."
+    assert baseline["applied"] is False
+    assert baseline["predicted_over_budget_segment_count"] == 1
+    assert controlled["applied"] is True
+    assert controlled["switched_candidate_count"] == 1
+    assert controlled["predicted_over_budget_segment_count"] == 0
+    assert controlled["predicted_overrun_seconds"] == 0.0
+    assert baseline["predicted_overrun_seconds"] > 1.5
+
+
+class _CappedBackend:
+    name = "capped"
+
+    def __init__(self) -> None:
+        self.budget_calls: list[list[str]] = []
+        self.plain_calls: list[list[str]] = []
+
+    def translate_batch(self, texts, *, source_language, target_language, batch_size):
+        self.plain_calls.append(list(texts))
+        return [f"Tam {text}" for text in texts]
+
+    def translate_batch_with_budget(
+        self, texts, *, source_language, target_language, batch_size, char_budgets, num_candidates
+    ):
+        self.budget_calls.append(list(texts))
+        if len(self.budget_calls) == 1:
+            # One word for a two-segment unit, so the split falls back per segment.
+            return [[TranslationCandidate("Tamam.")] for _ in texts]
+        return [[TranslationCandidate("Yarim", hit_length_cap=True)] for _ in texts]
+
+
+def test_run_m2_pipeline_length_control_budgets_split_fallback_and_drops_capped(
+    tmp_path: Path, monkeypatch
+) -> None:
+    fragments = [(0.0, 1.0, "We are going"), (1.1, 2.1, "to the park.")]
+    translation_input = tmp_path / "translation_input.en-tr.json"
+    translation_input.write_text(
+        json.dumps(
+            {
+                "schema_version": "1.0",
+                "stage": "m2_translation_input",
+                "generated_at_utc": "2026-02-16T10:00:00Z",
+                "source_language": "en",
+                "target_language": "tr",
+                "segment_count": len(fragments),
+                "total_source_word_count": sum(len(text.split()) for _, _, text in fragments),
+                "segments": [
+                    {
+                        "id": index,
+                        "start": start,
+                        "end": end,
+                        "duration": end - start,
+                        "source_text": text,
+                        "source_word_count": len(text.split()),
+                    }
+                    for index, (start, end, text) in enumerate(fragments)
+                ],
+            }
+        ),
+        encoding="utf-8",
+    )
+    backend = _CappedBackend()
+    monkeypatch.setattr("video_translate.pipeline.m2.build_translation_backend", lambda _: backend)
+    base = _build_app_config()
+    config = replace(
+        base,
+        translate=replace(
+            base.translate, sentence_merge_enabled=True, length_control_enabled=True
+        ),
+    )
+    output_json = tmp_path / "translation_output.en-tr.json"
+    run_manifest_json = tmp_path / "run_m2_manifest.json"
+    segments_before = MT_SEGMENTS.value()
+    rate_samples_before = MT_SEGMENTS_PER_SECOND.count()
+
+    add_span_observer(observe_span)
+    try:
+        run_m2_pipeline(
+            translation_input_json_path=translation_input,
+            output_json_path=output_json,
+            qa_report_json_path=tmp_path / "m2_qa_report.json",
+            run_manifest_json_path=run_manifest_json,
+            config=config,
+        )
+    finally:
+        remove_span_observer(observe_span)
+
+    # One merged input plus two split-fallback segments; the capped retranslations of
+    # the fallback segments are not counted again.
+    assert MT_SEGMENTS.value() - segments_before == 3
+    assert MT_SEGMENTS_PER_SECOND.count() - rate_samples_before == 2
+    # The split fallback is budgeted too; capped candidates are translated again uncapped.
+    assert backend.budget_calls == [
+        ["We are going to the park."],
+        ["We are going", "to the park."],
+    ]
+    assert backend.plain_calls == [["We are going", "to the park."]]
+    segments = json.loads(output_json.read_text(encoding="utf-8"))["segments"]
+    assert [segment["target_text"] for segment in segments] == [
+        "Tam We are going",
+        "Tam to the park.",
+    ]
+    manifest = json.loads(run_manifest_json.read_text(encoding="utf-8"))
+    assert manifest["speed"]["sentence_merge"]["split_fallback_segment_count"] == 2
+    assert manifest["length_control"]["capped_retranslation_count"] == 2
+    assert manifest["length_control"]["chars_per_second_source"] == "estimated"
@@ -1,3 +1,4 @@
+from dataclasses import replace
 from pathlib import Path
 
 from video_translate.config import TranslateConfig, TranslateTransformersConfig
@@ -6,6 +7,7 @@ from video_translate.translate.contracts import (
     build_translation_output_document,
     parse_translation_input_document,
 )
+from video_translate.translate.glossary import contains_term
 
 
 def _translate_config() -> TranslateConfig:
@@ -237,3 +239,79 @@ def test_build_m2_qa_report_does_not_flag_language_mismatch_when_tr_text_present
     flags = report["quality_flags"]
     assert isinstance(flags, list)
     assert "target_language_mismatch_suspected" not in flags
+
+
+def test_build_m2_qa_report_glossary_index_matches_nested_term_scan() -> None:
+    source_texts = [
+        "Welcome to İstanbul, open source city.",
+        "ISTANBUL and ıstanbul both count; so does OPEN   SOURCE?",
+        "No terms here, only opensource and istanbuls.",
+        "C++ is not a word term, but e-mail and open source are.",
+        "",
+    ]
+    input_doc = parse_translation_input_document(
+        {
+            "schema_version": "1.0",
+            "stage": "m2_translation_input",
+            "generated_at_utc": "2026-02-16T10:00:00Z",
+            "source_language": "en",
+            "target_language": "tr",
+            "segment_count": len(source_texts),
+            "total_source_word_count": 30,
+            "segments": [
+                {
+                    "id": index,
+                    "start": float(index),
+                    "end": float(index + 1),
+                    "duration": 1.0,
+                    "source_text": text,
+                    "source_word_count": len(text.split()),
+                }
+                for index, text in enumerate(source_texts)
+            ],
+        }
+    )
+    output_doc = build_translation_output_document(
+        input_doc=input_doc,
+        translated_texts=[
+            "istanbul'a hos geldin, acik kaynak sehri.",
+            "istanbul ve istanbul sayilir.",
+            "burada terim yok.",
+            "C++ ve eposta.",
+            "",
+        ],
+        backend="mock",
+    )
+    glossary = {
+        "istanbul": "İstanbul",
+        "open source": "acik kaynak",
+        "C++": "C++",
+        "e-mail": "e-posta",
+    }
+
+    for case_sensitive in (False, True):
+        config = replace(_translate_config(), glossary_case_sensitive=case_sensitive)
+        report = build_m2_qa_report(output_doc, config, glossary=glossary)
+
+        expected = [
+            (segment.id, source_term, target_term)
+            for segment in output_doc.segments
+            for source_term, target_term in glossary.items()
+            if contains_term(segment.source_text, source_term, case_sensitive=case_sensitive)
+        ]
+        matched = [
+            item
+            for item in expected
+            if contains_term(
+                output_doc.segments[item[0]].target_text, item[2], case_sensitive=case_sensitive
+            )
+        ]
+        terminology = report["terminology_metrics"]
+        assert terminology["expected_term_count"] == len(expected)
+        assert terminology["matched_term_count"] == len(matched)
+        assert terminology["miss_samples"] == [
+            {"segment_id": segment_id, "source_term": source, "expected_target_term": target}
+            for segment_id, source, target in expected
+            if (segment_id, source, target) not in matched
+        ]
+    assert len(expected) > 0
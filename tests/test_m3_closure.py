@@ -1,7 +1,9 @@
 import json
+from dataclasses import replace
 from pathlib import Path
 from types import SimpleNamespace
 
+from video_translate.config import load_config
 from video_translate.pipeline.m3_closure import run_m3_closure_workflow
 
 
@@ -38,34 +40,14 @@ def test_run_m3_closure_workflow_with_auto_tune(tmp_path: Path, monkeypatch) ->
             selection_report_json=selection_report,
         ),
     )
+    base_config = load_config(None)
+    espeak_config = replace(
+        base_config,
+        tts=replace(base_config.tts, backend="espeak", qa_fail_on_flags=False),
+    )
     monkeypatch.setattr(
         "video_translate.pipeline.m3_closure.load_config",
-        lambda *_: SimpleNamespace(
-            tools=SimpleNamespace(),
-            pipeline=SimpleNamespace(),
-            asr=SimpleNamespace(),
-            translate=SimpleNamespace(),
-            tts=SimpleNamespace(
-                backend="espeak",
-                sample_rate=24000,
-                min_segment_seconds=0.12,
-                mock_base_tone_hz=220,
-                espeak_bin="espeak",
-                espeak_voice="tr",
-                espeak_speed_wpm=165,
-                espeak_pitch=50,
-                espeak_adaptive_rate_enabled=True,
-                espeak_adaptive_rate_min_wpm=120,
-                espeak_adaptive_rate_max_wpm=260,
-                espeak_adaptive_rate_max_passes=3,
-                espeak_adaptive_rate_tolerance_seconds=0.06,
-                max_duration_delta_seconds=0.08,
-                qa_max_postfit_segment_ratio=0.60,
-                qa_max_postfit_seconds_ratio=0.35,
-                qa_fail_on_flags=False,
-                qa_allowed_flags=(),
-            ),
-        ),
+        lambda *_: espeak_config,
     )
 
     captured = {"strict_gate": False}
@@ -1,9 +1,11 @@
 import json
 import wave
+from dataclasses import replace
 from pathlib import Path
 
 import pytest
 
+from video_translate.asr.vad import SPEECH_MAP_FILENAME, SpeechMap, write_speech_map
 from video_translate.config import (
     ASRConfig,
     AppConfig,
@@ -13,7 +15,9 @@ from video_translate.config import (
     TranslateConfig,
     TranslateTransformersConfig,
 )
-from video_translate.pipeline.m3 import run_m3_pipeline
+from video_translate.pipeline.m3 import _build_stitched_preview_wav, run_m3_pipeline
+from video_translate.tts.backends import MockTTSBackend
+from video_translate.tts.contracts import TTSOutputDocument, TTSOutputSegment
 
 
 def _build_app_config(tts_fail_on_flags: bool = False) -> AppConfig:
@@ -135,6 +139,23 @@ def test_run_m3_pipeline_with_mock_backend(tmp_path: Path) -> None:
     assert manifest_payload["stage"] == "m3"
     assert Path(manifest_payload["outputs"]["stitched_preview_wav"]).exists()
     assert manifest_payload["qa_gate"]["enabled"] is False
+    assert manifest_payload["speech_alignment"] is None
+
+    # With an M1 speech map in the run dir, M3 reports TTS audio placed over silence.
+    write_speech_map(
+        tmp_path / "work" / SPEECH_MAP_FILENAME,
+        SpeechMap(duration=2.0, regions=[(0.0, 0.4)], threshold_db=-45.0),
+    )
+    run_m3_pipeline(
+        tts_input_json_path=tts_input,
+        output_json_path=output_json,
+        qa_report_json_path=qa_report_json,
+        run_manifest_json_path=run_manifest_json,
+        config=_build_app_config(),
+    )
+    alignment = json.loads(run_manifest_json.read_text(encoding="utf-8"))["speech_alignment"]
+    assert alignment["source_speech_seconds"] == 0.4
+    assert alignment["tts_seconds_outside_source_speech"] == pytest.approx(0.6)
 
 
 def test_run_m3_pipeline_fails_when_qa_gate_blocks_flags(tmp_path: Path) -> None:
@@ -385,3 +406,129 @@ def test_run_m3_pipeline_fails_when_postfit_ratio_exceeds_limit(tmp_path: Path,
 
     qa_payload = json.loads(qa_report_json.read_text(encoding="utf-8"))
     assert "postfit_segment_ratio_above_max" in qa_payload["quality_flags"]
+
+
+def _write_tts_input(path: Path, texts: list[str]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        json.dumps(
+            {
+                "schema_version": "1.0",
+                "stage": "m3_tts_input",
+                "generated_at_utc": "2026-02-18T10:00:00Z",
+                "language": "tr",
+                "segment_count": len(texts),
+                "total_target_word_count": len(texts),
+                "segments": [
+                    {
+                        "id": index,
+                        "start": float(index),
+                        "end": float(index) + 0.8,
+                        "duration": 0.8,
+                        "target_text": text,
+                        "target_word_count": 1,
+                    }
+                    for index, text in enumerate(texts)
+                ],
+            }
+        ),
+        encoding="utf-8",
+    )
+
+
+def test_run_m3_pipeline_incremental_resynthesizes_only_changed_segments(
+    tmp_path: Path, monkeypatch
+) -> None:
+    tts_input = tmp_path / "output" / "tts" / "tts_input.tr.json"
+    output_json = tmp_path / "output" / "tts" / "tts_output.tr.json"
+    qa_report_json = tmp_path / "output" / "qa" / "m3_qa_report.json"
+    run_manifest_json = tmp_path / "run_m3_manifest.json"
+    synthesized_texts: list[str] = []
+
+    class _CountingBackend(MockTTSBackend):
+        def synthesize_to_wav(self, **kwargs) -> float:  # type: ignore[override]
+            synthesized_texts.append(kwargs["text"])
+            return super().synthesize_to_wav(**kwargs)
+
+    monkeypatch.setattr(
+        "video_translate.pipeline.m3.build_tts_backend",
+        lambda *_: _CountingBackend(base_tone_hz=220, min_segment_seconds=0.12),
+    )
+
+    _write_tts_input(tts_input, ["bir", "iki", "uc"])
+    run_m3_pipeline(
+        tts_input_json_path=tts_input,
+        output_json_path=output_json,
+        qa_report_json_path=qa_report_json,
+        run_manifest_json_path=run_manifest_json,
+        config=_build_app_config(),
+        incremental=True,
+    )
+    assert synthesized_texts == ["bir", "iki", "uc"]
+    first_manifest = json.loads(run_manifest_json.read_text(encoding="utf-8"))
+    assert first_manifest["incremental"]["previous_index_used"] is False
+    assert first_manifest["incremental"]["stitch_mode"] == "full"
+
+    _write_tts_input(tts_input, ["bir", "iki uzun metin", "uc"])
+    artifacts = run_m3_pipeline(
+        tts_input_json_path=tts_input,
+        output_json_path=output_json,
+        qa_report_json_path=qa_report_json,
+        run_manifest_json_path=run_manifest_json,
+        config=_build_app_config(),
+        incremental=True,
+    )
+    assert synthesized_texts[3:] == ["iki uzun metin"]
+    manifest = json.loads(run_manifest_json.read_text(encoding="utf-8"))
+    assert manifest["incremental"]["reused_segment_count"] == 2
+    assert manifest["incremental"]["changed_segment_count"] == 1
+    assert manifest["incremental"]["stitch_mode"] == "patched"
+
+    output_payload = json.loads(output_json.read_text(encoding="utf-8"))
+    reference_doc = TTSOutputDocument(
+        schema_version="1.0",
+        stage="m3_tts_output",
+        generated_at_utc="",
+        backend="mock",
+        language="tr",
+        sample_rate=24000,
+        segment_count=len(output_payload["segments"]),
+        segments=[TTSOutputSegment(**segment) for segment in output_payload["segments"]],
+    )
+    reference_wav = tmp_path / "reference.wav"
+    _build_stitched_preview_wav(output_doc=reference_doc, preview_wav_path=reference_wav)
+    with wave.open(str(artifacts.stitched_preview_wav), "rb") as patched, wave.open(
+        str(reference_wav), "rb"
+    ) as reference:
+        assert patched.readframes(patched.getnframes()) == reference.readframes(
+            reference.getnframes()
+        )
+
+
+def test_run_m3_pipeline_incremental_ignores_index_after_config_change(tmp_path: Path) -> None:
+    tts_input = tmp_path / "output" / "tts" / "tts_input.tr.json"
+    output_json = tmp_path / "output" / "tts" / "tts_output.tr.json"
+    qa_report_json = tmp_path / "output" / "qa" / "m3_qa_report.json"
+    run_manifest_json = tmp_path / "run_m3_manifest.json"
+    _write_tts_input(tts_input, ["bir", "iki"])
+    run_m3_pipeline(
+        tts_input_json_path=tts_input,
+        output_json_path=output_json,
+        qa_report_json_path=qa_report_json,
+        run_manifest_json_path=run_manifest_json,
+        config=_build_app_config(),
+    )
+
+    base_config = _build_app_config()
+    changed_config = replace(base_config, tts=replace(base_config.tts, mock_base_tone_hz=330))
+    run_m3_pipeline(
+        tts_input_json_path=tts_input,
+        output_json_path=output_json,
+        qa_report_json_path=qa_report_json,
+        run_manifest_json_path=run_manifest_json,
+        config=changed_config,
+        incremental=True,
+    )
+    manifest = json.loads(run_manifest_json.read_text(encoding="utf-8"))
+    assert manifest["incremental"]["previous_index_used"] is False
+    assert manifest["incremental"]["changed_segment_count"] == 2
@@ -0,0 +1,109 @@
+import threading
+import urllib.request
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+from video_translate.metrics import (
+    ASR_REAL_TIME_FACTOR,
+    FFMPEG_MERGE_DURATION,
+    STAGE_DURATION,
+    STAGE_FAILURES,
+    TTS_SEGMENTS,
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+    observe_span,
+)
+from video_translate.tracing import add_span_observer, remove_span_observer, span, trace_run
+from video_translate.ui import _build_handler
+
+
+def test_registry_renders_prometheus_text_format() -> None:
+    registry = MetricsRegistry()
+    counter = registry.register(Counter("demo_total", "Demo counter.", ("status",)))
+    gauge = registry.register(Gauge("demo_running", "Demo gauge."))
+    histogram = registry.register(
+        Histogram("demo_seconds", "Demo histogram.", buckets=(1.0, 5.0))
+    )
+
+    counter.inc(status="ok")
+    counter.inc(2, status='fa"il')
+    gauge.inc()
+    histogram.observe(0.5)
+    histogram.observe(1.0)
+    histogram.observe(7.0)
+
+    text = registry.render()
+
+    assert "# TYPE demo_total counter" in text
+    assert 'demo_total{status="ok"} 1' in text
+    assert 'demo_total{status="fa\\"il"} 2' in text
+    assert "demo_running 1" in text
+    assert 'demo_seconds_bucket{le="1"} 2' in text
+    assert 'demo_seconds_bucket{le="5"} 2' in text
+    assert 'demo_seconds_bucket{le="+Inf"} 3' in text
+    assert "demo_seconds_sum 8.5" in text
+    assert "demo_seconds_count 3" in text
+    assert text.endswith("\n")
+
+
+def test_metrics_validate_labels_and_duplicates() -> None:
+    registry = MetricsRegistry()
+    counter = registry.register(Counter("demo_total", "Demo.", ("stage",)))
+
+    with pytest.raises(ValueError, match="expects labels: stage"):
+        counter.inc()
+    with pytest.raises(ValueError, match="only increase"):
+        counter.inc(-1, stage="m1")
+    with pytest.raises(ValueError, match="already registered"):
+        registry.register(Counter("demo_total", "Again."))
+
+
+def test_observe_span_feeds_pipeline_metrics_with_tracing_off() -> None:
+    m2_before = STAGE_DURATION.count(stage="m2")
+    m3_failures_before = STAGE_FAILURES.value(stage="m3")
+    rtf_before = ASR_REAL_TIME_FACTOR.count()
+    tts_before = TTS_SEGMENTS.value()
+    merge_before = FFMPEG_MERGE_DURATION.count()
+
+    add_span_observer(observe_span)
+    try:
+        with trace_run("m2", trace_format="off"):
+            with span("asr.decode", audio_seconds=10.0, segment_count=3):
+                pass
+            with span("tts.synthesize", synthesized_segment_count=4):
+                pass
+            with span("ffmpeg.merge"):
+                pass
+        with pytest.raises(RuntimeError):
+            with trace_run("m3", trace_format="off"):
+                raise RuntimeError("boom")
+    finally:
+        remove_span_observer(observe_span)
+
+    assert STAGE_DURATION.count(stage="m2") == m2_before + 1
+    assert STAGE_FAILURES.value(stage="m3") == m3_failures_before + 1
+    assert ASR_REAL_TIME_FACTOR.count() == rtf_before + 1
+    assert TTS_SEGMENTS.value() == tts_before + 4
+    assert FFMPEG_MERGE_DURATION.count() == merge_before + 1
+
+
+def test_ui_metrics_endpoint_serves_registry() -> None:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _build_handler())
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05})
+    thread.start()
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}/metrics"
+        with urllib.request.urlopen(url, timeout=5) as response:
+            content_type = response.headers["Content-Type"]
+            body = response.read().decode("utf-8")
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join(timeout=5)
+
+    assert content_type.startswith("text/plain; version=0.0.4")
+    assert "# TYPE video_translate_jobs_running gauge" in body
+    assert "# TYPE video_translate_stage_duration_seconds histogram" in body
@@ -0,0 +1,40 @@
+from dataclasses import asdict
+from pathlib import Path
+
+from video_translate.io import read_json
+from video_translate.models import TranscriptSegment, WordTimestamp
+from video_translate.pipeline.model_memory_benchmark import (
+    CONTRACT_MODELS,
+    run_model_memory_benchmark,
+)
+
+
+def test_contract_models_are_slotted_and_keep_dict_shape() -> None:
+    word = WordTimestamp(word="hello", start=0.0, end=0.5, probability=0.9)
+    segment = TranscriptSegment(id=0, start=0.0, end=1.0, text="hello", words=[word])
+
+    assert not hasattr(segment, "__dict__")
+    assert all("__slots__" in vars(model) for model in CONTRACT_MODELS)
+    assert asdict(segment) == {
+        "id": 0,
+        "start": 0.0,
+        "end": 1.0,
+        "text": "hello",
+        "words": [{"word": "hello", "start": 0.0, "end": 0.5, "probability": 0.9}],
+    }
+
+
+def test_run_model_memory_benchmark_reports_savings(tmp_path: Path) -> None:
+    report_path = run_model_memory_benchmark(
+        output_json_path=tmp_path / "model_memory_benchmark.json",
+        instance_count=2000,
+    )
+    payload = read_json(report_path)
+
+    assert payload["stage"] == "model_memory_benchmark"
+    assert [item["model"] for item in payload["models"]] == [
+        model.__name__ for model in CONTRACT_MODELS
+    ]
+    for item in payload["models"]:
+        assert item["slotted"] is True
+        assert item["bytes_per_instance_after"] < item["bytes_per_instance_before"]
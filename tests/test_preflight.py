@@ -1,10 +1,17 @@
+import stat
+import sys
 import types
 
 from pytest import MonkeyPatch
 
 from pathlib import Path
 
-from video_translate.preflight import PreflightReport, preflight_errors, run_preflight
+from video_translate.preflight import (
+    PreflightReport,
+    clear_preflight_cache,
+    preflight_errors,
+    run_preflight,
+)
 
 
 def test_run_preflight_success(monkeypatch: MonkeyPatch) -> None:
@@ -210,3 +217,116 @@ def test_run_preflight_piper_backend_finds_local_venv_binary(
     assert report.ok
     assert report.piper is not None
     assert report.piper.path == str(local_piper)
+
+
+def _counting_which(calls: list[str]):
+    def fake_which(command: str) -> str | None:
+        calls.append(command)
+        return f"/bin/{command}"
+
+    return fake_which
+
+
+def test_run_preflight_cache_reuses_result_until_path_changes(monkeypatch: MonkeyPatch) -> None:
+    clear_preflight_cache()
+    calls: list[str] = []
+    monkeypatch.setattr("video_translate.preflight.shutil.which", _counting_which(calls))
+    monkeypatch.setattr(
+        "video_translate.preflight.importlib.util.find_spec",
+        lambda _: types.SimpleNamespace(name="faster_whisper"),
+    )
+
+    first = run_preflight(yt_dlp_bin="yt-dlp", ffmpeg_bin="ffmpeg", cache_ttl_seconds=60.0)
+    second = run_preflight(yt_dlp_bin="yt-dlp", ffmpeg_bin="ffmpeg", cache_ttl_seconds=60.0)
+    assert second == first
+    assert calls == ["yt-dlp", "ffmpeg"]
+
+    run_preflight(yt_dlp_bin="yt-dlp", ffmpeg_bin="ffmpeg-custom", cache_ttl_seconds=60.0)
+    assert calls[-1] == "ffmpeg-custom"
+
+    monkeypatch.setenv("PATH", "/opt/other-tools")
+    run_preflight(yt_dlp_bin="yt-dlp", ffmpeg_bin="ffmpeg", cache_ttl_seconds=60.0)
+    assert len(calls) == 6
+    clear_preflight_cache()
+
+
+def test_run_preflight_cache_expires_after_ttl(monkeypatch: MonkeyPatch) -> None:
+    clear_preflight_cache()
+    calls: list[str] = []
+    clock = {"now": 1000.0}
+    monkeypatch.setattr("video_translate.preflight.shutil.which", _counting_which(calls))
+    monkeypatch.setattr("video_translate.preflight.importlib.util.find_spec", lambda _: None)
+    monkeypatch.setattr("video_translate.preflight.time.time", lambda: clock["now"])
+
+    run_preflight(yt_dlp_bin="yt-dlp", ffmpeg_bin="ffmpeg", cache_ttl_seconds=30.0)
+    clock["now"] += 10.0
+    run_preflight(yt_dlp_bin="yt-dlp", ffmpeg_bin="ffmpeg", cache_ttl_seconds=30.0)
+    assert len(calls) == 2
+    clock["now"] += 30.0
+    run_preflight(yt_dlp_bin="yt-dlp", ffmpeg_bin="ffmpeg", cache_ttl_seconds=30.0)
+    assert len(calls) == 4
+    clear_preflight_cache()
+
+
+def test_run_preflight_disk_cache_survives_process_cache_reset(
+    monkeypatch: MonkeyPatch, tmp_path: Path
+) -> None:
+    clear_preflight_cache()
+    calls: list[str] = []
+    cache_path = tmp_path / ".cache" / "preflight.json"
+    monkeypatch.setattr("video_translate.preflight.shutil.which", _counting_which(calls))
+    monkeypatch.setattr("video_translate.preflight.importlib.util.find_spec", lambda _: None)
+
+    first = run_preflight(
+        yt_dlp_bin="yt-dlp", ffmpeg_bin="ffmpeg", cache_ttl_seconds=60.0, cache_path=cache_path
+    )
+    clear_preflight_cache()
+    second = run_preflight(
+        yt_dlp_bin="yt-dlp", ffmpeg_bin="ffmpeg", cache_ttl_seconds=60.0, cache_path=cache_path
+    )
+
+    assert cache_path.exists()
+    assert second == first
+    assert len(calls) == 2
+    clear_preflight_cache()
+
+
+def _write_tool(path: Path, body: str) -> Path:
+    path.write_text(f"#!{sys.executable}\n{body}", encoding="utf-8")
+    path.chmod(path.stat().st_mode | stat.S_IEXEC)
+    return path
+
+
+def test_run_preflight_deep_probes_versions_once(monkeypatch: MonkeyPatch, tmp_path: Path) -> None:
+    clear_preflight_cache()
+    probe_log = tmp_path / "probes.log"
+    body = (
+        "import sys\n"
+        f"open({str(probe_log)!r}, 'a').write('probe\\n')\n"
+        "print('tool 1.2.3')\n"
+    )
+    yt_dlp = _write_tool(tmp_path / "yt-dlp", body)
+    ffmpeg = _write_tool(tmp_path / "ffmpeg", "import sys\nsys.exit(3)\n")
+    monkeypatch.setattr(
+        "video_translate.preflight.shutil.which",
+        lambda command: str(yt_dlp) if command == "yt-dlp" else str(ffmpeg),
+    )
+    monkeypatch.setattr(
+        "video_translate.preflight.importlib.util.find_spec",
+        lambda _: types.SimpleNamespace(name="faster_whisper"),
+    )
+
+    report = run_preflight(
+        yt_dlp_bin="yt-dlp", ffmpeg_bin="ffmpeg", deep=True, cache_ttl_seconds=60.0
+    )
+    again = run_preflight(
+        yt_dlp_bin="yt-dlp", ffmpeg_bin="ffmpeg", deep=True, cache_ttl_seconds=60.0
+    )
+
+    assert report.yt_dlp.version == "tool 1.2.3"
+    assert report.ffmpeg.probed and report.ffmpeg.version is None
+    assert not report.ok
+    assert "did not respond to a version probe" in " ".join(preflight_errors(report))
+    assert again == report
+    assert probe_log.read_text(encoding="utf-8").count("probe") == 1
+    clear_preflight_cache()
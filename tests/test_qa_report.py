@@ -1,5 +1,9 @@
+from statistics import mean, median
+
+import pytest
+
 from video_translate.models import TranscriptDocument, TranscriptSegment, WordTimestamp
-from video_translate.qa.m1_report import build_m1_qa_report
+from video_translate.qa.m1_report import M1QAStats, build_m1_qa_report
 
 
 def test_build_m1_qa_report_with_word_timestamps() -> None:
@@ -73,3 +77,46 @@ def test_build_m1_qa_report_without_word_timestamps() -> None:
     flags = report["quality_flags"]
     assert isinstance(flags, list)
     assert "empty_segments_present" in flags
+
+
+def test_streamed_m1_qa_stats_match_document_walk() -> None:
+    probabilities = [0.05 * step for step in range(1, 20)] + [0.99, 0.97, 0.3]
+    segments = [
+        TranscriptSegment(
+            id=index,
+            start=float(index),
+            end=index + 0.8,
+            text=f"word {index}",
+            words=[
+                WordTimestamp(word="word", start=float(index), end=index + 0.4, probability=p)
+            ],
+        )
+        for index, p in enumerate(probabilities)
+    ]
+    doc = TranscriptDocument(
+        language="en", language_probability=0.9, duration=30.0, segments=segments
+    )
+
+    stats = M1QAStats()
+    for segment in segments:
+        stats.add_segment(
+            start=segment.start,
+            end=segment.end,
+            text=segment.text,
+            probabilities=(word.probability for word in segment.words),
+        )
+    streamed = build_m1_qa_report(doc, stats=stats)
+    walked = build_m1_qa_report(doc)
+
+    assert streamed == walked
+    word_metrics = streamed["word_metrics"]
+    assert word_metrics["count"] == len(probabilities)
+    assert word_metrics["avg_probability"] == pytest.approx(mean(probabilities))
+    assert word_metrics["min_probability"] == min(probabilities)
+    assert word_metrics["max_probability"] == 0.99
+    assert word_metrics["low_confidence_count"] == sum(1 for p in probabilities if p < 0.6)
+    percentiles = list(word_metrics["probability_percentiles_estimated"].values())
+    assert percentiles == sorted(percentiles)
+    assert word_metrics["probability_percentiles_estimated"]["p50"] == pytest.approx(
+        median(probabilities), abs=0.05
+    )
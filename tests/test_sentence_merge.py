@@ -0,0 +1,53 @@
+from video_translate.translate.contracts import TranslationInputSegment
+from video_translate.translate.sentence_merge import merge_sentence_units, split_target_text
+
+
+def _segment(index: int, start: float, end: float, text: str) -> TranslationInputSegment:
+    return TranslationInputSegment(
+        id=index,
+        start=start,
+        end=end,
+        duration=end - start,
+        source_text=text,
+        source_word_count=len(text.split()),
+    )
+
+
+def test_merge_sentence_units_breaks_on_punctuation_gaps_and_limits() -> None:
+    segments = [
+        _segment(0, 0.0, 1.0, "So today we are going"),
+        _segment(1, 1.1, 2.0, "to look at elephants."),
+        _segment(2, 2.1, 3.0, "They live in herds"),
+        _segment(3, 4.5, 5.0, "and they travel far"),
+        _segment(4, 5.1, 6.0, "every single"),
+        _segment(5, 6.1, 7.0, "day"),
+    ]
+
+    units = merge_sentence_units(segments, max_gap_seconds=0.6, max_segments=2, max_words=40)
+
+    assert [unit.positions for unit in units] == [(0, 1), (2,), (3, 4), (5,)]
+    assert units[0].text == "So today we are going to look at elephants."
+
+
+def test_merge_sentence_units_respects_word_limit_and_closing_quotes() -> None:
+    segments = [
+        _segment(0, 0.0, 1.0, 'He said "stop."'),
+        _segment(1, 1.0, 2.0, "one two three"),
+        _segment(2, 2.0, 3.0, "four five six"),
+    ]
+
+    units = merge_sentence_units(segments, max_gap_seconds=1.0, max_segments=4, max_words=5)
+
+    assert [unit.positions for unit in units] == [(0,), (1,), (2,)]
+
+
+def test_split_target_text_follows_weights_and_snaps_to_punctuation() -> None:
+    parts = split_target_text(
+        "Bugün filleri inceleyeceğiz, çünkü sürüler halinde yaşarlar.", [1.0, 1.0]
+    )
+
+    assert parts == ["Bugün filleri inceleyeceğiz,", "çünkü sürüler halinde yaşarlar."]
+    assert split_target_text("bir iki", [1.0, 1.0, 1.0]) is None
+    assert split_target_text(" tek ", [2.0]) == ["tek"]
+    uneven = split_target_text("a b c d e f g h", [3.0, 1.0])
+    assert uneven == ["a b c d e f", "g h"]
@@ -1,23 +1,80 @@
 import subprocess
 import sys
 from pathlib import Path
-from types import SimpleNamespace
 from typing import Any
 
 import pytest
 
-from video_translate.utils.subprocess_utils import CommandExecutionError, run_command
+from video_translate.utils.subprocess_utils import (
+    CommandExecutionError,
+    LineProtocolWorker,
+    clear_env_cache,
+    command_stats_since,
+    command_stats_snapshot,
+    get_line_worker,
+    merged_env,
+    run_command,
+)
+
+_LINE_ECHO_SCRIPT = (
+    "import sys\n"
+    "for line in sys.stdin:\n"
+    "    if line.strip() == 'exit':\n"
+    "        break\n"
+    "    sys.stdout.write(line.upper())\n"
+    "    sys.stdout.flush()\n"
+)
+
+# Like the echo script, but logs an extra stdout line before every other answer.
+_NOISY_ECHO_SCRIPT = (
+    "import sys\n"
+    "for index, line in enumerate(sys.stdin):\n"
+    "    if index % 2 == 0:\n"
+    "        sys.stdout.write('log: loading voice\\n')\n"
+    "    sys.stdout.write('done ' + line)\n"
+    "    sys.stdout.flush()\n"
+)
+
+class _FakePopen:
+    def __init__(self, captured: dict[str, Any], error: BaseException | None = None) -> None:
+        self.captured = captured
+        self.error = error
+        self.returncode: int | None = None
+
+    def __call__(self, *args: Any, **kwargs: Any) -> "_FakePopen":
+        del args
+        self.captured.update(kwargs)
+        return self
 
+    def __enter__(self) -> "_FakePopen":
+        return self
 
-def test_run_command_passes_timeout_to_subprocess(monkeypatch: Any) -> None:
+    def __exit__(self, *exc_info: Any) -> None:
+        del exc_info
+
+    def communicate(self, input: Any = None, timeout: float | None = None) -> tuple[str, str]:  # noqa: A002
+        if self.error is not None:
+            error, self.error = self.error, None
+            raise error
+        self.captured["input"] = input
+        self.captured["timeout"] = timeout
+        self.returncode = 0
+        return "", ""
+
+    def kill(self) -> None:
+        self.returncode = -9
+
+
+def _patch_popen(monkeypatch: Any, error: BaseException | None = None) -> dict[str, Any]:
     captured: dict[str, Any] = {}
+    monkeypatch.setattr(
+        "video_translate.utils.subprocess_utils.subprocess.Popen", _FakePopen(captured, error)
+    )
+    return captured
 
-    def fake_run(*args: Any, **kwargs: Any) -> SimpleNamespace:
-        del args
-        captured["timeout"] = kwargs.get("timeout")
-        return SimpleNamespace(returncode=0, stderr="", stdout="")
 
-    monkeypatch.setattr("video_translate.utils.subprocess_utils.subprocess.run", fake_run)
+def test_run_command_passes_timeout_to_subprocess(monkeypatch: Any) -> None:
+    captured = _patch_popen(monkeypatch)
 
     result = run_command(["echo", "ok"], cwd=Path("."), timeout_seconds=12.0)
     assert result.returncode == 0
@@ -25,17 +82,7 @@ def test_run_command_passes_timeout_to_subprocess(monkeypatch: Any) -> None:
 
 
 def test_run_command_uses_utf8_text_mode(monkeypatch: Any) -> None:
-    captured: dict[str, Any] = {}
-
-    def fake_run(*args: Any, **kwargs: Any) -> SimpleNamespace:
-        del args
-        captured["encoding"] = kwargs.get("encoding")
-        captured["errors"] = kwargs.get("errors")
-        captured["text"] = kwargs.get("text")
-        captured["input"] = kwargs.get("input")
-        return SimpleNamespace(returncode=0, stderr="", stdout="")
-
-    monkeypatch.setattr("video_translate.utils.subprocess_utils.subprocess.run", fake_run)
+    captured = _patch_popen(monkeypatch)
 
     result = run_command(["cmd", "/c", "echo"], input_text="merhaba")
     assert result.returncode == 0
@@ -46,14 +93,7 @@ def test_run_command_uses_utf8_text_mode(monkeypatch: Any) -> None:
 
 
 def test_run_command_passes_env_overrides(monkeypatch: Any) -> None:
-    captured: dict[str, Any] = {}
-
-    def fake_run(*args: Any, **kwargs: Any) -> SimpleNamespace:
-        del args
-        captured["env"] = kwargs.get("env")
-        return SimpleNamespace(returncode=0, stderr="", stdout="")
-
-    monkeypatch.setattr("video_translate.utils.subprocess_utils.subprocess.run", fake_run)
+    captured = _patch_popen(monkeypatch)
 
     result = run_command(
         ["cmd", "/c", "echo"],
@@ -68,14 +108,14 @@ def test_run_command_passes_env_overrides(monkeypatch: Any) -> None:
 
 
 def test_run_command_timeout_raises_command_execution_error(monkeypatch: Any) -> None:
-    def fake_run(*args: Any, **kwargs: Any) -> SimpleNamespace:
-        del args, kwargs
-        raise subprocess.TimeoutExpired(cmd="ffmpeg -i x y", timeout=5.0, stderr="still running")
-
-    monkeypatch.setattr("video_translate.utils.subprocess_utils.subprocess.run", fake_run)
+    _patch_popen(
+        monkeypatch,
+        error=subprocess.TimeoutExpired(cmd="ffmpeg -i x y", timeout=5.0, stderr="still running"),
+    )
 
-    with pytest.raises(CommandExecutionError, match="timed out"):
+    with pytest.raises(CommandExecutionError, match="timed out") as exc_info:
         run_command(["ffmpeg", "-i", "x", "y"], timeout_seconds=5.0)
+    assert "still running" in str(exc_info.value)
 
 
 def test_run_command_handles_non_ascii_input_text() -> None:
@@ -87,3 +127,92 @@ def test_run_command_handles_non_ascii_input_text() -> None:
     payload = "\u4f60\u597d, ger\u00e7ekten"
     result = run_command([sys.executable, "-c", echo_stdin_script], input_text=payload)
     assert result.stdout == payload
+
+
+def test_run_command_binary_mode_returns_bytes_and_decodes_errors() -> None:
+    result = run_command(
+        [sys.executable, "-c", "import sys; sys.stdout.buffer.write(bytes(range(256)))"],
+        binary=True,
+    )
+    assert result.stdout == bytes(range(256))
+
+    with pytest.raises(CommandExecutionError, match="ge\u00e7ersiz"):
+        run_command(
+            [
+                sys.executable,
+                "-c",
+                "import sys; sys.stderr.buffer.write('ge\u00e7ersiz'.encode()); sys.exit(3)",
+            ],
+            binary=True,
+        )
+
+
+def test_merged_env_is_cached_per_override_set(monkeypatch: Any) -> None:
+    clear_env_cache()
+    first = merged_env({"B": "2", "A": "1"})
+    assert merged_env({"A": "1", "B": "2"}) is first
+    assert merged_env(None) is None
+
+    monkeypatch.setenv("VIDEO_TRANSLATE_ENV_CACHE_PROBE", "x")
+    clear_env_cache()
+    refreshed = merged_env({"A": "1", "B": "2"})
+    assert refreshed is not first
+    assert refreshed is not None and refreshed["VIDEO_TRANSLATE_ENV_CACHE_PROBE"] == "x"
+
+
+def test_run_command_reports_spawn_overhead_per_command() -> None:
+    before = command_stats_snapshot()
+    for _ in range(2):
+        run_command([sys.executable, "-c", "pass"])
+
+    label = Path(sys.executable).name.lower().removesuffix(".exe")
+    stats = command_stats_since(before)[label]
+    assert stats["calls"] == 2
+    assert stats["spawns"] == 2
+    assert stats["worker_requests"] == 0
+    assert 0.0 < stats["spawn_seconds"] <= stats["wall_seconds"]
+    assert stats["avg_spawn_ms"] > 0.0
+
+
+def test_line_worker_reuses_one_process_for_many_requests() -> None:
+    command = [sys.executable, "-c", _LINE_ECHO_SCRIPT]
+    worker = get_line_worker(command)
+    assert get_line_worker(command) is worker
+    before = command_stats_snapshot()
+    try:
+        answers = [worker.request(f"satir {index}", timeout_seconds=30.0) for index in range(5)]
+    finally:
+        worker.close()
+
+    assert answers == [f"SATIR {index}" for index in range(5)]
+    label = Path(sys.executable).name.lower().removesuffix(".exe")
+    stats = command_stats_since(before)[label]
+    assert stats["spawns"] == 1
+    assert stats["worker_requests"] == 5
+
+
+def test_line_worker_matches_answers_to_requests_despite_extra_lines() -> None:
+    worker = LineProtocolWorker([sys.executable, "-c", _NOISY_ECHO_SCRIPT])
+    try:
+        answers = [
+            worker.request(
+                f"seg_{index}.wav",
+                timeout_seconds=30.0,
+                matches=lambda response, index=index: response.endswith(f"seg_{index}.wav"),
+            )
+            for index in range(4)
+        ]
+    finally:
+        worker.close()
+
+    assert answers == [f"done seg_{index}.wav" for index in range(4)]
+
+
+def test_line_worker_disables_itself_when_process_exits() -> None:
+    worker = LineProtocolWorker([sys.executable, "-c", _LINE_ECHO_SCRIPT])
+
+    with pytest.raises(CommandExecutionError, match="exited before answering"):
+        worker.request("exit", timeout_seconds=30.0)
+    assert worker.disabled
+    with pytest.raises(CommandExecutionError, match="disabled"):
+        worker.request("again", timeout_seconds=30.0)
@@ -0,0 +1,166 @@
+import json
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from video_translate.config import load_config
+from video_translate.pipeline.m2 import run_m2_pipeline
+from video_translate.tracing import (
+    current_tracer,
+    set_trace_output_path,
+    span,
+    trace_file_path,
+    trace_run,
+)
+
+
+def _read_spans(path: Path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_span_is_noop_without_active_trace() -> None:
+    with span("orphan", value=1) as record:
+        record.set(extra=True)
+    assert current_tracer() is None
+
+
+def test_trace_run_exports_nested_spans_as_jsonl(tmp_path: Path) -> None:
+    output = trace_file_path(tmp_path / "logs", "unit", "jsonl")
+
+    with trace_run("root", trace_format="jsonl", output_path=output, run_id="r1"):
+        with span("child", kind="outer") as child:
+            with span("grandchild"):
+                sum(range(1000))
+            child.set(items=3)
+
+    assert output == tmp_path / "logs" / "trace_unit.jsonl"
+    spans = {item["name"]: item for item in _read_spans(output)}
+    assert set(spans) == {"root", "child", "grandchild"}
+    assert spans["root"]["parent_id"] is None
+    assert spans["root"]["attributes"] == {"run_id": "r1"}
+    assert spans["child"]["parent_id"] == spans["root"]["span_id"]
+    assert spans["grandchild"]["parent_id"] == spans["child"]["span_id"]
+    assert spans["child"]["attributes"] == {"kind": "outer", "items": 3}
+    assert spans["root"]["duration_seconds"] >= spans["child"]["duration_seconds"]
+    assert spans["grandchild"]["cpu_seconds"] >= 0.0
+    assert spans["root"]["status"] == "ok"
+    assert current_tracer() is None
+
+
+def test_span_cpu_excludes_work_on_other_threads(tmp_path: Path) -> None:
+    output = tmp_path / "trace.jsonl"
+    stop = threading.Event()
+
+    def _busy() -> None:
+        while not stop.is_set():
+            sum(range(1000))
+
+    worker = threading.Thread(target=_busy)
+    with trace_run("root", trace_format="jsonl", output_path=output):
+        worker.start()
+        try:
+            with span("waiting"):
+                time.sleep(0.2)
+        finally:
+            stop.set()
+            worker.join()
+
+    spans = {item["name"]: item for item in _read_spans(output)}
+    assert spans["waiting"]["cpu_seconds"] < 0.1
+    assert "process_child_cpu_seconds" in spans["waiting"]
+
+
+def test_trace_run_chrome_format_writes_complete_events(tmp_path: Path) -> None:
+    output = trace_file_path(tmp_path, "unit", "chrome")
+
+    with trace_run("root", trace_format="chrome", output_path=output):
+        with span("child"):
+            pass
+
+    assert output.name == "trace_unit.trace.json"
+    payload = json.loads(output.read_text(encoding="utf-8"))
+    events = payload["traceEvents"]
+    assert [event["name"] for event in events] == ["root", "child"]
+    assert all(event["ph"] == "X" for event in events)
+    assert "cpu_seconds" in events[1]["args"]
+
+
+def test_trace_run_records_error_and_still_exports(tmp_path: Path) -> None:
+    output = tmp_path / "trace.jsonl"
+
+    with pytest.raises(RuntimeError, match="boom"):
+        with trace_run("root", trace_format="jsonl", output_path=output):
+            with span("failing"):
+                raise RuntimeError("boom")
+
+    spans = {item["name"]: item for item in _read_spans(output)}
+    assert spans["failing"]["status"] == "error"
+    assert spans["failing"]["error"] == "RuntimeError: boom"
+    assert spans["root"]["status"] == "error"
+
+
+def test_nested_trace_run_only_exports_outermost(tmp_path: Path) -> None:
+    inner_output = tmp_path / "inner.jsonl"
+
+    with trace_run("outer", trace_format="jsonl"):
+        with trace_run("inner", trace_format="jsonl", output_path=inner_output):
+            pass
+        set_trace_output_path(tmp_path / "outer.jsonl")
+        set_trace_output_path(tmp_path / "ignored.jsonl")
+
+    assert not inner_output.exists()
+    assert not (tmp_path / "ignored.jsonl").exists()
+    names = [item["name"] for item in _read_spans(tmp_path / "outer.jsonl")]
+    assert names == ["outer", "inner"]
+
+
+def test_trace_run_off_writes_nothing(tmp_path: Path) -> None:
+    output = tmp_path / "trace.jsonl"
+
+    with trace_run("root", trace_format="off", output_path=output):
+        with span("child"):
+            assert current_tracer() is None
+
+    assert not output.exists()
+
+
+def test_run_m2_pipeline_writes_stage_trace(tmp_path: Path) -> None:
+    translation_input = tmp_path / "translation_input.en-tr.json"
+    translation_input.write_text(
+        json.dumps(
+            {
+                "schema_version": "1.0",
+                "stage": "m2_translation_input",
+                "generated_at_utc": "2026-02-16T10:00:00Z",
+                "source_language": "en",
+                "target_language": "tr",
+                "segment_count": 1,
+                "total_source_word_count": 2,
+                "segments": [
+                    {
+                        "id": 0,
+                        "start": 0.0,
+                        "end": 2.0,
+                        "duration": 2.0,
+                        "source_text": "hello world",
+                        "source_word_count": 2,
+                    }
+                ],
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    run_m2_pipeline(
+        translation_input_json_path=translation_input,
+        output_json_path=tmp_path / "output" / "translation_output.en-tr.json",
+        qa_report_json_path=tmp_path / "output" / "m2_qa_report.json",
+        run_manifest_json_path=tmp_path / "run_m2_manifest.json",
+        config=load_config(None),
+    )
+
+    names = [item["name"] for item in _read_spans(tmp_path / "logs" / "trace_m2.jsonl")]
+    assert names[0] == "m2"
+    assert {"read_input", "mt.load", "mt.translate", "qa", "write_outputs"} <= set(names)
@@ -0,0 +1,117 @@
+from pathlib import Path
+
+import pytest
+
+from video_translate.io import read_json, write_transcript_json
+from video_translate.models import TranscriptDocument, TranscriptSegment, WordTimestamp
+from video_translate.pipeline.m1 import rebuild_m1_qa_report
+from video_translate.qa.m1_report import build_m1_qa_report
+from video_translate.transcript_columns import (
+    open_word_columns,
+    word_columns_path_for,
+    write_word_columns,
+)
+
+
+def _doc() -> TranscriptDocument:
+    return TranscriptDocument(
+        language="en",
+        language_probability=0.99,
+        duration=10.0,
+        segments=[
+            TranscriptSegment(
+                id=0,
+                start=0.0,
+                end=3.0,
+                text="hello world",
+                words=[
+                    WordTimestamp(word="hello", start=0.0, end=1.0, probability=0.95),
+                    WordTimestamp(word="wörld", start=1.0, end=2.0, probability=0.55),
+                ],
+            ),
+            TranscriptSegment(id=1, start=3.5, end=4.0, text="", words=[]),
+            TranscriptSegment(
+                id=2,
+                start=4.0,
+                end=7.0,
+                text="a test",
+                words=[
+                    WordTimestamp(word="a", start=4.0, end=4.5, probability=0.40),
+                    WordTimestamp(word="test", start=4.5, end=6.0, probability=0.93),
+                ],
+            ),
+        ],
+    )
+
+
+def test_word_columns_round_trip(tmp_path: Path) -> None:
+    path = tmp_path / "transcript.en.words.bin"
+    assert write_word_columns(path, _doc()) == 4
+
+    with open_word_columns(path) as columns:
+        assert len(columns) == 4
+        assert columns.segment_count == 3
+        assert list(columns.segment_id) == [0, 0, 2, 2]
+        assert list(columns.start) == [0.0, 1.0, 4.0, 4.5]
+        assert columns.word(1) == "wörld"
+        assert columns.word_timestamp(3) == WordTimestamp(
+            word="test", start=4.5, end=6.0, probability=0.93
+        )
+
+
+def test_word_columns_handles_empty_transcript(tmp_path: Path) -> None:
+    path = tmp_path / "empty.words.bin"
+    doc = TranscriptDocument(language="en", language_probability=0.9, duration=1.0, segments=[])
+    assert write_word_columns(path, doc) == 0
+    with open_word_columns(path) as columns:
+        assert len(columns) == 0
+
+
+def test_open_word_columns_rejects_foreign_file(tmp_path: Path) -> None:
+    path = tmp_path / "bogus.words.bin"
+    path.write_bytes(b"not a columns file at all, just bytes")
+    with pytest.raises(ValueError, match="Unsupported word columns file"):
+        open_word_columns(path)
+
+
+def test_m1_qa_report_from_columns_matches_object_path(tmp_path: Path) -> None:
+    doc = _doc()
+    path = tmp_path / "transcript.en.words.bin"
+    write_word_columns(path, doc)
+
+    with open_word_columns(path) as columns:
+        report = build_m1_qa_report(doc, word_columns=columns)
+
+    assert report == build_m1_qa_report(doc)
+
+
+def test_transcript_json_with_sidecar_strips_words(tmp_path: Path) -> None:
+    doc = _doc()
+    transcript_json = tmp_path / "transcript.en.json"
+    sidecar = word_columns_path_for(transcript_json)
+    assert sidecar.name == "transcript.en.words.bin"
+
+    write_word_columns(sidecar, doc)
+    write_transcript_json(transcript_json, doc, word_columns_path=sidecar)
+
+    payload = read_json(transcript_json)
+    assert payload["word_timestamps_path"] == "transcript.en.words.bin"
+    assert all(segment["words"] == [] for segment in payload["segments"])
+    with open_word_columns(sidecar) as columns:
+        sidecar_words = [columns.word_timestamp(index) for index in range(len(columns))]
+    assert sidecar_words == [word for segment in doc.segments for word in segment.words]
+
+
+def test_rebuild_m1_qa_report_reads_words_from_the_sidecar(tmp_path: Path) -> None:
+    doc = _doc()
+    transcript_json = tmp_path / "output" / "transcript" / "transcript.en.json"
+    sidecar = word_columns_path_for(transcript_json)
+    write_word_columns(sidecar, doc)
+    write_transcript_json(transcript_json, doc, word_columns_path=sidecar)
+
+    report_path = rebuild_m1_qa_report(run_root=tmp_path)
+
+    assert report_path == tmp_path / "output" / "qa" / "m1_qa_report.json"
+    report = read_json(report_path)
+    assert report == build_m1_qa_report(doc)
+    assert report["word_metrics"]["count"] == 4
@@ -1,7 +1,25 @@
-﻿import pytest
+﻿import sys
+from dataclasses import replace
+from pathlib import Path
+from types import ModuleType, SimpleNamespace
 
-from video_translate.config import TranslateConfig, TranslateTransformersConfig
-from video_translate.translate.backends import TransformersTranslationBackend, build_translation_backend
+import pytest
+
+from video_translate.config import (
+    TranslateConfig,
+    TranslateCTranslate2Config,
+    TranslateTransformersConfig,
+)
+from video_translate.tracing import current_tracer, trace_run
+from video_translate.translate import backends
+from video_translate.translate.backends import (
+    BudgetedTranslationBackend,
+    CTranslate2TranslationBackend,
+    TransformersTranslationBackend,
+    build_translation_backend,
+    token_batches,
+)
+from video_translate.translate.length_control import TranslationCandidate
 
 
 def _base_translate_config(backend: str) -> TranslateConfig:
@@ -64,3 +82,140 @@ def test_repair_common_mojibake_cp1254_variant() -> None:
     assert "\u015f" in repaired
     assert "\u0131" in repaired
 
+
+
+def test_token_batches_group_similar_lengths_within_budget() -> None:
+    batches = token_batches([3, 10, 4, 9, 30], max_batch_tokens=20)
+
+    assert batches == [[0, 2], [3, 1], [4]]
+    assert sorted(index for batch in batches for index in batch) == [0, 1, 2, 3, 4]
+
+
+class _FakeTokenizer:
+    lang_code_to_token = {"tr": "__tr__", "en": "__en__"}
+
+    def __init__(self) -> None:
+        self.src_lang = "en"
+
+    def encode(self, text: str) -> list[str]:
+        return [f"__{self.src_lang}__", *text.split(), "</s>"]
+
+    def convert_ids_to_tokens(self, ids: list[str]) -> list[str]:
+        return list(ids)
+
+    def convert_tokens_to_ids(self, tokens: list[str]) -> list[str]:
+        return list(tokens)
+
+    def decode(self, ids: list[str], skip_special_tokens: bool) -> str:
+        assert skip_special_tokens
+        return " ".join(token for token in ids if not token.startswith("__") and token != "</s>")
+
+
+def _install_fake_ctranslate2(monkeypatch: pytest.MonkeyPatch) -> dict[str, list[object]]:
+    calls: dict[str, list[object]] = {"convert": [], "load": [], "batch": [], "tokenizer": []}
+
+    class Converter:
+        def __init__(self, model_id: str) -> None:
+            self.model_id = model_id
+
+        def convert(self, output_dir: str, *, quantization: str, force: bool) -> None:
+            calls["convert"].append((self.model_id, quantization))
+            Path(output_dir).mkdir(parents=True)
+            (Path(output_dir) / "model.bin").write_bytes(b"ct2")
+
+    class Translator:
+        def __init__(self, model_dir: str, **kwargs: object) -> None:
+            calls["load"].append((model_dir, kwargs))
+
+        def translate_batch(self, batch: list[list[str]], **kwargs: object) -> list[object]:
+            calls["batch"].append(len(batch))
+            prefixes = kwargs["target_prefix"] or [[] for _ in batch]
+            return [
+                SimpleNamespace(
+                    hypotheses=[[*prefix, *(token.upper() for token in tokens[1:-1]), "</s>"]]
+                )
+                for prefix, tokens in zip(prefixes, batch, strict=True)
+            ]
+
+    ctranslate2 = ModuleType("ctranslate2")
+    ctranslate2.converters = SimpleNamespace(TransformersConverter=Converter)
+    ctranslate2.Translator = Translator
+    transformers = ModuleType("transformers")
+
+    def from_pretrained(model_id: str) -> _FakeTokenizer:
+        calls["tokenizer"].append(model_id)
+        return _FakeTokenizer()
+
+    transformers.AutoTokenizer = SimpleNamespace(from_pretrained=from_pretrained)
+    monkeypatch.setitem(sys.modules, "ctranslate2", ctranslate2)
+    monkeypatch.setitem(sys.modules, "transformers", transformers)
+    monkeypatch.setattr(backends, "_CT2_TRANSLATORS", {})
+    return calls
+
+
+def test_ctranslate2_backend_converts_once_and_batches_by_tokens(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    calls = _install_fake_ctranslate2(monkeypatch)
+    config = replace(
+        _base_translate_config("ctranslate2"),
+        ctranslate2=TranslateCTranslate2Config(
+            model_id="facebook/m2m100_418M",
+            cache_dir=tmp_path / "ct2",
+            max_batch_tokens=12,
+            source_lang_code="en",
+            target_lang_code="tr",
+        ),
+    )
+    backend = build_translation_backend(config)
+    assert isinstance(backend, CTranslate2TranslationBackend)
+    texts = ["hello world", "a much longer sentence with many words", "hi"]
+
+    with trace_run("mt", trace_format="jsonl"):
+        first = backend.translate_batch(
+            texts, source_language="en", target_language="tr", batch_size=8
+        )
+        spans = [item.name for item in current_tracer().spans]
+    second = backend.translate_batch(
+        texts, source_language="en", target_language="tr", batch_size=8
+    )
+
+    assert first == ["HELLO WORLD", "A MUCH LONGER SENTENCE WITH MANY WORDS", "HI"]
+    assert second == first
+    assert calls["convert"] == [("facebook/m2m100_418M", "int8")]
+    assert len(calls["load"]) == 1
+    assert calls["tokenizer"] == ["facebook/m2m100_418M"]
+    assert (tmp_path / "ct2" / "facebook_m2m100_418m-int8" / "model.bin").is_file()
+    # Two short inputs share a batch; the long one exceeds the budget on its own.
+    assert calls["batch"] == [2, 1, 2, 1]
+    assert spans.count("mt.batch") == 2
+    assert "mt.model_convert" in spans
+
+
+def test_ctranslate2_backend_flags_hypotheses_cut_at_the_budget_cap(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    _install_fake_ctranslate2(monkeypatch)
+    config = replace(
+        _base_translate_config("ctranslate2"),
+        ctranslate2=TranslateCTranslate2Config(
+            model_id="facebook/m2m100_418M",
+            cache_dir=tmp_path / "ct2",
+            source_lang_code="en",
+            target_lang_code="tr",
+        ),
+    )
+    backend = build_translation_backend(config)
+    assert isinstance(backend, BudgetedTranslationBackend)
+
+    candidates = backend.translate_batch_with_budget(
+        ["hi", "a much longer sentence with far too many words"],
+        source_language="en",
+        target_language="tr",
+        batch_size=8,
+        char_budgets=[1, 1],
+        num_candidates=1,
+    )
+
+    assert candidates[0] == [TranslationCandidate("HI")]
+    assert candidates[1][0].hit_length_cap is True
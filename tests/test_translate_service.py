@@ -0,0 +1,127 @@
+import json
+import threading
+import urllib.request
+from dataclasses import dataclass, field, replace
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+from video_translate.config import load_config
+from video_translate.translate.backends import (
+    TransformersTranslationBackend,
+    TranslationServiceBackend,
+)
+from video_translate.translate.service import (
+    MicroBatcher,
+    build_service_backend,
+    build_service_handler,
+)
+
+
+@dataclass
+class _RecordingBackend:
+    name: str = "recording"
+    batches: list[list[str]] = field(default_factory=list)
+    fail: bool = False
+
+    def translate_batch(
+        self,
+        texts: list[str],
+        *,
+        source_language: str,
+        target_language: str,
+        batch_size: int,
+    ) -> list[str]:
+        if self.fail:
+            raise RuntimeError("model crashed")
+        self.batches.append(list(texts))
+        return [f"{target_language}:{text}" for text in texts]
+
+
+def test_micro_batcher_coalesces_concurrent_requests() -> None:
+    backend = _RecordingBackend()
+    batcher = MicroBatcher(backend, max_batch_size=8, max_wait_seconds=0.3)
+    results: dict[str, list[str]] = {}
+
+    def submit(name: str, texts: list[str]) -> None:
+        results[name] = batcher.submit(texts, source_language="en", target_language="tr")
+
+    threads = [
+        threading.Thread(target=submit, args=("a", ["one", "two", "shared"])),
+        threading.Thread(target=submit, args=("b", ["three", "shared", "four"])),
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5.0)
+    stats = batcher.stats()
+    batcher.close()
+
+    assert results["a"] == ["tr:one", "tr:two", "tr:shared"]
+    assert results["b"] == ["tr:three", "tr:shared", "tr:four"]
+    # Both jobs share one backend call; the repeated text is translated once.
+    assert len(backend.batches) == 1
+    assert sorted(backend.batches[0]) == ["four", "one", "shared", "three", "two"]
+    assert stats["batch_count"] == 1
+    assert stats["coalesced_batch_count"] == 1
+    assert stats["mean_batch_fill"] == 0.75
+    assert stats["max_queue_depth"] >= 3
+    assert stats["queue_depth"] == 0
+
+
+def test_micro_batcher_splits_large_requests_and_keeps_order() -> None:
+    backend = _RecordingBackend()
+    batcher = MicroBatcher(backend, max_batch_size=2, max_wait_seconds=0.0)
+
+    translated = batcher.submit(
+        ["a", "b", "c", "d", "e"], source_language="en", target_language="de"
+    )
+    batcher.close()
+
+    assert translated == ["de:a", "de:b", "de:c", "de:d", "de:e"]
+    assert [len(batch) for batch in backend.batches] == [2, 2, 1]
+
+
+def test_service_client_round_trip_and_metrics() -> None:
+    backend = _RecordingBackend()
+    batcher = MicroBatcher(backend, max_batch_size=4, max_wait_seconds=0.0)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), build_service_handler(batcher))
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05})
+    thread.start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        client = TranslationServiceBackend(url=base_url, timeout_seconds=5.0)
+        translated = client.translate_batch(
+            ["hello", "world"], source_language="en", target_language="tr", batch_size=8
+        )
+        with urllib.request.urlopen(f"{base_url}/stats", timeout=5.0) as response:
+            stats = json.loads(response.read().decode("utf-8"))
+        with urllib.request.urlopen(f"{base_url}/metrics", timeout=5.0) as response:
+            metrics_text = response.read().decode("utf-8")
+
+        backend.fail = True
+        with pytest.raises(RuntimeError, match="model crashed"):
+            client.translate_batch(
+                ["boom"], source_language="en", target_language="tr", batch_size=8
+            )
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join(timeout=5.0)
+        batcher.close()
+
+    assert translated == ["tr:hello", "tr:world"]
+    assert stats["request_count"] == 1
+    assert stats["mean_batch_fill"] == 0.5
+    assert "video_translate_mt_service_queue_depth 0" in metrics_text
+    assert "video_translate_mt_service_batch_fill_ratio_count 1" in metrics_text
+
+
+def test_build_service_backend_keeps_transformers_model_resident() -> None:
+    translate = load_config().translate
+    backend = build_service_backend(replace(translate, backend="transformers"))
+    assert isinstance(backend, TransformersTranslationBackend)
+    assert backend.resident is True
+
+    with pytest.raises(ValueError, match="needs a model backend"):
+        build_service_backend(replace(translate, backend="service"))
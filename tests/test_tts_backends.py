@@ -1,3 +1,5 @@
+import json
+from collections.abc import Callable
 from pathlib import Path
 
 import pytest
@@ -9,6 +11,7 @@ from video_translate.tts.backends import (
     PiperTTSBackend,
     build_tts_backend,
 )
+from video_translate.utils.subprocess_utils import CommandExecutionError
 
 
 def _base_tts_config(backend: str) -> TTSConfig:
@@ -188,6 +191,84 @@ def test_piper_backend_builds_command_and_writes_wav(monkeypatch: pytest.MonkeyP
     assert env_overrides.get("PYTHONIOENCODING") == "utf-8"
 
 
+
+def test_piper_backend_streams_segments_to_persistent_worker(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    backend = PiperTTSBackend(
+        piper_bin="piper",
+        model_path=tmp_path / "voice.onnx",
+        config_path=None,
+        speaker_id=None,
+        length_scale=1.0,
+        noise_scale=0.667,
+        noise_w=0.8,
+        min_segment_seconds=0.12,
+        persistent_worker=True,
+    )
+    worker_commands: list[list[str]] = []
+    requests: list[dict[str, str]] = []
+    spawned: list[list[str]] = []
+
+    class FakeWorker:
+        disabled = False
+
+        def request(
+            self,
+            line: str,
+            timeout_seconds: float | None = None,
+            *,
+            matches: Callable[[str], bool] | None = None,
+        ) -> str:
+            del timeout_seconds
+            payload = json.loads(line)
+            assert matches is not None
+            assert matches(payload["output_file"])
+            assert not matches(str(tmp_path / "seg_other.wav"))
+            requests.append(payload)
+            if payload["text"] == "bozuk":
+                self.disabled = True
+                raise CommandExecutionError(["piper"], 1, "worker crashed")
+            MockTTSBackend(base_tone_hz=220, min_segment_seconds=0.12).synthesize_to_wav(
+                text=payload["text"],
+                output_wav=Path(payload["output_file"]),
+                target_duration=0.3,
+                sample_rate=24000,
+            )
+            return payload["output_file"]
+
+    fake_worker = FakeWorker()
+
+    def fake_get_line_worker(command: list[str], **_kwargs: object) -> FakeWorker:
+        worker_commands.append(command)
+        return fake_worker
+
+    def fake_run_command(command: list[str], **_kwargs: object) -> None:
+        spawned.append(command)
+        MockTTSBackend(base_tone_hz=220, min_segment_seconds=0.12).synthesize_to_wav(
+            text="x",
+            output_wav=Path(command[command.index("--output_file") + 1]),
+            target_duration=0.3,
+            sample_rate=24000,
+        )
+
+    monkeypatch.setattr("video_translate.tts.backends.get_line_worker", fake_get_line_worker)
+    monkeypatch.setattr("video_translate.tts.backends.run_command", fake_run_command)
+
+    for index, text in enumerate(["merhaba", "dunya", "bozuk", "son"]):
+        duration = backend.synthesize_to_wav(
+            text=text,
+            output_wav=tmp_path / f"seg_{index}.wav",
+            target_duration=0.3,
+            sample_rate=24000,
+        )
+        assert duration > 0.0
+
+    assert "--json-input" in worker_commands[0]
+    assert [item["text"] for item in requests] == ["merhaba", "dunya", "bozuk"]
+    # The failed segment and every later one fall back to one piper process per call.
+    assert len(spawned) == 2
+
 def test_espeak_backend_adaptive_rate_retries_until_tolerance(
     monkeypatch: pytest.MonkeyPatch, tmp_path: Path
 ) -> None:
@@ -0,0 +1,107 @@
+import wave
+from pathlib import Path
+
+import pytest
+
+from video_translate.asr.vad import (
+    SpeechMap,
+    detect_speech_map,
+    read_speech_map,
+    write_speech_map,
+    write_speech_only_wav,
+)
+from video_translate.models import TranscriptDocument, TranscriptSegment, WordTimestamp
+from video_translate.pipeline.m1_benchmark import write_synthetic_speech_fixture
+from video_translate.qa.m1_report import build_m1_qa_report
+
+
+def _fixture(tmp_path: Path) -> Path:
+    # 1.6 s bursts with 1.4 s gaps: every gap is long enough to be skipped.
+    return write_synthetic_speech_fixture(
+        tmp_path / "source_16k_mono.wav", seconds=9.0, burst_seconds=1.6, gap_seconds=1.4
+    )
+
+
+def _detect(wav_path: Path) -> SpeechMap:
+    return detect_speech_map(
+        wav_path,
+        threshold_db=-45.0,
+        hangover_seconds=0.1,
+        padding_seconds=0.1,
+        min_silence_seconds=0.5,
+    )
+
+
+def test_detect_speech_map_finds_bursts_and_skips_gaps(tmp_path: Path) -> None:
+    speech_map = _detect(_fixture(tmp_path))
+
+    assert len(speech_map.regions) == 3
+    for index, (start, end) in enumerate(speech_map.regions):
+        burst_start = index * 3.0
+        assert start <= burst_start + 0.1
+        assert end >= burst_start + 1.5
+        assert end <= burst_start + 2.0
+    assert speech_map.duration == pytest.approx(9.0)
+    assert 0.3 < speech_map.skipped_ratio < 0.55
+
+
+def test_speech_map_round_trip_and_overlap(tmp_path: Path) -> None:
+    speech_map = SpeechMap(duration=10.0, regions=[(1.0, 2.0), (4.0, 6.0)], threshold_db=-40.0)
+    path = write_speech_map(tmp_path / "speech_map.json", speech_map)
+
+    loaded = read_speech_map(path)
+
+    assert loaded is not None
+    assert loaded.regions == speech_map.regions
+    assert loaded.speech_seconds == pytest.approx(3.0)
+    assert loaded.overlap_seconds(1.5, 5.0) == pytest.approx(1.5)
+    assert loaded.overlap_seconds(2.0, 4.0) == 0.0
+    assert read_speech_map(tmp_path / "missing.json") is None
+
+
+def test_speech_only_wav_maps_timestamps_back_to_source(tmp_path: Path) -> None:
+    source = _fixture(tmp_path)
+    speech_map = SpeechMap(duration=9.0, regions=[(0.0, 2.0), (3.0, 5.0)], threshold_db=-45.0)
+
+    audio = write_speech_only_wav(source, speech_map, tmp_path / "speech_only.wav")
+    with wave.open(str(audio.path), "rb") as wav_file:
+        assert wav_file.getnframes() == 4 * 16000
+
+    doc = TranscriptDocument(
+        language="en",
+        language_probability=0.9,
+        duration=4.0,
+        segments=[
+            TranscriptSegment(
+                id=1,
+                start=1.5,
+                end=2.0,
+                text="join",
+                words=[WordTimestamp(word="join", start=1.5, end=2.0, probability=0.9)],
+            ),
+            TranscriptSegment(id=2, start=2.0, end=3.5, text="after", words=[]),
+        ],
+    )
+    remapped = audio.remap_document(doc, duration=9.0)
+
+    assert remapped.duration == 9.0
+    assert [(item.start, item.end) for item in remapped.segments] == [(1.5, 2.0), (3.0, 4.5)]
+    assert remapped.segments[0].words[0].end == 2.0
+
+
+def test_m1_qa_report_uses_speech_map_for_coverage() -> None:
+    doc = TranscriptDocument(
+        language="en",
+        language_probability=0.9,
+        duration=10.0,
+        segments=[TranscriptSegment(id=1, start=0.0, end=1.0, text="hi", words=[])],
+    )
+    speech_map = SpeechMap(duration=10.0, regions=[(0.0, 4.0)], threshold_db=-45.0)
+
+    report = build_m1_qa_report(doc, speech_map=speech_map)
+
+    segment_metrics = report["segment_metrics"]
+    assert segment_metrics["speech_coverage_source"] == "speech_map"
+    assert segment_metrics["speech_coverage_ratio"] == pytest.approx(0.4)
+    fallback = build_m1_qa_report(doc)["segment_metrics"]
+    assert fallback["speech_coverage_source"] == "asr_segments"
@@ -0,0 +1,101 @@
+import json
+from pathlib import Path
+
+from video_translate.config import load_config
+from video_translate.model_registry import ModelReference, ModelRegistry, model_references
+from video_translate.pipeline.m1_benchmark import synthetic_whisper_factory
+from video_translate.pipeline.warmup import run_warmup
+
+
+def _config(tmp_path: Path) -> Path:
+    config = tmp_path / "profile.toml"
+    config.write_text(
+        "\n".join(
+            [
+                "[pipeline]",
+                f'workspace_dir = "{(tmp_path / "runs").as_posix()}"',
+                "[asr]",
+                'model = "medium"',
+                'fallback_model = "small"',
+                "fallback_on_oom = true",
+            ]
+        ),
+        encoding="utf-8",
+    )
+    return config
+
+
+def _fake_resolver(root: Path, calls: list[str]):
+    def resolve(reference: ModelReference) -> Path:
+        calls.append(reference.name)
+        model_dir = root / reference.name
+        model_dir.mkdir(parents=True, exist_ok=True)
+        (model_dir / "model.bin").write_bytes(reference.name.encode("utf-8") * 64)
+        (model_dir / "config.json").write_text("{}", encoding="utf-8")
+        return model_dir
+
+    return resolve
+
+
+def test_model_references_cover_asr_and_fallback_models(tmp_path: Path) -> None:
+    config = load_config(_config(tmp_path))
+
+    references = model_references(config)
+
+    assert [(item.kind, item.name) for item in references] == [
+        ("asr", "medium"),
+        ("asr", "small"),
+    ]
+
+
+def test_run_warmup_registers_models_and_reports_cold_vs_warm(tmp_path: Path) -> None:
+    calls: list[str] = []
+    config = _config(tmp_path)
+    resolver = _fake_resolver(tmp_path / "hub", calls)
+    factory = synthetic_whisper_factory(load_seconds=0.0)
+
+    first = run_warmup(
+        config_paths=[config],
+        output_json_path=tmp_path / "warmup.json",
+        resolver=resolver,
+        model_factory=factory,
+    )
+
+    assert first.ok
+    assert calls == ["medium", "small"]
+    registry = json.loads(first.registry_path.read_text(encoding="utf-8"))
+    assert set(registry["models"]) == {"asr:medium", "asr:small"}
+    assert set(registry["models"]["asr:medium"]["files"]) == {"config.json", "model.bin"}
+    report = json.loads(first.report_path.read_text(encoding="utf-8"))
+    assert report["stage"] == "warmup"
+    assert report["summary"]["ok_count"] == 2
+    model = report["models"][0]
+    assert model["resolved_from"] == "resolver"
+    assert model["cold_first_job_seconds"] is not None
+    assert model["warm_first_job_seconds"] is not None
+
+    # The second run reuses the registry and only verifies checksums.
+    (tmp_path / "hub" / "small" / "model.bin").write_bytes(b"truncated")
+    second = run_warmup(
+        config_paths=[config],
+        output_json_path=tmp_path / "warmup.json",
+        resolver=resolver,
+        model_factory=factory,
+    )
+
+    assert calls == ["medium", "small"]
+    assert not second.ok
+    statuses = {item.reference.name: item for item in second.results}
+    assert statuses["medium"].status == "ok"
+    assert statuses["medium"].resolved_from == "registry"
+    assert statuses["small"].status == "checksum_mismatch"
+    assert statuses["small"].mismatched_files == ["model.bin"]
+
+
+def test_model_registry_ignores_unreadable_file(tmp_path: Path) -> None:
+    path = tmp_path / "model_registry.json"
+    path.write_text("{not json", encoding="utf-8")
+
+    registry = ModelRegistry(path)
+
+    assert registry.entries == {}
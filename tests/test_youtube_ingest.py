@@ -0,0 +1,258 @@
+import stat
+import sys
+from dataclasses import replace
+from pathlib import Path
+from time import perf_counter
+
+import pytest
+
+from video_translate.config import load_config
+from video_translate.ingest import youtube
+from video_translate.ingest.youtube import (
+    build_yt_dlp_command,
+    download_youtube_source,
+    start_split_youtube_download,
+)
+from video_translate.io import read_json
+from video_translate.models import TranscriptDocument
+from video_translate.pipeline.m1 import run_m1_pipeline
+
+# Minimal yt-dlp stand-in: honours --output/--format/--write-info-json and, for the
+# video-only format, blocks until a release file appears next to the output.
+_FAKE_YT_DLP = """\
+import json, sys, time
+from pathlib import Path
+
+args = sys.argv[1:]
+template = Path(args[args.index("--output") + 1])
+fmt = args[args.index("--format") + 1] if "--format" in args else "best"
+log = template.parent / "calls.log"
+with log.open("a", encoding="utf-8") as handle:
+    handle.write(json.dumps(args) + "\\n")
+if fmt.startswith("bestvideo"):
+    release = template.parent / "release_video"
+    deadline = time.time() + 10
+    while not release.exists() and time.time() < deadline:
+        time.sleep(0.01)
+    ext, size = "mp4", 4096
+elif fmt.startswith("bestaudio"):
+    ext, size = "m4a", 512
+else:
+    ext, size = "mp4", 8192
+output = Path(str(template).replace("%(ext)s", ext))
+output.write_bytes(b"x" * size)
+if "--write-info-json" in args:
+    Path(str(template).replace("%(ext)s", "info.json")).write_text("{}", encoding="utf-8")
+"""
+
+
+def _write_fake_yt_dlp(tmp_path: Path) -> str:
+    script = tmp_path / "fake_yt_dlp"
+    script.write_text(f"#!{sys.executable}\n{_FAKE_YT_DLP}", encoding="utf-8")
+    script.chmod(script.stat().st_mode | stat.S_IEXEC)
+    return str(script)
+
+
+def test_build_yt_dlp_command_adds_format_and_fragments() -> None:
+    command = build_yt_dlp_command(
+        yt_dlp_bin="yt-dlp",
+        url="https://example.com/video",
+        output_template=Path("runs/test/source_audio.%(ext)s"),
+        format_selector="bestaudio/best",
+        concurrent_fragments=4,
+    )
+    assert command[command.index("--format") + 1] == "bestaudio/best"
+    assert command[command.index("--concurrent-fragments") + 1] == "4"
+    assert command[-1] == "https://example.com/video"
+
+
+def test_download_youtube_source_with_stand_in(tmp_path: Path) -> None:
+    yt_dlp = _write_fake_yt_dlp(tmp_path)
+    result = download_youtube_source(
+        url="https://example.com/video",
+        output_dir=tmp_path / "input",
+        yt_dlp_bin=yt_dlp,
+    )
+    assert result.media_path.name == "source.mp4"
+    assert result.info_json_path == tmp_path / "input" / "source.info.json"
+
+
+def test_split_download_returns_audio_before_video(tmp_path: Path) -> None:
+    yt_dlp = _write_fake_yt_dlp(tmp_path)
+    input_dir = tmp_path / "input"
+    split = start_split_youtube_download(
+        url="https://example.com/video",
+        output_dir=input_dir,
+        yt_dlp_bin=yt_dlp,
+        concurrent_fragments=8,
+    )
+
+    assert split.audio.media_path.name == "source_audio.m4a"
+    assert split.audio.info_json_path == input_dir / "source_audio.info.json"
+    assert not split.video.done()
+
+    (input_dir / "release_video").write_text("", encoding="utf-8")
+    assert split.video.result(timeout=10) == input_dir / "source_video.mp4"
+    calls = (input_dir / "calls.log").read_text(encoding="utf-8")
+    assert calls.count('"--concurrent-fragments", "8"') == 2
+
+
+def test_split_download_cancel_terminates_video_download(tmp_path: Path) -> None:
+    yt_dlp = _write_fake_yt_dlp(tmp_path)
+    input_dir = tmp_path / "input"
+    split = start_split_youtube_download(
+        url="https://example.com/video",
+        output_dir=input_dir,
+        yt_dlp_bin=yt_dlp,
+    )
+
+    started = perf_counter()
+    split.cancel()
+
+    # The stand-in would block for 10 s without a release file.
+    assert perf_counter() - started < 5.0
+    assert split.video.done()
+    assert not (input_dir / "source_video.mp4").exists()
+
+
+def test_run_m1_pipeline_split_ingest_overlaps_asr_with_video(tmp_path: Path, monkeypatch) -> None:
+    yt_dlp = _write_fake_yt_dlp(tmp_path)
+    run_input_dir = tmp_path / "runs" / "split_run" / "input"
+    seen: dict[str, object] = {}
+
+    def _fake_normalize(**kwargs):
+        seen["normalize_input"] = kwargs["input_media"]
+        kwargs["output_wav"].parent.mkdir(parents=True, exist_ok=True)
+        kwargs["output_wav"].write_bytes(b"")
+        return kwargs["output_wav"]
+
+    def _fake_transcribe(_audio, _asr, on_segment_collected=None, **_kwargs):
+        # Video is still blocked while ASR runs; release it from inside the ASR stage.
+        seen["video_pending_during_asr"] = not (run_input_dir / "source_video.mp4").exists()
+        (run_input_dir / "release_video").write_text("", encoding="utf-8")
+        return TranscriptDocument(
+            language="en", language_probability=0.9, duration=1.0, segments=[]
+        )
+
+    monkeypatch.setattr("video_translate.pipeline.m1.normalize_audio_for_asr", _fake_normalize)
+    monkeypatch.setattr("video_translate.pipeline.m1.transcribe_audio", _fake_transcribe)
+    base_config = load_config(None)
+    config = replace(
+        base_config,
+        tools=replace(base_config.tools, yt_dlp=yt_dlp),
+        pipeline=replace(
+            base_config.pipeline,
+            workspace_dir=tmp_path / "runs",
+            ingest_mode="split",
+            ingest_concurrent_fragments=4,
+        ),
+    )
+
+    artifacts = run_m1_pipeline(
+        source_url="https://example.com/video",
+        config=config,
+        run_id="split_run",
+        emit_srt=False,
+    )
+
+    assert seen["normalize_input"] == run_input_dir / "source_audio.m4a"
+    assert seen["video_pending_during_asr"] is True
+    assert artifacts.source_media == run_input_dir / "source_video.mp4"
+    assert artifacts.source_audio == run_input_dir / "source_audio.m4a"
+    manifest = read_json(artifacts.run_manifest)
+    assert manifest["ingest"]["mode"] == "split"
+    assert manifest["artifacts"]["source_audio"] == str(run_input_dir / "source_audio.m4a")
+
+
+def test_run_m1_pipeline_split_ingest_stops_video_download_on_failure(
+    tmp_path: Path, monkeypatch
+) -> None:
+    yt_dlp = _write_fake_yt_dlp(tmp_path)
+    started_downloads: list[youtube.SplitDownload] = []
+
+    def _recording_split_download(**kwargs):
+        split = youtube.start_split_youtube_download(**kwargs)
+        started_downloads.append(split)
+        return split
+
+    def _failing_normalize(**_kwargs):
+        raise RuntimeError("ffmpeg failed")
+
+    monkeypatch.setattr(
+        "video_translate.pipeline.m1.start_split_youtube_download", _recording_split_download
+    )
+    monkeypatch.setattr("video_translate.pipeline.m1.normalize_audio_for_asr", _failing_normalize)
+    base_config = load_config(None)
+    config = replace(
+        base_config,
+        tools=replace(base_config.tools, yt_dlp=yt_dlp),
+        pipeline=replace(
+            base_config.pipeline, workspace_dir=tmp_path / "runs", ingest_mode="split"
+        ),
+    )
+
+    with pytest.raises(RuntimeError, match="ffmpeg failed"):
+        run_m1_pipeline(
+            source_url="https://example.com/video",
+            config=config,
+            run_id="failed_run",
+            emit_srt=False,
+        )
+
+    assert len(started_downloads) == 1
+    assert started_downloads[0].video.done()
+    assert not (tmp_path / "runs" / "failed_run" / "input" / "source_video.mp4").exists()
+
+
+def test_run_m1_pipeline_resume_reuses_downloaded_and_normalized_media(
+    tmp_path: Path, monkeypatch
+) -> None:
+    yt_dlp = _write_fake_yt_dlp(tmp_path)
+    run_input_dir = tmp_path / "runs" / "resumed_run" / "input"
+    normalized: list[Path] = []
+
+    def _fake_normalize(**kwargs):
+        normalized.append(kwargs["input_media"])
+        kwargs["output_wav"].parent.mkdir(parents=True, exist_ok=True)
+        kwargs["output_wav"].write_bytes(b"")
+        return kwargs["output_wav"]
+
+    def _fake_transcribe(_audio, _asr, **_kwargs):
+        return TranscriptDocument(
+            language="en", language_probability=0.9, duration=1.0, segments=[]
+        )
+
+    monkeypatch.setattr("video_translate.pipeline.m1.normalize_audio_for_asr", _fake_normalize)
+    monkeypatch.setattr("video_translate.pipeline.m1.transcribe_audio", _fake_transcribe)
+    base_config = load_config(None)
+    config = replace(
+        base_config,
+        tools=replace(base_config.tools, yt_dlp=yt_dlp),
+        pipeline=replace(
+            base_config.pipeline, workspace_dir=tmp_path / "runs", ingest_mode="split"
+        ),
+    )
+    run_input_dir.mkdir(parents=True)
+    (run_input_dir / "release_video").write_text("", encoding="utf-8")
+
+    first = run_m1_pipeline(
+        source_url="https://example.com/video",
+        config=config,
+        run_id="resumed_run",
+        emit_srt=False,
+        resume=True,
+    )
+    yt_dlp_calls = (run_input_dir / "calls.log").read_text(encoding="utf-8")
+    resumed = run_m1_pipeline(
+        source_url="https://example.com/video",
+        config=config,
+        run_id="resumed_run",
+        emit_srt=False,
+        resume=True,
+    )
+
+    assert normalized == [run_input_dir / "source_audio.m4a"]
+    assert (run_input_dir / "calls.log").read_text(encoding="utf-8") == yt_dlp_calls
+    assert resumed.source_media == first.source_media == run_input_dir / "source_video.mp4"
+    assert resumed.source_audio == run_input_dir / "source_audio.m4a"
+    assert read_json(resumed.run_manifest)["ingest"]["reused_existing_media"] is True